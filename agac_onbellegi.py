@@ -0,0 +1,200 @@
+from collections import OrderedDict
+from typing import List, Dict, Optional, Tuple, Iterable
+from arama_istatistikleri import AramaIstatistikleri
+
+
+class EnKisaYolAgaci:
+    """Bir kök duraktan tüm duraklara arama ağacı - mesafe ve ebeveyn kenar dizileri"""
+    
+    def __init__(self, graf, kok: int, olcut: str, izin_maskesi: int,
+                 mesafeler: List[float], ebeveyn: List[int]):
+        self._graf = graf
+        self._kok = kok
+        self._olcut = olcut
+        self._izin_maskesi = izin_maskesi
+        self._mesafeler = mesafeler
+        self._ebeveyn = ebeveyn
+    
+    @property
+    def kok(self) -> int:
+        return self._kok
+    
+    @property
+    def olcut(self) -> str:
+        return self._olcut
+    
+    @property
+    def izin_maskesi(self) -> int:
+        return self._izin_maskesi
+    
+    def mesafe(self, hedef: int) -> float:
+        """Kökten hedefe süre (dk) veya kenar sayısı; ulaşılamıyorsa inf"""
+        return self._mesafeler[hedef]
+    
+    def yol(self, hedef: int) -> Optional[List[int]]:
+        """Kökten hedefe kenar indeksleri listesi (ulaşılamıyorsa None)"""
+        if self._mesafeler[hedef] == float('inf'):
+            return None
+        kenarlar = []
+        dugum = hedef
+        while dugum != self._kok:
+            k = self._ebeveyn[dugum]
+            kenarlar.append(k)
+            dugum = self._graf.kenar_kaynagi(k)
+        kenarlar.reverse()
+        return kenarlar
+
+
+class AgacOnbellegi:
+    """
+    Kök durak, ölçüt ve mod maskesi başına en kısa yol ağaçlarını tutan sınırlı önbellek
+    
+    Çıkarma en az kullanılan (LFU) ağaca göre yapılır; eşit kullanımda en eski
+    kullanılan çıkarılır. Kullanım sayıları önbellekte olmayan kökler için de
+    tutulur: önbellek doluyken yeni bir ağaç ancak kökü en az kullanılan ağaçtan
+    daha sık sorgulanmışsa hesaplanıp eklenir, aksi halde çağıran noktadan
+    noktaya aramaya döner.
+    """
+    
+    VARSAYILAN_KAPASITE = 64
+    OLCUTLER = ("sure", "durak")  # En kısa süre (Dijkstra) veya en az durak (BFS)
+    
+    def __init__(self, graf, kapasite: int = VARSAYILAN_KAPASITE):
+        if kapasite < 1:
+            raise ValueError("Önbellek kapasitesi en az 1 olmalı")
+        self._graf = graf
+        self._kapasite = kapasite
+        self._agaclar: Dict[Tuple[int, str, int], EnKisaYolAgaci] = {}
+        self._kullanimlar: Dict[Tuple[int, str, int], int] = {}
+        # Kullanım sayısı -> o sayıdaki önbellek anahtarları (en eski kullanılan başta)
+        self._kovalar: Dict[int, OrderedDict] = {}
+        self._en_az_kullanim = 0
+        self._isabet = 0
+        self._iskalama = 0
+    
+    def agac_getir(self, kok: int, olcut: str = "sure", izin_maskesi: Optional[int] = None,
+                   istatistik: Optional[AramaIstatistikleri] = None) -> Optional[EnKisaYolAgaci]:
+        """
+        Kökün ağacını döndür; önbellekte yoksa kabul edilirse hesaplanıp eklenir
+        
+        Args:
+            izin_maskesi: Kullanılabilecek kenar modları (varsayılan: tüm modlar)
+            istatistik: Verilirse isabet/ıskalama ve yeni ağaç sayaçları buna eklenir
+        
+        Returns:
+            Ağaç veya (önbellek dolu ve kök yeterince sık değilse) None
+        """
+        if olcut not in self.OLCUTLER:
+            raise ValueError(f"Bilinmeyen ölçüt: {olcut}")
+        if izin_maskesi is None:
+            izin_maskesi = self._graf.MOD_TUMU
+        anahtar = (kok, olcut, izin_maskesi)
+        kullanim = self._kullanimlar.get(anahtar, 0) + 1
+        self._kullanimlar[anahtar] = kullanim
+        
+        agac = self._agaclar.get(anahtar)
+        if agac is not None:
+            self._isabet += 1
+            if istatistik is not None:
+                istatistik.onbellek_isabeti += 1
+            self._kovadan_cikar(anahtar, kullanim - 1)
+            self._kovaya_ekle(anahtar, kullanim)
+            if not self._kovalar.get(self._en_az_kullanim):
+                self._en_az_kullanim = kullanim
+            return agac
+        
+        self._iskalama += 1
+        if istatistik is not None:
+            istatistik.onbellek_iskalamasi += 1
+        if len(self._agaclar) >= self._kapasite:
+            if kullanim <= self._en_az_kullanim:
+                return None
+            self._en_az_kullanilani_cikar()
+        if istatistik is not None:
+            istatistik.olusturulan_agac += 1
+        return self._ekle(anahtar, kullanim)
+    
+    def isit(self, kokler: Iterable[int], olcut: str = "sure", izin_maskesi: Optional[int] = None):
+        """
+        Verilen kökler için ağaçları önceden hesapla (örn. başlangıçta popüler duraklar)
+        
+        Isıtılan ağaçlar bir kez kullanılmış sayılır; kapasiteden fazla kök
+        verilirse yalnızca ilk kapasite kadarı tutulur.
+        """
+        if olcut not in self.OLCUTLER:
+            raise ValueError(f"Bilinmeyen ölçüt: {olcut}")
+        if izin_maskesi is None:
+            izin_maskesi = self._graf.MOD_TUMU
+        for kok in kokler:
+            anahtar = (kok, olcut, izin_maskesi)
+            if anahtar in self._agaclar:
+                continue
+            if len(self._agaclar) >= self._kapasite:
+                break
+            kullanim = max(self._kullanimlar.get(anahtar, 0), 1)
+            self._kullanimlar[anahtar] = kullanim
+            self._ekle(anahtar, kullanim)
+    
+    def temizle(self):
+        """Tüm ağaçları, kullanım sayılarını ve istatistikleri sil"""
+        self._agaclar.clear()
+        self._kullanimlar.clear()
+        self._kovalar.clear()
+        self._en_az_kullanim = 0
+        self._isabet = 0
+        self._iskalama = 0
+    
+    def __len__(self) -> int:
+        return len(self._agaclar)
+    
+    def __contains__(self, anahtar: Tuple[int, str, int]) -> bool:
+        return anahtar in self._agaclar
+    
+    @property
+    def kapasite(self) -> int:
+        return self._kapasite
+    
+    @property
+    def isabet_sayisi(self) -> int:
+        return self._isabet
+    
+    @property
+    def iskalama_sayisi(self) -> int:
+        return self._iskalama
+    
+    @property
+    def isabet_orani(self) -> float:
+        toplam = self._isabet + self._iskalama
+        return self._isabet / toplam if toplam else 0.0
+    
+    def _ekle(self, anahtar: Tuple[int, str, int], kullanim: int) -> EnKisaYolAgaci:
+        """Ağacı hesapla ve verilen kullanım sayısıyla önbelleğe ekle"""
+        kok, olcut, izin_maskesi = anahtar
+        if olcut == "sure":
+            mesafeler, ebeveyn = self._graf.en_kisa_sureler(kok, izin_maskesi=izin_maskesi)
+        else:
+            mesafeler, ebeveyn = self._graf.en_az_durak_sayilari(kok, izin_maskesi)
+        agac = EnKisaYolAgaci(self._graf, kok, olcut, izin_maskesi, mesafeler, ebeveyn)
+        self._agaclar[anahtar] = agac
+        self._kovaya_ekle(anahtar, kullanim)
+        if len(self._agaclar) == 1 or kullanim < self._en_az_kullanim:
+            self._en_az_kullanim = kullanim
+        return agac
+    
+    def _en_az_kullanilani_cikar(self):
+        kova = self._kovalar[self._en_az_kullanim]
+        anahtar, _ = kova.popitem(last=False)
+        del self._agaclar[anahtar]
+        if not kova:
+            del self._kovalar[self._en_az_kullanim]
+            if self._kovalar:
+                self._en_az_kullanim = min(self._kovalar)
+    
+    def _kovaya_ekle(self, anahtar: Tuple[int, str, int], kullanim: int):
+        self._kovalar.setdefault(kullanim, OrderedDict())[anahtar] = None
+    
+    def _kovadan_cikar(self, anahtar: Tuple[int, str, int], kullanim: int):
+        kova = self._kovalar[kullanim]
+        del kova[anahtar]
+        if not kova:
+            del self._kovalar[kullanim]
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple
 
 
 class AktarmaIndirimi(ABC):
@@ -25,6 +25,15 @@ class AktarmaIndirimi(ABC):
     def indirim_tipi(self) -> str:
         """İndirim tipini döndür"""
         pass
+    
+    def tablolanabilir(self) -> bool:
+        """
+        İndirim sabit bir tabloya derlenebilir mi?
+        
+        Sonucu yalnızca taşıma tiplerine ve ücrete bağlı olan kurallar için True.
+        Dış duruma (saat, kampanya vb.) bağlı kurallar False döndürmelidir.
+        """
+        return True
 
 
 class OtobusTramvayIndirimi(AktarmaIndirimi):
@@ -112,9 +121,22 @@ class NegatifUcretIndirimi(AktarmaIndirimi):
 class AktarmaIndirimYoneticisi:
     """Aktarma indirimlerini yöneten sınıf"""
     
+    # Tabloya derlenen taşıma tipleri (çağıranların kullandığı yazımlar)
+    TABLO_TIPLERI = ("otobus", "otobüs", "tramvay", "taksi", "yurume", "")
+    
+    # Doğrusallık kontrolü için deneme ücretleri
+    _DENEME_UCRETLERI = (2.5, 10.0, 100.0)
+    
     def __init__(self):
         self._indirimler: List[AktarmaIndirimi] = []
+        self._tip_indeksi: Dict[str, int] = {
+            tip: i for i, tip in enumerate(self.TABLO_TIPLERI)
+        }
+        # (baslangic, hedef) -> (carpan, sabit, aciklama); None = yavaş yol
+        self._tablo: List[Optional[Tuple[float, float, Optional[str]]]] = []
+        self._surum = 0  # Her derlemede artar (önbellek geçersizleme için)
         self._varsayilan_indirimleri_ekle()
+        self.tablo_derle()
     
     def _varsayilan_indirimleri_ekle(self):
         """Varsayılan indirim stratejilerini ekle"""
@@ -127,6 +149,55 @@ class AktarmaIndirimYoneticisi:
     def indirim_ekle(self, indirim: AktarmaIndirimi):
         """Yeni bir indirim stratejisi ekle"""
         self._indirimler.append(indirim)
+        self.tablo_derle()
+    
+    def tablo_derle(self):
+        """
+        Kayıtlı indirimleri (baslangic_tipi, hedef_tipi) -> (carpan, sabit, aciklama)
+        tablosuna derle
+        
+        Her tip çifti için kurallar ücretin doğrusal bir fonksiyonu olarak ölçülür.
+        Çift için en fazla bir kural etkiliyse sonuç tabloya yazılır; doğrusal
+        olmayan, birden fazla etkili kuralı olan veya tablolanamayan kurallar
+        içeren çiftler yavaş yola (tüm kuralları tek tek deneme) bırakılır.
+        """
+        tip_sayisi = len(self.TABLO_TIPLERI)
+        tablo: List[Optional[Tuple[float, float, Optional[str]]]] = [None] * (tip_sayisi * tip_sayisi)
+        
+        if all(indirim.tablolanabilir() for indirim in self._indirimler):
+            for i, baslangic_tipi in enumerate(self.TABLO_TIPLERI):
+                for j, hedef_tipi in enumerate(self.TABLO_TIPLERI):
+                    tablo[i * tip_sayisi + j] = self._cift_derle(baslangic_tipi, hedef_tipi)
+        
+        self._tablo = tablo
+        self._surum += 1
+    
+    def _cift_derle(self, baslangic_tipi: str,
+                    hedef_tipi: str) -> Optional[Tuple[float, float, Optional[str]]]:
+        """Tek bir tip çifti için tablo girdisini hesapla (None = tablolanamaz)"""
+        girdi: Tuple[float, float, Optional[str]] = (1.0, 0.0, None)
+        
+        for indirim in self._indirimler:
+            sabit = indirim.indirim_uygula(baslangic_tipi, hedef_tipi, 0.0)
+            carpan = indirim.indirim_uygula(baslangic_tipi, hedef_tipi, 1.0) - sabit
+            
+            # Doğrusallığı doğrula
+            for ucret in self._DENEME_UCRETLERI:
+                beklenen = carpan * ucret + sabit
+                gercek = indirim.indirim_uygula(baslangic_tipi, hedef_tipi, ucret)
+                if abs(gercek - beklenen) > 1e-9 * max(1.0, abs(ucret)):
+                    return None
+            
+            # Ücreti değiştirmeyen kural bu çift için etkisiz
+            if abs(carpan - 1.0) < 1e-12 and abs(sabit) < 1e-12:
+                continue
+            
+            # İki etkili kuralın minimumu doğrusal değil
+            if girdi[2] is not None:
+                return None
+            girdi = (carpan, sabit, indirim.indirim_tipi())
+        
+        return girdi
     
     def indirim_hesapla(self, baslangic_tipi: str, hedef_tipi: str, 
                         mevcut_ucret: float) -> tuple[float, Optional[str]]:
@@ -136,6 +207,23 @@ class AktarmaIndirimYoneticisi:
         Returns:
             (indirimli_ucret, indirim_aciklama)
         """
+        i = self._tip_indeksi.get(baslangic_tipi)
+        j = self._tip_indeksi.get(hedef_tipi)
+        if i is not None and j is not None:
+            girdi = self._tablo[i * len(self.TABLO_TIPLERI) + j]
+            if girdi is not None:
+                carpan, sabit, aciklama = girdi
+                if aciklama is not None:
+                    yeni_ucret = mevcut_ucret * carpan + sabit
+                    if yeni_ucret < mevcut_ucret:
+                        return yeni_ucret, aciklama
+                return mevcut_ucret, None
+        
+        return self._indirim_hesapla_yavas(baslangic_tipi, hedef_tipi, mevcut_ucret)
+    
+    def _indirim_hesapla_yavas(self, baslangic_tipi: str, hedef_tipi: str,
+                               mevcut_ucret: float) -> tuple[float, Optional[str]]:
+        """Tablo dışı çiftler için tüm kuralları tek tek dene"""
         en_iyi_ucret = mevcut_ucret
         uygulanan_indirim = None
         
@@ -152,4 +240,7 @@ class AktarmaIndirimYoneticisi:
     @property
     def indirimler(self) -> List[AktarmaIndirimi]:
         return self._indirimler
-
+    
+    @property
+    def surum(self) -> int:
+        return self._surum
@@ -0,0 +1,88 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+@dataclass
+class AramaIzi:
+    """Tek bir noktadan noktaya aramanın genişletme sırası"""
+    baglam: str  # Aramayı yapan strateji (boşsa doğrudan RotaHesaplayici)
+    yontem: str  # "bfs", "dijkstra", "astar" veya "ch"
+    kaynak: str  # Durak ID
+    hedef: str  # Durak ID
+    genisletme_sirasi: List[str] = field(default_factory=list)  # Kuyruktan çıkış sırasıyla durak ID'leri
+
+
+@dataclass
+class AramaIstatistikleri:
+    """
+    Bir rota sorgusunun arama tanılamaları (explain=True)
+    
+    Sayaçlar sorgudaki tüm noktadan noktaya aramaların toplamıdır; en büyük
+    kuyruk boyu tüm aramaların en büyüğüdür. Önbellekteki ağaçtan okunan ve
+    bileşen kontrolüyle elenen çiftlerde arama yapılmaz, sayaçlara eklenmez.
+    """
+    aramalar: int = 0  # Noktadan noktaya arama sayısı
+    cikarilan_dugum: int = 0  # Kuyruktan (BFS'te sıradan) çıkarılan durak
+    gevsetilen_kenar: int = 0  # İncelenen (mod maskesine takılmayan) kenar
+    en_buyuk_kuyruk: int = 0
+    olusturulan_etiket: int = 0  # Mesafesi iyileştirilip kuyruğa eklenen durak
+    onbellek_isabeti: int = 0  # Ağaç önbelleğinden okunan yollar
+    onbellek_iskalamasi: int = 0
+    olusturulan_agac: int = 0  # Iskalamada hesaplanıp önbelleğe eklenen ağaçlar
+    bilesen_elemesi: int = 0  # Ulaşılamaz olduğu bileşenlerden anlaşılıp aranmayan çiftler
+    strateji_sureleri: Dict[str, float] = field(default_factory=dict)  # ms
+    secim_ms: float = 0.0  # Seçeneklerin değerlendirilip en uygunun seçilmesi
+    toplam_ms: float = 0.0
+    izler: Optional[List[AramaIzi]] = None  # None: genişletme sırası tutulmaz
+    baglam: str = ""  # Şu an çalışan strateji (izlere yazılır)
+    
+    def arama_ekle(self, cikarilan: int, gevsetilen: int, en_buyuk_kuyruk: int, etiket: int):
+        self.aramalar += 1
+        self.cikarilan_dugum += cikarilan
+        self.gevsetilen_kenar += gevsetilen
+        self.olusturulan_etiket += etiket
+        if en_buyuk_kuyruk > self.en_buyuk_kuyruk:
+            self.en_buyuk_kuyruk = en_buyuk_kuyruk
+    
+    def iz_baslat(self, yontem: str, kaynak: str, hedef: str) -> Optional[List[str]]:
+        """Yeni aramanın izini aç; iz tutulmuyorsa None (arama döngüsü bu listeye ekler)"""
+        if self.izler is None:
+            return None
+        iz = AramaIzi(self.baglam, yontem, kaynak, hedef)
+        self.izler.append(iz)
+        return iz.genisletme_sirasi
+    
+    def birlestir(self, diger: "AramaIstatistikleri"):
+        """Alt sorgunun (örn. bir stratejinin kendi hesaplayıcısının) sayaçlarını ekle"""
+        self.arama_ekle(diger.cikarilan_dugum, diger.gevsetilen_kenar,
+                        diger.en_buyuk_kuyruk, diger.olusturulan_etiket)
+        self.aramalar += diger.aramalar - 1
+        self.onbellek_isabeti += diger.onbellek_isabeti
+        self.onbellek_iskalamasi += diger.onbellek_iskalamasi
+        self.olusturulan_agac += diger.olusturulan_agac
+        self.bilesen_elemesi += diger.bilesen_elemesi
+        if self.izler is not None and diger.izler:
+            for iz in diger.izler:
+                iz.baglam = iz.baglam or self.baglam
+            self.izler.extend(diger.izler)
+    
+    def ozet(self) -> str:
+        """İnsan okunur tanılama metni"""
+        satirlar = [
+            f"Aramalar: {self.aramalar}, çıkarılan durak: {self.cikarilan_dugum}, "
+            f"gevşetilen kenar: {self.gevsetilen_kenar}",
+            f"En büyük kuyruk: {self.en_buyuk_kuyruk}, oluşturulan etiket: {self.olusturulan_etiket}",
+            f"Ağaç önbelleği: {self.onbellek_isabeti} isabet, {self.onbellek_iskalamasi} ıskalama "
+            f"({self.olusturulan_agac} yeni ağaç), bileşen elemesi: {self.bilesen_elemesi}",
+        ]
+        for strateji, sure in self.strateji_sureleri.items():
+            satirlar.append(f"  {strateji:<40} {sure:>9.3f} ms")
+        if self.secim_ms:
+            satirlar.append(f"  {'(seçim)':<40} {self.secim_ms:>9.3f} ms")
+        satirlar.append(f"Toplam: {self.toplam_ms:.3f} ms")
+        if self.izler is not None:
+            for iz in self.izler:
+                baslik = f"{iz.baglam} / " if iz.baglam else ""
+                satirlar.append(f"İz [{baslik}{iz.yontem}] {iz.kaynak} -> {iz.hedef}: "
+                                f"{' > '.join(iz.genisletme_sirasi)}")
+        return "\n".join(satirlar)
@@ -1,20 +1,46 @@
+import os
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
+from collections import OrderedDict
 from typing import Optional, List
 from konum import Konum
 from yolcu import Yolcu, GenelYolcu, OgrenciYolcu, YasliYolcu, OgretmenYolcu
 from rota import RotaHesaplayici, Rota
-from taksi import Taksi
-from veri_yukleyici import VeriYukleyici
-from hat import HatYoneticisi
-from rota_secenekleri import RotaSecenekleriUretici
 from cuzdan import Cuzdan
 from en_uygun_rota_secici import EnUygunRotaSecici
+from rota_motoru import RotaMotoru
+from arka_plan_isci import ArkaPlanIsci
+from odeme import NakitOdeme, KrediKartiOdeme, KentkartOdeme
+from sonuc_paneli import SonucTamponu, SanalSatirListesi, ETIKET_STILLERI
+from harita_gorunumu import HaritaGorunumu
 
 
 class UlasimArayuzu:
     """Toplu taşıma sistemi kullanıcı arayüzü"""
     
+    SANAL_LISTE_ESIGI = 400  # Bundan uzun sonuçlar sanal listede gösterilir (satır)
+    EN_YAKIN_DURAK_ONBELLEK_BOYUTU = 256
+    DURAK_ONERI_SAYISI = 20  # Hedef durak kutusunda gösterilen öneri sayısı
+    CANLI_GECIKME_MS = 300  # Canlı modda son düzenlemeden sonra hesaplamaya kadar beklenen süre
+    ROTA_ONBELLEK_BOYUTU = 128  # Önbellekte tutulan başlangıç-hedef çifti sayısı
+    
+    _ULASIM_IKONLARI = {
+        "otobus": ("🚌", "Otobüs"),
+        "tramvay": ("🚊", "Tramvay"),
+        "taksi": ("🚕", "Taksi"),
+        "aktarma": ("🔄", "Aktarma"),
+        "bekleme": ("⏳", "Bekleme"),
+    }
+    
+    _ALTERNATIF_ACIKLAMALARI = {
+        "Sadece Taksi": "Daha hızlı, ancak maliyetli",
+        "Sadece Otobüs": "Daha uygun maliyetli, ancak daha uzun sürebilir",
+        "Sadece Tramvay": "Rahat ve dengeli bir ulaşım seçeneği",
+        "Otobüs + Tramvay Aktarması": "Aktarma ile entegre ulaşım - en az aktarmalı rota",
+        "Taksi + Otobüs/Tramvay Kombinasyonu": "Daha hızlı, ancak maliyetli",
+        EnUygunRotaSecici.BUTCELI_ROTA_ADI: "Bakiyenizle ödenebilecek en hızlı rota"
+    }
+    
     def __init__(self, root: tk.Tk):
         self.root = root
         self.root.title("🚌 İzmit Toplu Taşıma Rota Planlayıcı")
@@ -37,42 +63,46 @@ class UlasimArayuzu:
         # Modern tema ayarları
         self._modern_tema_ayarla()
         
-        # Veri yükleme
-        import os
-        # Dosya adını bul (encoding sorunları için)
-        dosya_yolu = None
-        for f in os.listdir('.'):
-            if f.endswith('.txt') and ('VER' in f.upper() or 'SET' in f.upper() or 'PROLAB' in f.upper()):
-                dosya_yolu = f
-                break
-        
-        if not dosya_yolu:
+        # Rota motoru: veri seti, hatlar ve hesaplayıcılar arayüzden bağımsız kurulur
+        try:
+            self.motor = RotaMotoru(onbellegi_isit=True,
+                                    sorgu_kaydi_dosyasi=os.environ.get("ROTA_SORGU_KAYDI"))
+        except FileNotFoundError:
             messagebox.showerror("Hata", "Veri dosyası bulunamadı!")
             return
-        
-        self.veri_yukleyici = VeriYukleyici(dosya_yolu)
-        if not self.veri_yukleyici.veri_yukle():
-            messagebox.showerror("Hata", f"Veri dosyası yüklenemedi!\nDosya: {dosya_yolu}")
+        except ValueError as e:
+            messagebox.showerror("Hata", f"Veri dosyası yüklenemedi!\n{e}")
             return
         
-        self.veri_yukleyici.duraklari_olustur()
-        self.hat_yoneticisi = HatYoneticisi(self.veri_yukleyici.duraklar)
+        self.veri_yukleyici = self.motor.veri_yukleyici
+        self.hat_yoneticisi = self.motor.hat_yoneticisi
+        self.taksi = self.motor.taksi
+        self.rota_hesaplayici = self.motor.rota_hesaplayici
+        self.rota_secenekleri_uretici = self.motor.rota_secenekleri_uretici
+        self.en_uygun_rota_secici = self.motor.en_uygun_rota_secici
+        self.ucret_motoru = self.motor.ucret_motoru
         
-        # Taksi bilgisi
-        taksi_bilgi = self.veri_yukleyici.taksi_bilgisi
-        self.taksi = Taksi(
-            acilis_ucreti=taksi_bilgi.get("openingFee", 10),
-            km_basina_ucret=taksi_bilgi.get("costPerKm", 4)
-        )
-        
-        # Rota hesaplayıcı
-        self.rota_hesaplayici = RotaHesaplayici(self.hat_yoneticisi, self.taksi)
+        # Sonuç gösteriminde kullanılan nesneler her gösterimde yeniden oluşturulmaz
+        self._yolcu_nesneleri = {
+            "Öğrenci": OgrenciYolcu(),
+            "Öğretmen": OgretmenYolcu(),
+            "65 Yaş Üstü": YasliYolcu()
+        }
+        self._odeme_nesneleri = {
+            "nakit": NakitOdeme(),
+            "kredi_karti": KrediKartiOdeme(),
+            "kentkart": KentkartOdeme()
+        }
+        self._en_yakin_durak_onbellegi = {}
         
-        # Rota seçenekleri üretici
-        self.rota_secenekleri_uretici = RotaSecenekleriUretici(self.hat_yoneticisi, self.taksi)
+        # (başlangıç, hedef) -> rota seçenekleri; yalnızca arka plan işçisinde okunup yazılır
+        self._rota_onbellegi: "OrderedDict" = OrderedDict()
+        self._canli_zamanlayici = None
         
-        # En uygun rota seçici
-        self.en_uygun_rota_secici = EnUygunRotaSecici(self.rota_secenekleri_uretici)
+        # Ağ haritası penceresi ilk açılışta oluşturulur; son rota açılışta vurgulanır
+        self._harita_penceresi = None
+        self._harita = None
+        self._son_rota = None
         
         # Arayüzü oluştur
         self._arayuzu_olustur()
@@ -188,11 +218,12 @@ class UlasimArayuzu:
         self.hedef_boylam.grid(row=4, column=3, padx=5, pady=5)
         self.hedef_boylam.insert(0, "29.9387")  # Örnek değer
         
-        # Durak seçimi
+        # Durak seçimi (yazdıkça isim dizininden öneri listesi güncellenir)
         durak_listesi = [durak.isim for durak in self.veri_yukleyici.duraklar.values()]
-        self.hedef_durak = ttk.Combobox(konum_frame, values=durak_listesi, 
-                                       state="readonly", width=40, font=("Segoe UI", 9))
+        self.hedef_durak = ttk.Combobox(konum_frame, values=durak_listesi[:self.DURAK_ONERI_SAYISI], 
+                                       width=40, font=("Segoe UI", 9))
         self.hedef_durak.grid(row=4, column=1, columnspan=3, padx=5, pady=5, sticky=(tk.W, tk.E))
+        self.hedef_durak.bind("<KeyRelease>", self._durak_onerilerini_guncelle)
         self.hedef_durak.grid_remove()  # Başlangıçta gizli
         
         # Yolcu bilgileri frame
@@ -318,6 +349,50 @@ class UlasimArayuzu:
                           activeforeground="white")
         buton5.pack(side=tk.LEFT, padx=5)
         
+        buton6 = tk.Button(buton_frame,
+                          text="🗺️ Harita",
+                          command=self._harita_ac,
+                          font=("Segoe UI", 10),
+                          bg=self.renkler["ana"],
+                          fg="white",
+                          relief="flat",
+                          padx=15,
+                          pady=10,
+                          cursor="hand2",
+                          activebackground="#1a252f",
+                          activeforeground="white")
+        buton6.pack(side=tk.LEFT, padx=5)
+        
+        # Canlı mod: girişler düzenlendikçe rota otomatik hesaplanır
+        self.canli_mod = tk.BooleanVar(value=False)
+        canli_kutusu = tk.Checkbutton(buton_frame, text="⚡ Canlı",
+                                      variable=self.canli_mod,
+                                      command=self._canli_mod_degisti,
+                                      font=("Segoe UI", 10),
+                                      bg=self.renkler["arka_plan"],
+                                      activebackground=self.renkler["arka_plan"],
+                                      cursor="hand2")
+        canli_kutusu.pack(side=tk.LEFT, padx=(15, 5))
+        
+        # Hesaplama ilerleme göstergesi (rota motoru arka planda çalışır)
+        self.ilerleme = ttk.Progressbar(buton_frame, mode="indeterminate", length=120)
+        self.ilerleme.pack(side=tk.LEFT, padx=(15, 5))
+        self.durum_label = tk.Label(buton_frame, text="",
+                                    font=("Segoe UI", 9),
+                                    bg=self.renkler["arka_plan"],
+                                    fg=self.renkler["koyu_gri"])
+        self.durum_label.pack(side=tk.LEFT, padx=5)
+        self.arka_plan_isci = ArkaPlanIsci(self.root, self._ilerleme_baslat, self._ilerleme_bitir)
+        self.root.protocol("WM_DELETE_WINDOW", self._kapat)
+        
+        # Canlı mod için giriş değişikliklerini dinle
+        for giris in (self.baslangic_enlem, self.baslangic_boylam, self.hedef_enlem,
+                      self.hedef_boylam, self.nakit, self.kredi_karti, self.kentkart):
+            giris.bind("<KeyRelease>", self._canli_degisiklik, add="+")
+        self.hedef_durak.bind("<KeyRelease>", self._canli_degisiklik, add="+")
+        for secim in (self.hedef_tipi, self.hedef_durak, self.yolcu_tipi, self.odeme_yontemi):
+            secim.bind("<<ComboboxSelected>>", self._canli_degisiklik, add="+")
+        
         # Sonuçlar frame
         sonuc_frame = ttk.LabelFrame(ana_frame, text="📋 Rota Detayları", 
                                      style="Modern.TLabelframe", padding="15")
@@ -338,6 +413,14 @@ class UlasimArayuzu:
                                                   padx=10,
                                                   pady=10)
         self.ozet_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        for etiket, stil in ETIKET_STILLERI.items():
+            self.ozet_text.tag_configure(etiket, **stil)
+        
+        # Uzun sonuçlar için yalnızca görünen satırları çizen liste (gerektiğinde gösterilir)
+        self.sanal_liste = SanalSatirListesi(sonuc_frame, etiket_stilleri=ETIKET_STILLERI,
+                                             bg=self.renkler["beyaz"])
+        self.sanal_liste.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.sanal_liste.grid_remove()
         
         # Grid ağırlıkları
         self.root.columnconfigure(0, weight=1)
@@ -347,6 +430,32 @@ class UlasimArayuzu:
         sonuc_frame.columnconfigure(0, weight=1)
         sonuc_frame.rowconfigure(0, weight=1)
     
+    def _ilerleme_baslat(self):
+        """Arka plan hesaplaması başladığında ilerleme göstergesini çalıştır"""
+        self.ilerleme.start(15)
+        self.durum_label.config(text="⏳ Hesaplanıyor...")
+    
+    def _ilerleme_bitir(self):
+        """Arka plan hesaplaması bittiğinde veya iptal edildiğinde göstergeyi durdur"""
+        self.ilerleme.stop()
+        self.durum_label.config(text="")
+    
+    def _hesaplama_hatasi(self, e: Exception):
+        """Arka plan hesaplamasındaki hatayı ana iş parçacığında göster"""
+        if isinstance(e, ValueError):
+            messagebox.showerror("Hata", f"Geçersiz sayısal değer: {str(e)}\nLütfen tüm alanları kontrol edin!")
+        elif isinstance(e, AttributeError):
+            messagebox.showerror("Hata", f"Arayüz hatası: {str(e)}")
+        else:
+            messagebox.showerror("Hata", f"Bir hata oluştu: {str(e)}")
+            import traceback
+            print("".join(traceback.format_exception(type(e), e, e.__traceback__)))
+    
+    def _kapat(self):
+        """Pencereyi kapat - çalışan hesaplamayı iptal ederek"""
+        self.arka_plan_isci.kapat()
+        self.root.destroy()
+    
     def _hedef_tipi_degisti(self, event=None):
         """Hedef tipi değiştiğinde arayüzü güncelle"""
         if self.hedef_tipi.get() == "Koordinat":
@@ -360,6 +469,21 @@ class UlasimArayuzu:
             self.hedef_boylam.grid_remove()
             self.hedef_durak.grid()
     
+    def _durak_onerilerini_guncelle(self, event=None):
+        """Hedef durak kutusuna yazılan metne göre öneri listesini güncelle"""
+        if event is not None and event.keysym in ("Up", "Down", "Escape", "Tab"):
+            return
+        metin = self.hedef_durak.get()
+        if not metin.strip():
+            self.hedef_durak["values"] = []
+            return
+        dizin = self.hat_yoneticisi.durak_adi_dizini
+        oneriler = dizin.oneriler(metin, self.DURAK_ONERI_SAYISI)
+        # Yazım hatalarına dayanıklı (daha yavaş) bulanık arama yalnızca Enter ile
+        if not oneriler and event is not None and event.keysym == "Return":
+            oneriler = dizin.bulanik_ara(metin, self.DURAK_ONERI_SAYISI)
+        self.hedef_durak["values"] = oneriler
+    
     def _hedef_konumu_al(self) -> Optional[Konum]:
         """Hedef konumu al (koordinat veya durak adından)"""
         try:
@@ -382,10 +506,17 @@ class UlasimArayuzu:
                     durak_adi = self.hedef_durak.get().strip() if hasattr(self.hedef_durak, 'get') else ""
                     if not durak_adi:
                         return None
-                    for durak_id, durak in self.veri_yukleyici.duraklar.items():
-                        if durak.isim == durak_adi:
-                            return Konum(durak.enlem, durak.boylam, durak.isim)
-                    return None
+                    # Büyük/küçük harf ve aksan farkı gözetilmez; tam eşleşme yoksa en iyi
+                    # önek eşleşmesi, o da yoksa en benzer isim
+                    dizin = self.hat_yoneticisi.durak_adi_dizini
+                    durak_id = dizin.durak_bul(durak_adi)
+                    if durak_id is None:
+                        oneriler = dizin.oneriler(durak_adi, 1) or dizin.bulanik_ara(durak_adi, 1)
+                        if not oneriler:
+                            return None
+                        durak_id = dizin.durak_bul(oneriler[0])
+                    durak = self.hat_yoneticisi.durak_getir(durak_id)
+                    return Konum(durak.enlem, durak.boylam, durak.isim)
                 except (AttributeError, tk.TclError):
                     return None
         except Exception:
@@ -441,13 +572,8 @@ class UlasimArayuzu:
             }
             odeme_yontemi = odeme_yontemi_map.get(self.odeme_yontemi.get(), "nakit")
             
-            # En uygun rotayı bul
-            en_uygun_rota, tum_secenekler = self.en_uygun_rota_secici.en_uygun_rotayi_bul(
-                baslangic_konum, hedef_konum, cuzdan, odeme_yontemi, "maliyet"
-            )
-            
-            # Sonuçları göster
-            self._en_uygun_rota_goster(en_uygun_rota, tum_secenekler, cuzdan, odeme_yontemi)
+            # En uygun rotayı arka planda bul, sonuçları ana iş parçacığında göster
+            self._en_uygun_rota_hesapla(baslangic_konum, hedef_konum, cuzdan, odeme_yontemi)
         
         except ValueError as e:
             messagebox.showerror("Hata", f"Geçersiz sayısal değer: {str(e)}\nLütfen tüm alanları kontrol edin!")
@@ -458,160 +584,221 @@ class UlasimArayuzu:
             import traceback
             print(traceback.format_exc())
     
-    def _en_uygun_rota_goster(self, en_uygun_rota: Optional[Rota], 
+    def _en_uygun_rota_hesapla(self, baslangic_konum: Konum, hedef_konum: Konum,
+                               cuzdan: Cuzdan, odeme_yontemi: str):
+        """En uygun rotayı arka planda bul, sonuçları ana iş parçacığında göster"""
+        def hesapla(belirtec):
+            tum_secenekler = self._rota_secenekleri_getir(baslangic_konum, hedef_konum)
+            belirtec.kontrol()
+            return self.en_uygun_rota_secici.secenekleri_degerlendir(
+                baslangic_konum, hedef_konum, tum_secenekler, cuzdan, odeme_yontemi, "maliyet"
+            )
+        
+        def goster(sonuc):
+            en_uygun_rota, tum_secenekler = sonuc
+            self._en_uygun_rota_goster(baslangic_konum, en_uygun_rota, tum_secenekler, cuzdan, odeme_yontemi)
+            self._haritada_goster(en_uygun_rota, baslangic_konum, hedef_konum)
+        
+        self.arka_plan_isci.calistir(hesapla, goster, self._hesaplama_hatasi)
+    
+    def _rota_secenekleri_getir(self, baslangic_konum: Konum, hedef_konum: Konum) -> List:
+        """
+        Rota seçenekleri - aynı başlangıç/hedef için önbellekten (arka plan işçisinde çağrılır)
+        
+        Seçenekler cüzdandan bağımsızdır; cüzdan veya ödeme yöntemi değiştiğinde
+        yalnızca ödeme kontrolü yeniden yapılır.
+        """
+        anahtar = (baslangic_konum.enlem, baslangic_konum.boylam, hedef_konum.enlem, hedef_konum.boylam)
+        tum_secenekler = self._rota_onbellegi.get(anahtar)
+        if tum_secenekler is not None:
+            self._rota_onbellegi.move_to_end(anahtar)
+            return tum_secenekler
+        tum_secenekler = self.rota_secenekleri_uretici.tum_rota_secenekleri_olustur(
+            baslangic_konum, hedef_konum
+        )
+        self._rota_onbellegi[anahtar] = tum_secenekler
+        if len(self._rota_onbellegi) > self.ROTA_ONBELLEK_BOYUTU:
+            self._rota_onbellegi.popitem(last=False)
+        return tum_secenekler
+    
+    def _canli_mod_degisti(self):
+        """Canlı mod açıldığında mevcut girişlerle hemen hesapla"""
+        if self.canli_mod.get():
+            self._canli_degisiklik()
+        elif self._canli_zamanlayici is not None:
+            self.root.after_cancel(self._canli_zamanlayici)
+            self._canli_zamanlayici = None
+    
+    def _canli_degisiklik(self, event=None):
+        """Canlı modda giriş değişikliği: hesaplamayı kısa bir gecikmeyle (debounce) planla"""
+        if not self.canli_mod.get():
+            return
+        if self._canli_zamanlayici is not None:
+            self.root.after_cancel(self._canli_zamanlayici)
+        self._canli_zamanlayici = self.root.after(self.CANLI_GECIKME_MS, self._canli_guncelle)
+    
+    def _canli_guncelle(self):
+        """Canlı mod: girişler geçerliyse en uygun rotayı hesapla (hata penceresi açmadan)"""
+        self._canli_zamanlayici = None
+        try:
+            baslangic_konum = Konum(float(self.baslangic_enlem.get()),
+                                    float(self.baslangic_boylam.get()), "Başlangıç")
+            cuzdan = Cuzdan(nakit=float((self.nakit.get() or "").strip() or "0"),
+                            kredi_karti_limiti=float((self.kredi_karti.get() or "").strip() or "0"),
+                            kentkart_bakiyesi=float((self.kentkart.get() or "").strip() or "0"))
+        except (ValueError, tk.TclError):
+            self.durum_label.config(text="✎ Girişler eksik veya geçersiz")
+            return
+        hedef_konum = self._hedef_konumu_al()
+        if not hedef_konum:
+            self.durum_label.config(text="✎ Girişler eksik veya geçersiz")
+            return
+        
+        odeme_yontemi_map = {
+            "Nakit": "nakit",
+            "Kredi Kartı": "kredi_karti",
+            "Kentkart": "kentkart"
+        }
+        odeme_yontemi = odeme_yontemi_map.get(self.odeme_yontemi.get(), "nakit")
+        self._en_uygun_rota_hesapla(baslangic_konum, hedef_konum, cuzdan, odeme_yontemi)
+    
+    def _en_uygun_rota_goster(self, baslangic_konum: Konum, en_uygun_rota: Optional[Rota],
                              tum_secenekler: List, cuzdan: Cuzdan, odeme_yontemi: str):
         """En uygun rota sonuçlarını göster - detaylı format"""
-        self.ozet_text.delete(1.0, tk.END)
+        tampon = SonucTamponu()
         
         # Başlangıç konumuna en yakın durak
-        try:
-            baslangic_enlem = float(self.baslangic_enlem.get())
-            baslangic_boylam = float(self.baslangic_boylam.get())
-            baslangic_konum = Konum(baslangic_enlem, baslangic_boylam, "Başlangıç")
-            
-            from mesafe_hesaplayici import MesafeHesaplayici
-            en_yakin_durak_id, mesafe = self.rota_hesaplayici._en_yakin_durak_bul(
-                baslangic_konum.enlem, baslangic_konum.boylam
-            )
-            
-            if en_yakin_durak_id:
-                durak = self.hat_yoneticisi.durak_getir(en_yakin_durak_id)
-                mesafe_metre = mesafe * 1000
-                self.ozet_text.insert(tk.END, "🔴 KULLANICI KONUMUNA EN YAKIN DURAK:\n")
-                self.ozet_text.insert(tk.END, f"📍 {durak.isim} ({mesafe_metre:.0f} m)\n")
-                if mesafe <= 3.0:
-                    self.ozet_text.insert(tk.END, f"🚶 Yürüme = 0 TL\n")
-                else:
-                    taksi_ucret = self.taksi.ucret_hesapla(mesafe)
-                    self.ozet_text.insert(tk.END, f"🚕 Taksi = {taksi_ucret:.2f} TL\n")
-                self.ozet_text.insert(tk.END, "\n" + "=" * 70 + "\n\n")
-        except:
-            pass
+        en_yakin_durak = self._en_yakin_durak_metni(baslangic_konum, "🔴 KULLANICI KONUMUNA EN YAKIN DURAK:\n📍 ")
+        if en_yakin_durak:
+            tampon.ekle(en_yakin_durak)
+            tampon.ekle("\n" + "=" * 70 + "\n\n", "ayirici")
         
         # En uygun rota detayları
         if en_uygun_rota:
-            self.ozet_text.insert(tk.END, "🔵 ROTA DETAYLARI:\n\n")
-            self._detayli_rota_goster(en_uygun_rota)
+            tampon.ekle("🔵 ROTA DETAYLARI:\n\n", "baslik")
+            self._detayli_rota_goster(tampon, en_uygun_rota)
             
             # Toplam
-            self.ozet_text.insert(tk.END, "\n" + "=" * 70 + "\n")
-            self.ozet_text.insert(tk.END, "📊 TOPLAM:\n")
-            self.ozet_text.insert(tk.END, f"💰 Ücret: {en_uygun_rota.toplam_ucret:.2f} TL\n")
+            tampon.ekle("\n" + "=" * 70 + "\n", "ayirici")
+            tampon.ekle("📊 TOPLAM:\n", "baslik")
+            tampon.ekle(f"💰 Ücret: {en_uygun_rota.toplam_ucret:.2f} TL\n")
             
             # Yolcu indirimi varsa göster
             yolcu_tipi = self.yolcu_tipi.get()
-            if yolcu_tipi != "Genel":
-                from yolcu import OgrenciYolcu, OgretmenYolcu, YasliYolcu
-                yolcu_map = {
-                    "Öğrenci": OgrenciYolcu(),
-                    "Öğretmen": OgretmenYolcu(),
-                    "65 Yaş Üstü": YasliYolcu()
-                }
-                yolcu = yolcu_map.get(yolcu_tipi)
-                if yolcu:
-                    indirimli_ucret = yolcu.indirimli_ucret_hesapla(en_uygun_rota.toplam_ucret)
-                    indirim_miktari = en_uygun_rota.toplam_ucret - indirimli_ucret
-                    indirim_yuzdesi = yolcu.indirim_orani() * 100
-                    self.ozet_text.insert(tk.END, f"   ({yolcu_tipi} %{indirim_yuzdesi:.0f} → {indirimli_ucret:.2f} TL)\n")
-            
-            self.ozet_text.insert(tk.END, f"⏱️  Süre: {en_uygun_rota.toplam_sure:.1f} dk\n")
-            self.ozet_text.insert(tk.END, f"📏 Mesafe: {en_uygun_rota.toplam_mesafe:.2f} km\n")
-            self.ozet_text.insert(tk.END, f"🔄 Aktarma Sayısı: {en_uygun_rota.aktarma_sayisi}\n")
+            yolcu = self._yolcu_nesneleri.get(yolcu_tipi)
+            if yolcu:
+                indirimli_ucret = yolcu.indirimli_ucret_hesapla(en_uygun_rota.toplam_ucret)
+                indirim_yuzdesi = yolcu.indirim_orani() * 100
+                tampon.ekle(f"   ({yolcu_tipi} %{indirim_yuzdesi:.0f} → {indirimli_ucret:.2f} TL)\n")
+            
+            tampon.ekle(f"⏱️  Süre: {en_uygun_rota.toplam_sure:.1f} dk\n"
+                        f"📏 Mesafe: {en_uygun_rota.toplam_mesafe:.2f} km\n"
+                        f"🔄 Aktarma Sayısı: {en_uygun_rota.aktarma_sayisi}\n")
         
         # Alternatif rotalar
-        self.ozet_text.insert(tk.END, "\n" + "=" * 70 + "\n")
-        self.ozet_text.insert(tk.END, "🌳 ALTERNATİF ROTALAR:\n\n")
-        self._alternatif_rotalari_goster(tum_secenekler, cuzdan, odeme_yontemi)
+        tampon.ekle("\n" + "=" * 70 + "\n", "ayirici")
+        tampon.ekle("🌳 ALTERNATİF ROTALAR:\n\n", "baslik")
+        self._alternatif_rotalari_goster(tampon, tum_secenekler, cuzdan, odeme_yontemi)
+        
+        self._sonucu_goster(tampon)
+    
+    def _en_yakin_durak_metni(self, konum: Konum, onek: str) -> str:
+        """Konuma en yakın durak ve oraya yürüme/taksi bilgisi (durak yoksa boş)"""
+        en_yakin_durak_id, mesafe = self._en_yakin_durak_getir(konum)
+        if not en_yakin_durak_id:
+            return ""
+        durak = self.hat_yoneticisi.durak_getir(en_yakin_durak_id)
+        metin = f"{onek}{durak.isim} ({mesafe * 1000:.0f} m)\n"
+        if mesafe <= 3.0:
+            return metin + "🚶 Yürüme = 0 TL\n"
+        return metin + f"🚕 Taksi = {self.taksi.ucret_hesapla(mesafe):.2f} TL\n"
+    
+    def _en_yakin_durak_getir(self, konum: Konum):
+        """En yakın durak ve mesafesi - aynı konum için tekrar hesaplanmaz"""
+        anahtar = (konum.enlem, konum.boylam)
+        sonuc = self._en_yakin_durak_onbellegi.get(anahtar)
+        if sonuc is None:
+            if len(self._en_yakin_durak_onbellegi) >= self.EN_YAKIN_DURAK_ONBELLEK_BOYUTU:
+                self._en_yakin_durak_onbellegi.clear()
+            sonuc = self.rota_hesaplayici.en_yakin_durak_bul(konum.enlem, konum.boylam)
+            self._en_yakin_durak_onbellegi[anahtar] = sonuc
+        return sonuc
     
-    def _detayli_rota_goster(self, rota: Rota):
+    def _sonucu_goster(self, tampon: SonucTamponu):
+        """
+        Tamponu sonuç paneline yaz
+        
+        Kısa sonuçlar Text bileşenine tek bir insert çağrısıyla (etiketleriyle)
+        yazılır; çok satırlı sonuçlar yalnızca görünen satırları çizen sanal
+        listede gösterilir.
+        """
+        self.ozet_text.delete(1.0, tk.END)
+        if tampon.satir_sayisi > self.SANAL_LISTE_ESIGI:
+            self.ozet_text.grid_remove()
+            self.sanal_liste.grid()
+            self.sanal_liste.satirlari_ayarla(tampon.satirlar())
+        else:
+            self.sanal_liste.grid_remove()
+            self.sanal_liste.temizle()
+            self.ozet_text.grid()
+            argumanlar = tampon.metin_argumanlari()
+            if argumanlar:
+                self.ozet_text.insert(tk.END, *argumanlar)
+    
+    def _detayli_rota_goster(self, tampon: SonucTamponu, rota: Rota):
         """Detaylı rota gösterimi - örnek çıktı formatına uygun"""
         yolcu_tipi = self.yolcu_tipi.get()
+        yolcu = self._yolcu_nesneleri.get(yolcu_tipi)
+        if yolcu:
+            indirim_yuzdesi = yolcu.indirim_orani() * 100
         
         for i, adim in enumerate(rota.adimlar, 1):
-            # Başlangıç ve hedef
-            baslangic = adim.baslangic if adim.baslangic != "konum" else "Konum"
-            hedef = adim.hedef if adim.hedef != "konum" else "Konum"
-            
-            # Durak isimlerini al
-            if adim.baslangic != "konum":
-                baslangic_durak = self.hat_yoneticisi.durak_getir(adim.baslangic)
-                baslangic = baslangic_durak.isim if baslangic_durak else adim.baslangic
-            
-            if adim.hedef != "konum":
-                hedef_durak = self.hat_yoneticisi.durak_getir(adim.hedef)
-                hedef = hedef_durak.isim if hedef_durak else adim.hedef
+            # Başlangıç ve hedef (durak isimleriyle)
+            baslangic = self._durak_adi(adim.baslangic)
+            hedef = self._durak_adi(adim.hedef)
             
             # İkon seçimi
-            if adim.ulasim_tipi == "otobus":
-                ikon = "🚌"
-                tasima_adi = "Otobüs"
-            elif adim.ulasim_tipi == "tramvay":
-                ikon = "🚊"
-                tasima_adi = "Tramvay"
-            elif adim.ulasim_tipi == "taksi":
-                ikon = "🚕"
-                tasima_adi = "Taksi"
-            elif adim.ulasim_tipi == "aktarma":
-                ikon = "🔄"
-                tasima_adi = "Aktarma"
-            else:
-                ikon = "🚶"
-                tasima_adi = "Yürüme"
+            ikon, tasima_adi = self._ULASIM_IKONLARI.get(adim.ulasim_tipi, ("🚶", "Yürüme"))
             
-            self.ozet_text.insert(tk.END, f"{i}. {baslangic} → {hedef} ({ikon} {tasima_adi})\n")
+            tampon.ekle(f"{i}. {baslangic} → {hedef} ({ikon} {tasima_adi})\n", "vurgu")
             
             # Süre
-            self.ozet_text.insert(tk.END, f"   ⏱️  Süre: {adim.sure:.0f} dk\n")
+            satirlar = [f"   ⏱️  Süre: {adim.sure:.0f} dk\n"]
             
             # Ücret
             if adim.ucret > 0:
                 ucret_metni = f"   💰 Ücret: {adim.ucret:.2f} TL"
                 
                 # Yolcu indirimi göster
-                if yolcu_tipi != "Genel" and adim.ulasim_tipi in ["otobus", "tramvay", "aktarma"]:
-                    from yolcu import OgrenciYolcu, OgretmenYolcu, YasliYolcu
-                    yolcu_map = {
-                        "Öğrenci": OgrenciYolcu(),
-                        "Öğretmen": OgretmenYolcu(),
-                        "65 Yaş Üstü": YasliYolcu()
-                    }
-                    yolcu = yolcu_map.get(yolcu_tipi)
-                    if yolcu:
-                        indirimli = yolcu.indirimli_ucret_hesapla(adim.ucret)
-                        indirim_yuzdesi = yolcu.indirim_orani() * 100
-                        ucret_metni += f" ({yolcu_tipi} %{indirim_yuzdesi:.0f} → {indirimli:.2f} TL)"
+                if yolcu and adim.ulasim_tipi in ("otobus", "tramvay", "aktarma"):
+                    indirimli = yolcu.indirimli_ucret_hesapla(adim.ucret)
+                    ucret_metni += f" ({yolcu_tipi} %{indirim_yuzdesi:.0f} → {indirimli:.2f} TL)"
                 
-                self.ozet_text.insert(tk.END, ucret_metni + "\n")
+                satirlar.append(ucret_metni + "\n")
             elif adim.ucret == 0:
-                self.ozet_text.insert(tk.END, f"   💰 Ücret: 0 TL\n")
+                satirlar.append("   💰 Ücret: 0 TL\n")
             else:
                 # Negatif ücret (teşvik)
-                self.ozet_text.insert(tk.END, f"   💰 Teşvik: {abs(adim.ucret):.2f} TL iade\n")
+                satirlar.append(f"   💰 Teşvik: {abs(adim.ucret):.2f} TL iade\n")
             
             # Mesafe (varsa)
             if adim.mesafe > 0:
-                self.ozet_text.insert(tk.END, f"   📏 Mesafe: {adim.mesafe:.2f} km\n")
+                satirlar.append(f"   📏 Mesafe: {adim.mesafe:.2f} km\n")
             
-            self.ozet_text.insert(tk.END, "\n")
+            satirlar.append("\n")
+            tampon.ekle("".join(satirlar))
     
-    def _alternatif_rotalari_goster(self, tum_secenekler: List, cuzdan: Cuzdan, odeme_yontemi: str):
+    def _durak_adi(self, durak_id: str) -> str:
+        """Adımdaki durak kimliğinin gösterim adı ("konum" için "Konum")"""
+        if durak_id == "konum":
+            return "Konum"
+        durak = self.hat_yoneticisi.durak_getir(durak_id)
+        return durak.isim if durak else durak_id
+    
+    def _alternatif_rotalari_goster(self, tampon: SonucTamponu, tum_secenekler: List,
+                                    cuzdan: Cuzdan, odeme_yontemi: str):
         """Alternatif rotaları detaylı göster"""
-        from odeme import NakitOdeme, KrediKartiOdeme, KentkartOdeme
-        
-        odeme_yontemi_map = {
-            "nakit": NakitOdeme(),
-            "kredi_karti": KrediKartiOdeme(),
-            "kentkart": KentkartOdeme()
-        }
-        odeme_obj = odeme_yontemi_map.get(odeme_yontemi, NakitOdeme())
-        
-        alternatif_aciklamalari = {
-            "Sadece Taksi": "Daha hızlı, ancak maliyetli",
-            "Sadece Otobüs": "Daha uygun maliyetli, ancak daha uzun sürebilir",
-            "Sadece Tramvay": "Rahat ve dengeli bir ulaşım seçeneği",
-            "Otobüs + Tramvay Aktarması": "Aktarma ile entegre ulaşım - en az aktarmalı rota",
-            "Taksi + Otobüs/Tramvay Kombinasyonu": "Daha hızlı, ancak maliyetli"
-        }
+        odeme_obj = self._odeme_nesneleri.get(odeme_yontemi, self._odeme_nesneleri["nakit"])
         
         for secenek in tum_secenekler:
             # Handle both 2-value and 3-value tuples
@@ -619,41 +806,38 @@ class UlasimArayuzu:
                 strateji_adi, rota, odeme_yapilabilir = secenek
             elif len(secenek) == 2:
                 strateji_adi, rota = secenek
-                # Calculate payment status if not provided
-                if rota:
-                    komisyonlu_tutar = odeme_obj.komisyonlu_tutar_hesapla(rota.toplam_ucret)
-                    odeme_yapilabilir = cuzdan.odeme_yapabilir_mi(komisyonlu_tutar, odeme_yontemi)
-                else:
-                    odeme_yapilabilir = False
-                    komisyonlu_tutar = 0.0
+                odeme_yapilabilir = None
             else:
                 continue  # Skip invalid entries
-            if rota:
-                durum_ikon = "✓" if odeme_yapilabilir else "✗"
-                durum_metin = "Ödeme Yapılabilir" if odeme_yapilabilir else "Yetersiz Bakiye"
-                
-                # Calculate komisyonlu_tutar if not already calculated (for 3-value tuples)
-                if len(secenek) == 3:
-                    komisyonlu_tutar = odeme_obj.komisyonlu_tutar_hesapla(rota.toplam_ucret)
-                
-                self.ozet_text.insert(tk.END, f"💎 {strateji_adi}\n")
-                self.ozet_text.insert(tk.END, f"   {durum_ikon} {durum_metin}\n")
-                self.ozet_text.insert(tk.END, f"   💰 Ücret: {rota.toplam_ucret:.2f} TL")
-                if odeme_yontemi != "nakit":
-                    self.ozet_text.insert(tk.END, f" (Komisyon dahil: {komisyonlu_tutar:.2f} TL)")
-                self.ozet_text.insert(tk.END, "\n")
-                self.ozet_text.insert(tk.END, f"   ⏱️  Süre: {rota.toplam_sure:.1f} dk\n")
-                self.ozet_text.insert(tk.END, f"   📏 Mesafe: {rota.toplam_mesafe:.2f} km\n")
-                self.ozet_text.insert(tk.END, f"   🔄 Aktarma: {rota.aktarma_sayisi}\n")
-                
-                aciklama = alternatif_aciklamalari.get(strateji_adi, "")
-                if aciklama:
-                    self.ozet_text.insert(tk.END, f"   📝 {aciklama}\n")
-                
-                self.ozet_text.insert(tk.END, "\n")
+            
+            tampon.ekle(f"💎 {strateji_adi}\n", "vurgu")
+            if not rota:
+                tampon.ekle("   ⚠ Bu rota seçeneği mevcut değil.\n\n", "olumsuz")
+                continue
+            
+            komisyonlu_tutar = odeme_obj.komisyonlu_tutar_hesapla(rota.toplam_ucret)
+            if odeme_yapilabilir is None:
+                # Calculate payment status if not provided
+                odeme_yapilabilir = cuzdan.odeme_yapabilir_mi(komisyonlu_tutar, odeme_yontemi)
+            
+            if odeme_yapilabilir:
+                tampon.ekle("   ✓ Ödeme Yapılabilir\n", "olumlu")
             else:
-                self.ozet_text.insert(tk.END, f"💎 {strateji_adi}\n")
-                self.ozet_text.insert(tk.END, f"   ⚠ Bu rota seçeneği mevcut değil.\n\n")
+                tampon.ekle("   ✗ Yetersiz Bakiye\n", "olumsuz")
+            
+            satirlar = [f"   💰 Ücret: {rota.toplam_ucret:.2f} TL"]
+            if odeme_yontemi != "nakit":
+                satirlar.append(f" (Komisyon dahil: {komisyonlu_tutar:.2f} TL)")
+            satirlar.append(f"\n   ⏱️  Süre: {rota.toplam_sure:.1f} dk\n"
+                            f"   📏 Mesafe: {rota.toplam_mesafe:.2f} km\n"
+                            f"   🔄 Aktarma: {rota.aktarma_sayisi}\n")
+            
+            aciklama = self._ALTERNATIF_ACIKLAMALARI.get(strateji_adi, "")
+            if aciklama:
+                satirlar.append(f"   📝 {aciklama}\n")
+            
+            satirlar.append("\n")
+            tampon.ekle("".join(satirlar))
     
     def _rota_hesapla(self):
         """Rota hesaplama işlemini gerçekleştir"""
@@ -692,26 +876,32 @@ class UlasimArayuzu:
             }
             yolcu_tipi = yolcu_tipi_map.get(yolcu_tipi_secim, "genel")
             
-            # Rota hesapla
-            rota = self.rota_hesaplayici.en_uygun_rota_bul(
-                baslangic_konum, hedef_konum, yolcu_tipi
-            )
-            
-            if rota:
-                # Tüm seçenekleri al
-                tum_secenekler = self.rota_secenekleri_uretici.tum_rota_secenekleri_olustur(
-                    baslangic_konum, hedef_konum
+            # Rota ve tüm seçenekler arka planda hesaplanır
+            def hesapla(belirtec):
+                rota = self.rota_hesaplayici.en_uygun_rota_bul(
+                    baslangic_konum, hedef_konum, yolcu_tipi
                 )
-                
-                # Cüzdan bilgileri (varsayılan)
-                cuzdan = Cuzdan(nakit=1000, kredi_karti_limiti=5000, kentkart_bakiyesi=500)
-                
-                # Detaylı gösterim
-                self._en_uygun_rota_goster(rota, tum_secenekler, cuzdan, "nakit")
-            else:
-                messagebox.showwarning("Uyarı", "Rota bulunamadı!")
-                self.ozet_text.delete(1.0, tk.END)
-                self.ozet_text.insert(tk.END, "Rota bulunamadı. Lütfen geçerli konumlar girin.")
+                if not rota:
+                    return None, []
+                belirtec.kontrol()
+                return rota, self._rota_secenekleri_getir(baslangic_konum, hedef_konum)
+            
+            def goster(sonuc):
+                rota, tum_secenekler = sonuc
+                self._haritada_goster(rota, baslangic_konum, hedef_konum)
+                if rota:
+                    # Cüzdan bilgileri (varsayılan)
+                    cuzdan = Cuzdan(nakit=1000, kredi_karti_limiti=5000, kentkart_bakiyesi=500)
+                    
+                    # Detaylı gösterim
+                    self._en_uygun_rota_goster(baslangic_konum, rota, tum_secenekler, cuzdan, "nakit")
+                else:
+                    messagebox.showwarning("Uyarı", "Rota bulunamadı!")
+                    tampon = SonucTamponu()
+                    tampon.ekle("Rota bulunamadı. Lütfen geçerli konumlar girin.")
+                    self._sonucu_goster(tampon)
+            
+            self.arka_plan_isci.calistir(hesapla, goster, self._hesaplama_hatasi)
         
         except ValueError as e:
             messagebox.showerror("Hata", f"Geçersiz sayısal değer: {str(e)}\nLütfen tüm alanları kontrol edin!")
@@ -724,49 +914,50 @@ class UlasimArayuzu:
     
     def _rota_goster(self, rota: Rota, yolcu_tipi: str):
         """Rota bilgilerini göster"""
-        self.ozet_text.delete(1.0, tk.END)
+        tampon = SonucTamponu()
         
         # Özet bilgiler
-        self.ozet_text.insert(tk.END, "=" * 70 + "\n")
-        self.ozet_text.insert(tk.END, "ROTA ÖZETİ\n")
-        self.ozet_text.insert(tk.END, "=" * 70 + "\n\n")
+        tampon.ekle("=" * 70 + "\n")
+        tampon.ekle("ROTA ÖZETİ\n", "baslik")
+        tampon.ekle("=" * 70 + "\n\n")
         
-        self.ozet_text.insert(tk.END, f"Yolcu Tipi: {yolcu_tipi}\n")
-        self.ozet_text.insert(tk.END, f"Toplam Mesafe: {rota.toplam_mesafe:.2f} km\n")
-        self.ozet_text.insert(tk.END, f"Toplam Süre: {rota.toplam_sure:.1f} dakika\n")
-        self.ozet_text.insert(tk.END, f"Toplam Ücret: {rota.toplam_ucret:.2f} TL\n")
-        self.ozet_text.insert(tk.END, f"Aktarma Sayısı: {rota.aktarma_sayisi}\n")
-        self.ozet_text.insert(tk.END, "\n" + "-" * 70 + "\n\n")
+        tampon.ekle(f"Yolcu Tipi: {yolcu_tipi}\n")
+        tampon.ekle(f"Toplam Mesafe: {rota.toplam_mesafe:.2f} km\n")
+        tampon.ekle(f"Toplam Süre: {rota.toplam_sure:.1f} dakika\n")
+        tampon.ekle(f"Toplam Ücret: {rota.toplam_ucret:.2f} TL\n")
+        tampon.ekle(f"Aktarma Sayısı: {rota.aktarma_sayisi}\n")
+        tampon.ekle("\n" + "-" * 70 + "\n\n")
         
         # Detaylı adımlar
-        self.ozet_text.insert(tk.END, "DETAYLI ROTA ADIMLARI:\n\n")
+        tampon.ekle("DETAYLI ROTA ADIMLARI:\n\n")
         
         for i, adim in enumerate(rota.adimlar, 1):
-            self.ozet_text.insert(tk.END, f"Adım {i}: {adim.aciklama}\n")
-            self.ozet_text.insert(tk.END, f"  → Ulaşım Tipi: {adim.ulasim_tipi.upper()}\n")
+            tampon.ekle(f"Adım {i}: {adim.aciklama}\n")
+            tampon.ekle(f"  → Ulaşım Tipi: {adim.ulasim_tipi.upper()}\n")
             if adim.mesafe > 0:
-                self.ozet_text.insert(tk.END, f"  → Mesafe: {adim.mesafe:.2f} km\n")
-            self.ozet_text.insert(tk.END, f"  → Süre: {adim.sure:.1f} dakika\n")
+                tampon.ekle(f"  → Mesafe: {adim.mesafe:.2f} km\n")
+            tampon.ekle(f"  → Süre: {adim.sure:.1f} dakika\n")
             
             # Ücret bilgisi - indirim varsa göster
             if adim.orijinal_ucret is not None and adim.orijinal_ucret != adim.ucret:
                 # İndirim uygulandı
                 if adim.ucret < 0:
-                    self.ozet_text.insert(tk.END, f"  → Ücret: {adim.orijinal_ucret:.2f} TL → "
-                                         f"Teşvik: {abs(adim.ucret):.2f} TL iade\n")
+                    tampon.ekle(f"  → Ücret: {adim.orijinal_ucret:.2f} TL → "
+                                f"Teşvik: {abs(adim.ucret):.2f} TL iade\n")
                 else:
                     indirim_miktari = adim.orijinal_ucret - adim.ucret
-                    self.ozet_text.insert(tk.END, f"  → Ücret: {adim.orijinal_ucret:.2f} TL "
-                                         f"(İndirim: -{indirim_miktari:.2f} TL) = {adim.ucret:.2f} TL\n")
+                    tampon.ekle(f"  → Ücret: {adim.orijinal_ucret:.2f} TL "
+                                f"(İndirim: -{indirim_miktari:.2f} TL) = {adim.ucret:.2f} TL\n")
                 if adim.indirim_aciklama:
-                    self.ozet_text.insert(tk.END, f"  → {adim.indirim_aciklama}\n")
+                    tampon.ekle(f"  → {adim.indirim_aciklama}\n")
             elif adim.ucret > 0:
-                self.ozet_text.insert(tk.END, f"  → Ücret: {adim.ucret:.2f} TL\n")
+                tampon.ekle(f"  → Ücret: {adim.ucret:.2f} TL\n")
             elif adim.ucret < 0:
-                self.ozet_text.insert(tk.END, f"  → Teşvik: {abs(adim.ucret):.2f} TL iade\n")
-            self.ozet_text.insert(tk.END, "\n")
+                tampon.ekle(f"  → Teşvik: {abs(adim.ucret):.2f} TL iade\n")
+            tampon.ekle("\n")
         
-        self.ozet_text.insert(tk.END, "=" * 70 + "\n")
+        tampon.ekle("=" * 70 + "\n")
+        self._sonucu_goster(tampon)
     
     def _fiyat_karsilastir(self):
         """Farklı yolcu tipleri için fiyat karşılaştırması yap"""
@@ -795,53 +986,46 @@ class UlasimArayuzu:
                     messagebox.showerror("Hata", "Lütfen bir durak seçin!")
                 return
             
-            # Tüm yolcu tipleri için rota hesapla
-            yolcu_tipleri = {
-                "Genel": "genel",
-                "Öğrenci": "ogrenci",
-                "Öğretmen": "ogretmen",
-                "65 Yaş Üstü": "yasli"
-            }
+            # Rota bir kez hesaplanır, tüm yolcu tipleri için fiyatlandırılır (arka planda)
+            def hesapla(belirtec):
+                rota = self.rota_hesaplayici.en_uygun_rota_bul(baslangic_konum, hedef_konum)
+                if not rota:
+                    return None, None
+                return rota, self.ucret_motoru.fiyatlandir(rota)
             
-            self.ozet_text.delete(1.0, tk.END)
-            self.ozet_text.insert(tk.END, "=" * 70 + "\n")
-            self.ozet_text.insert(tk.END, "FİYAT KARŞILAŞTIRMASI\n")
-            self.ozet_text.insert(tk.END, "=" * 70 + "\n\n")
-            
-            rotalar = {}
-            for yolcu_adi, yolcu_kodu in yolcu_tipleri.items():
-                rota = self.rota_hesaplayici.en_uygun_rota_bul(
-                    baslangic_konum, hedef_konum, yolcu_kodu
-                )
-                if rota:
-                    rotalar[yolcu_adi] = rota
-            
-            if not rotalar:
-                self.ozet_text.insert(tk.END, "Rota bulunamadı!\n")
-                return
-            
-            # Karşılaştırma tablosu
-            self.ozet_text.insert(tk.END, f"{'Yolcu Tipi':<20} {'Ücret (TL)':<15} {'İndirim':<15} {'Süre (dk)':<15}\n")
-            self.ozet_text.insert(tk.END, "-" * 70 + "\n")
-            
-            genel_ucret = rotalar.get("Genel", None)
-            if genel_ucret:
-                genel_ucret = genel_ucret.toplam_ucret
-            
-            for yolcu_adi in ["Genel", "Öğrenci", "Öğretmen", "65 Yaş Üstü"]:
-                if yolcu_adi in rotalar:
-                    rota = rotalar[yolcu_adi]
+            def goster(sonuc):
+                rota, ucret_tablosu = sonuc
+                tampon = SonucTamponu()
+                tampon.ekle("=" * 70 + "\n")
+                tampon.ekle("FİYAT KARŞILAŞTIRMASI\n", "baslik")
+                tampon.ekle("=" * 70 + "\n\n")
+                
+                if not rota:
+                    tampon.ekle("Rota bulunamadı!\n")
+                    self._sonucu_goster(tampon)
+                    return
+                
+                # Karşılaştırma tablosu
+                tampon.ekle(f"{'Yolcu Tipi':<20} {'Ücret (TL)':<15} {'İndirim':<15} {'Süre (dk)':<15}\n")
+                tampon.ekle("-" * 70 + "\n")
+                
+                genel_ucret = ucret_tablosu.yolcu_ucreti("Genel")
+                
+                for yolcu_adi, ucret in zip(ucret_tablosu.yolcu_tipleri, ucret_tablosu.toplam_ucretler):
                     indirim = 0.0
                     if genel_ucret and yolcu_adi != "Genel":
-                        indirim = ((genel_ucret - rota.toplam_ucret) / genel_ucret) * 100
+                        indirim = ((genel_ucret - ucret) / genel_ucret) * 100
                     
                     indirim_str = f"%{indirim:.1f}" if indirim > 0 else "-"
-                    self.ozet_text.insert(tk.END, 
-                        f"{yolcu_adi:<20} {rota.toplam_ucret:<15.2f} {indirim_str:<15} {rota.toplam_sure:<15.1f}\n")
+                    tampon.ekle(
+                        f"{yolcu_adi:<20} {ucret:<15.2f} {indirim_str:<15} {rota.toplam_sure:<15.1f}\n")
+                
+                tampon.ekle("\n" + "=" * 70 + "\n")
+                tampon.ekle(f"\nToplam Mesafe: {rota.toplam_mesafe:.2f} km\n")
+                tampon.ekle(f"Aktarma Sayısı: {rota.aktarma_sayisi}\n")
+                self._sonucu_goster(tampon)
             
-            self.ozet_text.insert(tk.END, "\n" + "=" * 70 + "\n")
-            self.ozet_text.insert(tk.END, f"\nToplam Mesafe: {list(rotalar.values())[0].toplam_mesafe:.2f} km\n")
-            self.ozet_text.insert(tk.END, f"Aktarma Sayısı: {list(rotalar.values())[0].aktarma_sayisi}\n")
+            self.arka_plan_isci.calistir(hesapla, goster, self._hesaplama_hatasi)
         
         except ValueError as e:
             messagebox.showerror("Hata", f"Geçersiz sayısal değer: {str(e)}\nLütfen tüm alanları kontrol edin!")
@@ -879,75 +1063,59 @@ class UlasimArayuzu:
                     messagebox.showerror("Hata", "Lütfen bir durak seçin!")
                 return
             
-            # Tüm rota seçeneklerini oluştur
-            secenekler = self.rota_secenekleri_uretici.tum_rota_secenekleri_olustur(
-                baslangic_konum, hedef_konum
-            )
-            
-            # Cüzdan bilgileri (varsayılan)
-            cuzdan = Cuzdan(nakit=1000, kredi_karti_limiti=5000, kentkart_bakiyesi=500)
+            # Tüm rota seçenekleri arka planda oluşturulur
+            def hesapla(belirtec):
+                return self._rota_secenekleri_getir(baslangic_konum, hedef_konum)
             
-            self.ozet_text.delete(1.0, tk.END)
-            self.ozet_text.insert(tk.END, "=" * 70 + "\n")
-            self.ozet_text.insert(tk.END, "TÜM ROTA SEÇENEKLERİ - DETAYLI KARŞILAŞTIRMA\n")
-            self.ozet_text.insert(tk.END, "=" * 70 + "\n\n")
-            
-            # Her seçenek için detaylı gösterim
-            for i, (strateji_adi, rota) in enumerate(secenekler, 1):
-                self.ozet_text.insert(tk.END, f"\n{'=' * 70}\n")
-                self.ozet_text.insert(tk.END, f"{i}. {strateji_adi}\n")
-                self.ozet_text.insert(tk.END, f"{'=' * 70}\n\n")
+            def goster(secenekler):
+                # Cüzdan bilgileri (varsayılan)
+                cuzdan = Cuzdan(nakit=1000, kredi_karti_limiti=5000, kentkart_bakiyesi=500)
                 
-                if rota:
-                    # En yakın durak
-                    try:
-                        from mesafe_hesaplayici import MesafeHesaplayici
-                        en_yakin_durak_id, mesafe = self.rota_hesaplayici._en_yakin_durak_bul(
-                            baslangic_konum.enlem, baslangic_konum.boylam
-                        )
-                        
-                        if en_yakin_durak_id:
-                            durak = self.hat_yoneticisi.durak_getir(en_yakin_durak_id)
-                            mesafe_metre = mesafe * 1000
-                            self.ozet_text.insert(tk.END, f"🔴 En Yakın Durak: {durak.isim} ({mesafe_metre:.0f} m)\n")
-                            if mesafe <= 3.0:
-                                self.ozet_text.insert(tk.END, f"🚶 Yürüme = 0 TL\n\n")
-                            else:
-                                taksi_ucret = self.taksi.ucret_hesapla(mesafe)
-                                self.ozet_text.insert(tk.END, f"🚕 Taksi = {taksi_ucret:.2f} TL\n\n")
-                    except:
-                        pass
-                    
-                    # Rota detayları
-                    self.ozet_text.insert(tk.END, "🔵 Rota Detayları:\n\n")
-                    self._detayli_rota_goster(rota)
-                    
-                    # Toplam
-                    self.ozet_text.insert(tk.END, "\n📊 Toplam:\n")
-                    self.ozet_text.insert(tk.END, f"   💰 Ücret: {rota.toplam_ucret:.2f} TL\n")
+                tampon = SonucTamponu()
+                tampon.ekle("=" * 70 + "\n", "ayirici")
+                tampon.ekle("TÜM ROTA SEÇENEKLERİ - DETAYLI KARŞILAŞTIRMA\n", "baslik")
+                tampon.ekle("=" * 70 + "\n\n", "ayirici")
+                
+                # En yakın durak bilgisi tüm seçeneklerde aynıdır, bir kez oluşturulur
+                en_yakin_durak = self._en_yakin_durak_metni(baslangic_konum, "🔴 En Yakın Durak: ")
+                if en_yakin_durak:
+                    en_yakin_durak += "\n"
+                
+                # Yolcu indirimi varsa gösterilir
+                yolcu_tipi = self.yolcu_tipi.get()
+                yolcu = self._yolcu_nesneleri.get(yolcu_tipi)
+                
+                # Her seçenek için detaylı gösterim
+                for i, (strateji_adi, rota) in enumerate(secenekler, 1):
+                    tampon.ekle(f"\n{'=' * 70}\n", "ayirici")
+                    tampon.ekle(f"{i}. {strateji_adi}\n", "baslik")
+                    tampon.ekle(f"{'=' * 70}\n\n", "ayirici")
                     
-                    # Yolcu indirimi varsa göster
-                    yolcu_tipi = self.yolcu_tipi.get()
-                    if yolcu_tipi != "Genel":
-                        from yolcu import OgrenciYolcu, OgretmenYolcu, YasliYolcu
-                        yolcu_map = {
-                            "Öğrenci": OgrenciYolcu(),
-                            "Öğretmen": OgretmenYolcu(),
-                            "65 Yaş Üstü": YasliYolcu()
-                        }
-                        yolcu = yolcu_map.get(yolcu_tipi)
+                    if rota:
+                        tampon.ekle(en_yakin_durak)
+                        
+                        # Rota detayları
+                        tampon.ekle("🔵 Rota Detayları:\n\n", "baslik")
+                        self._detayli_rota_goster(tampon, rota)
+                        
+                        # Toplam
+                        tampon.ekle("\n📊 Toplam:\n", "baslik")
+                        tampon.ekle(f"   💰 Ücret: {rota.toplam_ucret:.2f} TL\n")
                         if yolcu:
                             indirimli_ucret = yolcu.indirimli_ucret_hesapla(rota.toplam_ucret)
                             indirim_yuzdesi = yolcu.indirim_orani() * 100
-                            self.ozet_text.insert(tk.END, f"   ({yolcu_tipi} %{indirim_yuzdesi:.0f} → {indirimli_ucret:.2f} TL)\n")
-                    
-                    self.ozet_text.insert(tk.END, f"   ⏱️  Süre: {rota.toplam_sure:.1f} dk\n")
-                    self.ozet_text.insert(tk.END, f"   📏 Mesafe: {rota.toplam_mesafe:.2f} km\n")
-                    self.ozet_text.insert(tk.END, f"   🔄 Aktarma: {rota.aktarma_sayisi}\n")
-                else:
-                    self.ozet_text.insert(tk.END, "  ⚠ Bu rota seçeneği mevcut değil.\n")
+                            tampon.ekle(f"   ({yolcu_tipi} %{indirim_yuzdesi:.0f} → {indirimli_ucret:.2f} TL)\n")
+                        
+                        tampon.ekle(f"   ⏱️  Süre: {rota.toplam_sure:.1f} dk\n"
+                                    f"   📏 Mesafe: {rota.toplam_mesafe:.2f} km\n"
+                                    f"   🔄 Aktarma: {rota.aktarma_sayisi}\n")
+                    else:
+                        tampon.ekle("  ⚠ Bu rota seçeneği mevcut değil.\n", "olumsuz")
+                
+                tampon.ekle("\n" + "=" * 70 + "\n", "ayirici")
+                self._sonucu_goster(tampon)
             
-            self.ozet_text.insert(tk.END, "\n" + "=" * 70 + "\n")
+            self.arka_plan_isci.calistir(hesapla, goster, self._hesaplama_hatasi)
         
         except ValueError as e:
             messagebox.showerror("Hata", f"Geçersiz sayısal değer: {str(e)}\nLütfen tüm alanları kontrol edin!")
@@ -965,7 +1133,35 @@ class UlasimArayuzu:
         self.hedef_enlem.delete(0, tk.END)
         self.hedef_boylam.delete(0, tk.END)
         self.yolcu_tipi.current(0)
-        self.ozet_text.delete(1.0, tk.END)
+        self.arka_plan_isci.iptal_et()
+        self._sonucu_goster(SonucTamponu())
+        self._haritada_goster(None)
+    
+    def _harita_ac(self):
+        """Ağ haritası penceresini aç (açıksa öne getir)"""
+        if self._harita_penceresi is not None and self._harita_penceresi.winfo_exists():
+            self._harita_penceresi.lift()
+            return
+        self._harita_penceresi = tk.Toplevel(self.root)
+        self._harita_penceresi.title("🗺️ Ulaşım Ağı Haritası")
+        self._harita_penceresi.geometry("900x700")
+        self._harita = HaritaGorunumu(self._harita_penceresi, self.veri_yukleyici.duraklar)
+        self._harita.pack(fill=tk.BOTH, expand=True)
+        self._harita_penceresi.protocol("WM_DELETE_WINDOW", self._harita_kapat)
+        if self._son_rota:
+            self._harita.rota_goster(*self._son_rota)
+    
+    def _harita_kapat(self):
+        self._harita_penceresi.destroy()
+        self._harita_penceresi = None
+        self._harita = None
+    
+    def _haritada_goster(self, rota: Optional[Rota], baslangic_konum: Optional[Konum] = None,
+                         hedef_konum: Optional[Konum] = None):
+        """Son rotayı sakla ve harita açıksa üzerinde vurgula"""
+        self._son_rota = (rota, baslangic_konum, hedef_konum) if rota else None
+        if self._harita is not None:
+            self._harita.rota_goster(rota, baslangic_konum, hedef_konum)
 
 
 def main():
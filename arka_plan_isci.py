@@ -0,0 +1,143 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+
+class IslemIptalEdildi(Exception):
+    """Arka plan işi iptal edildiğinde kontrol noktalarında fırlatılır"""
+
+
+class IptalBelirteci:
+    """Bir arka plan işinin iptal durumunu taşıyan belirteç"""
+    
+    def __init__(self):
+        self._olay = threading.Event()
+    
+    def iptal_et(self):
+        self._olay.set()
+    
+    @property
+    def iptal_edildi(self) -> bool:
+        return self._olay.is_set()
+    
+    def kontrol(self):
+        """İş iptal edildiyse IslemIptalEdildi fırlat (uzun işlerde aşama aralarında çağrılır)"""
+        if self._olay.is_set():
+            raise IslemIptalEdildi()
+
+
+class ArkaPlanIsci:
+    """
+    Rota hesaplamalarını Tk ana döngüsünü bloklamadan çalıştıran işçi
+    
+    İşler tek bir işçi iş parçacığında sırayla çalışır; böylece rota motorunun
+    önbellekleri aynı anda tek işten değiştirilir. Yeni bir iş başlatmak önceki
+    işi iptal eder: sırada bekliyorsa hiç çalıştırılmaz, çalışıyorsa sonucu atılır
+    (iş belirteç üzerinden kontrol noktası koyduysa erken biter). Sonuçlar bir
+    kuyruğa yazılır ve ana iş parçacığında root.after ile yoklanarak geri
+    çağrılara iletilir; Tk bileşenlerine yalnızca ana iş parçacığı dokunur.
+    """
+    
+    YOKLAMA_MS = 16  # ~60 kare/sn
+    
+    def __init__(self, root, ilerleme_baslat: Optional[Callable[[], None]] = None,
+                 ilerleme_bitir: Optional[Callable[[], None]] = None):
+        """
+        Args:
+            root: Tk kök penceresi (after ile yoklama için)
+            ilerleme_baslat: Bir iş başladığında çağrılır (örn. ilerleme çubuğunu başlat)
+            ilerleme_bitir: Bekleyen iş kalmadığında çağrılır
+        """
+        self._root = root
+        self._ilerleme_baslat = ilerleme_baslat
+        self._ilerleme_bitir = ilerleme_bitir
+        self._havuz = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rota_iscisi")
+        self._sonuclar: "queue.Queue" = queue.Queue()
+        self._aktif: Optional[IptalBelirteci] = None
+        self._geri_cagrilar = {}
+        self._yoklama_kimligi = None
+    
+    def calistir(self, is_fonksiyonu: Callable[[IptalBelirteci], Any],
+                 basari: Callable[[Any], None],
+                 hata: Optional[Callable[[Exception], None]] = None) -> IptalBelirteci:
+        """
+        İşi arka planda çalıştır; önceki iş iptal edilir
+        
+        Args:
+            is_fonksiyonu: İşçi iş parçacığında çalışır, iptal belirtecini alır;
+                Tk bileşenlerine dokunmamalıdır
+            basari: Sonuçla birlikte ana iş parçacığında çağrılır
+            hata: İş hata fırlatırsa ana iş parçacığında çağrılır
+        
+        Returns:
+            İşin iptal belirteci
+        """
+        self.iptal_et()
+        belirtec = IptalBelirteci()
+        self._aktif = belirtec
+        self._geri_cagrilar[belirtec] = (basari, hata)
+        self._havuz.submit(self._calis, belirtec, is_fonksiyonu)
+        
+        if self._ilerleme_baslat:
+            self._ilerleme_baslat()
+        if self._yoklama_kimligi is None:
+            self._yoklama_kimligi = self._root.after(self.YOKLAMA_MS, self._yokla)
+        return belirtec
+    
+    def iptal_et(self):
+        """Çalışan veya bekleyen işi iptal et"""
+        if self._aktif is not None:
+            self._aktif.iptal_et()
+            self._aktif = None
+            if self._ilerleme_bitir:
+                self._ilerleme_bitir()
+    
+    @property
+    def mesgul(self) -> bool:
+        return self._aktif is not None
+    
+    def kapat(self):
+        """İşleri iptal et ve işçiyi durdur (pencere kapanırken)"""
+        self.iptal_et()
+        if self._yoklama_kimligi is not None:
+            self._root.after_cancel(self._yoklama_kimligi)
+            self._yoklama_kimligi = None
+        self._havuz.shutdown(wait=False)
+    
+    def _calis(self, belirtec: IptalBelirteci, is_fonksiyonu: Callable[[IptalBelirteci], Any]):
+        """İşçi iş parçacığı: iptal edilmemişse işi çalıştır ve sonucu kuyruğa yaz"""
+        if belirtec.iptal_edildi:
+            self._sonuclar.put((belirtec, None, None))
+            return
+        try:
+            self._sonuclar.put((belirtec, is_fonksiyonu(belirtec), None))
+        except IslemIptalEdildi:
+            self._sonuclar.put((belirtec, None, None))
+        except Exception as e:
+            self._sonuclar.put((belirtec, None, e))
+    
+    def _yokla(self):
+        """Ana iş parçacığı: biten işlerin geri çağrılarını çalıştır"""
+        self._yoklama_kimligi = None
+        while True:
+            try:
+                belirtec, sonuc, hata = self._sonuclar.get_nowait()
+            except queue.Empty:
+                break
+            basari_cagrisi, hata_cagrisi = self._geri_cagrilar.pop(belirtec)
+            if belirtec.iptal_edildi:
+                continue
+            self._aktif = None
+            if self._ilerleme_bitir:
+                self._ilerleme_bitir()
+            if hata is None:
+                try:
+                    basari_cagrisi(sonuc)
+                except Exception as e:
+                    hata = e
+            if hata is not None and hata_cagrisi:
+                hata_cagrisi(hata)
+        
+        if self._geri_cagrilar:
+            self._yoklama_kimligi = self._root.after(self.YOKLAMA_MS, self._yokla)
@@ -0,0 +1,90 @@
+"""
+Dijkstra ile A* (haversine), A* + ALT (işaret durakları) ve kontraksiyon
+hiyerarşisi aramalarının genişlettiği durak sayılarını karşılaştırır.
+
+Kullanım:
+    python benchmarks/astar_karsilastirma.py [veri_dosyasi] [--ciftler N] [--isaretler K]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from veri_yukleyici import VeriYukleyici
+from durak_grafi import DurakGrafi
+
+
+VARSAYILAN_VERI = "VERİ SETİ PROLAB 1.txt"
+
+
+def durak_ciftleri(graf: DurakGrafi, cift_sayisi: int, tohum: int = 41):
+    """Karşılaştırmada kullanılacak (kaynak, hedef) çiftlerini üret"""
+    n = graf.durak_sayisi
+    tum_ciftler = n * n
+    if tum_ciftler <= cift_sayisi:
+        return [(u, v) for u in range(n) for v in range(n)]
+    rastgele = random.Random(tohum)
+    return [(rastgele.randrange(n), rastgele.randrange(n)) for _ in range(cift_sayisi)]
+
+
+def olc(graf: DurakGrafi, ciftler, yontem: str):
+    """Tüm çiftler için toplam genişletme, süre ve yol sürelerini döndür"""
+    toplam_genisletme = 0
+    sureler = []
+    baslangic = time.perf_counter()
+    for kaynak, hedef in ciftler:
+        kenarlar, genisletilen = graf.yol_bul(kaynak, hedef, yontem)
+        toplam_genisletme += genisletilen
+        sureler.append(None if kenarlar is None else graf.yol_suresi(kenarlar))
+    gecen = time.perf_counter() - baslangic
+    return toplam_genisletme, gecen, sureler
+
+
+def main():
+    ayristirici = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ayristirici.add_argument("veri_dosyasi", nargs="?", default=VARSAYILAN_VERI)
+    ayristirici.add_argument("--ciftler", type=int, default=1000)
+    ayristirici.add_argument("--isaretler", type=int, default=4)
+    argumanlar = ayristirici.parse_args()
+
+    veri_yukleyici = VeriYukleyici(argumanlar.veri_dosyasi)
+    if not veri_yukleyici.veri_yukle():
+        sys.exit(1)
+    veri_yukleyici.duraklari_olustur()
+
+    graf = DurakGrafi(veri_yukleyici.duraklar)
+    ciftler = durak_ciftleri(graf, argumanlar.ciftler)
+
+    sonuclar = {}
+    sonuclar["dijkstra"] = olc(graf, ciftler, "dijkstra")
+    sonuclar["astar (haversine)"] = olc(graf, ciftler, "astar")
+
+    baslangic = time.perf_counter()
+    graf.isaretleri_hesapla(argumanlar.isaretler)
+    on_hesaplama = time.perf_counter() - baslangic
+    sonuclar["astar + ALT"] = olc(graf, ciftler, "astar")
+
+    kontraksiyon = graf.kontraksiyon_hiyerarsisi()
+    sonuclar["ch"] = olc(graf, ciftler, "ch")
+
+    referans = sonuclar["dijkstra"]
+    print(f"Durak: {graf.durak_sayisi}, kenar: {graf.kenar_sayisi}, çift: {len(ciftler)}")
+    print(f"İşaret durakları ({on_hesaplama * 1000:.1f} ms): {', '.join(graf.isaret_duraklari)}")
+    print(kontraksiyon.istatistikler)
+    print(f"{'Yöntem':<20} {'Genişletme':>12} {'Oran':>8} {'Süre (ms)':>10}")
+    for ad, (genisletme, gecen, sureler) in sonuclar.items():
+        oran = genisletme / referans[0] if referans[0] else 0.0
+        print(f"{ad:<20} {genisletme:>12} {oran:>8.2f} {gecen * 1000:>10.1f}")
+        # Tüm yöntemler aynı (en kısa) süreleri bulmalı
+        for beklenen, bulunan in zip(referans[2], sureler):
+            if (beklenen is None) != (bulunan is None) or \
+                    (beklenen is not None and abs(beklenen - bulunan) > 1e-9):
+                print(f"  UYARI: {ad} farklı sonuç üretti ({beklenen} != {bulunan})")
+                break
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Hat çıkarımının dosyadaki durak sırasından bağımsız olduğunu doğrular.
+
+Sentetik bir şehrin durakları doğal (üretim) sırasıyla ve birkaç rastgele
+karıştırılmış sırayla HatYoneticisi'ne verilir; çıkarılan hatların durak
+dizileri kümesi her sırada aynı olmalıdır. Sentetik hatlar çift yönlü
+olduğundan her son durak tam olarak bir hat yönünü başlatmalıdır. Fark
+bulunursa yazdırılır ve çıkış kodu 1 olur.
+
+Kullanım:
+    python benchmarks/hat_dogrulama.py [--duraklar N] [--hatlar N] [--karistirma N] [--tohum T]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from veri_yukleyici import VeriYukleyici
+from hat import HatYoneticisi
+from sentetik_sehir import sentetik_sehir_olustur, dosyaya_yaz
+
+
+def duraklari_yukle(durak_sayisi: int, hat_sayisi: int, tohum: int) -> dict:
+    """Sentetik şehri üret ve durakları dosya sırasıyla yükle"""
+    with tempfile.TemporaryDirectory() as klasor:
+        dosya_yolu = os.path.join(klasor, "sehir.json")
+        dosyaya_yaz(sentetik_sehir_olustur(durak_sayisi, hat_sayisi, tohum=tohum), dosya_yolu)
+        veri_yukleyici = VeriYukleyici(dosya_yolu)
+        if not veri_yukleyici.veri_yukle():
+            sys.exit(1)
+        veri_yukleyici.duraklari_olustur()
+    return veri_yukleyici.duraklar
+
+
+def hat_kumesi(duraklar: dict) -> set:
+    """Çıkarılan hatların durak dizileri"""
+    return {tuple(hat.duraklar) for hat in HatYoneticisi(duraklar).hatlar.values()}
+
+
+def main():
+    ayristirici = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ayristirici.add_argument("--duraklar", type=int, default=500)
+    ayristirici.add_argument("--hatlar", type=int, default=40)
+    ayristirici.add_argument("--karistirma", type=int, default=5)
+    ayristirici.add_argument("--tohum", type=int, default=41)
+    argumanlar = ayristirici.parse_args()
+
+    duraklar = duraklari_yukle(argumanlar.duraklar, argumanlar.hatlar, argumanlar.tohum)
+    beklenen = hat_kumesi(duraklar)
+    hatali = False
+
+    uc_sayisi = sum(1 for durak in duraklar.values() if durak.son_durak)
+    kisa = sum(1 for hat in beklenen if len(hat) == 2)
+    print(f"Doğal sıra: {len(beklenen)} hat ({kisa} iki duraklı), {uc_sayisi} son durak")
+    if len(beklenen) != uc_sayisi:
+        print("  Hat sayısı son durak sayısına eşit değil: hatlar parçalanmış")
+        hatali = True
+
+    rastgele = random.Random(argumanlar.tohum)
+    for deneme in range(1, argumanlar.karistirma + 1):
+        idler = list(duraklar)
+        rastgele.shuffle(idler)
+        hatlar = hat_kumesi({durak_id: duraklar[durak_id] for durak_id in idler})
+        if hatlar != beklenen:
+            print(f"Karıştırma {deneme}: {len(hatlar)} hat, {len(hatlar - beklenen)} farklı")
+            hatali = True
+
+    print("Fark yok" if not hatali else "Hat çıkarımı durak sırasına bağlı")
+    sys.exit(1 if hatali else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Profil (rRAPTOR) sorgularını kalkış başına tek sorgularla karşılaştırır.
+
+Sentetik bir şehirde rastgele seçilen durak çiftleri için profil_sorgula
+penceresindeki her örnek kalkış zamanında sorgula ile bulunan varış, profilde
+o zamandan sonra kalkan en iyi yolculuğun varışıyla karşılaştırılır. Profil
+pencerede daha kötü bir varış döndürürse fark yazdırılır ve çıkış kodu 1 olur.
+
+Kullanım:
+    python benchmarks/profil_dogrulama.py [--duraklar N] [--ciftler N] [--pencere 420 540]
+        [--adim DK] [--aktarma K] [--tohum T]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from veri_yukleyici import VeriYukleyici
+from hat import HatYoneticisi
+from tarife import Tarife, dakikayi_saate_cevir
+from raptor import RaptorMotoru, Yolculuk
+from sentetik_sehir import sentetik_sehir_olustur, dosyaya_yaz
+
+
+def motor_kur(durak_sayisi: int, tohum: int) -> RaptorMotoru:
+    """Sentetik şehri üret, yükle ve varsayılan tarifeyle RAPTOR motorunu kur"""
+    with tempfile.TemporaryDirectory() as klasor:
+        dosya_yolu = os.path.join(klasor, "sehir.json")
+        dosyaya_yaz(sentetik_sehir_olustur(durak_sayisi, tohum=tohum), dosya_yolu)
+        veri_yukleyici = VeriYukleyici(dosya_yolu)
+        if not veri_yukleyici.veri_yukle():
+            sys.exit(1)
+        veri_yukleyici.duraklari_olustur()
+    return RaptorMotoru(Tarife.varsayilan(HatYoneticisi(veri_yukleyici.duraklar)))
+
+
+def son_kalkis(yolculuk: Yolculuk) -> float:
+    """Yolculuğun ilk sefere yetişmek için kaynaktan en geç çıkılabileceği zaman"""
+    bacaklar = yolculuk.bacaklar
+    if bacaklar[0].tip == "sefer" or len(bacaklar) == 1:
+        return bacaklar[0].kalkis
+    return bacaklar[1].kalkis - (bacaklar[0].varis - bacaklar[0].kalkis)
+
+
+def dogrula(motor: RaptorMotoru, cift_sayisi: int, pencere_baslangic: float, pencere_bitis: float,
+            adim: float, en_fazla_aktarma: int, tohum: int):
+    """Profil ile tek sorguları karşılaştır; (kontrol sayısı, farklar) döndür"""
+    n = motor.tarife.hat_yoneticisi.durak_grafi.durak_sayisi
+    rastgele = random.Random(tohum)
+    kontrol = 0
+    farklar = []
+    for _ in range(cift_sayisi):
+        kaynak, hedef = rastgele.randrange(n), rastgele.randrange(n)
+        profil = motor.profil_sorgula(kaynak, hedef, pencere_baslangic, pencere_bitis, en_fazla_aktarma)
+        kalkis = pencere_baslangic
+        while kalkis <= pencere_bitis:
+            yolculuk = motor.sorgula(kaynak, hedef, kalkis, en_fazla_aktarma)
+            # Pencere dışında kalkan sefere binen yolculuklar profilde bulunamaz
+            if yolculuk is not None and yolculuk.bacaklar and son_kalkis(yolculuk) <= pencere_bitis:
+                kontrol += 1
+                profil_varis = min((aday.varis for aday in profil if aday.kalkis >= kalkis),
+                                   default=float('inf'))
+                if yolculuk.varis < profil_varis:
+                    farklar.append((kaynak, hedef, kalkis, yolculuk.varis, profil_varis))
+            kalkis += adim
+    return kontrol, farklar
+
+
+def main():
+    ayristirici = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ayristirici.add_argument("--duraklar", type=int, default=1500)
+    ayristirici.add_argument("--ciftler", type=int, default=60)
+    ayristirici.add_argument("--pencere", type=float, nargs=2, default=[420, 540])
+    ayristirici.add_argument("--adim", type=float, default=10)
+    ayristirici.add_argument("--aktarma", type=int, default=4)
+    ayristirici.add_argument("--tohum", type=int, default=3)
+    argumanlar = ayristirici.parse_args()
+
+    motor = motor_kur(argumanlar.duraklar, argumanlar.tohum)
+    kontrol, farklar = dogrula(motor, argumanlar.ciftler, argumanlar.pencere[0], argumanlar.pencere[1],
+                               argumanlar.adim, argumanlar.aktarma, argumanlar.tohum)
+    for kaynak, hedef, kalkis, varis, profil_varis in farklar:
+        print(f"{kaynak} -> {hedef} {dakikayi_saate_cevir(kalkis)}: sorgula {dakikayi_saate_cevir(varis)}, "
+              f"profil {dakikayi_saate_cevir(profil_varis) if profil_varis < float('inf') else '-'}")
+    print(f"{kontrol} kontrol, {len(farklar)} fark")
+    sys.exit(1 if farklar else 0)
+
+
+if __name__ == "__main__":
+    main()
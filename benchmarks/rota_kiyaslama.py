@@ -0,0 +1,201 @@
+"""
+Sentetik şehirlerde veri yükleme ve rota sorgularının sürelerini ölçer.
+
+Her ağ boyutu için sentetik_sehir ile tekrarlanabilir bir veri seti üretilir,
+RotaMotoru ile yüklenir ve aynı tohumla seçilen sorgu çiftlerinde en yakın
+durak araması, en_uygun_rota_bul, tum_rota_secenekleri_olustur ve
+detayli_analiz zamanlanır. Sonuçlar JSON olarak yazılır; --karsilastir ile
+önceki bir çalıştırmanın medyanlarına oranlanır. --asamalar ile boru hattının
+aşama süreleri (gecikme_olcumu) de sonuçlara eklenir.
+
+Kullanım:
+    python benchmarks/rota_kiyaslama.py [--boyutlar 1000 10000 100000] [--sorgular N]
+        [--cikti sonuclar.json] [--karsilastir onceki.json] [--tohum T] [--asamalar]
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import gecikme_olcumu
+from konum import Konum
+from cuzdan import Cuzdan
+from rota_motoru import RotaMotoru
+from sentetik_sehir import sentetik_sehir_olustur, dosyaya_yaz
+
+
+SONUC_SURUMU = 1
+VARSAYILAN_BOYUTLAR = [1000, 10000, 100000]
+KONUM_SAPMASI = 0.003  # Sorgu konumlarının duraktan en fazla sapması (derece, ~300 m)
+
+
+def sorgu_ciftleri(motor: RotaMotoru, sorgu_sayisi: int, tohum: int):
+    """Rastgele duraklar çevresinde (başlangıç, hedef) konum çiftleri üret"""
+    rastgele = random.Random(tohum)
+    duraklar = list(motor.veri_yukleyici.duraklar.values())
+
+    def konum():
+        durak = rastgele.choice(duraklar)
+        return Konum(durak.enlem + rastgele.uniform(-KONUM_SAPMASI, KONUM_SAPMASI),
+                     durak.boylam + rastgele.uniform(-KONUM_SAPMASI, KONUM_SAPMASI))
+
+    return [(konum(), konum()) for _ in range(sorgu_sayisi)]
+
+
+def istatistik(sureler):
+    """Süre listesinin (sn) özet istatistikleri (ms)"""
+    sirali = sorted(sureler)
+    adet = len(sirali)
+    return {
+        "adet": adet,
+        "ortalama_ms": sum(sirali) / adet * 1000,
+        "medyan_ms": (sirali[(adet - 1) // 2] + sirali[adet // 2]) / 2 * 1000,
+        "p95_ms": sirali[max(0, math.ceil(adet * 0.95) - 1)] * 1000,
+        "en_az_ms": sirali[0] * 1000,
+        "en_fazla_ms": sirali[-1] * 1000,
+    }
+
+
+def olc(islem, argumanlar):
+    """İşlemi her argüman demeti için çalıştır; (süreler, boş olmayan sonuç sayısı)"""
+    sureler = []
+    bulunan = 0
+    for arguman in argumanlar:
+        baslangic = time.perf_counter()
+        sonuc = islem(*arguman)
+        sureler.append(time.perf_counter() - baslangic)
+        if sonuc:
+            bulunan += 1
+    return sureler, bulunan
+
+
+def boyutu_olc(durak_sayisi: int, sorgu_sayisi: int, tohum: int, klasor: str, parametreler: dict,
+               asamalar: bool = False) -> dict:
+    """Bir ağ boyutu için veri setini üret, yükle ve tüm işlemleri ölç"""
+    baslangic = time.perf_counter()
+    veri = sentetik_sehir_olustur(durak_sayisi, parametreler["hatlar"], parametreler["tramvay_orani"],
+                                  parametreler["aktarma_yogunlugu"], tohum)
+    dosya_yolu = os.path.join(klasor, f"sehir_{durak_sayisi}.json")
+    dosyaya_yaz(veri, dosya_yolu)
+    uretim_suresi = time.perf_counter() - baslangic
+    del veri
+
+    motor = RotaMotoru(dosya_yolu)
+    motor.hazirla("durak_grafi", "en_uygun_rota_secici")
+    yukleme = {asama: sure * 1000 for asama, sure in motor.asama_sureleri.items()}
+    yukleme["toplam"] = sum(yukleme.values())
+
+    ciftler = sorgu_ciftleri(motor, sorgu_sayisi, tohum)
+    # Ölçüm, metot referansları alınmadan önce açılmalı (önceden alınan bağlı metotlar ölçülmez)
+    olcer = gecikme_olcumu.etkinlestir(gecikme_olcumu.GecikmeOlcer()) if asamalar else None
+    hesaplayici = motor.rota_hesaplayici
+    cuzdan = Cuzdan(nakit=1000, kredi_karti_limiti=5000, kentkart_bakiyesi=500)
+    islemler = {
+        "en_yakin_durak": (lambda konum: hesaplayici.en_yakin_durak_bul(konum.enlem, konum.boylam)[0],
+                           [(konum,) for cift in ciftler for konum in cift]),
+        "en_uygun_rota_bul": (hesaplayici.en_uygun_rota_bul, ciftler),
+        "tum_rota_secenekleri_olustur": (motor.rota_secenekleri_uretici.tum_rota_secenekleri_olustur,
+                                         ciftler),
+        "detayli_analiz": (lambda baslangic_konum, hedef_konum: motor.en_uygun_rota_secici.detayli_analiz(
+            baslangic_konum, hedef_konum, cuzdan, "nakit")["secenekler"], ciftler),
+    }
+
+    sonuc = {
+        "durak_sayisi": durak_sayisi,
+        "hat_sayisi": len(motor.hat_yoneticisi.hatlar),
+        "kenar_sayisi": motor.durak_grafi.kenar_sayisi,
+        "uretim_ms": uretim_suresi * 1000,
+        "yukleme_ms": yukleme,
+        "islemler": {},
+    }
+    try:
+        for ad, (islem, argumanlar) in islemler.items():
+            sureler, bulunan = olc(islem, argumanlar)
+            sonuc["islemler"][ad] = {**istatistik(sureler), "bulunan": bulunan}
+    finally:
+        if olcer is not None:
+            gecikme_olcumu.devre_disi_birak()
+    if olcer is not None:
+        sonuc["asamalar"] = olcer.istatistikler()
+    return sonuc
+
+
+def karsilastir(onceki: dict, simdiki: dict):
+    """İki çalıştırmanın ortak boyut ve işlemlerinde medyan oranlarını yazdır"""
+    onceki_boyutlar = {sonuc["durak_sayisi"]: sonuc for sonuc in onceki["sonuclar"]}
+    print(f"\n{'Durak':>8} {'İşlem':<30} {'Önceki (ms)':>12} {'Şimdiki (ms)':>13} {'Oran':>7}")
+    for sonuc in simdiki["sonuclar"]:
+        eski = onceki_boyutlar.get(sonuc["durak_sayisi"])
+        if eski is None:
+            continue
+        satirlar = [("yukleme", eski["yukleme_ms"]["toplam"], sonuc["yukleme_ms"]["toplam"])]
+        for ad, olcum in sonuc["islemler"].items():
+            if ad in eski["islemler"]:
+                satirlar.append((ad, eski["islemler"][ad]["medyan_ms"], olcum["medyan_ms"]))
+        for ad, eski_ms, yeni_ms in satirlar:
+            oran = yeni_ms / eski_ms if eski_ms else float("inf")
+            print(f"{sonuc['durak_sayisi']:>8} {ad:<30} {eski_ms:>12.3f} {yeni_ms:>13.3f} {oran:>7.2f}")
+
+
+def main():
+    ayristirici = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ayristirici.add_argument("--boyutlar", type=int, nargs="+", default=VARSAYILAN_BOYUTLAR)
+    ayristirici.add_argument("--sorgular", type=int, default=20)
+    ayristirici.add_argument("--hatlar", type=int, default=0,
+                             help="Hat sayısı (0: durak sayısına göre)")
+    ayristirici.add_argument("--tramvay-orani", type=float, default=0.2)
+    ayristirici.add_argument("--aktarma-yogunlugu", type=float, default=0.3)
+    ayristirici.add_argument("--tohum", type=int, default=41)
+    ayristirici.add_argument("--cikti", default="kiyaslama_sonuclari.json")
+    ayristirici.add_argument("--karsilastir", metavar="ONCEKI_JSON")
+    ayristirici.add_argument("--asamalar", action="store_true",
+                             help="Aşama sürelerini de ölç (küçük bir ek yük getirir)")
+    argumanlar = ayristirici.parse_args()
+
+    parametreler = {
+        "sorgular": argumanlar.sorgular,
+        "hatlar": argumanlar.hatlar,
+        "tramvay_orani": argumanlar.tramvay_orani,
+        "aktarma_yogunlugu": argumanlar.aktarma_yogunlugu,
+        "tohum": argumanlar.tohum,
+        "asamalar": argumanlar.asamalar,
+    }
+    rapor = {
+        "surum": SONUC_SURUMU,
+        "tarih": datetime.now().isoformat(timespec="seconds"),
+        "ortam": {"python": platform.python_version(), "platform": platform.platform()},
+        "parametreler": parametreler,
+        "sonuclar": [],
+    }
+
+    print(f"{'Durak':>8} {'İşlem':<30} {'Medyan (ms)':>12} {'p95 (ms)':>10} {'Bulunan':>8}")
+    with tempfile.TemporaryDirectory() as klasor:
+        for durak_sayisi in argumanlar.boyutlar:
+            sonuc = boyutu_olc(durak_sayisi, argumanlar.sorgular, argumanlar.tohum, klasor, parametreler,
+                               argumanlar.asamalar)
+            rapor["sonuclar"].append(sonuc)
+            print(f"{durak_sayisi:>8} {'yukleme':<30} {sonuc['yukleme_ms']['toplam']:>12.1f}")
+            for ad, olcum in sonuc["islemler"].items():
+                print(f"{durak_sayisi:>8} {ad:<30} {olcum['medyan_ms']:>12.3f} {olcum['p95_ms']:>10.3f} "
+                      f"{olcum['bulunan']:>5}/{olcum['adet']}")
+
+    with open(argumanlar.cikti, "w", encoding="utf-8") as dosya:
+        json.dump(rapor, dosya, ensure_ascii=False, indent=2)
+    print(f"Sonuçlar: {argumanlar.cikti}")
+
+    if argumanlar.karsilastir:
+        with open(argumanlar.karsilastir, encoding="utf-8") as dosya:
+            karsilastir(json.load(dosya), rapor)
+
+
+if __name__ == "__main__":
+    main()
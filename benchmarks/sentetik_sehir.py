@@ -0,0 +1,200 @@
+"""
+VeriYukleyici'nin okuduğu JSON şemasında, tekrarlanabilir sentetik şehir ağı üretir.
+
+Hatlar şehir alanında rastgele yönlü, hafif kıvrımlı yollar boyunca dizilir; her
+hat iki yönlü işletilir (her durak ileri ve geri komşusunu nextStops olarak
+taşır). Aktarmalar, başka bir hattaki en yakın durağa yürüme mesafesindeyse
+eklenir. Aynı parametreler ve tohum her zaman aynı dosyayı üretir.
+
+Kullanım:
+    python benchmarks/sentetik_sehir.py cikti.json [--duraklar N] [--hatlar H]
+        [--tramvay-orani O] [--aktarma-yogunlugu Y] [--tohum T]
+"""
+import argparse
+import json
+import math
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mesafe_hesaplayici import MesafeHesaplayici
+
+
+MERKEZ_ENLEM = 40.7654  # İzmit
+MERKEZ_BOYLAM = 29.9408
+KM_DERECE_ENLEM = 110.574
+DURAK_BASINA_ALAN_KM2 = 0.1  # Şehir alanı durak sayısıyla büyür (yoğunluk sabit)
+DURAK_ARALIGI_KM = 0.45
+AKTARMA_YARICAPI_KM = 0.3
+ORTALAMA_HAT_UZUNLUGU = 25  # durak
+
+# Taşıma tipine göre (ortalama hız km/sa, açılış ücreti TL, km başına ücret TL)
+TIP_PARAMETRELERI = {
+    "bus": (20.0, 2.0, 0.3),
+    "tram": (25.0, 1.5, 0.25),
+}
+ISIM_KELIMELERI = [
+    "Yahya Kaptan", "Sekapark", "Otogar", "Umuttepe", "Halkevi", "Kuruçeşme", "Gültepe",
+    "Körfez", "Değirmendere", "Başiskele", "Kartepe", "Gölcük", "Derince", "Karamürsel",
+    "İzmit", "Çayırova", "Dilovası", "Yeniköy", "Bekirpaşa", "Cedit", "Ömerağa", "Serdar",
+    "Tepecik", "Kozluk", "Yenidoğan", "Alikahya", "Şirintepe", "Üniversite", "Çarşı", "Sanayi",
+]
+
+
+def sentetik_sehir_olustur(durak_sayisi: int, hat_sayisi: int = 0, tramvay_orani: float = 0.2,
+                           aktarma_yogunlugu: float = 0.3, tohum: int = 41) -> dict:
+    """
+    Sentetik şehir verisi üret
+
+    Args:
+        durak_sayisi: Toplam durak sayısı
+        hat_sayisi: Hat sayısı (0: hat başına ortalama ORTALAMA_HAT_UZUNLUGU durak)
+        tramvay_orani: Tramvay hatlarının oranı (0-1)
+        aktarma_yogunlugu: Yakınında başka hattan durak olduğunda aktarma
+            eklenme olasılığı (0-1)
+        tohum: Rastgele sayı üreteci tohumu
+
+    Returns:
+        {"city", "taxi", "duraklar"} sözlüğü (VeriYukleyici şeması)
+    """
+    if durak_sayisi < 2:
+        raise ValueError("En az iki durak gerekli")
+    if not 0.0 <= tramvay_orani <= 1.0 or not 0.0 <= aktarma_yogunlugu <= 1.0:
+        raise ValueError("Oranlar 0 ile 1 arasında olmalı")
+    if hat_sayisi <= 0:
+        hat_sayisi = max(1, round(durak_sayisi / ORTALAMA_HAT_UZUNLUGU))
+    hat_sayisi = min(hat_sayisi, durak_sayisi // 2)
+
+    rastgele = random.Random(tohum)
+    kenar_km = math.sqrt(durak_sayisi * DURAK_BASINA_ALAN_KM2)
+    km_derece_boylam = KM_DERECE_ENLEM * math.cos(math.radians(MERKEZ_ENLEM))
+
+    duraklar = []
+    hat_duraklari = []  # Hat -> durak sıraları
+    tramvay_hatti_sayisi = round(hat_sayisi * tramvay_orani)
+    for hat in range(hat_sayisi):
+        tip = "tram" if hat < tramvay_hatti_sayisi else "bus"
+        uzunluk = durak_sayisi // hat_sayisi + (1 if hat < durak_sayisi % hat_sayisi else 0)
+        x, y = rastgele.uniform(0, kenar_km), rastgele.uniform(0, kenar_km)
+        yon = rastgele.uniform(0, 2 * math.pi)
+        siralar = []
+        for _ in range(uzunluk):
+            # Alan dışına çıkan hat kenardan geri döner
+            if not 0 <= x <= kenar_km:
+                yon = math.pi - yon
+                x = min(max(x, 0.0), kenar_km)
+            if not 0 <= y <= kenar_km:
+                yon = -yon
+                y = min(max(y, 0.0), kenar_km)
+            sira = len(duraklar)
+            ek = "Tram" if tip == "tram" else "Bus"
+            duraklar.append({
+                "id": f"{tip}_{sira}",
+                "name": f"{rastgele.choice(ISIM_KELIMELERI)} {sira} ({ek})",
+                "type": tip,
+                "lat": round(MERKEZ_ENLEM + (y - kenar_km / 2) / KM_DERECE_ENLEM, 6),
+                "lon": round(MERKEZ_BOYLAM + (x - kenar_km / 2) / km_derece_boylam, 6),
+                "sonDurak": False,
+                "nextStops": [],
+                "transfer": None,
+            })
+            siralar.append(sira)
+            yon += rastgele.gauss(0, 0.25)
+            adim = DURAK_ARALIGI_KM * rastgele.uniform(0.6, 1.4)
+            x += adim * math.cos(yon)
+            y += adim * math.sin(yon)
+        hat_duraklari.append(siralar)
+
+    # Çift yönlü hat bağlantıları; hattın iki ucu son durak olarak işaretlenir
+    for siralar in hat_duraklari:
+        duraklar[siralar[0]]["sonDurak"] = duraklar[siralar[-1]]["sonDurak"] = True
+        for onceki, sonraki in zip(siralar, siralar[1:]):
+            duraklar[onceki]["nextStops"].append(_baglanti(duraklar[onceki], duraklar[sonraki]))
+            duraklar[sonraki]["nextStops"].append(_baglanti(duraklar[sonraki], duraklar[onceki]))
+
+    _aktarmalari_ekle(duraklar, hat_duraklari, aktarma_yogunlugu, rastgele)
+
+    return {
+        "city": f"Sentetik ({durak_sayisi} durak, tohum {tohum})",
+        "taxi": {"openingFee": 10, "costPerKm": 4},
+        "duraklar": duraklar,
+    }
+
+
+def _baglanti(kaynak: dict, hedef: dict) -> dict:
+    mesafe = MesafeHesaplayici.haversine_mesafe(kaynak["lat"], kaynak["lon"], hedef["lat"], hedef["lon"])
+    hiz, acilis, km_ucreti = TIP_PARAMETRELERI[kaynak["type"]]
+    return {
+        "stopId": hedef["id"],
+        "mesafe": round(mesafe, 2),
+        "sure": max(1, round(mesafe / hiz * 60)),
+        "ucret": round(acilis + km_ucreti * mesafe, 2),
+    }
+
+
+def _aktarmalari_ekle(duraklar: list, hat_duraklari: list, aktarma_yogunlugu: float,
+                      rastgele: random.Random):
+    """Başka hattaki en yakın durağa (yarıçap içindeyse) karşılıklı aktarma ekle"""
+    hat_no = [0] * len(duraklar)
+    for hat, siralar in enumerate(hat_duraklari):
+        for sira in siralar:
+            hat_no[sira] = hat
+
+    # Izgara: hücre boyu aktarma yarıçapı kadar, komşu 3x3 hücre aranır
+    hucre_enlem = AKTARMA_YARICAPI_KM / KM_DERECE_ENLEM
+    hucre_boylam = hucre_enlem / math.cos(math.radians(MERKEZ_ENLEM))
+    izgara = {}
+    for sira, durak in enumerate(duraklar):
+        anahtar = (int(durak["lat"] // hucre_enlem), int(durak["lon"] // hucre_boylam))
+        izgara.setdefault(anahtar, []).append(sira)
+
+    for sira, durak in enumerate(duraklar):
+        if durak["transfer"] is not None or rastgele.random() >= aktarma_yogunlugu:
+            continue
+        hx, hy = int(durak["lat"] // hucre_enlem), int(durak["lon"] // hucre_boylam)
+        en_yakin, en_kisa = None, AKTARMA_YARICAPI_KM
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for aday in izgara.get((hx + dx, hy + dy), ()):
+                    if hat_no[aday] == hat_no[sira] or duraklar[aday]["transfer"] is not None:
+                        continue
+                    mesafe = MesafeHesaplayici.haversine_mesafe(
+                        durak["lat"], durak["lon"], duraklar[aday]["lat"], duraklar[aday]["lon"])
+                    if mesafe < en_kisa:
+                        en_yakin, en_kisa = aday, mesafe
+        if en_yakin is None:
+            continue
+        sure = max(1, round(en_kisa * 12 + rastgele.uniform(0, 2)))  # Yürüme + bekleme (dk)
+        ucret = rastgele.choice((0, 0, 0.5))
+        durak["transfer"] = {"transferStopId": duraklar[en_yakin]["id"],
+                             "transferSure": sure, "transferUcret": ucret}
+        duraklar[en_yakin]["transfer"] = {"transferStopId": durak["id"],
+                                          "transferSure": sure, "transferUcret": ucret}
+
+
+def dosyaya_yaz(veri: dict, dosya_yolu: str):
+    with open(dosya_yolu, "w", encoding="utf-8") as dosya:
+        json.dump(veri, dosya, ensure_ascii=False)
+
+
+def main():
+    ayristirici = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ayristirici.add_argument("cikti")
+    ayristirici.add_argument("--duraklar", type=int, default=1000)
+    ayristirici.add_argument("--hatlar", type=int, default=0)
+    ayristirici.add_argument("--tramvay-orani", type=float, default=0.2)
+    ayristirici.add_argument("--aktarma-yogunlugu", type=float, default=0.3)
+    ayristirici.add_argument("--tohum", type=int, default=41)
+    argumanlar = ayristirici.parse_args()
+
+    veri = sentetik_sehir_olustur(argumanlar.duraklar, argumanlar.hatlar, argumanlar.tramvay_orani,
+                                  argumanlar.aktarma_yogunlugu, argumanlar.tohum)
+    dosyaya_yaz(veri, argumanlar.cikti)
+    aktarmalar = sum(1 for durak in veri["duraklar"] if durak["transfer"])
+    print(f"{argumanlar.cikti}: {len(veri['duraklar'])} durak, {aktarmalar} aktarmalı durak")
+
+
+if __name__ == "__main__":
+    main()
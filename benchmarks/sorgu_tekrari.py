@@ -0,0 +1,307 @@
+"""
+Kaydedilmiş sorgu günlüğünü (sorgu_kaydi) rota motoruna yeniden oynatır.
+
+Her kayıt, kaydedildiği motor çağrısıyla yeniden çalıştırılır. Rapor verim
+(sorgu/sn), gecikme yüzdelikleri ve kayıttaki sonuç özetleriyle farkları
+içerir. --hiz verilirse sorgular sabit oranla gönderilir (açık döngü; yanıt
+süresine kuyrukta bekleme dahildir), verilmezse her işçi bir öncekini bitirir
+bitirmez yenisini alır. --eszamanlilik 1'den büyükse her işçi ayrı bir süreçte
+kendi motorunu kurar.
+
+"degerlendirme" kayıtları (arayüzün önceden üretilmiş seçenekleri yeniden
+değerlendirmesi) için seçenekler süre ölçümünden önce üretilir; böylece her
+kaydın süresi kaydedilen çağrının süresiyle karşılaştırılabilir kalır.
+
+Kayıt almak için:
+    ROTA_SORGU_KAYDI=sorgular.jsonl python arayuz.py
+    (veya RotaMotoru(..., sorgu_kaydi_dosyasi="sorgular.jsonl"))
+
+Kullanım:
+    python benchmarks/sorgu_tekrari.py sorgular.jsonl [--veri veri.json] [--arama-modu MOD]
+        [--hiz QPS] [--eszamanlilik N] [--sinir N] [--onbellegi-isit] [--farklar N]
+        [--cikti rapor.json]
+"""
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import platform
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sorgu_kaydi
+from konum import Konum
+from cuzdan import Cuzdan
+from maliyet_agirliklari import MaliyetAgirliklari
+from rota_motoru import RotaMotoru
+
+
+RAPOR_SURUMU = 1
+SECENEK_ONBELLEGI_SINIRI = 1024  # "degerlendirme" kayıtları için tutulan seçenek listeleri
+ISCI_HAZIRLIK_SURESI = 600  # sn - işçilerin motor kurması için en fazla bekleme
+
+
+def motor_kur(veri: str, arama_modu: str, onbellegi_isit: bool) -> RotaMotoru:
+    motor = RotaMotoru(veri, arama_modu=arama_modu, onbellegi_isit=onbellegi_isit)
+    motor.hazirla("durak_grafi", "en_uygun_rota_secici")
+    return motor
+
+
+def kaydi_calistir(motor: RotaMotoru, kayit: dict, secenek_onbellegi: dict):
+    """Kaydı motorda yeniden çalıştır; (servis süresi sn, sonuç özeti, hata veya None)"""
+    try:
+        tur = kayit["tur"]
+        baslangic_konum = Konum(*kayit["baslangic"])
+        hedef_konum = Konum(*kayit["hedef"])
+        if "cuzdan" in kayit:
+            cuzdan = Cuzdan(**kayit["cuzdan"])
+        secici = motor.en_uygun_rota_secici
+        if tur == "degerlendirme":
+            anahtar = (tuple(kayit["baslangic"]), tuple(kayit["hedef"]))
+            secenekler = secenek_onbellegi.get(anahtar)
+            if secenekler is None:
+                if len(secenek_onbellegi) >= SECENEK_ONBELLEGI_SINIRI:
+                    secenek_onbellegi.clear()
+                secenekler = secenek_onbellegi[anahtar] = \
+                    motor.rota_secenekleri_uretici.tum_rota_secenekleri_olustur(baslangic_konum, hedef_konum)
+
+        baslangic = time.perf_counter()
+        if tur == "rota":
+            sonuc = motor.rota_hesaplayici.en_uygun_rota_bul(baslangic_konum, hedef_konum,
+                                                             kayit.get("yolcu_tipi"))
+        elif tur == "secenekler":
+            sonuc = motor.rota_secenekleri_uretici.tum_rota_secenekleri_olustur(baslangic_konum, hedef_konum)
+        elif tur == "secici":
+            agirliklar = kayit.get("agirliklar")
+            sonuc = secici.en_uygun_rotayi_bul(
+                baslangic_konum, hedef_konum, cuzdan, kayit["odeme_yontemi"], kayit["oncelik"],
+                kayit.get("butce_kisitli", False),
+                MaliyetAgirliklari(**agirliklar) if agirliklar else None
+            )
+        else:
+            sonuc = secici.secenekleri_degerlendir(baslangic_konum, hedef_konum, secenekler, cuzdan,
+                                                   kayit["odeme_yontemi"], kayit["oncelik"])
+        sure = time.perf_counter() - baslangic
+        return sure, sorgu_kaydi.sonuc_ozeti(tur, sonuc), None
+    except Exception as hata:
+        return 0.0, None, f"{type(hata).__name__}: {hata}"
+
+
+# Süreç işçileri: motor işçi başına bir kez kurulur
+_isci_motoru = None
+_isci_secenekleri: dict = {}
+
+
+def _isci_baslat(veri: str, arama_modu: str, onbellegi_isit: bool, engel):
+    global _isci_motoru
+    _isci_motoru = motor_kur(veri, arama_modu, onbellegi_isit)
+    engel.wait(ISCI_HAZIRLIK_SURESI)
+
+
+def _isci_hazir() -> int:
+    return os.getpid()
+
+
+def _isci_calistir(kayit: dict):
+    return kaydi_calistir(_isci_motoru, kayit, _isci_secenekleri)
+
+
+def oynat(kayitlar, veri: str, arama_modu: str, onbellegi_isit: bool, hiz: float, eszamanlilik: int):
+    """
+    Kayıtları oynat
+
+    Returns:
+        ([(yanıt sn, servis sn, özet, hata), ...] kayıt sırasıyla, toplam süre sn)
+    """
+    sonuclar = [None] * len(kayitlar)
+    if eszamanlilik <= 1:
+        motor = motor_kur(veri, arama_modu, onbellegi_isit)
+        secenek_onbellegi = {}
+        baslangic = time.perf_counter()
+        for sira, kayit in enumerate(kayitlar):
+            planlanan = baslangic + sira / hiz if hiz else time.perf_counter()
+            bekleme = planlanan - time.perf_counter()
+            if bekleme > 0:
+                time.sleep(bekleme)
+            servis, ozet, hata = kaydi_calistir(motor, kayit, secenek_onbellegi)
+            sonuclar[sira] = (time.perf_counter() - planlanan, servis, ozet, hata)
+        return sonuclar, time.perf_counter() - baslangic
+
+    # Her gönderim bir işçi süreci başlatır; engel tüm işçiler motorunu kurana kadar bekletir
+    engel = multiprocessing.Barrier(eszamanlilik + 1)
+    with ProcessPoolExecutor(max_workers=eszamanlilik, initializer=_isci_baslat,
+                             initargs=(veri, arama_modu, onbellegi_isit, engel)) as havuz:
+        hazirlik = [havuz.submit(_isci_hazir) for _ in range(eszamanlilik)]
+        engel.wait(ISCI_HAZIRLIK_SURESI)
+        wait(hazirlik)
+
+        # Kapalı döngüde en fazla eszamanlilik kadar sorgu işlemde tutulur
+        yer = None if hiz else threading.Semaphore(eszamanlilik)
+
+        def tamamlandi(sira, planlanan, gelecek):
+            servis, ozet, hata = gelecek.result()
+            sonuclar[sira] = (time.perf_counter() - planlanan, servis, ozet, hata)
+            if yer is not None:
+                yer.release()
+
+        gelecekler = []
+        baslangic = time.perf_counter()
+        for sira, kayit in enumerate(kayitlar):
+            if hiz:
+                planlanan = baslangic + sira / hiz
+                bekleme = planlanan - time.perf_counter()
+                if bekleme > 0:
+                    time.sleep(bekleme)
+            else:
+                yer.acquire()
+                planlanan = time.perf_counter()
+            gelecek = havuz.submit(_isci_calistir, kayit)
+            gelecek.add_done_callback(lambda g, s=sira, p=planlanan: tamamlandi(s, p, g))
+            gelecekler.append(gelecek)
+        wait(gelecekler)
+        sure = time.perf_counter() - baslangic
+    return sonuclar, sure
+
+
+def yuzdelikler(sureler) -> dict:
+    """Süre listesinin (sn) özet istatistikleri (ms, en yakın sıra yüzdelikleri)"""
+    sirali = sorted(sureler)
+    adet = len(sirali)
+    if adet == 0:
+        return {"adet": 0}
+
+    def yuzdelik(oran):
+        return sirali[max(0, math.ceil(adet * oran) - 1)] * 1000
+
+    return {
+        "adet": adet,
+        "ortalama_ms": sum(sirali) / adet * 1000,
+        "p50_ms": yuzdelik(0.50),
+        "p90_ms": yuzdelik(0.90),
+        "p95_ms": yuzdelik(0.95),
+        "p99_ms": yuzdelik(0.99),
+        "en_fazla_ms": sirali[-1] * 1000,
+    }
+
+
+def rapor_olustur(kayitlar, sonuclar, sure: float, motor_stratejileri, farklar_siniri: int) -> dict:
+    farklar = []
+    fark_sayisi = 0
+    hatalar = []
+    tur_sureleri = {}
+    for sira, (kayit, (_, servis, ozet, hata)) in enumerate(zip(kayitlar, sonuclar)):
+        if hata is not None:
+            hatalar.append({"sira": sira, "tur": kayit["tur"], "hata": hata})
+            continue
+        tur_sureleri.setdefault(kayit["tur"], []).append(servis)
+        if "sonuc" in kayit and kayit["sonuc"] != ozet:
+            fark_sayisi += 1
+            if len(farklar) < farklar_siniri:
+                farklar.append({"sira": sira, "tur": kayit["tur"], "baslangic": kayit["baslangic"],
+                                "hedef": kayit["hedef"], "kayit": kayit["sonuc"], "tekrar": ozet})
+
+    kayit_sureleri = [kayit["sure_ms"] / 1000 for kayit in kayitlar if "sure_ms" in kayit]
+    strateji_farki = sum(1 for kayit in kayitlar
+                         if "stratejiler" in kayit and kayit["stratejiler"] != motor_stratejileri)
+    return {
+        "sorgu": len(kayitlar),
+        "tur_sayilari": sorgu_kaydi.tur_sayilari(kayitlar),
+        "sure_sn": sure,
+        "verim_sorgu_sn": len(kayitlar) / sure if sure else 0.0,
+        "yanit": yuzdelikler([sonuc[0] for sonuc in sonuclar]),
+        "servis": yuzdelikler([sonuc[1] for sonuc, kayit in zip(sonuclar, kayitlar) if sonuc[3] is None]),
+        "kayittaki_servis": yuzdelikler(kayit_sureleri),
+        "turler": {tur: yuzdelikler(sureler) for tur, sureler in tur_sureleri.items()},
+        "fark_sayisi": fark_sayisi,
+        "farklar": farklar,
+        "strateji_kumesi_farkli": strateji_farki,
+        "hata_sayisi": len(hatalar),
+        "hatalar": hatalar[:farklar_siniri],
+    }
+
+
+def raporu_yazdir(rapor: dict):
+    print(f"{rapor['sorgu']} sorgu {rapor['sure_sn']:.2f} sn içinde oynatıldı: "
+          f"{rapor['verim_sorgu_sn']:.1f} sorgu/sn")
+    print("Türler: " + ", ".join(f"{tur} {adet}" for tur, adet in rapor["tur_sayilari"].items() if adet))
+    print(f"\n{'Gecikme':<22} {'Adet':>6} {'Ort. (ms)':>10} {'p50':>9} {'p90':>9} {'p95':>9} "
+          f"{'p99':>9} {'En fazla':>9}")
+    satirlar = [("yanıt", rapor["yanit"]), ("servis", rapor["servis"]),
+                ("kayıttaki servis", rapor["kayittaki_servis"])]
+    satirlar += [(f"  {tur}", ozet) for tur, ozet in rapor["turler"].items()]
+    for ad, ozet in satirlar:
+        if not ozet["adet"]:
+            continue
+        print(f"{ad:<22} {ozet['adet']:>6} {ozet['ortalama_ms']:>10.3f} {ozet['p50_ms']:>9.3f} "
+              f"{ozet['p90_ms']:>9.3f} {ozet['p95_ms']:>9.3f} {ozet['p99_ms']:>9.3f} "
+              f"{ozet['en_fazla_ms']:>9.3f}")
+
+    print(f"\nSonuç farkı: {rapor['fark_sayisi']}, hata: {rapor['hata_sayisi']}, "
+          f"strateji kümesi farklı kayıt: {rapor['strateji_kumesi_farkli']}")
+    for fark in rapor["farklar"]:
+        print(f"  #{fark['sira']} {fark['tur']} {fark['baslangic']} -> {fark['hedef']}")
+        print(f"    kayıt : {json.dumps(fark['kayit'], ensure_ascii=False)}")
+        print(f"    tekrar: {json.dumps(fark['tekrar'], ensure_ascii=False)}")
+    for hata in rapor["hatalar"]:
+        print(f"  #{hata['sira']} {hata['tur']}: {hata['hata']}")
+
+
+def main():
+    ayristirici = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ayristirici.add_argument("kayit", help="sorgu_kaydi JSONL dosyası")
+    ayristirici.add_argument("--veri", help="Veri seti (varsayılan: çalışma klasöründe aranır)")
+    ayristirici.add_argument("--arama-modu", help="Varsayılan: kayıttaki arama modu, yoksa bfs")
+    ayristirici.add_argument("--hiz", type=float, default=0.0,
+                             help="Saniyedeki sorgu (0: kapalı döngü, en hızlı)")
+    ayristirici.add_argument("--eszamanlilik", type=int, default=1, help="İşçi süreç sayısı")
+    ayristirici.add_argument("--sinir", type=int, default=0, help="Yalnızca ilk N kayıt (0: tümü)")
+    ayristirici.add_argument("--onbellegi-isit", action="store_true",
+                             help="Motorları arayüz gibi ağaç önbelleği ısıtılmış başlat")
+    ayristirici.add_argument("--farklar", type=int, default=10, help="Gösterilecek en fazla fark")
+    ayristirici.add_argument("--cikti", help="JSON rapor dosyası")
+    argumanlar = ayristirici.parse_args()
+
+    kayitlar = list(sorgu_kaydi.kayitlari_oku(argumanlar.kayit))
+    if argumanlar.sinir > 0:
+        kayitlar = kayitlar[:argumanlar.sinir]
+    if not kayitlar:
+        ayristirici.error(f"Kayıt bulunamadı: {argumanlar.kayit}")
+    arama_modu = argumanlar.arama_modu or next(
+        (kayit["arama_modu"] for kayit in kayitlar if "arama_modu" in kayit), "bfs")
+
+    # Strateji kümesini ve veri yolunu ana süreçte bir kez kurarak doğrula
+    motor = RotaMotoru(argumanlar.veri, arama_modu=arama_modu)
+    veri = motor.dosya_yolu
+    motor_stratejileri = [strateji.strateji_adi() for strateji in motor.rota_secenekleri_uretici.stratejiler]
+    del motor
+
+    sonuclar, sure = oynat(kayitlar, veri, arama_modu, argumanlar.onbellegi_isit,
+                           argumanlar.hiz, argumanlar.eszamanlilik)
+    rapor = rapor_olustur(kayitlar, sonuclar, sure, motor_stratejileri, argumanlar.farklar)
+    raporu_yazdir(rapor)
+
+    if argumanlar.cikti:
+        rapor = {
+            "surum": RAPOR_SURUMU,
+            "tarih": datetime.now().isoformat(timespec="seconds"),
+            "ortam": {"python": platform.python_version(), "platform": platform.platform()},
+            "parametreler": {"kayit": argumanlar.kayit, "veri": veri, "arama_modu": arama_modu,
+                             "hiz": argumanlar.hiz, "eszamanlilik": argumanlar.eszamanlilik,
+                             "onbellegi_isit": argumanlar.onbellegi_isit},
+            **rapor,
+        }
+        with open(argumanlar.cikti, "w", encoding="utf-8") as dosya:
+            json.dump(rapor, dosya, ensure_ascii=False, indent=2)
+        print(f"Rapor: {argumanlar.cikti}")
+    if rapor["fark_sayisi"] or rapor["hata_sayisi"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -57,6 +57,21 @@ class Cuzdan:
         """Toplam kullanılabilir bakiye"""
         return self._nakit + self._kredi_karti_limiti + self._kentkart_bakiyesi
     
+    def bakiye(self, odeme_yontemi: str) -> float:
+        """
+        Belirtilen ödeme yöntemindeki kullanılabilir bakiye
+        
+        Args:
+            odeme_yontemi: "nakit", "kredi_karti", "kentkart"
+        """
+        if odeme_yontemi == "nakit":
+            return self._nakit
+        elif odeme_yontemi == "kredi_karti":
+            return self._kredi_karti_limiti
+        elif odeme_yontemi == "kentkart":
+            return self._kentkart_bakiyesi
+        return 0.0
+    
     def odeme_yapabilir_mi(self, tutar: float, odeme_yontemi: str) -> bool:
         """
         Belirtilen ödeme yöntemi ile ödeme yapılabilir mi?
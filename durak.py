@@ -13,6 +13,7 @@ class Durak(ABC):
         self._son_durak = son_durak
         self._sonraki_duraklar: List[Dict] = []
         self._aktarma: Optional[Dict] = None
+        self._gelen_aktarmalar: List[Dict] = []  # Bu durağa aktarma yapılan duraklar (ters)
     
     @property
     def durak_id(self) -> str:
@@ -42,6 +43,10 @@ class Durak(ABC):
     def aktarma(self) -> Optional[Dict]:
         return self._aktarma
     
+    @property
+    def gelen_aktarmalar(self) -> List[Dict]:
+        return self._gelen_aktarmalar
+    
     def sonraki_durak_ekle(self, durak_bilgisi: Dict):
         """Sonraki durağı ekle"""
         self._sonraki_duraklar.append(durak_bilgisi)
@@ -50,6 +55,10 @@ class Durak(ABC):
         """Aktarma bilgisini ayarla"""
         self._aktarma = aktarma_bilgisi
     
+    def gelen_aktarma_ekle(self, aktarma_bilgisi: Dict):
+        """Gelen aktarmayı ekle (transferStopId aktarmanın yapıldığı durak)"""
+        self._gelen_aktarmalar.append(aktarma_bilgisi)
+    
     @abstractmethod
     def tasima_tipi(self) -> str:
         """Taşıma tipini döndür (otobüs veya tramvay)"""
@@ -0,0 +1,168 @@
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from typing import List, Dict, Optional, Tuple
+from durak import Durak
+
+
+# Türkçe büyük harf -> küçük harf (str.lower "I" ve "İ" için yanlış sonuç verir)
+_TURKCE_KUCUK_HARF = str.maketrans({"I": "ı", "İ": "i"})
+# Aksan duyarsız karşılaştırma için harf katlama
+_AKSAN_KATLAMA = str.maketrans({
+    "ç": "c", "ğ": "g", "ı": "i", "ö": "o", "ş": "s", "ü": "u",
+    "â": "a", "î": "i", "û": "u", "\u0307": None,
+})
+
+
+def turkce_normallestir(metin: str) -> str:
+    """
+    Arama anahtarı: Türkçe kurallarıyla küçük harf, aksansız, yalnızca harf/rakam
+    
+    Örn: "İzmit Otogarı (Bus)" -> "izmit otogari bus"
+    """
+    metin = metin.translate(_TURKCE_KUCUK_HARF).lower().translate(_AKSAN_KATLAMA)
+    return " ".join("".join(c if c.isalnum() else " " for c in metin).split())
+
+
+class DurakAdiDizini:
+    """
+    Durak isimleri için önek ve bulanık (trigram) arama dizini
+    
+    Önek araması sıralı anahtar listesi üzerinde ikili arama ile yapılır
+    (düzleştirilmiş bir önek ağacı): hem ismin başı hem de isimdeki her kelimenin
+    başı eşleşir, sorgu süresi isim sayısından bağımsız olarak O(log n + limit)
+    kalır. Yazım hatalarına dayanıklı arama trigram benzerliğiyle (Dice
+    katsayısı) yapılır; daha pahalı olduğundan yazarken değil gönderimde kullanılır.
+    """
+    
+    ONERI_SAYISI = 10
+    BULANIK_ESIK = 0.3  # Bu benzerliğin altındaki isimler önerilmez
+    TARAMA_SINIRI = 30000  # Bulanık aramada okunan en fazla trigram listesi kaydı
+    ADAY_SINIRI = 300  # Benzerliği tam hesaplanan en fazla aday
+    
+    def __init__(self, duraklar: Dict[str, Durak]):
+        isim_sirasi: Dict[str, int] = {}
+        self._isimler: List[str] = []  # Farklı durak isimleri (gösterim hali)
+        self._durak_idleri: List[List[str]] = []  # İsim sırası -> o isimdeki duraklar
+        for durak_id, durak in duraklar.items():
+            sira = isim_sirasi.get(durak.isim)
+            if sira is None:
+                sira = isim_sirasi[durak.isim] = len(self._isimler)
+                self._isimler.append(durak.isim)
+                self._durak_idleri.append([])
+            self._durak_idleri[sira].append(durak_id)
+        
+        self._anahtarlar = [turkce_normallestir(isim) for isim in self._isimler]
+        # Normalleştirilmiş isim -> duraklar (yazımı farklı ama anahtarı aynı isimler birleşir)
+        self._anahtar_duraklari: Dict[str, List[str]] = {}
+        for sira, anahtar in enumerate(self._anahtarlar):
+            self._anahtar_duraklari.setdefault(anahtar, []).extend(self._durak_idleri[sira])
+        
+        # Önek dizinleri: isim başları ve isim içindeki kelime başları (ayrı, isim başı öncelikli)
+        bas_girdileri = sorted((anahtar, sira) for sira, anahtar in enumerate(self._anahtarlar))
+        kelime_girdileri = []
+        for sira, anahtar in enumerate(self._anahtarlar):
+            konum = anahtar.find(" ")
+            while konum >= 0:
+                kelime_girdileri.append((anahtar[konum + 1:], sira))
+                konum = anahtar.find(" ", konum + 1)
+        kelime_girdileri.sort()
+        self._onek_dizinleri: List[Tuple[List[str], array]] = [
+            ([anahtar for anahtar, _ in girdiler], array('I', (sira for _, sira in girdiler)))
+            for girdiler in (bas_girdileri, kelime_girdileri)
+        ]
+        
+        # Trigram -> o trigramı içeren isim sıraları
+        trigram_listeleri: Dict[str, List[int]] = {}
+        self._trigram_sayilari = array('H')
+        for sira, anahtar in enumerate(self._anahtarlar):
+            trigramlar = self._trigramlar(anahtar)
+            self._trigram_sayilari.append(min(len(trigramlar), 0xFFFF))
+            for trigram in trigramlar:
+                trigram_listeleri.setdefault(trigram, []).append(sira)
+        self._trigram_dizini: Dict[str, array] = {
+            trigram: array('I', siralar) for trigram, siralar in trigram_listeleri.items()
+        }
+    
+    def __len__(self) -> int:
+        return len(self._isimler)
+    
+    def oneriler(self, sorgu: str, limit: int = ONERI_SAYISI) -> List[str]:
+        """
+        Yazarken öneri: yalnızca önek eşleşmeleri
+        
+        Her tuş vuruşunda çağrıldığından bulanık arama yapılmaz; yazım hatalı
+        sorgular için bulanik_ara gönderimde (Enter, rota bulma) çağrılmalıdır.
+        """
+        return self.onek_ara(sorgu, limit)
+    
+    def onek_ara(self, sorgu: str, limit: int = ONERI_SAYISI) -> List[str]:
+        """İsmi veya isimdeki bir kelimesi sorguyla başlayan durak isimleri"""
+        onek = turkce_normallestir(sorgu)
+        if not onek:
+            return []
+        sonuc: List[str] = []
+        gorulen = set()
+        for anahtarlar, siralar in self._onek_dizinleri:
+            i = bisect_left(anahtarlar, onek)
+            while i < len(anahtarlar) and len(sonuc) < limit and anahtarlar[i].startswith(onek):
+                sira = siralar[i]
+                if sira not in gorulen:
+                    gorulen.add(sira)
+                    sonuc.append(self._isimler[sira])
+                i += 1
+            if len(sonuc) >= limit:
+                break
+        return sonuc
+    
+    def bulanik_ara(self, sorgu: str, limit: int = ONERI_SAYISI,
+                    esik: float = BULANIK_ESIK) -> List[str]:
+        """
+        Trigram benzerliği en yüksek durak isimleri (yazım hatalarına dayanıklı)
+        
+        Trigram listeleri en kısadan başlanarak, toplamı TARAMA_SINIRI'nı aşmayana
+        kadar okunur: çok yaygın trigramların (örn. "bus") listeleri aday üretmek
+        için okunmaz. Ortak trigram sayısı en yüksek ADAY_SINIRI aday
+        için benzerlik, isimlerin tüm trigramlarıyla tam olarak hesaplanır.
+        """
+        trigramlar = self._trigramlar(turkce_normallestir(sorgu))
+        if not trigramlar:
+            return []
+        listeler = sorted((self._trigram_dizini.get(trigram, ()) for trigram in trigramlar), key=len)
+        ortak = Counter()
+        kalan = self.TARAMA_SINIRI
+        for siralar in listeler:
+            # Listeler kısadan uzuna sıralı; sığmayan listeden sonrakiler de sığmaz
+            if len(siralar) > kalan:
+                if not ortak:
+                    ortak.update(siralar[:kalan])
+                break
+            ortak.update(siralar)
+            kalan -= len(siralar)
+        
+        sorgu_sayisi = len(trigramlar)
+        adaylar = []
+        for sira, _ in ortak.most_common(self.ADAY_SINIRI):
+            anahtar = self._anahtarlar[sira]
+            sayi = len(trigramlar & self._trigramlar(anahtar))
+            benzerlik = 2 * sayi / (sorgu_sayisi + self._trigram_sayilari[sira])
+            if benzerlik >= esik:
+                adaylar.append((-benzerlik, anahtar, sira))
+        adaylar.sort()
+        return [self._isimler[sira] for _, _, sira in adaylar[:limit]]
+    
+    def durak_bul(self, isim: str) -> Optional[str]:
+        """İsmi (büyük/küçük harf ve aksan farkı gözetmeksizin) eşleşen ilk durağın ID'si"""
+        durak_idleri = self._anahtar_duraklari.get(turkce_normallestir(isim))
+        return durak_idleri[0] if durak_idleri else None
+    
+    def durak_idleri(self, isim: str) -> List[str]:
+        """Bu isimdeki tüm durakların ID'leri"""
+        return list(self._anahtar_duraklari.get(turkce_normallestir(isim), ()))
+    
+    @staticmethod
+    def _trigramlar(anahtar: str) -> set:
+        if not anahtar:
+            return set()
+        dolgulu = f"  {anahtar} "
+        return {dolgulu[i:i + 3] for i in range(len(dolgulu) - 2)}
@@ -0,0 +1,1177 @@
+import heapq
+import json
+import struct
+from array import array
+from typing import List, Dict, Optional, Tuple
+from durak import Durak
+from arama_istatistikleri import AramaIstatistikleri
+from aktarma_indirimi import AktarmaIndirimYoneticisi
+from mesafe_hesaplayici import MesafeHesaplayici
+
+
+class DurakGrafi:
+    """Durak ağının dizi tabanlı (CSR) derlenmiş hali - arama motorları için"""
+    
+    ARAMA_YONTEMLERI = ("dijkstra", "astar", "ch")
+    
+    # Kenar ulaşım modu bitleri - aramalar izin verilen modların maskesini alır
+    MOD_OTOBUS = 1
+    MOD_TRAMVAY = 2
+    MOD_AKTARMA = 4
+    MOD_YURUME = 8
+    MOD_TAKSI = 16
+    MOD_TUMU = MOD_OTOBUS | MOD_TRAMVAY | MOD_AKTARMA | MOD_YURUME | MOD_TAKSI
+    MOD_ERISILEBILIR = 32  # Maskede varsa yalnızca erişilebilir kenarlar kullanılır
+    _KENAR_ERISILEMEZ = 64  # Kenar modlarında erişilebilir olmayan kenarları işaretler
+    _DURAK_TIPI_MODLARI = {"otobüs": MOD_OTOBUS, "tramvay": MOD_TRAMVAY}
+    
+    # Yüklemede güçlü bağlı bileşenleri hesaplanan mod maskeleri
+    ON_HESAPLANAN_MASKELER = (MOD_TUMU, MOD_OTOBUS, MOD_TRAMVAY)
+    _KAPANIS_SINIRI = 4096  # Bileşen sayısı bunu aşarsa erişim maskeleri yerine aralık etiketleri
+    
+    # Anlık görüntü dosya biçimi
+    _SIHIRLI = b"DGRF"
+    _SURUM = 1
+    _TEMEL_DIZILER = ("_enlemler", "_boylamlar", "_kenar_baslangic", "_kenar_kaynak",
+                      "_kenar_hedef", "_kenar_sure", "_kenar_ucret", "_kenar_mesafe",
+                      "_kenar_aktarma")
+    
+    def __init__(self, duraklar: Dict[str, Durak]):
+        self._durak_idleri: List[str] = list(duraklar.keys())
+        self._indeks: Dict[str, int] = {durak_id: i for i, durak_id in enumerate(self._durak_idleri)}
+        self._tasima_tipleri: List[str] = [durak.tasima_tipi() for durak in duraklar.values()]
+        self._enlemler = array('d', (durak.enlem for durak in duraklar.values()))
+        self._boylamlar = array('d', (durak.boylam for durak in duraklar.values()))
+        
+        # Kenarlar: her durak için önce sonraki duraklar, sonra aktarma
+        self._kenar_baslangic = array('i', [0])
+        self._kenar_kaynak = array('i')
+        self._kenar_hedef = array('i')
+        self._kenar_sure = array('d')
+        self._kenar_ucret = array('d')
+        self._kenar_mesafe = array('d')
+        self._kenar_aktarma = array('b')
+        self._kenar_bilgileri: List[Dict] = []  # Yol -> RotaAdimi dönüşümü için
+        
+        for u, durak in enumerate(duraklar.values()):
+            for sonraki in durak.sonraki_duraklar:
+                hedef = self._indeks.get(sonraki["stopId"])
+                if hedef is not None:
+                    self._kenar_ekle(u, hedef, sonraki["sure"], sonraki["ucret"],
+                                     sonraki["mesafe"], False, sonraki)
+            if durak.aktarma:
+                hedef = self._indeks.get(durak.aktarma["transferStopId"])
+                if hedef is not None:
+                    aktarma_bilgisi = {
+                        "transferSure": durak.aktarma["transferSure"],
+                        "transferUcret": durak.aktarma["transferUcret"]
+                    }
+                    self._kenar_ekle(u, hedef, durak.aktarma["transferSure"],
+                                     durak.aktarma["transferUcret"], 0.0, True, aktarma_bilgisi)
+            self._kenar_baslangic.append(len(self._kenar_hedef))
+        
+        self._bos_durumlari_olustur()
+    
+    def _bos_durumlari_olustur(self):
+        """Derlemeden türetilen, sonradan hesaplanan yapıları başlat"""
+        # İndirim yöneticisine göre hesaplanmış kenar ücretleri önbelleği
+        self._ucret_onbellegi: Dict[int, Tuple[int, array]] = {}
+        
+        # Ters komşuluk (hedefe gelen kenarlar), ilk ihtiyaçta oluşturulur
+        self._ters_baslangic: Optional[array] = None
+        self._ters_kenarlar: Optional[array] = None
+        
+        # Anlık görüntüye yazılan ön hesaplanmış diziler (işaret durakları vb.)
+        self._ek_diziler: Dict[str, array] = {}
+        
+        # A* için en yüksek hız (km/dk) - haversine alt sınırı bununla bölünür
+        self._en_yuksek_hiz: Optional[float] = None
+        
+        # Kontraksiyon hiyerarşisi (isteğe bağlı ön işleme)
+        self._kontraksiyon = None
+        
+        # Kök durak başına arama ağaçları önbelleği, ilk ihtiyaçta oluşturulur
+        self._agac_onbellegi = None
+        
+        # Kenar başına ulaşım modu bitleri
+        self._kenar_modlarini_olustur()
+        
+        # Yasak mod maskesi başına güçlü bağlı bileşenler ve bileşenler arası erişim kümeleri
+        self._bilesenler: Dict[int, Tuple[array, _BilesenErisimi]] = {}
+        for izin_maskesi in self.ON_HESAPLANAN_MASKELER:
+            self._bilesenleri_getir(izin_maskesi)
+    
+    def _kenar_ekle(self, kaynak: int, hedef: int, sure: float, ucret: float,
+                    mesafe: float, aktarma: bool, bilgi: Dict):
+        """CSR dizilerine bir kenar ekle"""
+        self._kenar_kaynak.append(kaynak)
+        self._kenar_hedef.append(hedef)
+        self._kenar_sure.append(sure)
+        self._kenar_ucret.append(ucret)
+        self._kenar_mesafe.append(mesafe)
+        self._kenar_aktarma.append(1 if aktarma else 0)
+        self._kenar_bilgileri.append(bilgi)
+    
+    def _kenar_modlarini_olustur(self):
+        """Kenar mod bitlerini durak tiplerinden ve kenar bilgilerinden türet"""
+        modlar = array('B')
+        for k in range(self.kenar_sayisi):
+            if self._kenar_aktarma[k]:
+                mod = self.MOD_AKTARMA
+            else:
+                mod = (self._DURAK_TIPI_MODLARI.get(self._tasima_tipleri[self._kenar_kaynak[k]], 0)
+                       | self._DURAK_TIPI_MODLARI.get(self._tasima_tipleri[self._kenar_hedef[k]], 0))
+            if self._kenar_bilgileri[k].get("erisilebilir", True) is False:
+                mod |= self._KENAR_ERISILEMEZ
+            modlar.append(mod)
+        self._kenar_modlari = modlar
+    
+    @classmethod
+    def _yasak_maskesi(cls, izin_maskesi: int) -> int:
+        """
+        İzin maskesini kenar başına tek AND ile sınanan yasak maskesine çevir
+        
+        Kenar, mod bitlerinden hiçbiri yasak maskesinde değilse kullanılabilir.
+        """
+        yasak = cls.MOD_TUMU & ~izin_maskesi
+        if izin_maskesi & cls.MOD_ERISILEBILIR:
+            yasak |= cls._KENAR_ERISILEMEZ
+        return yasak
+    
+    @property
+    def durak_sayisi(self) -> int:
+        return len(self._durak_idleri)
+    
+    @property
+    def kenar_sayisi(self) -> int:
+        return len(self._kenar_hedef)
+    
+    def indeks(self, durak_id: str) -> Optional[int]:
+        """Durak ID'sinin grafikteki indeksini döndür"""
+        return self._indeks.get(durak_id)
+    
+    def durak_id(self, indeks: int) -> str:
+        """İndeksteki durağın ID'sini döndür"""
+        return self._durak_idleri[indeks]
+    
+    def kenar_kaynagi(self, kenar: int) -> int:
+        return self._kenar_kaynak[kenar]
+    
+    def kenar_hedefi(self, kenar: int) -> int:
+        return self._kenar_hedef[kenar]
+    
+    def kenar_suresi(self, kenar: int) -> float:
+        return self._kenar_sure[kenar]
+    
+    def kenar_modu(self, kenar: int) -> int:
+        return self._kenar_modlari[kenar]
+    
+    def durak_modu(self, indeks: int) -> int:
+        """Durağın taşıma tipine karşılık gelen mod biti"""
+        return self._DURAK_TIPI_MODLARI.get(self._tasima_tipleri[indeks], 0)
+    
+    @property
+    def ek_diziler(self) -> Dict[str, array]:
+        """Anlık görüntüye yazılan ön hesaplanmış diziler"""
+        return self._ek_diziler
+    
+    def _ters_komsuluk_olustur(self):
+        """Kenarları hedef durağa göre gruplayan ters CSR dizilerini oluştur"""
+        sayaclar = [0] * (self.durak_sayisi + 1)
+        for v in self._kenar_hedef:
+            sayaclar[v + 1] += 1
+        for i in range(self.durak_sayisi):
+            sayaclar[i + 1] += sayaclar[i]
+        
+        ters_baslangic = array('i', sayaclar)
+        ters_kenarlar = array('i', [0] * self.kenar_sayisi)
+        konumlar = sayaclar[:-1]
+        for k, v in enumerate(self._kenar_hedef):
+            ters_kenarlar[konumlar[v]] = k
+            konumlar[v] += 1
+        
+        self._ters_baslangic = ters_baslangic
+        self._ters_kenarlar = ters_kenarlar
+    
+    def _bilesenleri_getir(self, izin_maskesi: int) -> Tuple[array, "_BilesenErisimi"]:
+        """Mod maskesinin bileşenlerini döndür; ön hesaplanmamışsa ilk ihtiyaçta hesapla"""
+        yasak = self._yasak_maskesi(izin_maskesi)
+        if yasak not in self._bilesenler:
+            self._bilesenler[yasak] = self._guclu_bilesenler(yasak)
+        return self._bilesenler[yasak]
+    
+    def _guclu_bilesenler(self, yasak: int) -> Tuple[array, "_BilesenErisimi"]:
+        """
+        Yasak modlardaki kenarlar çıkarılmış grafın güçlü bağlı bileşenleri (yinelemeli Tarjan)
+        
+        Tarjan bileşenleri, bir bileşenden ulaşılabilen tüm bileşenler ondan önce
+        numaralanacak sırada üretir; bu yüzden bileşenler arası erişim kümeleri
+        (bit maskeleri) tek geçişte birleştirilebilir. Bileşen sayısı sınırı
+        aşılırsa bit maskeleri yerine bileşen başına sabit boyutlu etiketler tutulur.
+        
+        Returns:
+            (durak başına bileşen numarası, bileşenler arası erişim)
+        """
+        n = self.durak_sayisi
+        sira = [-1] * n
+        dusuk = [0] * n
+        yiginda = [False] * n
+        bilesen = array('i', [-1]) * n
+        yigin: List[int] = []
+        sayac = 0
+        bilesen_sayisi = 0
+        
+        for kok in range(n):
+            if sira[kok] != -1:
+                continue
+            sira[kok] = dusuk[kok] = sayac
+            sayac += 1
+            yigin.append(kok)
+            yiginda[kok] = True
+            cagrilar = [(kok, self._kenar_baslangic[kok])]
+            
+            while cagrilar:
+                u, k = cagrilar[-1]
+                son = self._kenar_baslangic[u + 1]
+                while k < son and self._kenar_modlari[k] & yasak:
+                    k += 1
+                if k < son:
+                    cagrilar[-1] = (u, k + 1)
+                    v = self._kenar_hedef[k]
+                    if sira[v] == -1:
+                        sira[v] = dusuk[v] = sayac
+                        sayac += 1
+                        yigin.append(v)
+                        yiginda[v] = True
+                        cagrilar.append((v, self._kenar_baslangic[v]))
+                    elif yiginda[v] and sira[v] < dusuk[u]:
+                        dusuk[u] = sira[v]
+                    continue
+                
+                cagrilar.pop()
+                if cagrilar:
+                    ust = cagrilar[-1][0]
+                    if dusuk[u] < dusuk[ust]:
+                        dusuk[ust] = dusuk[u]
+                if dusuk[u] == sira[u]:
+                    while True:
+                        w = yigin.pop()
+                        yiginda[w] = False
+                        bilesen[w] = bilesen_sayisi
+                        if w == u:
+                            break
+                    bilesen_sayisi += 1
+        
+        if bilesen_sayisi == 1:
+            return bilesen, _BilesenErisimi(erisimler=[1])
+        
+        # Yoğunlaştırılmış DAG: bileşen başına ardıl bileşenler
+        ardillar: List[List[int]] = [[] for _ in range(bilesen_sayisi)]
+        for u in range(n):
+            c = bilesen[u]
+            for k in range(self._kenar_baslangic[u], self._kenar_baslangic[u + 1]):
+                d = bilesen[self._kenar_hedef[k]]
+                if d != c and not self._kenar_modlari[k] & yasak:
+                    ardillar[c].append(d)
+        
+        if bilesen_sayisi <= self._KAPANIS_SINIRI:
+            erisimler = [0] * bilesen_sayisi
+            for c in range(bilesen_sayisi):
+                erisim = 1 << c
+                for d in ardillar[c]:
+                    erisim |= erisimler[d]
+                erisimler[c] = erisim
+            return bilesen, _BilesenErisimi(erisimler=erisimler)
+        
+        return bilesen, _BilesenErisimi(zayif=self._zayif_bilesenler(ardillar),
+                                        araliklar=self._erisim_araliklari(ardillar))
+    
+    @staticmethod
+    def _zayif_bilesenler(ardillar: List[List[int]]) -> array:
+        """Yoğunlaştırılmış DAG'de bileşen başına zayıf bağlı bileşen numarası (birleşim-bul)"""
+        ebeveyn = array('i', range(len(ardillar)))
+        
+        def kok(c: int) -> int:
+            while ebeveyn[c] != c:
+                ebeveyn[c] = ebeveyn[ebeveyn[c]]
+                c = ebeveyn[c]
+            return c
+        
+        for c, komsular in enumerate(ardillar):
+            for d in komsular:
+                a, b = kok(c), kok(d)
+                if a != b:
+                    ebeveyn[a] = b
+        return array('i', (kok(c) for c in range(len(ardillar))))
+    
+    @staticmethod
+    def _erisim_araliklari(ardillar: List[List[int]]) -> List[Tuple[array, array]]:
+        """
+        Yoğunlaştırılmış DAG için GRAIL aralık etiketleri
+        
+        Her geçişte bileşenlere DFS bitiş sırası verilir ve her bileşenin aralığı
+        [ulaşılabilen bileşenlerin en küçük sırası, kendi sırası] olur. a, b'ye
+        ulaşıyorsa b'nin aralığı a'nınkinin içindedir; bu yüzden aralık dışında
+        kalmak yol olmadığını kesin gösterir. Tarjan numaraları zaten bir bitiş
+        sırasıdır; ikinci geçiş kökleri ve ardılları ters sırada dolaşır.
+        """
+        bilesen_sayisi = len(ardillar)
+        alt = array('i', range(bilesen_sayisi))
+        for c in range(bilesen_sayisi):
+            # Ardıllar her zaman daha küçük numaralıdır, önce hesaplanmışlardır
+            for d in ardillar[c]:
+                if alt[d] < alt[c]:
+                    alt[c] = alt[d]
+        araliklar = [(array('i', range(bilesen_sayisi)), alt)]
+        
+        sira = array('i', [-1]) * bilesen_sayisi
+        alt = array('i', [0]) * bilesen_sayisi
+        ziyaret = bytearray(bilesen_sayisi)
+        sayac = 0
+        for kok in range(bilesen_sayisi - 1, -1, -1):
+            if ziyaret[kok]:
+                continue
+            ziyaret[kok] = 1
+            cagrilar = [(kok, len(ardillar[kok]))]
+            while cagrilar:
+                c, i = cagrilar[-1]
+                if i > 0:
+                    cagrilar[-1] = (c, i - 1)
+                    d = ardillar[c][i - 1]
+                    if not ziyaret[d]:
+                        ziyaret[d] = 1
+                        cagrilar.append((d, len(ardillar[d])))
+                    continue
+                cagrilar.pop()
+                sira[c] = sayac
+                en_kucuk = sayac
+                for d in ardillar[c]:
+                    if alt[d] < en_kucuk:
+                        en_kucuk = alt[d]
+                alt[c] = en_kucuk
+                sayac += 1
+        araliklar.append((sira, alt))
+        return araliklar
+    
+    def ulasilabilir_mi(self, kaynak: int, hedef: int, izin_maskesi: int = MOD_TUMU) -> bool:
+        """
+        Kaynaktan hedefe verilen modda yol olabilir mi (arama yapmadan)
+        
+        Aynı bileşendeki duraklar birbirine ulaşır; farklı bileşenler için
+        ön hesaplanmış bileşenler arası erişime bakılır. Bileşen sayısı sınırı
+        aşıldıysa False kesindir, True ise yol olabileceğini gösterir (arama gerekir).
+        
+        Args:
+            izin_maskesi: İzin verilen modlar (MOD_* bitleri); ön hesaplanmamış
+                maskelerin bileşenleri ilk sorguda hesaplanır
+        """
+        bilesen, erisim = self._bilesenleri_getir(izin_maskesi)
+        a = bilesen[kaynak]
+        b = bilesen[hedef]
+        if a == b:
+            return True
+        return erisim.ulasabilir(a, b)
+    
+    def bilesen_sayisi(self, izin_maskesi: int = MOD_TUMU) -> int:
+        """Mod maskesindeki güçlü bağlı bileşen sayısı"""
+        bilesen, _ = self._bilesenleri_getir(izin_maskesi)
+        return max(bilesen) + 1 if len(bilesen) else 0
+    
+    def en_kisa_sureler(self, kok: int, ters: bool = False,
+                        en_fazla_sure: float = float('inf'),
+                        izin_maskesi: int = MOD_TUMU) -> Tuple[List[float], List[int]]:
+        """
+        Bir duraktan tüm duraklara en kısa süreler (Dijkstra)
+        
+        Args:
+            kok: Kök durak indeksi
+            ters: True ise kenarlar ters yönde izlenir (tüm duraklardan köke süreler)
+            en_fazla_sure: Bu süreyi aşan duraklara genişleme yapılmaz
+            izin_maskesi: Kullanılabilecek kenar modları (MOD_* bitleri)
+        
+        Returns:
+            (sureler, ebeveyn_kenarlar) - ulaşılamayan (veya sınırı aşan) duraklar için inf / -1
+        """
+        if ters and self._ters_baslangic is None:
+            self._ters_komsuluk_olustur()
+        
+        yasak = self._yasak_maskesi(izin_maskesi)
+        sureler = [float('inf')] * self.durak_sayisi
+        ebeveyn = [-1] * self.durak_sayisi
+        sureler[kok] = 0.0
+        kuyruk = [(0.0, kok)]
+        
+        while kuyruk:
+            sure, u = heapq.heappop(kuyruk)
+            if sure > sureler[u]:
+                continue
+            if ters:
+                kenarlar = self._ters_kenarlar[self._ters_baslangic[u]:self._ters_baslangic[u + 1]]
+            else:
+                kenarlar = range(self._kenar_baslangic[u], self._kenar_baslangic[u + 1])
+            for k in kenarlar:
+                if self._kenar_modlari[k] & yasak:
+                    continue
+                v = self._kenar_kaynak[k] if ters else self._kenar_hedef[k]
+                yeni_sure = sure + self._kenar_sure[k]
+                if yeni_sure < sureler[v] and yeni_sure <= en_fazla_sure:
+                    sureler[v] = yeni_sure
+                    ebeveyn[v] = k
+                    heapq.heappush(kuyruk, (yeni_sure, v))
+        
+        return sureler, ebeveyn
+    
+    def en_az_durak_sayilari(self, kok: int, izin_maskesi: int = MOD_TUMU,
+                             hedef: Optional[int] = None) -> Tuple[List[float], List[int]]:
+        """
+        Bir duraktan tüm duraklara en az kenarlı yollar (BFS)
+        
+        Kenarlar derleme sırasıyla (önce sonraki duraklar, sonra aktarma) izlenir;
+        böylece eşit uzunluktaki yollar arasında hep aynı yol seçilir.
+        
+        Args:
+            izin_maskesi: Kullanılabilecek kenar modları (MOD_* bitleri)
+            hedef: Verilirse bu durak sıradan çıkınca arama durur
+        
+        Returns:
+            (kenar_sayilari, ebeveyn_kenarlar) - ulaşılamayan duraklar için inf / -1
+        """
+        yasak = self._yasak_maskesi(izin_maskesi)
+        sayilar = [float('inf')] * self.durak_sayisi
+        ebeveyn = [-1] * self.durak_sayisi
+        sayilar[kok] = 0.0
+        sira = [kok]
+        
+        for u in sira:
+            if u == hedef:
+                break
+            yeni_sayi = sayilar[u] + 1
+            for k in range(self._kenar_baslangic[u], self._kenar_baslangic[u + 1]):
+                if self._kenar_modlari[k] & yasak:
+                    continue
+                v = self._kenar_hedef[k]
+                if sayilar[v] == float('inf'):
+                    sayilar[v] = yeni_sayi
+                    ebeveyn[v] = k
+                    sira.append(v)
+        
+        return sayilar, ebeveyn
+    
+    def _izli_en_az_durak_sayilari(self, kok: int, izin_maskesi: int, hedef: int,
+                                   istatistik: AramaIstatistikleri) -> Tuple[List[float], List[int]]:
+        """en_az_durak_sayilari ile aynı sırada arar; sayaçları ve genişletme izini kaydeder"""
+        yasak = self._yasak_maskesi(izin_maskesi)
+        sayilar = [float('inf')] * self.durak_sayisi
+        ebeveyn = [-1] * self.durak_sayisi
+        sayilar[kok] = 0.0
+        sira = [kok]
+        iz = istatistik.iz_baslat("bfs", self.durak_id(kok), self.durak_id(hedef))
+        gevsetilen = 0
+        en_buyuk_kuyruk = 1
+        
+        for i, u in enumerate(sira):
+            if iz is not None:
+                iz.append(self._durak_idleri[u])
+            if u == hedef:
+                break
+            yeni_sayi = sayilar[u] + 1
+            for k in range(self._kenar_baslangic[u], self._kenar_baslangic[u + 1]):
+                if self._kenar_modlari[k] & yasak:
+                    continue
+                gevsetilen += 1
+                v = self._kenar_hedef[k]
+                if sayilar[v] == float('inf'):
+                    sayilar[v] = yeni_sayi
+                    ebeveyn[v] = k
+                    sira.append(v)
+            en_buyuk_kuyruk = max(en_buyuk_kuyruk, len(sira) - i - 1)
+        
+        istatistik.arama_ekle(i + 1, gevsetilen, en_buyuk_kuyruk, len(sira))
+        return sayilar, ebeveyn
+    
+    def en_az_durakli_yol(self, kaynak: int, hedef: int, izin_maskesi: int = MOD_TUMU,
+                          istatistik: Optional[AramaIstatistikleri] = None) -> Optional[List[int]]:
+        """
+        İki durak arasındaki en az kenarlı yol (BFS, hedefe ulaşınca durur)
+        
+        Args:
+            istatistik: Verilirse arama sayaçları (ve istenmişse izi) buna eklenir;
+                aynı yol, sayaçsız döngüyle aynı genişletme sırasıyla bulunur
+        
+        Returns:
+            Kenar indeksleri listesi veya yol yoksa None
+        """
+        if istatistik is None:
+            sayilar, ebeveyn = self.en_az_durak_sayilari(kaynak, izin_maskesi, hedef)
+        else:
+            sayilar, ebeveyn = self._izli_en_az_durak_sayilari(kaynak, izin_maskesi, hedef, istatistik)
+        if sayilar[hedef] == float('inf'):
+            return None
+        kenarlar = []
+        dugum = hedef
+        while dugum != kaynak:
+            kenarlar.append(ebeveyn[dugum])
+            dugum = self._kenar_kaynak[ebeveyn[dugum]]
+        kenarlar.reverse()
+        return kenarlar
+    
+    def yol_bul(self, kaynak: int, hedef: int, yontem: str = "dijkstra",
+                izin_maskesi: int = MOD_TUMU,
+                istatistik: Optional[AramaIstatistikleri] = None) -> Tuple[Optional[List[int]], int]:
+        """
+        İki durak arasındaki en hızlı yolu bul
+        
+        Args:
+            kaynak: Başlangıç durak indeksi
+            hedef: Hedef durak indeksi
+            yontem: "dijkstra", "astar" (haversine + işaret durağı sezgiseli) veya
+                "ch" (kontraksiyon hiyerarşisi; hazır değilse ilk sorguda oluşturulur)
+            izin_maskesi: Kullanılabilecek kenar modları (MOD_* bitleri); hiyerarşi
+                tüm kenarlarla kurulduğundan kısıtlı maskelerde "ch" yerine Dijkstra
+                kullanılır
+            istatistik: Verilirse arama sayaçları (ve istenmişse izi) buna eklenir;
+                "ch" için yalnızca genişletilen durak sayısı bilinir
+        
+        Returns:
+            (kenar indeksleri listesi veya None, genişletilen durak sayısı)
+        """
+        if yontem not in self.ARAMA_YONTEMLERI:
+            raise ValueError(f"Bilinmeyen arama yöntemi: {yontem}")
+        
+        yasak = self._yasak_maskesi(izin_maskesi)
+        if yontem == "ch":
+            if not yasak:
+                kenarlar, genisletilen = self.kontraksiyon_hiyerarsisi().yol_bul(kaynak, hedef)
+                if istatistik is not None:
+                    istatistik.arama_ekle(genisletilen, 0, 0, 0)
+                    istatistik.iz_baslat("ch", self.durak_id(kaynak), self.durak_id(hedef))
+                return kenarlar, genisletilen
+            yontem = "dijkstra"
+        
+        if yontem == "astar":
+            sezgisel = self._astar_sezgiseli(hedef)
+        else:
+            sezgisel = None
+        if istatistik is not None:
+            return self._izli_yol_bul(kaynak, hedef, yontem, yasak, sezgisel, istatistik)
+        
+        durum = _AramaDurumu(self.durak_sayisi)
+        durum.guncelle(kaynak, 0.0, -1)
+        kuyruk = [(0.0, 0.0, kaynak)]
+        genisletilen = 0
+        
+        while kuyruk:
+            _, sure, u = heapq.heappop(kuyruk)
+            if sure > durum.mesafe(u):
+                continue
+            genisletilen += 1
+            if u == hedef:
+                return durum.yol(hedef, self._kenar_kaynak), genisletilen
+            for k in range(self._kenar_baslangic[u], self._kenar_baslangic[u + 1]):
+                if self._kenar_modlari[k] & yasak:
+                    continue
+                v = self._kenar_hedef[k]
+                yeni_sure = sure + self._kenar_sure[k]
+                if yeni_sure < durum.mesafe(v):
+                    tahmin = sezgisel(v) if sezgisel else 0.0
+                    if tahmin == float('inf'):
+                        continue
+                    durum.guncelle(v, yeni_sure, k)
+                    heapq.heappush(kuyruk, (yeni_sure + tahmin, yeni_sure, v))
+        
+        return None, genisletilen
+    
+    def _izli_yol_bul(self, kaynak: int, hedef: int, yontem: str, yasak: int, sezgisel,
+                      istatistik: AramaIstatistikleri) -> Tuple[Optional[List[int]], int]:
+        """yol_bul döngüsünün sayaç tutan kopyası - aynı sırayla genişletir"""
+        durum = _AramaDurumu(self.durak_sayisi)
+        durum.guncelle(kaynak, 0.0, -1)
+        kuyruk = [(0.0, 0.0, kaynak)]
+        iz = istatistik.iz_baslat(yontem, self.durak_id(kaynak), self.durak_id(hedef))
+        genisletilen = 0
+        gevsetilen = 0
+        etiket = 1
+        en_buyuk_kuyruk = 1
+        yol = None
+        
+        while kuyruk:
+            _, sure, u = heapq.heappop(kuyruk)
+            if sure > durum.mesafe(u):
+                continue
+            genisletilen += 1
+            if iz is not None:
+                iz.append(self._durak_idleri[u])
+            if u == hedef:
+                yol = durum.yol(hedef, self._kenar_kaynak)
+                break
+            for k in range(self._kenar_baslangic[u], self._kenar_baslangic[u + 1]):
+                if self._kenar_modlari[k] & yasak:
+                    continue
+                gevsetilen += 1
+                v = self._kenar_hedef[k]
+                yeni_sure = sure + self._kenar_sure[k]
+                if yeni_sure < durum.mesafe(v):
+                    tahmin = sezgisel(v) if sezgisel else 0.0
+                    if tahmin == float('inf'):
+                        continue
+                    durum.guncelle(v, yeni_sure, k)
+                    heapq.heappush(kuyruk, (yeni_sure + tahmin, yeni_sure, v))
+                    etiket += 1
+            en_buyuk_kuyruk = max(en_buyuk_kuyruk, len(kuyruk))
+        
+        istatistik.arama_ekle(genisletilen, gevsetilen, en_buyuk_kuyruk, etiket)
+        return yol, genisletilen
+    
+    def _astar_sezgiseli(self, hedef: int):
+        """
+        Hedefe kalan süre için kabul edilebilir alt sınır fonksiyonu oluştur
+        
+        Haversine mesafesi ağdaki en yüksek hıza bölünür; işaret durakları
+        hesaplanmışsa üçgen eşitsizliği (ALT) sınırlarıyla sıkılaştırılır.
+        """
+        hiz = self._en_yuksek_hiz_hesapla()
+        hedef_enlem = self._enlemler[hedef]
+        hedef_boylam = self._boylamlar[hedef]
+        
+        isaretler = self._ek_diziler.get("isaret_duraklari")
+        if isaretler:
+            n = self.durak_sayisi
+            ileri = self._ek_diziler["isaret_ileri"]
+            geri = self._ek_diziler["isaret_geri"]
+            hedef_ileri = [ileri[i * n + hedef] for i in range(len(isaretler))]
+            hedef_geri = [geri[i * n + hedef] for i in range(len(isaretler))]
+        
+        sonsuz = float('inf')
+        onbellek: Dict[int, float] = {}
+        
+        def sezgisel(v: int) -> float:
+            deger = onbellek.get(v)
+            if deger is not None:
+                return deger
+            if hiz == sonsuz:
+                deger = 0.0
+            else:
+                deger = MesafeHesaplayici.haversine_mesafe(
+                    self._enlemler[v], self._boylamlar[v], hedef_enlem, hedef_boylam
+                ) / hiz
+            if isaretler:
+                for i in range(len(isaretler)):
+                    # d(L, t) - d(L, v) <= d(v, t)
+                    l_v = ileri[i * n + v]
+                    if hedef_ileri[i] == sonsuz:
+                        if l_v != sonsuz:
+                            deger = sonsuz  # v ulaşılabilir, t değil: v'den t'ye yol yok
+                            break
+                    elif l_v != sonsuz:
+                        deger = max(deger, hedef_ileri[i] - l_v)
+                    # d(v, L) - d(t, L) <= d(v, t)
+                    v_l = geri[i * n + v]
+                    if v_l == sonsuz:
+                        if hedef_geri[i] != sonsuz:
+                            deger = sonsuz  # t işarete ulaşır, v ulaşamaz
+                            break
+                    elif hedef_geri[i] != sonsuz:
+                        deger = max(deger, v_l - hedef_geri[i])
+            onbellek[v] = deger
+            return deger
+        
+        return sezgisel
+    
+    def _en_yuksek_hiz_hesapla(self) -> float:
+        """Tüm kenarlar için kuş uçuşu mesafe / süre oranının en büyüğü (km/dk)"""
+        if self._en_yuksek_hiz is None:
+            en_yuksek = 0.0
+            for k in range(self.kenar_sayisi):
+                u, v = self._kenar_kaynak[k], self._kenar_hedef[k]
+                mesafe = MesafeHesaplayici.haversine_mesafe(
+                    self._enlemler[u], self._boylamlar[u], self._enlemler[v], self._boylamlar[v]
+                )
+                if mesafe <= 0:
+                    continue
+                if self._kenar_sure[k] <= 0:
+                    en_yuksek = float('inf')
+                    break
+                en_yuksek = max(en_yuksek, mesafe / self._kenar_sure[k])
+            self._en_yuksek_hiz = en_yuksek if en_yuksek > 0 else float('inf')
+        return self._en_yuksek_hiz
+    
+    def isaretleri_hesapla(self, isaret_sayisi: int = 4):
+        """
+        ALT sezgiseli için işaret (landmark) duraklarını seç ve süreleri hesapla
+        
+        İlk işaret en çok bağlantısı olan (merkez) duraktır; sonrakiler seçilmiş
+        işaretlere kuş uçuşu en uzak duraklardır. Her işaretten tüm duraklara ve
+        tüm duraklardan işarete süreler düz dizilerde saklanır.
+        """
+        n = self.durak_sayisi
+        if n == 0:
+            return
+        isaret_sayisi = min(isaret_sayisi, n)
+        
+        dereceler = [self._kenar_baslangic[u + 1] - self._kenar_baslangic[u] for u in range(n)]
+        secilenler = [max(range(n), key=lambda u: dereceler[u])]
+        en_yakin = [float('inf')] * n
+        while len(secilenler) < isaret_sayisi:
+            son = secilenler[-1]
+            for u in range(n):
+                en_yakin[u] = min(en_yakin[u], MesafeHesaplayici.haversine_mesafe(
+                    self._enlemler[u], self._boylamlar[u],
+                    self._enlemler[son], self._boylamlar[son]
+                ))
+            secilenler.append(max(range(n), key=lambda u: en_yakin[u]))
+        
+        ileri = array('d')
+        geri = array('d')
+        for isaret in secilenler:
+            ileri.extend(self.en_kisa_sureler(isaret)[0])
+            geri.extend(self.en_kisa_sureler(isaret, ters=True)[0])
+        
+        self._ek_diziler["isaret_duraklari"] = array('i', secilenler)
+        self._ek_diziler["isaret_ileri"] = ileri
+        self._ek_diziler["isaret_geri"] = geri
+    
+    def kontraksiyon_hiyerarsisi(self):
+        """
+        Kontraksiyon hiyerarşisini döndür
+        
+        Anlık görüntüden yüklenmişse kayıtlı diziler kullanılır, yoksa ön işleme
+        burada çalıştırılır (süre ve kısayol sayısı istatistiklerde raporlanır).
+        """
+        if self._kontraksiyon is None:
+            from kontraksiyon_hiyerarsisi import KontraksiyonHiyerarsisi
+            hiyerarsi = KontraksiyonHiyerarsisi.graftan_yukle(self)
+            if hiyerarsi is None:
+                hiyerarsi = KontraksiyonHiyerarsisi(self)
+                hiyerarsi.on_isle()
+            self._kontraksiyon = hiyerarsi
+        return self._kontraksiyon
+    
+    @property
+    def agac_onbellegi(self):
+        """Kök durak başına en kısa yol ağaçlarını tutan LFU önbelleği"""
+        if self._agac_onbellegi is None:
+            from agac_onbellegi import AgacOnbellegi
+            self._agac_onbellegi = AgacOnbellegi(self)
+        return self._agac_onbellegi
+    
+    @property
+    def isaret_duraklari(self) -> List[str]:
+        """Seçilmiş işaret duraklarının ID'leri"""
+        return [self._durak_idleri[i] for i in self._ek_diziler.get("isaret_duraklari", [])]
+    
+    def anlik_goruntu_kaydet(self, dosya_yolu: str):
+        """
+        Derlenmiş grafı ve ön hesaplanmış dizileri ikili dosyaya yaz
+        
+        Biçim: sihirli baytlar, sürüm, JSON üstbilgi (durak ID'leri, taşıma tipleri,
+        kenar bilgileri) ve ardından adlandırılmış dizi bölümleri.
+        """
+        ustbilgi = json.dumps({
+            "durak_idleri": self._durak_idleri,
+            "tasima_tipleri": self._tasima_tipleri,
+            "kenar_bilgileri": self._kenar_bilgileri
+        }, ensure_ascii=False).encode("utf-8")
+        
+        bolumler = {ad: getattr(self, ad) for ad in self._TEMEL_DIZILER}
+        bolumler.update(self._ek_diziler)
+        
+        with open(dosya_yolu, "wb") as dosya:
+            dosya.write(self._SIHIRLI)
+            dosya.write(struct.pack("<II", self._SURUM, len(ustbilgi)))
+            dosya.write(ustbilgi)
+            dosya.write(struct.pack("<I", len(bolumler)))
+            for ad, dizi in bolumler.items():
+                ad_baytlari = ad.encode("utf-8")
+                veri = dizi.tobytes()
+                dosya.write(struct.pack("<H", len(ad_baytlari)))
+                dosya.write(ad_baytlari)
+                dosya.write(struct.pack("<cQ", dizi.typecode.encode("ascii"), len(veri)))
+                dosya.write(veri)
+    
+    @classmethod
+    def anlik_goruntu_yukle(cls, dosya_yolu: str) -> "DurakGrafi":
+        """İkili anlık görüntüden grafı (Durak nesneleri olmadan) yükle"""
+        with open(dosya_yolu, "rb") as dosya:
+            if dosya.read(4) != cls._SIHIRLI:
+                raise ValueError(f"{dosya_yolu} geçerli bir durak grafı anlık görüntüsü değil")
+            surum, ustbilgi_boyu = struct.unpack("<II", dosya.read(8))
+            if surum != cls._SURUM:
+                raise ValueError(f"Desteklenmeyen anlık görüntü sürümü: {surum}")
+            ustbilgi = json.loads(dosya.read(ustbilgi_boyu).decode("utf-8"))
+            
+            bolumler: Dict[str, array] = {}
+            (bolum_sayisi,) = struct.unpack("<I", dosya.read(4))
+            for _ in range(bolum_sayisi):
+                (ad_boyu,) = struct.unpack("<H", dosya.read(2))
+                ad = dosya.read(ad_boyu).decode("utf-8")
+                tip, veri_boyu = struct.unpack("<cQ", dosya.read(9))
+                dizi = array(tip.decode("ascii"))
+                dizi.frombytes(dosya.read(veri_boyu))
+                bolumler[ad] = dizi
+        
+        graf = cls.__new__(cls)
+        graf._durak_idleri = ustbilgi["durak_idleri"]
+        graf._indeks = {durak_id: i for i, durak_id in enumerate(graf._durak_idleri)}
+        graf._tasima_tipleri = ustbilgi["tasima_tipleri"]
+        graf._kenar_bilgileri = ustbilgi["kenar_bilgileri"]
+        for ad in cls._TEMEL_DIZILER:
+            setattr(graf, ad, bolumler.pop(ad))
+        graf._bos_durumlari_olustur()
+        graf._ek_diziler.update(bolumler)
+        return graf
+    
+    def alternatif_yollar(self, kaynak: int, hedef: int, k: int = 5,
+                          ortusme_esigi: float = 0.7,
+                          ceza_carpani: float = 1.5) -> List[List[int]]:
+        """
+        Birbirinden anlamlı ölçüde farklı en fazla k yol bul (kenar cezası yöntemi)
+        
+        Her turda bulunan yolun kenarlarının süresi ceza çarpanı ile artırılır ve
+        arama tekrarlanır. Hedefe olan cezasız süreler bir kez ters Dijkstra ile
+        hesaplanıp sonraki tüm turlarda A* sezgiseli olarak kullanılır (cezalar
+        yalnızca süreyi artırdığından bu sezgisel kabul edilebilirdir); arama
+        dizileri de turlar arasında yeniden kullanılır.
+        
+        Args:
+            kaynak: Başlangıç durak indeksi
+            hedef: Hedef durak indeksi
+            k: İstenen en fazla yol sayısı
+            ortusme_esigi: Kabul edilen bir yolla süre bazında en fazla ortak oran
+            ceza_carpani: Kullanılan kenarların süresine uygulanan çarpan
+        
+        Returns:
+            Kenar indeksi listelerinden oluşan yol listesi (ilk eleman en hızlısı)
+        """
+        hedefe_sureler, _ = self.en_kisa_sureler(hedef, ters=True)
+        if hedefe_sureler[kaynak] == float('inf'):
+            return []
+        if kaynak == hedef:
+            return [[]]
+        
+        agirliklar = array('d', self._kenar_sure)
+        durum = _AramaDurumu(self.durak_sayisi)
+        yollar: List[List[int]] = []
+        
+        # Aynı yol tekrar bulunabileceğinden deneme sayısı sınırlı
+        for _ in range(k * 3):
+            yol = self._sezgisel_arama(kaynak, hedef, agirliklar, hedefe_sureler, durum)
+            if yol is None:
+                break
+            
+            if all(self._ortusme_orani(yol, kabul) <= ortusme_esigi for kabul in yollar):
+                yollar.append(yol)
+                if len(yollar) >= k:
+                    break
+            
+            for kenar in yol:
+                agirliklar[kenar] *= ceza_carpani
+        
+        return yollar
+    
+    def _sezgisel_arama(self, kaynak: int, hedef: int, agirliklar: array,
+                        sezgisel: List[float], durum: "_AramaDurumu") -> Optional[List[int]]:
+        """Verilen kenar ağırlıkları ve sezgisel ile A* araması"""
+        durum.sifirla()
+        durum.guncelle(kaynak, 0.0, -1)
+        kuyruk = [(sezgisel[kaynak], 0.0, kaynak)]
+        
+        while kuyruk:
+            _, sure, u = heapq.heappop(kuyruk)
+            if sure > durum.mesafe(u):
+                continue
+            if u == hedef:
+                return durum.yol(hedef, self._kenar_kaynak)
+            for k in range(self._kenar_baslangic[u], self._kenar_baslangic[u + 1]):
+                v = self._kenar_hedef[k]
+                if sezgisel[v] == float('inf'):
+                    continue
+                yeni_sure = sure + agirliklar[k]
+                if yeni_sure < durum.mesafe(v):
+                    durum.guncelle(v, yeni_sure, k)
+                    heapq.heappush(kuyruk, (yeni_sure + sezgisel[v], yeni_sure, v))
+        
+        return None
+    
+    def _ortusme_orani(self, yol: List[int], diger: List[int]) -> float:
+        """Yolun süresinin diğer yolla ortak kenarlara düşen oranı"""
+        toplam = sum(self._kenar_sure[k] for k in yol)
+        if toplam <= 0:
+            return 1.0 if set(yol) == set(diger) else 0.0
+        diger_kenarlar = set(diger)
+        ortak = sum(self._kenar_sure[k] for k in yol if k in diger_kenarlar)
+        return ortak / toplam
+    
+    def yol_suresi(self, kenarlar: List[int]) -> float:
+        """Kenar listesinin toplam süresi (dakika)"""
+        return sum(self._kenar_sure[k] for k in kenarlar)
+    
+    def agac_degerleri(self, kok: int, kenar_ucretleri: array) -> Tuple[List[float], array, array]:
+        """
+        En kısa süre ağacındaki her durak için süre, ücret ve aktarma sayısı
+        
+        Ücret ve aktarma sayısı, kökten durağa giden en kısa süreli yol boyunca toplanır.
+        
+        Returns:
+            (sureler, ucretler, aktarmalar) - ulaşılamayan duraklar için inf / inf / -1
+        """
+        sureler, ebeveyn = self.en_kisa_sureler(kok)
+        ucretler = array('d', [float('inf')]) * self.durak_sayisi
+        aktarmalar = array('i', [-1]) * self.durak_sayisi
+        ucretler[kok] = 0.0
+        aktarmalar[kok] = 0
+        
+        for dugum in range(self.durak_sayisi):
+            if aktarmalar[dugum] >= 0 or ebeveyn[dugum] == -1:
+                continue
+            # Değeri bilinen ilk ataya kadar çık, sonra geri dönerken topla
+            zincir = []
+            while aktarmalar[dugum] < 0:
+                zincir.append(ebeveyn[dugum])
+                dugum = self._kenar_kaynak[ebeveyn[dugum]]
+            for k in reversed(zincir):
+                hedef = self._kenar_hedef[k]
+                ucretler[hedef] = ucretler[dugum] + kenar_ucretleri[k]
+                aktarmalar[hedef] = aktarmalar[dugum] + self._kenar_aktarma[k]
+                dugum = hedef
+        
+        return sureler, ucretler, aktarmalar
+    
+    def genel_maliyetler(self, sure_agirligi: float, ucret_agirligi: float,
+                         aktarma_agirligi: float, kenar_ucretleri: array) -> array:
+        """
+        Kenar başına genelleştirilmiş maliyet: α·süre + β·ücret + γ·aktarma
+        
+        Negatif ücretli (teşvik) kenarların maliyeti sıfırın altına inmez; böylece
+        aramalar Dijkstra olarak kalır.
+        """
+        maliyetler = array('d', [0.0]) * self.kenar_sayisi
+        for k in range(self.kenar_sayisi):
+            maliyet = (sure_agirligi * self._kenar_sure[k] + ucret_agirligi * kenar_ucretleri[k]
+                       + aktarma_agirligi * self._kenar_aktarma[k])
+            maliyetler[k] = maliyet if maliyet > 0 else 0.0
+        return maliyetler
+    
+    def cok_kaynakli_yol_bul(self, baslangic_maliyetleri: Dict[int, float],
+                             bitis_maliyetleri: Dict[int, float], kenar_maliyetleri: array,
+                             izin_maskesi: int = MOD_TUMU) -> Optional[Tuple[int, int, List[int], float]]:
+        """
+        Birçok başlangıç ve bitiş durağı arasında en düşük maliyetli yol (Dijkstra)
+        
+        Arama tüm başlangıç duraklarından, başlangıç maliyetleriyle birlikte başlar;
+        bitiş maliyeti eklenmiş en iyi toplamdan pahalı etiketler çıkınca durur.
+        
+        Args:
+            baslangic_maliyetleri: Durak indeksi -> o durağa erişim maliyeti
+            bitis_maliyetleri: Durak indeksi -> o duraktan hedefe ulaşım maliyeti
+            kenar_maliyetleri: Negatif olmayan kenar maliyetleri
+            izin_maskesi: Kullanılabilecek kenar modları (MOD_* bitleri)
+        
+        Returns:
+            (başlangıç durağı, bitiş durağı, kenar indeksleri, toplam maliyet) veya None
+        """
+        yasak = self._yasak_maskesi(izin_maskesi)
+        maliyetler = [float('inf')] * self.durak_sayisi
+        ebeveyn = [-1] * self.durak_sayisi
+        kuyruk = []
+        for durak, maliyet in baslangic_maliyetleri.items():
+            if maliyet < maliyetler[durak]:
+                maliyetler[durak] = maliyet
+                kuyruk.append((maliyet, durak))
+        heapq.heapify(kuyruk)
+        
+        en_iyi = float('inf')
+        en_iyi_bitis = -1
+        while kuyruk:
+            maliyet, u = heapq.heappop(kuyruk)
+            if maliyet > maliyetler[u]:
+                continue
+            if maliyet >= en_iyi:
+                break
+            bitis = bitis_maliyetleri.get(u)
+            if bitis is not None and maliyet + bitis < en_iyi:
+                en_iyi = maliyet + bitis
+                en_iyi_bitis = u
+            for k in range(self._kenar_baslangic[u], self._kenar_baslangic[u + 1]):
+                if self._kenar_modlari[k] & yasak:
+                    continue
+                v = self._kenar_hedef[k]
+                yeni_maliyet = maliyet + kenar_maliyetleri[k]
+                if yeni_maliyet < maliyetler[v]:
+                    maliyetler[v] = yeni_maliyet
+                    ebeveyn[v] = k
+                    heapq.heappush(kuyruk, (yeni_maliyet, v))
+        
+        if en_iyi_bitis < 0:
+            return None
+        kenarlar = []
+        dugum = en_iyi_bitis
+        while ebeveyn[dugum] != -1:
+            kenarlar.append(ebeveyn[dugum])
+            dugum = self._kenar_kaynak[ebeveyn[dugum]]
+        kenarlar.reverse()
+        return dugum, en_iyi_bitis, kenarlar, en_iyi
+    
+    def kenar_ucretleri(self, indirim_yoneticisi: AktarmaIndirimYoneticisi) -> array:
+        """
+        Aktarma indirimleri uygulanmış kenar ücretleri
+        
+        Sonuç yönetici sürümüne göre önbelleklenir; indirim eklendiğinde yeniden hesaplanır.
+        """
+        anahtar = id(indirim_yoneticisi)
+        kayit = self._ucret_onbellegi.get(anahtar)
+        if kayit and kayit[0] == indirim_yoneticisi.surum:
+            return kayit[1]
+        
+        ucretler = array('d', self._kenar_ucret)
+        for k in range(self.kenar_sayisi):
+            if self._kenar_aktarma[k]:
+                ucretler[k], _ = indirim_yoneticisi.indirim_hesapla(
+                    self._tasima_tipleri[self._kenar_kaynak[k]],
+                    self._tasima_tipleri[self._kenar_hedef[k]],
+                    self._kenar_ucret[k]
+                )
+        
+        self._ucret_onbellegi[anahtar] = (indirim_yoneticisi.surum, ucretler)
+        return ucretler
+    
+    def butceli_yol_bul(self, kaynak: int, hedef: int, butce: float,
+                        kenar_ucretleri: array) -> Optional[List[int]]:
+        """
+        Ücreti bütçeyi aşmayan en hızlı yolu bul (kaynak kısıtlı en kısa yol)
+        
+        Her durakta (süre, ücret) etiketlerinin Pareto kümesi tutulur; bütçeyi
+        aşan etiketler arama sırasında budanır. Etiketler süreye göre işlendiğinden
+        hedefe bütçe içinde ulaşan ilk etiket bütçeye uyan en hızlı yoldur.
+        
+        Returns:
+            Kenar indeksleri listesi veya None
+        """
+        # Negatif ücretli kenarlar (teşvik) sonradan bütçeyi düşürebilir
+        negatif_pay = -sum(ucret for ucret in kenar_ucretleri if ucret < 0)
+        
+        baslangic = self._kenar_baslangic
+        hedefler = self._kenar_hedef
+        sureler = self._kenar_sure
+        
+        # Etiketler: (ebeveyn etiket, kenar)
+        etiket_ebeveyn = [-1]
+        etiket_kenar = [-1]
+        en_dusuk_ucret = [float('inf')] * self.durak_sayisi
+        kuyruk = [(0.0, 0.0, 0, kaynak)]
+        
+        while kuyruk:
+            sure, ucret, etiket, u = heapq.heappop(kuyruk)
+            
+            # Daha hızlı ve daha ucuz bir etiket zaten işlendi
+            if ucret >= en_dusuk_ucret[u]:
+                continue
+            en_dusuk_ucret[u] = ucret
+            
+            # Negatif ücretli kenarlar varken hedefe bütçeyi aşarak varan etiketler
+            # kuyruğa girebilir; bunlar kabul edilmez, arama devam eder
+            if u == hedef and ucret <= butce:
+                return self._etiket_yolu(etiket, etiket_ebeveyn, etiket_kenar)
+            
+            for k in range(baslangic[u], baslangic[u + 1]):
+                v = hedefler[k]
+                yeni_ucret = ucret + kenar_ucretleri[k]
+                if yeni_ucret - negatif_pay > butce or yeni_ucret >= en_dusuk_ucret[v]:
+                    continue
+                etiket_ebeveyn.append(etiket)
+                etiket_kenar.append(k)
+                heapq.heappush(kuyruk, (sure + sureler[k], yeni_ucret, len(etiket_kenar) - 1, v))
+        
+        return None
+    
+    def _etiket_yolu(self, etiket: int, etiket_ebeveyn: List[int],
+                     etiket_kenar: List[int]) -> List[int]:
+        """Etiket zincirini kenar listesine çevir"""
+        kenarlar = []
+        while etiket_kenar[etiket] != -1:
+            kenarlar.append(etiket_kenar[etiket])
+            etiket = etiket_ebeveyn[etiket]
+        kenarlar.reverse()
+        return kenarlar
+    
+    def yol_demetleri(self, kenarlar: List[int]) -> List[Tuple]:
+        """
+        Kenar listesini RotaHesaplayici'nin yol biçimine çevir
+        
+        Returns:
+            [(baslangic_id, hedef_id, bilgi), ...] - aktarmalar için 4. eleman True
+        """
+        yol = []
+        for k in kenarlar:
+            baslangic_id = self._durak_idleri[self._kenar_kaynak[k]]
+            hedef_id = self._durak_idleri[self._kenar_hedef[k]]
+            if self._kenar_aktarma[k]:
+                yol.append((baslangic_id, hedef_id, self._kenar_bilgileri[k], True))
+            else:
+                yol.append((baslangic_id, hedef_id, self._kenar_bilgileri[k]))
+        return yol
+
+
+class _BilesenErisimi:
+    """
+    Güçlü bağlı bileşenler arası (yoğunlaştırılmış DAG) erişim
+    
+    Bit maskeleri varsa cevap kesindir. Yoksa yalnızca yolun zorunlu koşulları
+    denetlenir: hedef bileşen Tarjan sırasında önce gelmeli, iki bileşen aynı
+    zayıf bağlı bileşende olmalı ve hedefin aralıkları kaynağınkilerin içinde
+    kalmalıdır. Bellek bileşen sayısıyla doğrusal kalır.
+    """
+    
+    __slots__ = ("_erisimler", "_zayif", "_araliklar")
+    
+    def __init__(self, erisimler: Optional[List[int]] = None, zayif: Optional[array] = None,
+                 araliklar: List[Tuple[array, array]] = ()):
+        self._erisimler = erisimler
+        self._zayif = zayif
+        self._araliklar = araliklar
+    
+    def ulasabilir(self, a: int, b: int) -> bool:
+        """a bileşeninden b bileşenine yol var mı (maskesiz durumda: olabilir mi)"""
+        if self._erisimler is not None:
+            return (self._erisimler[a] >> b) & 1 == 1
+        # Ulaşılabilen bileşenler her zaman daha küçük numaralıdır
+        if b > a or self._zayif[a] != self._zayif[b]:
+            return False
+        for sira, alt in self._araliklar:
+            if sira[b] > sira[a] or alt[b] < alt[a]:
+                return False
+        return True
+
+
+class _AramaDurumu:
+    """Ardışık aramalarda yeniden kullanılan mesafe/ebeveyn dizileri"""
+    
+    def __init__(self, durak_sayisi: int):
+        self._mesafeler = [float('inf')] * durak_sayisi
+        self._ebeveynler = [-1] * durak_sayisi
+        self._damgalar = [0] * durak_sayisi
+        self._damga = 0
+    
+    def sifirla(self):
+        """Dizileri temizlemeden yeni bir arama başlat (damga ile geçersizleme)"""
+        self._damga += 1
+    
+    def mesafe(self, dugum: int) -> float:
+        if self._damgalar[dugum] != self._damga:
+            return float('inf')
+        return self._mesafeler[dugum]
+    
+    def guncelle(self, dugum: int, mesafe: float, ebeveyn_kenar: int):
+        self._damgalar[dugum] = self._damga
+        self._mesafeler[dugum] = mesafe
+        self._ebeveynler[dugum] = ebeveyn_kenar
+    
+    def yol(self, hedef: int, kenar_kaynak: array) -> List[int]:
+        """Ebeveyn kenarlarını izleyerek kenar listesini oluştur"""
+        kenarlar = []
+        dugum = hedef
+        while self._ebeveynler[dugum] != -1:
+            kenar = self._ebeveynler[dugum]
+            kenarlar.append(kenar)
+            dugum = kenar_kaynak[kenar]
+        kenarlar.reverse()
+        return kenarlar
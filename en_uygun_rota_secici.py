@@ -1,20 +1,43 @@
-from typing import List, Optional, Tuple
+import time
+from typing import List, Optional, Tuple, Union
 from konum import Konum
-from rota import Rota
+from rota import Rota, RotaHesaplayici
 from rota_secenekleri import RotaSecenekleriUretici
 from cuzdan import Cuzdan
 from odeme import OdemeYontemi, NakitOdeme, KrediKartiOdeme, KentkartOdeme
+from maliyet_agirliklari import MaliyetAgirliklari
+from gecikme_olcumu import asama
+from arama_istatistikleri import AramaIstatistikleri
+from sorgu_kaydi import kaydedilen_sorgu
 
 
 class EnUygunRotaSecici:
     """En uygun rotayı seçen sınıf - maliyet, süre ve bakiye kontrolü"""
     
-    def __init__(self, rota_secenekleri_uretici: RotaSecenekleriUretici):
+    BUTCELI_ROTA_ADI = "Bütçeye Uygun En Hızlı Rota"
+    GENEL_MALIYET_ROTA_ADI = "En Düşük Genel Maliyetli Rota"
+    
+    def __init__(self, rota_secenekleri_uretici: RotaSecenekleriUretici,
+                 rota_hesaplayici: Optional[RotaHesaplayici] = None):
         self._rota_secenekleri_uretici = rota_secenekleri_uretici
+        self._rota_hesaplayici = rota_hesaplayici or RotaHesaplayici(
+            rota_secenekleri_uretici.hat_yoneticisi, rota_secenekleri_uretici.taksi
+        )
+    
+    @property
+    def rota_secenekleri_uretici(self) -> RotaSecenekleriUretici:
+        return self._rota_secenekleri_uretici
     
+    @asama("secici.en_uygun_rotayi_bul")
+    @kaydedilen_sorgu("secici")
     def en_uygun_rotayi_bul(self, baslangic_konum: Konum, hedef_konum: Konum,
                            cuzdan: Cuzdan, odeme_yontemi: str = "nakit",
-                           oncelik: str = "maliyet") -> Tuple[Optional[Rota], List[Tuple[str, Rota, bool]]]:
+                           oncelik: str = "maliyet",
+                           butce_kisitli: bool = False,
+                           agirliklar: Optional[MaliyetAgirliklari] = None,
+                           explain: bool = False, iz: bool = False
+                           ) -> Union[Tuple[Optional[Rota], List[Tuple[str, Rota, bool]]],
+                                      Tuple[Optional[Rota], List[Tuple[str, Rota, bool]], AramaIstatistikleri]]:
         """
         En uygun rotayı bul
         
@@ -23,22 +46,85 @@ class EnUygunRotaSecici:
             hedef_konum: Hedef konum
             cuzdan: Kullanıcı cüzdanı
             odeme_yontemi: Ödeme yöntemi ("nakit", "kredi_karti", "kentkart")
-            oncelik: Öncelik ("maliyet", "sure", "aktarma")
+            oncelik: Öncelik ("maliyet", "sure", "aktarma" veya "genel"); "genel"
+                stratejileri denemez, genelleştirilmiş maliyetli tek arama yapar
+            butce_kisitli: True ise stratejiler denenmez, bakiyeye sığan en hızlı
+                rota doğrudan bütçe kısıtlı arama ile bulunur (oncelik yok sayılır)
+            agirliklar: "genel" öncelikte maliyet ağırlıkları (örn. yolcunun
+                maliyet_agirliklari()); verilmezse varsayılanlar kullanılır
+            explain: Arama tanılamalarını da döndür (strateji başına süre ve
+                arama sayaçları; bütçe kısıtlı ve "genel" aramalarda yalnızca süre)
+            iz: explain ile birlikte genişletme sırasını da kaydet
+        
+        Returns:
+            (en_uygun_rota, [(strateji_adi, rota, odeme_yapilabilir), ...]);
+            explain ise sonuna AramaIstatistikleri eklenir
+        """
+        istatistik = AramaIstatistikleri(izler=[] if iz else None) if explain else None
+        baslangic = time.perf_counter()
+        
+        if butce_kisitli:
+            rota = self.butceye_uygun_rota_bul(baslangic_konum, hedef_konum, cuzdan, odeme_yontemi)
+            sonuc = rota, [(self.BUTCELI_ROTA_ADI, rota, rota is not None)]
+            if istatistik is not None:
+                istatistik.strateji_sureleri[self.BUTCELI_ROTA_ADI] = (time.perf_counter() - baslangic) * 1000
+        elif oncelik == "genel":
+            rota = self._rota_hesaplayici.genel_maliyetli_rota_bul(
+                baslangic_konum, hedef_konum, agirliklar
+            )
+            if istatistik is not None:
+                istatistik.strateji_sureleri[self.GENEL_MALIYET_ROTA_ADI] = (
+                    (time.perf_counter() - baslangic) * 1000
+                )
+            odeme_yapilabilir = False
+            if rota:
+                komisyonlu_tutar = self._odeme_yontemi_olustur(odeme_yontemi).komisyonlu_tutar_hesapla(
+                    rota.toplam_ucret
+                )
+                odeme_yapilabilir = cuzdan.odeme_yapabilir_mi(komisyonlu_tutar, odeme_yontemi)
+            sonuc = rota, [(self.GENEL_MALIYET_ROTA_ADI, rota, odeme_yapilabilir)]
+        else:
+            # Tüm rota seçeneklerini al
+            tum_secenekler = self._rota_secenekleri_uretici.tum_rota_secenekleri_olustur(
+                baslangic_konum, hedef_konum, istatistik
+            )
+            secim_baslangici = time.perf_counter()
+            sonuc = self.secenekleri_degerlendir(baslangic_konum, hedef_konum, tum_secenekler,
+                                                 cuzdan, odeme_yontemi, oncelik)
+            if istatistik is not None:
+                istatistik.secim_ms = (time.perf_counter() - secim_baslangici) * 1000
+        
+        if istatistik is None:
+            return sonuc
+        istatistik.toplam_ms = (time.perf_counter() - baslangic) * 1000
+        return sonuc + (istatistik,)
+    
+    @asama("secici.degerlendirme")
+    @kaydedilen_sorgu("degerlendirme")
+    def secenekleri_degerlendir(self, baslangic_konum: Konum, hedef_konum: Konum,
+                                tum_secenekler: List[Tuple[str, Optional[Rota]]],
+                                cuzdan: Cuzdan, odeme_yontemi: str = "nakit",
+                                oncelik: str = "maliyet") -> Tuple[Optional[Rota], List[Tuple[str, Rota, bool]]]:
+        """
+        Önceden üretilmiş rota seçeneklerine ödeme kontrolü yapıp en uygununu seç
+        
+        Rota araması yapılmaz (yalnızca hiçbir seçenek ödenemiyorsa bütçe kısıtlı
+        arama); cüzdan veya ödeme yöntemi değiştiğinde seçenekler yeniden
+        üretilmeden kullanılabilir.
+        
+        Args:
+            tum_secenekler: tum_rota_secenekleri_olustur çıktısı [(strateji_adi, rota), ...]
         
         Returns:
             (en_uygun_rota, [(strateji_adi, rota, odeme_yapilabilir), ...])
         """
-        # Tüm rota seçeneklerini al
-        tum_secenekler = self._rota_secenekleri_uretici.tum_rota_secenekleri_olustur(
-            baslangic_konum, hedef_konum
-        )
+        odeme_yontemi_obj = self._odeme_yontemi_olustur(odeme_yontemi)
         
         # Her seçenek için ödeme kontrolü yap
         secenekler_analiz = []
         for strateji_adi, rota in tum_secenekler:
             if rota:
                 # Komisyon dahil toplam tutarı hesapla
-                odeme_yontemi_obj = self._odeme_yontemi_olustur(odeme_yontemi)
                 komisyonlu_tutar = odeme_yontemi_obj.komisyonlu_tutar_hesapla(rota.toplam_ucret)
                 
                 # Ödeme yapılabilir mi?
@@ -48,11 +134,56 @@ class EnUygunRotaSecici:
             else:
                 secenekler_analiz.append((strateji_adi, None, False))
         
+        # Hiçbir seçenek ödenemiyorsa bakiyeye sığan rotayı doğrudan ara
+        if not any(odeme_yapilabilir for _, _, odeme_yapilabilir in secenekler_analiz):
+            butceli_rota = self.butceye_uygun_rota_bul(baslangic_konum, hedef_konum,
+                                                       cuzdan, odeme_yontemi)
+            if butceli_rota:
+                secenekler_analiz.append((self.BUTCELI_ROTA_ADI, butceli_rota, True))
+        
         # En uygun rotayı seç
         en_uygun_rota = self._en_iyi_rotayi_sec(secenekler_analiz, oncelik, cuzdan, odeme_yontemi)
         
         return en_uygun_rota, secenekler_analiz
     
+    @asama("secici.butceye_uygun_rota_bul")
+    def butceye_uygun_rota_bul(self, baslangic_konum: Konum, hedef_konum: Konum,
+                               cuzdan: Cuzdan, odeme_yontemi: str = "nakit") -> Optional[Rota]:
+        """
+        Cüzdandaki bakiyeyle ödenebilecek en hızlı rotayı bul
+        
+        Returns:
+            Komisyon dahil ücreti bakiyeye sığan en hızlı rota veya None
+        """
+        return self._rota_hesaplayici.butceli_rota_bul(
+            baslangic_konum, hedef_konum, cuzdan.bakiye(odeme_yontemi),
+            self._odeme_yontemi_olustur(odeme_yontemi)
+        )
+    
+    @asama("secici.varisa_gore_rota_bul")
+    def varisa_gore_rota_bul(self, baslangic_konum: Konum, hedef_konum: Konum, varis_zamani,
+                             cuzdan: Cuzdan, odeme_yontemi: str = "nakit",
+                             yolcu_tipi: Optional[str] = None) -> Tuple[Optional[Rota], bool]:
+        """
+        Hedefe en geç verilen saatte varan rotayı bul ve ödenebilirliğini kontrol et
+        
+        Args:
+            varis_zamani: Hedef konuma en geç varış saati ("SS:DD" veya dk)
+        
+        Returns:
+            (rota, odeme_yapilabilir) - zamanında varan rota yoksa (None, False)
+        """
+        rota = self._rota_hesaplayici.varisa_gore_rota_bul(
+            baslangic_konum, hedef_konum, varis_zamani, yolcu_tipi=yolcu_tipi
+        )
+        if rota is None:
+            return None, False
+        
+        komisyonlu_tutar = self._odeme_yontemi_olustur(odeme_yontemi).komisyonlu_tutar_hesapla(
+            rota.toplam_ucret
+        )
+        return rota, cuzdan.odeme_yapabilir_mi(komisyonlu_tutar, odeme_yontemi)
+    
     def _odeme_yontemi_olustur(self, odeme_yontemi: str) -> OdemeYontemi:
         """Ödeme yöntemi nesnesi oluştur"""
         if odeme_yontemi == "nakit":
@@ -63,6 +194,7 @@ class EnUygunRotaSecici:
             return KentkartOdeme()
         return NakitOdeme()
     
+    @asama("secici.en_iyi_rota_secimi")
     def _en_iyi_rotayi_sec(self, secenekler: List[Tuple[str, Optional[Rota], bool]],
                           oncelik: str, cuzdan: Cuzdan, odeme_yontemi: str) -> Optional[Rota]:
         """En iyi rotayı seç"""
@@ -90,11 +222,18 @@ class EnUygunRotaSecici:
         
         return uygun_rotalar[0][1]  # En iyi rota
     
+    @asama("secici.detayli_analiz")
     def detayli_analiz(self, baslangic_konum: Konum, hedef_konum: Konum,
-                      cuzdan: Cuzdan, odeme_yontemi: str) -> dict:
+                      cuzdan: Cuzdan, odeme_yontemi: str,
+                      alternatif_sayisi: int = 0, ortusme_esigi: float = 0.7) -> dict:
         """
         Detaylı rota analizi - tüm seçenekleri karşılaştır
         
+        Args:
+            alternatif_sayisi: Stratejilere ek olarak aranacak birbirinden farklı
+                toplu taşıma rotası sayısı (0: yalnızca stratejiler)
+            ortusme_esigi: Alternatif rotaların en fazla ortak süre oranı
+        
         Returns:
             Analiz sonuçları dict
         """
@@ -102,6 +241,13 @@ class EnUygunRotaSecici:
             baslangic_konum, hedef_konum
         )
         
+        if alternatif_sayisi > 0:
+            alternatifler = self._rota_hesaplayici.alternatif_rotalar_bul(
+                baslangic_konum, hedef_konum, alternatif_sayisi, ortusme_esigi
+            )
+            for i, rota in enumerate(alternatifler, 1):
+                tum_secenekler.append((f"Alternatif Rota {i}", rota))
+        
         odeme_yontemi_obj = self._odeme_yontemi_olustur(odeme_yontemi)
         
         analiz = {
@@ -0,0 +1,228 @@
+import functools
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+# Kayıtlı ölçüm noktaları: (sınıf, metot adı, özgün fonksiyon, aşama adı)
+_ASAMALAR: List[Tuple[type, str, Callable, str]] = []
+_etkin_olcer: Optional["GecikmeOlcer"] = None
+
+
+class GecikmeHistogrami:
+    """
+    Tek bir aşamanın süre histogramı (Prometheus tarzı sabit kovalar)
+    
+    Kovalar 10 µs ile 10 sn arasında 1-2.5-5 dizisiyle büyür; yüzdelikler kova
+    içinde doğrusal aradeğerlemeyle tahmin edilir, en küçük/en büyük kesindir.
+    """
+    
+    SINIRLAR = tuple(float(f"{carpan}e{us}") for us in range(-5, 1) for carpan in (1, 2.5, 5)) + (10.0,)
+    
+    def __init__(self):
+        self._sayilar = array('Q', [0] * (len(self.SINIRLAR) + 1))  # Son kova: +Inf
+        self._adet = 0
+        self._toplam = 0.0
+        self._en_az = float('inf')
+        self._en_fazla = 0.0
+    
+    def kaydet(self, sure: float):
+        self._sayilar[bisect_left(self.SINIRLAR, sure)] += 1
+        self._adet += 1
+        self._toplam += sure
+        if sure < self._en_az:
+            self._en_az = sure
+        if sure > self._en_fazla:
+            self._en_fazla = sure
+    
+    @property
+    def adet(self) -> int:
+        return self._adet
+    
+    @property
+    def toplam(self) -> float:
+        return self._toplam
+    
+    def kovalar(self) -> List[Tuple[float, int]]:
+        """(üst sınır, kümülatif adet) listesi - son eleman (inf, toplam adet)"""
+        kumulatif = 0
+        sonuc = []
+        for sinir, sayi in zip(self.SINIRLAR + (float('inf'),), self._sayilar):
+            kumulatif += sayi
+            sonuc.append((sinir, kumulatif))
+        return sonuc
+    
+    def yuzdelik(self, oran: float) -> float:
+        """Tahmini yüzdelik (sn), örn. oran=0.95"""
+        if self._adet == 0:
+            return 0.0
+        hedef = oran * self._adet
+        kumulatif = 0
+        alt = 0.0
+        for sinir, sayi in zip(self.SINIRLAR + (self._en_fazla,), self._sayilar):
+            if sayi and kumulatif + sayi >= hedef:
+                tahmin = alt + (min(sinir, self._en_fazla) - alt) * (hedef - kumulatif) / sayi
+                return min(max(tahmin, self._en_az), self._en_fazla)
+            kumulatif += sayi
+            alt = sinir
+        return self._en_fazla
+    
+    def ozet(self) -> Dict[str, float]:
+        """Milisaniye cinsinden özet istatistikler"""
+        return {
+            "adet": self._adet,
+            "toplam_ms": self._toplam * 1000,
+            "ortalama_ms": self._toplam / self._adet * 1000 if self._adet else 0.0,
+            "p50_ms": self.yuzdelik(0.50) * 1000,
+            "p95_ms": self.yuzdelik(0.95) * 1000,
+            "p99_ms": self.yuzdelik(0.99) * 1000,
+            "en_az_ms": self._en_az * 1000 if self._adet else 0.0,
+            "en_fazla_ms": self._en_fazla * 1000,
+        }
+
+
+class GecikmeOlcer:
+    """
+    Rota hesaplama aşamalarının sürelerini histogramlarda toplayan ölçer
+    
+    Süreler kapsayıcıdır: iç içe aşamalarda dış aşama iç aşamaların süresini de
+    içerir (örn. rota.en_uygun_rota_bul ⊃ rota.durak_arasi_arama).
+    """
+    
+    METRIK_ADI = "rota_asama_sure_saniye"
+    
+    def __init__(self):
+        self._histogramlar: Dict[str, GecikmeHistogrami] = {}
+        self._kilit = threading.Lock()  # Arayüzün işçi iş parçacığı da ölçülebilir
+    
+    def kaydet(self, asama: str, sure: float):
+        with self._kilit:
+            histogram = self._histogramlar.get(asama)
+            if histogram is None:
+                histogram = self._histogramlar[asama] = GecikmeHistogrami()
+            histogram.kaydet(sure)
+    
+    def histogram(self, asama: str) -> Optional[GecikmeHistogrami]:
+        return self._histogramlar.get(asama)
+    
+    def istatistikler(self) -> Dict[str, Dict[str, float]]:
+        """Aşama adı -> özet istatistikler (ms), ada göre sıralı"""
+        with self._kilit:
+            return {asama: self._histogramlar[asama].ozet() for asama in sorted(self._histogramlar)}
+    
+    def sifirla(self):
+        with self._kilit:
+            self._histogramlar.clear()
+    
+    def rapor(self) -> str:
+        """İnsan okunur aşama tablosu"""
+        satirlar = [f"{'Aşama':<36} {'Adet':>7} {'Ort. (ms)':>10} {'p50':>9} {'p95':>9} {'p99':>9}"]
+        for asama, ozet in self.istatistikler().items():
+            satirlar.append(f"{asama:<36} {ozet['adet']:>7} {ozet['ortalama_ms']:>10.3f} "
+                            f"{ozet['p50_ms']:>9.3f} {ozet['p95_ms']:>9.3f} {ozet['p99_ms']:>9.3f}")
+        return "\n".join(satirlar)
+    
+    def prometheus_metni(self) -> str:
+        """Histogramları Prometheus metin biçiminde (text exposition format 0.0.4) döndür"""
+        ad = self.METRIK_ADI
+        satirlar = [f"# HELP {ad} Rota hesaplama aşamalarının süresi (saniye)",
+                    f"# TYPE {ad} histogram"]
+        with self._kilit:
+            for asama in sorted(self._histogramlar):
+                histogram = self._histogramlar[asama]
+                etiket = _etiket_kacis(asama)
+                for sinir, kumulatif in histogram.kovalar():
+                    le = "+Inf" if sinir == float('inf') else repr(sinir)
+                    satirlar.append(f'{ad}_bucket{{asama="{etiket}",le="{le}"}} {kumulatif}')
+                satirlar.append(f'{ad}_sum{{asama="{etiket}"}} {histogram.toplam!r}')
+                satirlar.append(f'{ad}_count{{asama="{etiket}"}} {histogram.adet}')
+        return "\n".join(satirlar) + "\n"
+
+
+def _etiket_kacis(deger: str) -> str:
+    return deger.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class _AsamaIsareti:
+    """asama() dekoratörünün döndürdüğü işaret - sınıf oluşturulurken yerini fonksiyona bırakır"""
+    
+    def __init__(self, fonksiyon: Callable, ad: str):
+        self._fonksiyon = fonksiyon
+        self._ad = ad
+    
+    def __set_name__(self, sahip: type, isim: str):
+        _ASAMALAR.append((sahip, isim, self._fonksiyon, self._ad))
+        if _etkin_olcer is None:
+            setattr(sahip, isim, self._fonksiyon)
+        else:
+            setattr(sahip, isim, _olculen(self._fonksiyon, self._ad, _etkin_olcer))
+
+
+def asama(ad: str) -> Callable[[Callable], Callable]:
+    """
+    Metodu ölçüm noktası olarak işaretle
+    
+    Ölçüm kapalıyken metot hiç sarmalanmaz (sıfır ek yük); etkinlestir() kayıtlı
+    metotları süre ölçen sarmalayıcılarla değiştirir, devre_disi_birak() geri alır.
+    Yalnızca sınıf içindeki (örnek) metotlarda kullanılır.
+    """
+    def dekorator(fonksiyon: Callable) -> Callable:
+        return _AsamaIsareti(fonksiyon, ad)
+    return dekorator
+
+
+def _olculen(fonksiyon: Callable, ad: str, olcer: GecikmeOlcer) -> Callable:
+    saat = time.perf_counter
+    kaydet = olcer.kaydet
+    
+    @functools.wraps(fonksiyon)
+    def sarmalayici(*args, **kwargs):
+        baslangic = saat()
+        try:
+            return fonksiyon(*args, **kwargs)
+        finally:
+            kaydet(ad, saat() - baslangic)
+    return sarmalayici
+
+
+def etkinlestir(olcer: Optional[GecikmeOlcer] = None) -> GecikmeOlcer:
+    """
+    Tüm kayıtlı aşamaları ölçmeye başla
+    
+    Metotlar sınıf üzerinde değiştirildiğinden, etkinleştirmeden önce alınmış bağlı
+    metot referansları (örn. geri çağrı olarak saklanan hesaplayici.en_uygun_rota_bul)
+    ölçülmez; iç aşamalar yine ölçülür.
+    
+    Args:
+        olcer: Sürelerin yazılacağı ölçer (varsayılan: yeni ölçer; zaten etkinse mevcut)
+    
+    Returns:
+        Etkin ölçer
+    """
+    global _etkin_olcer
+    if olcer is None:
+        olcer = _etkin_olcer or GecikmeOlcer()
+    _etkin_olcer = olcer
+    for sahip, isim, fonksiyon, ad in _ASAMALAR:
+        setattr(sahip, isim, _olculen(fonksiyon, ad, olcer))
+    return olcer
+
+
+def devre_disi_birak():
+    """Ölçümü kapat - metotlar özgün hallerine döner"""
+    global _etkin_olcer
+    _etkin_olcer = None
+    for sahip, isim, fonksiyon, _ in _ASAMALAR:
+        setattr(sahip, isim, fonksiyon)
+
+
+def etkin_olcer() -> Optional[GecikmeOlcer]:
+    """Ölçüm açıksa etkin ölçer, değilse None"""
+    return _etkin_olcer
+
+
+def asama_adlari() -> List[str]:
+    """Kayıtlı ölçüm noktalarının aşama adları"""
+    return sorted({ad for _, _, _, ad in _ASAMALAR})
@@ -0,0 +1,394 @@
+import math
+import tkinter as tk
+from array import array
+from typing import List, Dict, Optional, Tuple
+from durak import Durak
+from konum import Konum
+
+
+class IzgaraDizini:
+    """
+    Düzlemdeki nesneleri eşit kare hücrelere dağıtan uzamsal dizin
+    
+    Görüş alanı sorgusu yalnızca dikdörtgenle kesişen hücreleri dolaşır; birden
+    fazla hücreye taşan nesneler (kenarlar) her hücreye kaydedilir ve sorguda
+    bir kez döndürülür. Çok sayıda hücreye taşan nesneler hücrelere dağıtılmaz,
+    ayrı bir listede tutulup sorguda sınırlayıcı kutularıyla süzülür.
+    """
+    
+    GENIS_OGE_HUCRE_SINIRI = 64
+    
+    def __init__(self, hucre_boyu: float):
+        if hucre_boyu <= 0:
+            raise ValueError("Hücre boyu pozitif olmalı")
+        self._hucre_boyu = hucre_boyu
+        self._hucreler: Dict[Tuple[int, int], array] = {}
+        self._genis_ogeler: List[Tuple[int, float, float, float, float]] = []
+    
+    @property
+    def hucre_boyu(self) -> float:
+        return self._hucre_boyu
+    
+    def ekle(self, oge: int, xmin: float, ymin: float, xmax: float, ymax: float):
+        """Öğeyi sınırlayıcı kutusunun kapladığı tüm hücrelere ekle"""
+        hx_bas, hx_son = self._hucre(xmin), self._hucre(xmax)
+        hy_bas, hy_son = self._hucre(ymin), self._hucre(ymax)
+        if (hx_son - hx_bas + 1) * (hy_son - hy_bas + 1) > self.GENIS_OGE_HUCRE_SINIRI:
+            self._genis_ogeler.append((oge, xmin, ymin, xmax, ymax))
+            return
+        for hx in range(hx_bas, hx_son + 1):
+            for hy in range(hy_bas, hy_son + 1):
+                hucre = self._hucreler.get((hx, hy))
+                if hucre is None:
+                    hucre = self._hucreler[(hx, hy)] = array('I')
+                hucre.append(oge)
+    
+    def sorgula(self, xmin: float, ymin: float, xmax: float, ymax: float) -> List[int]:
+        """Dikdörtgenle kesişen hücrelerdeki öğeler (tekrarsız)"""
+        hx_bas, hx_son = self._hucre(xmin), self._hucre(xmax)
+        hy_bas, hy_son = self._hucre(ymin), self._hucre(ymax)
+        hucreler = self._hucreler
+        if (hx_son - hx_bas + 1) * (hy_son - hy_bas + 1) > len(hucreler):
+            # Görüş alanı dizinden büyük: dolu hücreleri doğrudan süz
+            secilen = [hucre for (hx, hy), hucre in hucreler.items()
+                       if hx_bas <= hx <= hx_son and hy_bas <= hy <= hy_son]
+        else:
+            secilen = [hucreler[(hx, hy)] for hx in range(hx_bas, hx_son + 1)
+                       for hy in range(hy_bas, hy_son + 1) if (hx, hy) in hucreler]
+        genisler = [oge for oge, oxmin, oymin, oxmax, oymax in self._genis_ogeler
+                    if oxmin <= xmax and oxmax >= xmin and oymin <= ymax and oymax >= ymin]
+        if len(secilen) == 1 and not genisler:
+            return list(secilen[0])
+        gorulen = set(genisler)
+        for hucre in secilen:
+            gorulen.update(hucre)
+        return list(gorulen)
+    
+    def temsilciler(self) -> List[int]:
+        """Her dolu hücreden bir öğe (uzak görünümde seyreltilmiş çizim için)"""
+        return [hucre[0] for hucre in self._hucreler.values()]
+    
+    def _hucre(self, deger: float) -> int:
+        return math.floor(deger / self._hucre_boyu)
+
+
+class HaritaGorunumu(tk.Frame):
+    """
+    Durakları, sonraki durak bağlantılarını ve seçili rotayı çizen harita
+    
+    Sürükleyerek kaydırılır, fare tekerleğiyle yakınlaştırılır. Kaydırma ve
+    yakınlaştırma anında mevcut canvas öğelerine uygulanır (move/scale); görüş
+    alanı kısa bir gecikmeyle ızgara dizininden yeniden sorgulanır ve öğeler
+    havuzdan yeniden kullanılarak güncellenir. Uzaklaştıkça ayrıntı düzeyi
+    düşer: ekranda aynı küçük hücreye düşen duraklardan yalnızca biri, birkaç
+    pikselden kısa kalan bağlantılar ise hiç çizilmez.
+    """
+    
+    DURAK_YARICAPI = 3  # piksel
+    LOD_HUCRE_PIKSEL = 8  # Bu boyuttaki ekran hücresinde en fazla bir durak çizilir
+    KISA_KENAR_PIKSEL = 4  # Ekranda bundan kısa bağlantılar çizilmez
+    EN_FAZLA_KENAR = 6000  # Bir çizimde en fazla bağlantı sayısı
+    YAKINLASTIRMA_ADIMI = 1.25
+    YENIDEN_CIZIM_GECIKMESI_MS = 40
+    DIZIN_HUCRE_DOLULUGU = 16  # Izgara hücresi başına ortalama durak sayısı hedefi
+    
+    RENKLER = {
+        "otobüs": "#3498db",
+        "tramvay": "#27ae60",
+        "kenar": "#bdc3c7",
+        "aktarma": "#e67e22",
+    }
+    ROTA_RENKLERI = {
+        "otobus": "#2980b9",
+        "tramvay": "#1e8449",
+        "taksi": "#f1c40f",
+        "aktarma": "#e67e22",
+        "yurume": "#7f8c8d",
+    }
+    
+    def __init__(self, ana, duraklar: Dict[str, Durak], **kwargs):
+        super().__init__(ana, **kwargs)
+        self.canvas = tk.Canvas(self, bg="#ffffff", highlightthickness=0)
+        self.canvas.pack(fill=tk.BOTH, expand=True)
+        
+        self._verileri_hazirla(duraklar)
+        
+        # Görünüm: dünya koordinatı (merkez) ve ölçek (piksel / dünya birimi)
+        self._merkez_x = 0.0
+        self._merkez_y = 0.0
+        self._olcek = 1.0
+        self._ilk_sigdirma = True
+        
+        # Yeniden kullanılan canvas öğeleri
+        self._durak_ogeleri: List[int] = []
+        self._kenar_ogeleri: List[int] = []
+        self._rota_ogeleri: List[int] = []
+        self._rota_parcalari: List[Tuple[str, float, float, float, float]] = []
+        
+        self._surukleme: Optional[Tuple[int, int]] = None
+        self._cizim_zamanlayici = None
+        
+        self.canvas.bind("<Configure>", self._boyut_degisti)
+        self.canvas.bind("<ButtonPress-1>", self._surukleme_basladi)
+        self.canvas.bind("<B1-Motion>", self._suruklendi)
+        self.canvas.bind("<ButtonRelease-1>", self._surukleme_bitti)
+        self.canvas.bind("<MouseWheel>", self._tekerlek)
+        self.canvas.bind("<Button-4>", self._tekerlek)
+        self.canvas.bind("<Button-5>", self._tekerlek)
+    
+    def _verileri_hazirla(self, duraklar: Dict[str, Durak]):
+        """Durak ve bağlantı koordinatlarını dizilere, dizinlere yerleştir"""
+        enlemler = [durak.enlem for durak in duraklar.values()]
+        self._enlem_carpani = math.cos(math.radians(sum(enlemler) / len(enlemler))) if enlemler else 1.0
+        
+        self._indeks: Dict[str, int] = {}
+        self._xler = array('d')
+        self._yler = array('d')
+        self._renkler: List[str] = []
+        for durak_id, durak in duraklar.items():
+            self._indeks[durak_id] = len(self._xler)
+            x, y = self._dunya_koordinati(durak.enlem, durak.boylam)
+            self._xler.append(x)
+            self._yler.append(y)
+            self._renkler.append(self.RENKLER.get(durak.tasima_tipi(), "#34495e"))
+        
+        self._kenar_kaynaklari = array('I')
+        self._kenar_hedefleri = array('I')
+        self._kenar_aktarma_mi = bytearray()
+        for durak_id, durak in duraklar.items():
+            kaynak = self._indeks[durak_id]
+            for sonraki in durak.sonraki_duraklar:
+                hedef = self._indeks.get(sonraki["stopId"])
+                if hedef is not None:
+                    self._kenar_kaynaklari.append(kaynak)
+                    self._kenar_hedefleri.append(hedef)
+                    self._kenar_aktarma_mi.append(0)
+            if durak.aktarma:
+                hedef = self._indeks.get(durak.aktarma["transferStopId"])
+                if hedef is not None:
+                    self._kenar_kaynaklari.append(kaynak)
+                    self._kenar_hedefleri.append(hedef)
+                    self._kenar_aktarma_mi.append(1)
+        
+        if self._xler:
+            self._sinirlar = (min(self._xler), min(self._yler), max(self._xler), max(self._yler))
+        else:
+            self._sinirlar = (0.0, 0.0, 1.0, 1.0)
+        genislik = max(self._sinirlar[2] - self._sinirlar[0], 1e-6)
+        yukseklik = max(self._sinirlar[3] - self._sinirlar[1], 1e-6)
+        hucre_sayisi = max(1.0, len(self._xler) / self.DIZIN_HUCRE_DOLULUGU)
+        hucre_boyu = math.sqrt(genislik * yukseklik / hucre_sayisi)
+        
+        self._durak_dizini = IzgaraDizini(hucre_boyu)
+        for i, (x, y) in enumerate(zip(self._xler, self._yler)):
+            self._durak_dizini.ekle(i, x, y, x, y)
+        self._kenar_dizini = IzgaraDizini(hucre_boyu)
+        for k, (a, b) in enumerate(zip(self._kenar_kaynaklari, self._kenar_hedefleri)):
+            self._kenar_dizini.ekle(k, min(self._xler[a], self._xler[b]), min(self._yler[a], self._yler[b]),
+                                    max(self._xler[a], self._xler[b]), max(self._yler[a], self._yler[b]))
+        
+        # Uzak görünüm için: hücre başına bir durak ve uzundan kısaya sıralı bağlantılar
+        self._temsilci_duraklar = array('I', self._durak_dizini.temsilciler())
+        uzunluklar = [abs(self._xler[a] - self._xler[b]) + abs(self._yler[a] - self._yler[b])
+                      for a, b in zip(self._kenar_kaynaklari, self._kenar_hedefleri)]
+        self._uzun_kenarlar = array('I', sorted(range(len(uzunluklar)), key=uzunluklar.__getitem__,
+                                                reverse=True))
+        self._uzun_kenar_boylari = array('d', (uzunluklar[k] for k in self._uzun_kenarlar))
+    
+    def _dunya_koordinati(self, enlem: float, boylam: float) -> Tuple[float, float]:
+        """Eşdikdörtgen izdüşüm (kuzey yukarıda, ekran y'si aşağı doğru artar)"""
+        return boylam * self._enlem_carpani, -enlem
+    
+    # Görünüm
+    
+    def tumunu_goster(self):
+        """Tüm ağı görüş alanına sığdır"""
+        genislik = max(self.canvas.winfo_width(), 1)
+        yukseklik = max(self.canvas.winfo_height(), 1)
+        xmin, ymin, xmax, ymax = self._sinirlar
+        self._merkez_x = (xmin + xmax) / 2
+        self._merkez_y = (ymin + ymax) / 2
+        self._olcek = 0.9 * min(genislik / max(xmax - xmin, 1e-6), yukseklik / max(ymax - ymin, 1e-6))
+        self._ciz()
+    
+    def rota_goster(self, rota, baslangic_konum: Optional[Konum] = None,
+                    hedef_konum: Optional[Konum] = None):
+        """
+        Rotayı harita üzerinde vurgula (None: vurguyu kaldır)
+        
+        Adımlardaki "konum" uçları için başlangıç/hedef konumu kullanılır; konum
+        verilmemişse bu adımlar çizilmez.
+        """
+        self._rota_parcalari = []
+        if rota is not None:
+            for adim in rota.adimlar:
+                bas = self._adim_ucu(adim.baslangic, baslangic_konum)
+                son = self._adim_ucu(adim.hedef, hedef_konum)
+                if bas and son:
+                    self._rota_parcalari.append((adim.ulasim_tipi, bas[0], bas[1], son[0], son[1]))
+        self._rotayi_ciz()
+    
+    def _adim_ucu(self, uc: str, konum: Optional[Konum]) -> Optional[Tuple[float, float]]:
+        if uc == "konum":
+            return self._dunya_koordinati(konum.enlem, konum.boylam) if konum else None
+        indeks = self._indeks.get(uc)
+        if indeks is None:
+            return None
+        return self._xler[indeks], self._yler[indeks]
+    
+    def _ekrana(self, x: float, y: float) -> Tuple[float, float]:
+        return ((x - self._merkez_x) * self._olcek + self.canvas.winfo_width() / 2,
+                (y - self._merkez_y) * self._olcek + self.canvas.winfo_height() / 2)
+    
+    # Olaylar
+    
+    def _boyut_degisti(self, event=None):
+        if self._ilk_sigdirma:
+            self._ilk_sigdirma = False
+            self.tumunu_goster()
+        else:
+            self._ciz()
+    
+    def _surukleme_basladi(self, event):
+        self._surukleme = (event.x, event.y)
+    
+    def _suruklendi(self, event):
+        if self._surukleme is None:
+            return
+        dx = event.x - self._surukleme[0]
+        dy = event.y - self._surukleme[1]
+        self._surukleme = (event.x, event.y)
+        # Mevcut öğeler anında taşınır, görüş alanı gecikmeli yeniden sorgulanır
+        self.canvas.move("all", dx, dy)
+        self._merkez_x -= dx / self._olcek
+        self._merkez_y -= dy / self._olcek
+        self._cizimi_planla()
+    
+    def _surukleme_bitti(self, event):
+        self._surukleme = None
+        self._cizimi_planla()
+    
+    def _tekerlek(self, event):
+        if event.num == 4 or getattr(event, "delta", 0) > 0:
+            carpan = self.YAKINLASTIRMA_ADIMI
+        else:
+            carpan = 1 / self.YAKINLASTIRMA_ADIMI
+        # İmlecin altındaki nokta yerinde kalacak şekilde merkezi kaydır
+        yari_genislik = self.canvas.winfo_width() / 2
+        yari_yukseklik = self.canvas.winfo_height() / 2
+        imlec_x = self._merkez_x + (event.x - yari_genislik) / self._olcek
+        imlec_y = self._merkez_y + (event.y - yari_yukseklik) / self._olcek
+        self._olcek *= carpan
+        self._merkez_x = imlec_x - (event.x - yari_genislik) / self._olcek
+        self._merkez_y = imlec_y - (event.y - yari_yukseklik) / self._olcek
+        self.canvas.scale("all", event.x, event.y, carpan, carpan)
+        self._cizimi_planla()
+    
+    def _cizimi_planla(self):
+        if self._cizim_zamanlayici is not None:
+            self.after_cancel(self._cizim_zamanlayici)
+        self._cizim_zamanlayici = self.after(self.YENIDEN_CIZIM_GECIKMESI_MS, self._ciz)
+    
+    # Çizim
+    
+    def _ciz(self):
+        """Görüş alanındaki durak ve bağlantıları havuzdaki öğelerle çiz"""
+        self._cizim_zamanlayici = None
+        genislik = self.canvas.winfo_width()
+        yukseklik = self.canvas.winfo_height()
+        yari_x = genislik / 2 / self._olcek
+        yari_y = yukseklik / 2 / self._olcek
+        xmin, xmax = self._merkez_x - yari_x, self._merkez_x + yari_x
+        ymin, ymax = self._merkez_y - yari_y, self._merkez_y + yari_y
+        
+        olcek = self._olcek
+        ox = genislik / 2 - self._merkez_x * olcek
+        oy = yukseklik / 2 - self._merkez_y * olcek
+        xler, yler = self._xler, self._yler
+        
+        # Uzak görünüm: dizin hücresi ekranda bir ayrıntı hücresinden küçükse hücre
+        # temsilcileri ve yalnızca ekranda yeterince uzun bağlantılar dolaşılır
+        uzak = self._durak_dizini.hucre_boyu * olcek < self.LOD_HUCRE_PIKSEL
+        
+        # Bağlantılar: ekranda çok kısa kalanlar atlanır
+        kisa = self.KISA_KENAR_PIKSEL
+        kenarlar = []
+        if uzak:
+            en_kisa_boy = kisa / olcek
+            adaylar = []
+            for k, boy in zip(self._uzun_kenarlar, self._uzun_kenar_boylari):
+                if boy < en_kisa_boy:
+                    break
+                adaylar.append(k)
+        else:
+            adaylar = self._kenar_dizini.sorgula(xmin, ymin, xmax, ymax)
+        for k in adaylar:
+            a = self._kenar_kaynaklari[k]
+            b = self._kenar_hedefleri[k]
+            x1, y1 = xler[a] * olcek + ox, yler[a] * olcek + oy
+            x2, y2 = xler[b] * olcek + ox, yler[b] * olcek + oy
+            if abs(x2 - x1) + abs(y2 - y1) < kisa:
+                continue
+            if max(x1, x2) < 0 or min(x1, x2) > genislik or max(y1, y2) < 0 or min(y1, y2) > yukseklik:
+                continue
+            kenarlar.append((x1, y1, x2, y2, self._kenar_aktarma_mi[k]))
+            if len(kenarlar) >= self.EN_FAZLA_KENAR:
+                break
+        
+        # Duraklar: her küçük ekran hücresinde en fazla bir durak
+        hucre = self.LOD_HUCRE_PIKSEL
+        dolu = set()
+        noktalar = []
+        adaylar = self._temsilci_duraklar if uzak else self._durak_dizini.sorgula(xmin, ymin, xmax, ymax)
+        for i in adaylar:
+            px, py = xler[i] * olcek + ox, yler[i] * olcek + oy
+            if px < 0 or px > genislik or py < 0 or py > yukseklik:
+                continue
+            anahtar = (int(px // hucre), int(py // hucre))
+            if anahtar in dolu:
+                continue
+            dolu.add(anahtar)
+            noktalar.append((px, py, self._renkler[i]))
+        
+        self._kenarlari_yerlestir(kenarlar)
+        self._duraklari_yerlestir(noktalar)
+        self._rotayi_ciz()
+    
+    def _kenarlari_yerlestir(self, kenarlar: List[Tuple[float, float, float, float, int]]):
+        canvas = self.canvas
+        while len(self._kenar_ogeleri) < len(kenarlar):
+            self._kenar_ogeleri.append(canvas.create_line(0, 0, 0, 0, fill=self.RENKLER["kenar"],
+                                                          tags=("kenar",)))
+        for oge, (x1, y1, x2, y2, aktarma) in zip(self._kenar_ogeleri, kenarlar):
+            canvas.coords(oge, x1, y1, x2, y2)
+            canvas.itemconfigure(oge, state=tk.NORMAL, dash=(3, 2) if aktarma else (),
+                                 fill=self.RENKLER["aktarma"] if aktarma else self.RENKLER["kenar"])
+        for oge in self._kenar_ogeleri[len(kenarlar):]:
+            canvas.itemconfigure(oge, state=tk.HIDDEN)
+    
+    def _duraklari_yerlestir(self, noktalar: List[Tuple[float, float, str]]):
+        canvas = self.canvas
+        r = self.DURAK_YARICAPI
+        while len(self._durak_ogeleri) < len(noktalar):
+            self._durak_ogeleri.append(canvas.create_oval(0, 0, 0, 0, outline="", tags=("durak",)))
+        for oge, (px, py, renk) in zip(self._durak_ogeleri, noktalar):
+            canvas.coords(oge, px - r, py - r, px + r, py + r)
+            canvas.itemconfigure(oge, state=tk.NORMAL, fill=renk)
+        for oge in self._durak_ogeleri[len(noktalar):]:
+            canvas.itemconfigure(oge, state=tk.HIDDEN)
+        if self._kenar_ogeleri:
+            canvas.tag_raise("durak", "kenar")
+    
+    def _rotayi_ciz(self):
+        """Seçili rotanın parçalarını en üstte, kalın çizgilerle çiz (ayrıntı düzeyinden bağımsız)"""
+        canvas = self.canvas
+        while len(self._rota_ogeleri) < len(self._rota_parcalari):
+            self._rota_ogeleri.append(canvas.create_line(0, 0, 0, 0, width=4, capstyle=tk.ROUND,
+                                                         tags=("rota",)))
+        for oge, (tip, x1, y1, x2, y2) in zip(self._rota_ogeleri, self._rota_parcalari):
+            canvas.coords(oge, *self._ekrana(x1, y1), *self._ekrana(x2, y2))
+            canvas.itemconfigure(oge, state=tk.NORMAL, fill=self.ROTA_RENKLERI.get(tip, "#8e44ad"),
+                                 dash=(6, 4) if tip in ("yurume", "aktarma") else ())
+        for oge in self._rota_ogeleri[len(self._rota_parcalari):]:
+            canvas.itemconfigure(oge, state=tk.HIDDEN)
+        canvas.tag_raise("rota")
@@ -1,5 +1,7 @@
 from typing import List, Dict, Optional
 from durak import Durak
+from durak_grafi import DurakGrafi
+from durak_adi_dizini import DurakAdiDizini
 
 
 class Hat:
@@ -42,34 +44,84 @@ class HatYoneticisi:
     def __init__(self, duraklar: Dict[str, Durak]):
         self._duraklar = duraklar
         self._hatlar: Dict[str, Hat] = {}
+        self._durak_grafi: Optional[DurakGrafi] = None
+        self._durak_adi_dizini: Optional[DurakAdiDizini] = None
         self._hatlari_olustur()
     
     def _hatlari_olustur(self):
-        """Duraklardan hatları otomatik oluştur"""
-        # Otobüs hatları
-        otobus_hatlari = {}
-        tramvay_hatlari = {}
+        """
+        Duraklar arası bağlantılardan (sonraki duraklar zincirleri) hatları oluştur
         
+        Her bağlantı tam olarak bir hatta yer alır. Sonuç dosyadaki durak sırasına
+        bağlı değildir: hatlar önce kendisine bağlantı gelmeyen duraklardan, sonra
+        hat uçlarından (son durak işaretli veya yalnızca tek bir durağa bağlı
+        duraklar), en son kalan duraklardan başlatılır; her grup ID sırasıyla
+        işlenir. Zincir uzatılırken geldiği durağa geri dönen bağlantı atlanır,
+        böylece çift yönlü hatların A→B→C ve C→B→A yönleri bütün olarak çıkar.
+        Dallanmalarda kullanılmamış bağlantılar yeni hatlar olarak devam eder.
+        """
+        komsular: Dict[str, set] = {durak_id: set() for durak_id in self._duraklar}
+        giris_derecesi = {durak_id: 0 for durak_id in self._duraklar}
         for durak_id, durak in self._duraklar.items():
-            tasima_tipi = durak.tasima_tipi()
-            
-            # Her durak için bir hat oluştur (basit yaklaşım)
-            # Gerçek uygulamada duraklar arası bağlantılara göre hatlar belirlenir
-            if tasima_tipi == "otobüs":
-                hat_id = f"hat_{durak_id}"
-                if hat_id not in otobus_hatlari:
-                    hat = Hat(hat_id, f"Otobüs Hattı - {durak.isim}", "bus")
-                    otobus_hatlari[hat_id] = hat
-                otobus_hatlari[hat_id].durak_ekle(durak_id)
-            elif tasima_tipi == "tramvay":
-                hat_id = f"hat_{durak_id}"
-                if hat_id not in tramvay_hatlari:
-                    hat = Hat(hat_id, f"Tramvay Hattı - {durak.isim}", "tram")
-                    tramvay_hatlari[hat_id] = hat
-                tramvay_hatlari[hat_id].durak_ekle(durak_id)
+            for sonraki in durak.sonraki_duraklar:
+                sonraki_id = sonraki["stopId"]
+                if sonraki_id in giris_derecesi and sonraki_id != durak_id:
+                    giris_derecesi[sonraki_id] += 1
+                    komsular[durak_id].add(sonraki_id)
+                    komsular[sonraki_id].add(durak_id)
         
-        self._hatlar.update(otobus_hatlari)
-        self._hatlar.update(tramvay_hatlari)
+        def oncelik(durak_id: str) -> int:
+            if giris_derecesi[durak_id] == 0:
+                return 0
+            if self._duraklar[durak_id].son_durak or len(komsular[durak_id]) == 1:
+                return 1
+            return 2
+        
+        baslangiclar = sorted(self._duraklar, key=lambda durak_id: (oncelik(durak_id), durak_id))
+        
+        kullanilan = set()
+        for baslangic_id in baslangiclar:
+            while True:
+                zincir = [baslangic_id]
+                mevcut_id = baslangic_id
+                while True:
+                    onceki_id = zincir[-2] if len(zincir) > 1 else None
+                    sonraki_id = self._kullanilmamis_baglanti(mevcut_id, kullanilan, onceki_id)
+                    # Döngüde aynı durak bir hatta iki kez yer alamaz
+                    if sonraki_id is None or sonraki_id in zincir:
+                        break
+                    kullanilan.add((mevcut_id, sonraki_id))
+                    zincir.append(sonraki_id)
+                    mevcut_id = sonraki_id
+                
+                if len(zincir) < 2:
+                    break
+                self._hat_ekle(zincir)
+    
+    def _kullanilmamis_baglanti(self, durak_id: str, kullanilan: set,
+                                onceki_id: Optional[str] = None) -> Optional[str]:
+        """Duraktan çıkan, henüz bir hatta eklenmemiş ve geri dönmeyen ilk bağlantının hedefi"""
+        for sonraki in self._duraklar[durak_id].sonraki_duraklar:
+            sonraki_id = sonraki["stopId"]
+            if (sonraki_id in self._duraklar and sonraki_id != onceki_id
+                    and (durak_id, sonraki_id) not in kullanilan):
+                return sonraki_id
+        return None
+    
+    def _hat_ekle(self, durak_idleri: List[str]):
+        """Sıralı durak listesinden yeni bir hat oluştur"""
+        ilk_durak = self._duraklar[durak_idleri[0]]
+        son_durak = self._duraklar[durak_idleri[-1]]
+        if ilk_durak.tasima_tipi() == "tramvay":
+            tip_adi, tasima_tipi = "Tramvay", "tram"
+        else:
+            tip_adi, tasima_tipi = "Otobüs", "bus"
+        
+        hat_id = f"hat_{len(self._hatlar) + 1}"
+        hat = Hat(hat_id, f"{tip_adi} Hattı - {ilk_durak.isim} → {son_durak.isim}", tasima_tipi)
+        for durak_id in durak_idleri:
+            hat.durak_ekle(durak_id)
+        self._hatlar[hat_id] = hat
     
     def durak_bilgisi_al(self, durak_id: str, hedef_durak_id: str) -> Optional[Dict]:
         """İki durak arasındaki bağlantı bilgisini getir"""
@@ -104,4 +156,17 @@ class HatYoneticisi:
     def tum_duraklar(self) -> Dict[str, Durak]:
         """Tüm durakları döndür"""
         return self._duraklar
-
+    
+    @property
+    def durak_grafi(self) -> DurakGrafi:
+        """Arama motorlarının kullandığı derlenmiş durak grafı (ilk erişimde oluşturulur)"""
+        if self._durak_grafi is None:
+            self._durak_grafi = DurakGrafi(self._duraklar)
+        return self._durak_grafi
+    
+    @property
+    def durak_adi_dizini(self) -> DurakAdiDizini:
+        """Durak isimleri için önek/bulanık arama dizini (ilk erişimde oluşturulur)"""
+        if self._durak_adi_dizini is None:
+            self._durak_adi_dizini = DurakAdiDizini(self._duraklar)
+        return self._durak_adi_dizini
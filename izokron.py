@@ -0,0 +1,166 @@
+import math
+from array import array
+from typing import List, Dict, Optional, Tuple
+from dataclasses import dataclass
+from konum import Konum
+from rota import RotaHesaplayici
+
+
+@dataclass
+class UlasilabilirlikIzgarasi:
+    """İzokron alanının düzenli enlem/boylam ızgarasındaki karşılığı"""
+    enlem_min: float
+    boylam_min: float
+    enlem_adimi: float  # derece
+    boylam_adimi: float  # derece
+    satir_sayisi: int
+    sutun_sayisi: int
+    sureler: array  # Satır öncelikli hücre varış süreleri (dk), ulaşılamayan hücreler inf
+    
+    def hucre_suresi(self, satir: int, sutun: int) -> float:
+        return self.sureler[satir * self.sutun_sayisi + sutun]
+    
+    def hucre_merkezi(self, satir: int, sutun: int) -> Konum:
+        return Konum(self.enlem_min + (satir + 0.5) * self.enlem_adimi,
+                     self.boylam_min + (sutun + 0.5) * self.boylam_adimi)
+    
+    @property
+    def ulasilabilir_hucre_sayisi(self) -> int:
+        return sum(1 for sure in self.sureler if sure < float('inf'))
+
+
+@dataclass
+class Izokron:
+    """Bir konumdan verilen sürede ulaşılabilen duraklar ve alan"""
+    merkez: Konum
+    sure_butcesi: float  # dk
+    erisim_tipi: Optional[str]  # En yakın durağa "yurume" veya "taksi"
+    durak_sureleri: Dict[str, float]  # Durak ID -> merkezden varış süresi (dk)
+    izgara: Optional[UlasilabilirlikIzgarasi]
+    
+    def __str__(self) -> str:
+        return f"İzokron: {self.merkez}, {self.sure_butcesi:.0f} dk, {len(self.durak_sureleri)} durak"
+
+
+class IzokronHesaplayici:
+    """Bir veya birçok konum için süre sınırlı erişilebilirlik (izokron) hesaplayan sınıf"""
+    
+    YURUME_DK_KM = 12.0  # RotaHesaplayici ile aynı yürüyüş hızı
+    _KM_DERECE_ENLEM = 110.574
+    
+    def __init__(self, rota_hesaplayici: RotaHesaplayici, hucre_km: float = 0.25):
+        """
+        Args:
+            rota_hesaplayici: Erişim adımı ve durak grafı için kullanılan hesaplayıcı
+            hucre_km: Izgara hücresinin kenar uzunluğu (km)
+        """
+        self._rota_hesaplayici = rota_hesaplayici
+        self._hat_yoneticisi = rota_hesaplayici.hat_yoneticisi
+        self._hucre_km = hucre_km
+    
+    def izokron_hesapla(self, merkez: Konum, sure_dk: float,
+                        izgara_olustur: bool = True) -> Izokron:
+        """
+        Merkezden sure_dk dakika içinde ulaşılabilen durakları ve alanı hesapla
+        
+        Merkezden en yakın durağa taksi zorunluluğu kurallarına göre yürüyerek veya
+        taksiyle gidilir; duraklar arası arama süre bütçesi aşılınca durur. Alan,
+        ulaşılan her duraktan kalan sürede yürünebilen bölgelerin birleşimidir.
+        """
+        return self._izokron_hesapla(merkez, sure_dk, izgara_olustur, {})
+    
+    def toplu_izokron_hesapla(self, merkezler: List[Konum], sure_dk: float,
+                              izgara_olustur: bool = True) -> List[Izokron]:
+        """
+        Birçok merkez için izokron hesapla
+        
+        Aynı erişim durağını paylaşan merkezler o durağın arama ağacını yeniden kullanır.
+        """
+        agaclar: Dict[int, Tuple[float, List[float]]] = {}
+        return [self._izokron_hesapla(merkez, sure_dk, izgara_olustur, agaclar)
+                for merkez in merkezler]
+    
+    def _izokron_hesapla(self, merkez: Konum, sure_dk: float, izgara_olustur: bool,
+                         agaclar: Dict[int, Tuple[float, List[float]]]) -> Izokron:
+        durak_sureleri: Dict[str, float] = {}
+        erisim_tipi = None
+        
+        durak_id, _ = self._rota_hesaplayici.en_yakin_durak_bul(merkez.enlem, merkez.boylam)
+        if durak_id:
+            erisim_adimi = self._rota_hesaplayici.baslangic_adimi_olustur(merkez, durak_id)
+            erisim_tipi = erisim_adimi.ulasim_tipi
+            kalan = sure_dk - erisim_adimi.sure
+            if kalan >= 0:
+                graf = self._hat_yoneticisi.durak_grafi
+                sureler = self._agac_getir(graf, graf.indeks(durak_id), kalan, agaclar)
+                for indeks, sure in enumerate(sureler):
+                    if sure <= kalan:
+                        durak_sureleri[graf.durak_id(indeks)] = erisim_adimi.sure + sure
+        
+        izgara = self._izgara_olustur(merkez, sure_dk, durak_sureleri) if izgara_olustur else None
+        return Izokron(merkez, sure_dk, erisim_tipi, durak_sureleri, izgara)
+    
+    def _agac_getir(self, graf, kok: int, sinir: float,
+                    agaclar: Dict[int, Tuple[float, List[float]]]) -> List[float]:
+        """Kök duraktan sınırlı arama ağacı; daha geniş sınırla hesaplanmışsa yeniden kullanılır"""
+        onbellek = agaclar.get(kok)
+        if onbellek is not None and onbellek[0] >= sinir:
+            return onbellek[1]
+        sureler, _ = graf.en_kisa_sureler(kok, en_fazla_sure=sinir)
+        agaclar[kok] = (sinir, sureler)
+        return sureler
+    
+    def _izgara_olustur(self, merkez: Konum, sure_dk: float,
+                        durak_sureleri: Dict[str, float]) -> UlasilabilirlikIzgarasi:
+        """Merkezden ve ulaşılan duraklardan kalan sürede yürünebilen hücreleri işaretle"""
+        km_boylam = self._KM_DERECE_ENLEM * math.cos(math.radians(merkez.enlem))
+        enlem_adimi = self._hucre_km / self._KM_DERECE_ENLEM
+        boylam_adimi = self._hucre_km / km_boylam
+        
+        # Yürüme kaynakları: (enlem, boylam, varış süresi, yürüme yarıçapı km)
+        kaynaklar = [(merkez.enlem, merkez.boylam, 0.0, sure_dk / self.YURUME_DK_KM)]
+        for durak_id, sure in durak_sureleri.items():
+            durak = self._hat_yoneticisi.durak_getir(durak_id)
+            kaynaklar.append((durak.enlem, durak.boylam, sure,
+                              (sure_dk - sure) / self.YURUME_DK_KM))
+        
+        enlem_min = min(k[0] - k[3] / self._KM_DERECE_ENLEM for k in kaynaklar)
+        enlem_max = max(k[0] + k[3] / self._KM_DERECE_ENLEM for k in kaynaklar)
+        boylam_min = min(k[1] - k[3] / km_boylam for k in kaynaklar)
+        boylam_max = max(k[1] + k[3] / km_boylam for k in kaynaklar)
+        satir_sayisi = max(1, math.ceil((enlem_max - enlem_min) / enlem_adimi))
+        sutun_sayisi = max(1, math.ceil((boylam_max - boylam_min) / boylam_adimi))
+        
+        # Hücre merkezlerinin km cinsinden koordinatları bir kez hesaplanır
+        satir_km = [(enlem_min + (i + 0.5) * enlem_adimi) * self._KM_DERECE_ENLEM
+                    for i in range(satir_sayisi)]
+        sutun_km = [(boylam_min + (j + 0.5) * boylam_adimi) * km_boylam
+                    for j in range(sutun_sayisi)]
+        sureler = array('d', [float('inf')]) * (satir_sayisi * sutun_sayisi)
+        
+        for enlem, boylam, baslangic_suresi, yaricap in kaynaklar:
+            if yaricap <= 0:
+                continue
+            y = enlem * self._KM_DERECE_ENLEM
+            x = boylam * km_boylam
+            ilk_satir = max(0, int((enlem - yaricap / self._KM_DERECE_ENLEM - enlem_min) / enlem_adimi))
+            son_satir = min(satir_sayisi - 1, int((enlem + yaricap / self._KM_DERECE_ENLEM - enlem_min) / enlem_adimi))
+            ilk_sutun = max(0, int((boylam - yaricap / km_boylam - boylam_min) / boylam_adimi))
+            son_sutun = min(sutun_sayisi - 1, int((boylam + yaricap / km_boylam - boylam_min) / boylam_adimi))
+            dx2 = [(sutun_km[j] - x) ** 2 for j in range(ilk_sutun, son_sutun + 1)]
+            yaricap2 = yaricap * yaricap
+            
+            for i in range(ilk_satir, son_satir + 1):
+                dy2 = (satir_km[i] - y) ** 2
+                if dy2 > yaricap2:
+                    continue
+                taban = i * sutun_sayisi + ilk_sutun
+                for j, d2 in enumerate(dx2):
+                    d2 += dy2
+                    if d2 <= yaricap2:
+                        sure = baslangic_suresi + math.sqrt(d2) * self.YURUME_DK_KM
+                        if sure < sureler[taban + j]:
+                            sureler[taban + j] = sure
+        
+        return UlasilabilirlikIzgarasi(enlem_min, boylam_min, enlem_adimi, boylam_adimi,
+                                       satir_sayisi, sutun_sayisi, sureler)
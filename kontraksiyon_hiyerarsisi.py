@@ -0,0 +1,323 @@
+import heapq
+import time
+from array import array
+from dataclasses import dataclass
+from typing import List, Dict, Optional, Tuple
+from durak_grafi import DurakGrafi
+
+
+@dataclass
+class KontraksiyonIstatistikleri:
+    """Ön işleme aşamasının raporu"""
+    on_isleme_suresi: float  # saniye
+    kisayol_sayisi: int
+    yukari_kenar_sayisi: int
+    asagi_kenar_sayisi: int
+    
+    def __str__(self) -> str:
+        return (f"Kontraksiyon: {self.on_isleme_suresi * 1000:.1f} ms, "
+                f"{self.kisayol_sayisi} kısayol, "
+                f"{self.yukari_kenar_sayisi}/{self.asagi_kenar_sayisi} yukarı/aşağı kenar")
+
+
+class KontraksiyonHiyerarsisi:
+    """
+    Durak grafı üzerinde kontraksiyon hiyerarşisi (Contraction Hierarchies)
+    
+    Duraklar önem sırasına göre tek tek daraltılır; daraltılan durak üzerinden
+    geçen en kısa yollar kısayol kenarlarıyla korunur. Sorgu, kaynaktan ve
+    hedeften yalnızca daha önemli duraklara doğru ilerleyen çift yönlü bir
+    Dijkstra'dır ve çok az durak genişletir.
+    """
+    
+    # Tanık (witness) aramasında yerleştirilecek en fazla durak
+    TANIK_ARAMA_SINIRI = 64
+    
+    # Anlık görüntüdeki dizi adları
+    _DIZI_ADLARI = ("kh_sira", "kh_yukari_baslangic", "kh_yukari_hedef", "kh_yukari_agirlik",
+                    "kh_yukari_orta", "kh_yukari_kenar", "kh_asagi_baslangic", "kh_asagi_kaynak",
+                    "kh_asagi_agirlik", "kh_asagi_orta", "kh_asagi_kenar", "kh_istatistik")
+    
+    def __init__(self, graf: DurakGrafi):
+        self._graf = graf
+        self._diziler: Dict[str, array] = {}
+        self._istatistikler: Optional[KontraksiyonIstatistikleri] = None
+    
+    @classmethod
+    def graftan_yukle(cls, graf: DurakGrafi) -> Optional["KontraksiyonHiyerarsisi"]:
+        """Grafın anlık görüntüsünde kayıtlı hiyerarşiyi yükle (yoksa None)"""
+        if any(ad not in graf.ek_diziler for ad in cls._DIZI_ADLARI):
+            return None
+        hiyerarsi = cls(graf)
+        hiyerarsi._diziler = {ad: graf.ek_diziler[ad] for ad in cls._DIZI_ADLARI}
+        sure, kisayol = hiyerarsi._diziler["kh_istatistik"]
+        hiyerarsi._istatistikler = KontraksiyonIstatistikleri(
+            on_isleme_suresi=sure, kisayol_sayisi=int(kisayol),
+            yukari_kenar_sayisi=len(hiyerarsi._diziler["kh_yukari_hedef"]),
+            asagi_kenar_sayisi=len(hiyerarsi._diziler["kh_asagi_kaynak"])
+        )
+        return hiyerarsi
+    
+    def on_isle(self) -> KontraksiyonIstatistikleri:
+        """
+        Durak sırasını belirle, durakları daralt ve yukarı/aşağı grafları oluştur
+        
+        Sonuç dizileri grafın ek dizilerine yazılır, böylece anlık görüntüyle
+        birlikte kaydedilir.
+        """
+        baslangic_zamani = time.perf_counter()
+        graf = self._graf
+        n = graf.durak_sayisi
+        
+        # Yaylar: (u, v) -> (agirlik, orta_durak, orijinal_kenar); paralel kenarlardan en kısası
+        cikan: List[Dict[int, Tuple[float, int, int]]] = [dict() for _ in range(n)]
+        giren: List[Dict[int, Tuple[float, int, int]]] = [dict() for _ in range(n)]
+        for k in range(graf.kenar_sayisi):
+            u, v = graf.kenar_kaynagi(k), graf.kenar_hedefi(k)
+            if u == v:
+                continue
+            agirlik = graf.kenar_suresi(k)
+            mevcut = cikan[u].get(v)
+            if mevcut is None or agirlik < mevcut[0]:
+                cikan[u][v] = (agirlik, -1, k)
+                giren[v][u] = (agirlik, -1, k)
+        
+        daraltildi = [False] * n
+        daraltilan_komsu = [0] * n
+        sira = [0] * n
+        kisayol_sayisi = 0
+        
+        def oncelik(v: int) -> int:
+            kisayollar = self._kisayollari_bul(v, cikan, giren, daraltildi)
+            return (len(kisayollar) - len(cikan[v]) - len(giren[v])) + daraltilan_komsu[v]
+        
+        kuyruk = [(oncelik(v), v) for v in range(n)]
+        heapq.heapify(kuyruk)
+        siradaki = 0
+        
+        while kuyruk:
+            _, v = heapq.heappop(kuyruk)
+            if daraltildi[v]:
+                continue
+            # Tembel güncelleme: öncelik değiştiyse yeniden kuyruğa koy
+            guncel = oncelik(v)
+            if kuyruk and guncel > kuyruk[0][0]:
+                heapq.heappush(kuyruk, (guncel, v))
+                continue
+            
+            for u, w, agirlik in self._kisayollari_bul(v, cikan, giren, daraltildi):
+                mevcut = cikan[u].get(w)
+                if mevcut is None or agirlik < mevcut[0]:
+                    cikan[u][w] = (agirlik, v, -1)
+                    giren[w][u] = (agirlik, v, -1)
+                    kisayol_sayisi += 1
+            
+            daraltildi[v] = True
+            sira[v] = siradaki
+            siradaki += 1
+            for komsu in list(cikan[v]) + list(giren[v]):
+                daraltilan_komsu[komsu] += 1
+        
+        self._dizileri_olustur(sira, cikan)
+        self._istatistikler = KontraksiyonIstatistikleri(
+            on_isleme_suresi=time.perf_counter() - baslangic_zamani,
+            kisayol_sayisi=kisayol_sayisi,
+            yukari_kenar_sayisi=len(self._diziler["kh_yukari_hedef"]),
+            asagi_kenar_sayisi=len(self._diziler["kh_asagi_kaynak"])
+        )
+        self._diziler["kh_istatistik"] = array('d', [self._istatistikler.on_isleme_suresi,
+                                                     float(kisayol_sayisi)])
+        graf.ek_diziler.update(self._diziler)
+        return self._istatistikler
+    
+    def _kisayollari_bul(self, v: int, cikan: List[Dict], giren: List[Dict],
+                         daraltildi: List[bool]) -> List[Tuple[int, int, float]]:
+        """v daraltılırsa gereken kısayolları (u, w, agirlik) bul"""
+        kisayollar = []
+        hedefler = {w: veri[0] for w, veri in cikan[v].items() if not daraltildi[w]}
+        if not hedefler:
+            return kisayollar
+        
+        for u, (giris_agirligi, _, _) in giren[v].items():
+            if daraltildi[u]:
+                continue
+            sinir = giris_agirligi + max(hedefler.values())
+            tanik = self._tanik_aramasi(u, v, sinir, cikan, daraltildi)
+            for w, cikis_agirligi in hedefler.items():
+                if w == u:
+                    continue
+                agirlik = giris_agirligi + cikis_agirligi
+                if tanik.get(w, float('inf')) > agirlik:
+                    kisayollar.append((u, w, agirlik))
+        return kisayollar
+    
+    def _tanik_aramasi(self, kaynak: int, haric: int, sinir: float,
+                       cikan: List[Dict], daraltildi: List[bool]) -> Dict[int, float]:
+        """Daraltılan durağı kullanmadan sınırlı yerel Dijkstra"""
+        mesafeler = {kaynak: 0.0}
+        kuyruk = [(0.0, kaynak)]
+        yerlesen = 0
+        while kuyruk and yerlesen < self.TANIK_ARAMA_SINIRI:
+            mesafe, u = heapq.heappop(kuyruk)
+            if mesafe > mesafeler.get(u, float('inf')):
+                continue
+            if mesafe > sinir:
+                break
+            yerlesen += 1
+            for w, (agirlik, _, _) in cikan[u].items():
+                if w == haric or daraltildi[w]:
+                    continue
+                yeni = mesafe + agirlik
+                if yeni < mesafeler.get(w, float('inf')):
+                    mesafeler[w] = yeni
+                    heapq.heappush(kuyruk, (yeni, w))
+        return mesafeler
+    
+    def _dizileri_olustur(self, sira: List[int], cikan: List[Dict]):
+        """Yayları sıraya göre yukarı (ileri arama) ve aşağı (geri arama) CSR dizilerine böl"""
+        n = len(sira)
+        yukari: List[List[Tuple[int, float, int, int]]] = [[] for _ in range(n)]
+        asagi: List[List[Tuple[int, float, int, int]]] = [[] for _ in range(n)]
+        for u in range(n):
+            for v, (agirlik, orta, kenar) in cikan[u].items():
+                if sira[v] > sira[u]:
+                    yukari[u].append((v, agirlik, orta, kenar))
+                else:
+                    # Geri arama v'den daha önemli u'ya doğru ilerler
+                    asagi[v].append((u, agirlik, orta, kenar))
+        
+        d = self._diziler
+        d["kh_sira"] = array('i', sira)
+        for onek, komsuluk in (("kh_yukari", yukari), ("kh_asagi", asagi)):
+            baslangic = array('i', [0])
+            komsular, agirliklar, ortalar, kenarlar = array('i'), array('d'), array('i'), array('i')
+            for liste in komsuluk:
+                for komsu, agirlik, orta, kenar in liste:
+                    komsular.append(komsu)
+                    agirliklar.append(agirlik)
+                    ortalar.append(orta)
+                    kenarlar.append(kenar)
+                baslangic.append(len(komsular))
+            d[onek + "_baslangic"] = baslangic
+            d[onek + ("_hedef" if onek == "kh_yukari" else "_kaynak")] = komsular
+            d[onek + "_agirlik"] = agirliklar
+            d[onek + "_orta"] = ortalar
+            d[onek + "_kenar"] = kenarlar
+    
+    def yol_bul(self, kaynak: int, hedef: int) -> Tuple[Optional[List[int]], int]:
+        """
+        Çift yönlü yukarı arama ile en hızlı yolu bul
+        
+        Returns:
+            (orijinal kenar indeksleri listesi veya None, genişletilen durak sayısı)
+        """
+        d = self._diziler
+        if kaynak == hedef:
+            return [], 0
+        
+        ileri = {kaynak: (0.0, -1, -1)}  # durak -> (mesafe, onceki, yay)
+        geri = {hedef: (0.0, -1, -1)}
+        ileri_kuyruk = [(0.0, kaynak)]
+        geri_kuyruk = [(0.0, hedef)]
+        en_iyi = float('inf')
+        bulusma = -1
+        genisletilen = 0
+        
+        while ileri_kuyruk or geri_kuyruk:
+            ileri_min = ileri_kuyruk[0][0] if ileri_kuyruk else float('inf')
+            geri_min = geri_kuyruk[0][0] if geri_kuyruk else float('inf')
+            if min(ileri_min, geri_min) >= en_iyi:
+                break
+            
+            if ileri_min <= geri_min:
+                kuyruk, etiketler, karsi = ileri_kuyruk, ileri, geri
+                baslangic, komsular = d["kh_yukari_baslangic"], d["kh_yukari_hedef"]
+            else:
+                kuyruk, etiketler, karsi = geri_kuyruk, geri, ileri
+                baslangic, komsular = d["kh_asagi_baslangic"], d["kh_asagi_kaynak"]
+            agirliklar = d["kh_yukari_agirlik"] if etiketler is ileri else d["kh_asagi_agirlik"]
+            
+            mesafe, u = heapq.heappop(kuyruk)
+            if mesafe > etiketler[u][0]:
+                continue
+            genisletilen += 1
+            
+            if u in karsi and mesafe + karsi[u][0] < en_iyi:
+                en_iyi = mesafe + karsi[u][0]
+                bulusma = u
+            
+            for yay in range(baslangic[u], baslangic[u + 1]):
+                v = komsular[yay]
+                yeni = mesafe + agirliklar[yay]
+                if v not in etiketler or yeni < etiketler[v][0]:
+                    etiketler[v] = (yeni, u, yay)
+                    heapq.heappush(kuyruk, (yeni, v))
+        
+        if bulusma == -1:
+            return None, genisletilen
+        
+        kenarlar: List[int] = []
+        # Kaynak -> buluşma (yukarı yaylar, ters sırada toplanır)
+        ileri_yaylar = []
+        u = bulusma
+        while ileri[u][1] != -1:
+            ileri_yaylar.append(ileri[u][2])
+            u = ileri[u][1]
+        for yay in reversed(ileri_yaylar):
+            self._yay_ac(yay, True, kenarlar)
+        # Buluşma -> hedef (aşağı yaylar)
+        u = bulusma
+        while geri[u][1] != -1:
+            self._yay_ac(geri[u][2], False, kenarlar)
+            u = geri[u][1]
+        return kenarlar, genisletilen
+    
+    def _yay_ac(self, yay: int, yukari: bool, kenarlar: List[int]):
+        """Kısayol yayını orijinal kenarlarına aç"""
+        d = self._diziler
+        onek = "kh_yukari" if yukari else "kh_asagi"
+        orta = d[onek + "_orta"][yay]
+        if orta == -1:
+            kenarlar.append(d[onek + "_kenar"][yay])
+            return
+        
+        # Yayın uçları
+        if yukari:
+            u = self._yay_sahibi(d["kh_yukari_baslangic"], yay)
+            w = d["kh_yukari_hedef"][yay]
+        else:
+            w = self._yay_sahibi(d["kh_asagi_baslangic"], yay)
+            u = d["kh_asagi_kaynak"][yay]
+        
+        # u -> orta: orta daha önemsiz, yay ortanın aşağı listesinde
+        self._yay_ac(self._yay_ara(d["kh_asagi_baslangic"], d["kh_asagi_kaynak"],
+                                   d["kh_asagi_agirlik"], orta, u), False, kenarlar)
+        # orta -> w: yay ortanın yukarı listesinde
+        self._yay_ac(self._yay_ara(d["kh_yukari_baslangic"], d["kh_yukari_hedef"],
+                                   d["kh_yukari_agirlik"], orta, w), True, kenarlar)
+    
+    @staticmethod
+    def _yay_sahibi(baslangic: array, yay: int) -> int:
+        """CSR başlangıç dizisinde yayın ait olduğu durağı ikili arama ile bul"""
+        alt, ust = 0, len(baslangic) - 1
+        while alt < ust:
+            orta = (alt + ust) // 2
+            if baslangic[orta + 1] <= yay:
+                alt = orta + 1
+            else:
+                ust = orta
+        return alt
+    
+    @staticmethod
+    def _yay_ara(baslangic: array, komsular: array, agirliklar: array,
+                 durak: int, komsu: int) -> int:
+        """Durağın listesinde verilen komşuya giden en kısa yayı bul"""
+        en_iyi, en_iyi_agirlik = -1, float('inf')
+        for yay in range(baslangic[durak], baslangic[durak + 1]):
+            if komsular[yay] == komsu and agirliklar[yay] < en_iyi_agirlik:
+                en_iyi, en_iyi_agirlik = yay, agirliklar[yay]
+        return en_iyi
+    
+    @property
+    def istatistikler(self) -> Optional[KontraksiyonIstatistikleri]:
+        return self._istatistikler
@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class MaliyetAgirliklari:
+    """
+    Genelleştirilmiş maliyet ağırlıkları - dakika cinsinden ortak birim
+    
+    maliyet = sure * toplam süre (dk) + ucret * ücret (TL)
+              + aktarma * aktarma sayısı + yurume * yürüme süresi (dk)
+    
+    Varsayılanlar: 1 TL bir dakikaya, her aktarma 3 dakikaya denk sayılır;
+    yürünen her dakikaya yarım dakika ek ceza eklenir.
+    """
+    sure: float = 1.0  # α
+    ucret: float = 1.0  # β
+    aktarma: float = 3.0  # γ
+    yurume: float = 0.5  # δ
+    
+    def __post_init__(self):
+        if min(self.sure, self.ucret, self.aktarma, self.yurume) < 0:
+            raise ValueError("Maliyet ağırlıkları negatif olamaz")
+    
+    def adim_maliyeti(self, adim, ucret_carpani: float = 1.0) -> float:
+        """Tek bir rota adımının maliyeti (ücret, yolcu indirimi çarpanıyla)"""
+        maliyet = self.sure * adim.sure + self.ucret * adim.ucret * ucret_carpani
+        if adim.ulasim_tipi == "aktarma":
+            maliyet += self.aktarma
+        elif adim.ulasim_tipi == "yurume":
+            maliyet += self.yurume * adim.sure
+        return maliyet
+    
+    def rota_maliyeti(self, rota) -> float:
+        """Tamamlanmış rotanın maliyeti (toplam ücret indirimli haliyle kullanılır)"""
+        yurume_suresi = sum(adim.sure for adim in rota.adimlar if adim.ulasim_tipi == "yurume")
+        return (self.sure * rota.toplam_sure + self.ucret * rota.toplam_ucret
+                + self.aktarma * rota.aktarma_sayisi + self.yurume * yurume_suresi)
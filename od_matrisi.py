@@ -0,0 +1,204 @@
+import os
+import struct
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Optional, Tuple
+from dataclasses import dataclass
+from konum import Konum
+from durak_grafi import DurakGrafi
+from rota import RotaHesaplayici
+
+
+@dataclass
+class OdMatrisi:
+    """Başlangıç-hedef (OD) matrisleri - satır başlangıç, sütun hedef konumu"""
+    baslangic_sayisi: int
+    hedef_sayisi: int
+    sureler: array  # 'f', satır öncelikli toplam süreler (dk)
+    ucretler: array  # 'f', satır öncelikli toplam ücretler (TL)
+    aktarmalar: array  # 'H', satır öncelikli aktarma sayıları
+    
+    _SIHIRLI = b"ODMX"
+    _SURUM = 1
+    
+    def sure(self, baslangic: int, hedef: int) -> float:
+        return self.sureler[baslangic * self.hedef_sayisi + hedef]
+    
+    def ucret(self, baslangic: int, hedef: int) -> float:
+        return self.ucretler[baslangic * self.hedef_sayisi + hedef]
+    
+    def aktarma_sayisi(self, baslangic: int, hedef: int) -> int:
+        return self.aktarmalar[baslangic * self.hedef_sayisi + hedef]
+    
+    def satir(self, baslangic: int) -> List[Tuple[float, float, int]]:
+        """Bir başlangıcın tüm hedeflere (süre, ücret, aktarma) değerleri"""
+        bas = baslangic * self.hedef_sayisi
+        son = bas + self.hedef_sayisi
+        return list(zip(self.sureler[bas:son], self.ucretler[bas:son], self.aktarmalar[bas:son]))
+    
+    def kaydet(self, dosya_yolu: str):
+        """
+        Matrisleri ikili dosyaya yaz
+        
+        Biçim: sihirli baytlar, sürüm, satır ve sütun sayısı, ardından her matris
+        için dizi tipi, bayt uzunluğu ve ham veri.
+        """
+        with open(dosya_yolu, "wb") as dosya:
+            dosya.write(self._SIHIRLI)
+            dosya.write(struct.pack("<III", self._SURUM, self.baslangic_sayisi, self.hedef_sayisi))
+            for dizi in (self.sureler, self.ucretler, self.aktarmalar):
+                veri = dizi.tobytes()
+                dosya.write(struct.pack("<cQ", dizi.typecode.encode("ascii"), len(veri)))
+                dosya.write(veri)
+    
+    @classmethod
+    def yukle(cls, dosya_yolu: str) -> "OdMatrisi":
+        """İkili dosyadan matrisleri yükle"""
+        with open(dosya_yolu, "rb") as dosya:
+            if dosya.read(4) != cls._SIHIRLI:
+                raise ValueError(f"{dosya_yolu} geçerli bir OD matrisi dosyası değil")
+            surum, baslangic_sayisi, hedef_sayisi = struct.unpack("<III", dosya.read(12))
+            if surum != cls._SURUM:
+                raise ValueError(f"Desteklenmeyen OD matrisi sürümü: {surum}")
+            diziler = []
+            for _ in range(3):
+                tip, veri_boyu = struct.unpack("<cQ", dosya.read(9))
+                dizi = array(tip.decode("ascii"))
+                dizi.frombytes(dosya.read(veri_boyu))
+                diziler.append(dizi)
+        return cls(baslangic_sayisi, hedef_sayisi, *diziler)
+
+
+class OdMatrisiHesaplayici:
+    """Çok başlangıçlı, çok hedefli süre/ücret/aktarma matrisi hesaplayan sınıf"""
+    
+    def __init__(self, rota_hesaplayici: RotaHesaplayici):
+        """
+        Args:
+            rota_hesaplayici: Erişim/bitiş adımları, taksi ve indirim kuralları için
+                kullanılan hesaplayıcı; matris değerleri en kısa süreli toplu taşıma
+                rotasına göre hesaplanır
+        """
+        self._rota_hesaplayici = rota_hesaplayici
+    
+    def hesapla(self, baslangiclar: List[Konum], hedefler: List[Konum],
+                yolcu_tipi: Optional[str] = None, is_sayisi: Optional[int] = None) -> OdMatrisi:
+        """
+        Tüm başlangıç-hedef çiftleri için toplam süre, ücret ve aktarma sayısı
+        
+        Her farklı erişim durağı için bir kez bire-çok arama yapılır; aramalar
+        işlemci çekirdeklerine dağıtılır. Toplu taşımayla ulaşılamayan çiftlerde
+        RotaHesaplayici gibi duraklar arası taksi kullanılır.
+        
+        Args:
+            baslangiclar: Başlangıç konumları (satırlar)
+            hedefler: Hedef konumları (sütunlar)
+            yolcu_tipi: Yolcu tipi (indirim hesaplaması için)
+            is_sayisi: Paralel işlem sayısı (varsayılan: çekirdek sayısı, 1: seri)
+        """
+        hesaplayici = self._rota_hesaplayici
+        graf = hesaplayici.hat_yoneticisi.durak_grafi
+        kenar_ucretleri = graf.kenar_ucretleri(hesaplayici.aktarma_indirim_yoneticisi)
+        
+        # Erişim ve bitiş adımları konum başına bir kez hesaplanır
+        baslangic_duraklari, erisimler = self._erisim_adimlari(baslangiclar, bitis=False)
+        hedef_duraklari, bitisler = self._erisim_adimlari(hedefler, bitis=True)
+        
+        kokler = sorted({graf.indeks(durak_id) for durak_id in baslangic_duraklari if durak_id})
+        hedef_indeksleri = sorted({graf.indeks(durak_id) for durak_id in hedef_duraklari if durak_id})
+        sutun_sirasi = {durak: i for i, durak in enumerate(hedef_indeksleri)}
+        
+        agaclar = self._agaclari_hesapla(graf, kenar_ucretleri, kokler, hedef_indeksleri, is_sayisi)
+        
+        indirim_carpani = 1.0
+        if yolcu_tipi:
+            indirim_carpani = 1 - hesaplayici.indirim_orani_al(yolcu_tipi)
+        
+        sonsuz = float('inf')
+        hedef_sayisi = len(hedefler)
+        sureler = array('f', [sonsuz]) * (len(baslangiclar) * hedef_sayisi)
+        ucretler = array('f', [sonsuz]) * (len(baslangiclar) * hedef_sayisi)
+        aktarmalar = array('H', [0]) * (len(baslangiclar) * hedef_sayisi)
+        taksi_onbellegi: Dict[Tuple[str, str], Tuple[float, float]] = {}
+        
+        sutunlar = [sutun_sirasi[graf.indeks(durak_id)] if durak_id else -1
+                    for durak_id in hedef_duraklari]
+        for i, durak_id in enumerate(baslangic_duraklari):
+            if not durak_id:
+                continue
+            agac_sureleri, agac_ucretleri, agac_aktarmalari = agaclar[graf.indeks(durak_id)]
+            erisim = erisimler[i]
+            taban = i * hedef_sayisi
+            for j, sutun in enumerate(sutunlar):
+                if sutun < 0:
+                    continue
+                bitis = bitisler[j]
+                ara_sure = agac_sureleri[sutun]
+                if ara_sure < sonsuz:
+                    ara_ucret = agac_ucretleri[sutun]
+                    aktarmalar[taban + j] = agac_aktarmalari[sutun]
+                else:
+                    # Toplu taşıma yolu yok: duraklar arası taksi
+                    anahtar = (durak_id, hedef_duraklari[j])
+                    if anahtar not in taksi_onbellegi:
+                        adim = hesaplayici.durak_arasi_taksi_adimi(*anahtar)
+                        taksi_onbellegi[anahtar] = (adim.sure, adim.ucret)
+                    ara_sure, ara_ucret = taksi_onbellegi[anahtar]
+                sureler[taban + j] = erisim.sure + ara_sure + bitis.sure
+                ucretler[taban + j] = (erisim.ucret + ara_ucret + bitis.ucret) * indirim_carpani
+        
+        return OdMatrisi(len(baslangiclar), hedef_sayisi, sureler, ucretler, aktarmalar)
+    
+    def _erisim_adimlari(self, konumlar: List[Konum], bitis: bool):
+        """Her konumun en yakın durağı ve o durağa (veya duraktan konuma) ulaşım adımı"""
+        hesaplayici = self._rota_hesaplayici
+        duraklar = []
+        adimlar = []
+        for konum in konumlar:
+            durak_id, _ = hesaplayici.en_yakin_durak_bul(konum.enlem, konum.boylam)
+            duraklar.append(durak_id)
+            if not durak_id:
+                adimlar.append(None)
+            elif bitis:
+                adimlar.append(hesaplayici.bitis_adimi_olustur(konum, durak_id))
+            else:
+                adimlar.append(hesaplayici.baslangic_adimi_olustur(konum, durak_id))
+        return duraklar, adimlar
+    
+    def _agaclari_hesapla(self, graf: DurakGrafi, kenar_ucretleri: array, kokler: List[int],
+                          hedef_indeksleri: List[int], is_sayisi: Optional[int]) -> Dict[int, Tuple]:
+        """Her kök için hedef duraklardaki (süre, ücret, aktarma) dizilerini hesapla"""
+        if is_sayisi is None:
+            is_sayisi = os.cpu_count() or 1
+        is_sayisi = min(is_sayisi, len(kokler))
+        
+        if is_sayisi <= 1:
+            return {kok: _agac_satiri(graf, kenar_ucretleri, kok, hedef_indeksleri) for kok in kokler}
+        
+        parca = max(1, len(kokler) // (is_sayisi * 4))
+        with ProcessPoolExecutor(max_workers=is_sayisi, initializer=_isci_baslat,
+                                 initargs=(graf, kenar_ucretleri, hedef_indeksleri)) as havuz:
+            return dict(zip(kokler, havuz.map(_isci_agaci, kokler, chunksize=parca)))
+
+
+def _agac_satiri(graf: DurakGrafi, kenar_ucretleri: array, kok: int,
+                 hedef_indeksleri: List[int]) -> Tuple[array, array, array]:
+    """Kökten arama yap ve yalnızca hedef duraklardaki değerleri döndür"""
+    sureler, ucretler, aktarmalar = graf.agac_degerleri(kok, kenar_ucretleri)
+    return (array('d', (sureler[d] for d in hedef_indeksleri)),
+            array('d', (ucretler[d] for d in hedef_indeksleri)),
+            array('i', (aktarmalar[d] for d in hedef_indeksleri)))
+
+
+# Paralel işçiler: graf her işleme bir kez aktarılır
+_isci_durumu: Optional[Tuple[DurakGrafi, array, List[int]]] = None
+
+
+def _isci_baslat(graf: DurakGrafi, kenar_ucretleri: array, hedef_indeksleri: List[int]):
+    global _isci_durumu
+    _isci_durumu = (graf, kenar_ucretleri, hedef_indeksleri)
+
+
+def _isci_agaci(kok: int) -> Tuple[array, array, array]:
+    graf, kenar_ucretleri, hedef_indeksleri = _isci_durumu
+    return _agac_satiri(graf, kenar_ucretleri, kok, hedef_indeksleri)
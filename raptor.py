@@ -0,0 +1,644 @@
+from array import array
+from typing import List, Dict, Optional, Tuple
+from dataclasses import dataclass, field
+from tarife import Tarife, dakikayi_saate_cevir
+
+
+@dataclass
+class YolculukBacagi:
+    """Zamanlı bir yolculuğun tek bacağı - bir sefer veya bir aktarma"""
+    tip: str  # "sefer" veya "aktarma"
+    baslangic: str  # Başlangıç durak ID
+    hedef: str  # Hedef durak ID
+    kalkis: float  # dk (gece yarısından itibaren)
+    varis: float  # dk
+    hat_id: Optional[str] = None
+    sefer_id: Optional[str] = None
+    duraklar: List[str] = field(default_factory=list)  # Sefer boyunca geçilen duraklar
+    
+    def __str__(self) -> str:
+        zaman = f"{dakikayi_saate_cevir(self.kalkis)}-{dakikayi_saate_cevir(self.varis)}"
+        if self.tip == "sefer":
+            return f"{self.sefer_id}: {self.baslangic} -> {self.hedef} ({zaman})"
+        return f"Aktarma: {self.baslangic} -> {self.hedef} ({zaman})"
+
+
+@dataclass
+class Yolculuk:
+    """Belirli bir kalkış zamanı için bulunan zamanlı yolculuk"""
+    kalkis: float  # Sorgunun kalkış zamanı (dk)
+    varis: float  # Hedef durağa varış zamanı (dk)
+    aktarma_sayisi: int  # Sefer değiştirme sayısı
+    bacaklar: List[YolculukBacagi]
+    
+    @property
+    def sure(self) -> float:
+        """Bekleme süreleri dahil toplam yolculuk süresi (dk)"""
+        return self.varis - self.kalkis
+    
+    def __str__(self) -> str:
+        return (f"Yolculuk: {dakikayi_saate_cevir(self.kalkis)} -> {dakikayi_saate_cevir(self.varis)}, "
+                f"{self.sure:.0f} dk, {self.aktarma_sayisi} aktarma")
+
+
+class RaptorMotoru:
+    """
+    Tarifeye dayalı RAPTOR (Round-bAsed Public Transit Optimized Router) motoru
+    
+    Her turda bir sefer daha kullanılarak, işaretli duraklardan geçen hatlar
+    taranır; k. turun sonunda en fazla k-1 aktarmalı en erken varış zamanları
+    bilinir. Hatlar, seferler ve durak zamanları düz dizilerde tutulur.
+    """
+    
+    def __init__(self, tarife: Tarife):
+        self._tarife = tarife
+        hat_yoneticisi = tarife.hat_yoneticisi
+        self._graf = hat_yoneticisi.durak_grafi
+        durak_sayisi = self._graf.durak_sayisi
+        
+        # Hatlar: durak dizisi ve satır sefer, sütun durak olan zaman bloğu
+        self._hat_idleri: List[str] = []
+        self._sefer_idleri: List[List[str]] = []
+        self._hat_durak_baslangic = array('i', [0])
+        self._hat_duraklari = array('i')
+        self._hat_zaman_baslangic = array('i', [0])
+        self._hat_sefer_sayilari = array('i')
+        self._durak_zamanlari = array('d')
+        
+        durak_hatlari: List[List[Tuple[int, int]]] = [[] for _ in range(durak_sayisi)]
+        for hat_id in tarife.hat_idleri:
+            hat = tarife.hat_getir(hat_id)
+            seferler = tarife.hat_seferleri(hat_id)
+            hat_no = len(self._hat_idleri)
+            self._hat_idleri.append(hat_id)
+            self._sefer_idleri.append([sefer.sefer_id for sefer in seferler])
+            for sira, durak_id in enumerate(hat.duraklar):
+                durak = self._graf.indeks(durak_id)
+                self._hat_duraklari.append(durak)
+                durak_hatlari[durak].append((hat_no, sira))
+            for sefer in seferler:
+                self._durak_zamanlari.extend(sefer.zamanlar)
+            self._hat_durak_baslangic.append(len(self._hat_duraklari))
+            self._hat_zaman_baslangic.append(len(self._durak_zamanlari))
+            self._hat_sefer_sayilari.append(len(seferler))
+        
+        # Duraktan geçen hatlar ve duraktaki sıraları
+        self._durak_hat_baslangic = array('i', [0])
+        self._durak_hatlari = array('i')
+        self._durak_hat_sirasi = array('i')
+        for hatlar in durak_hatlari:
+            for hat_no, sira in hatlar:
+                self._durak_hatlari.append(hat_no)
+                self._durak_hat_sirasi.append(sira)
+            self._durak_hat_baslangic.append(len(self._durak_hatlari))
+        
+        # Aktarmalar (yürüme bağlantıları)
+        self._aktarma_baslangic = array('i', [0])
+        self._aktarma_hedef = array('i')
+        self._aktarma_sure = array('d')
+        for indeks in range(durak_sayisi):
+            durak = hat_yoneticisi.durak_getir(self._graf.durak_id(indeks))
+            if durak.aktarma and self._graf.indeks(durak.aktarma["transferStopId"]) is not None:
+                self._aktarma_hedef.append(self._graf.indeks(durak.aktarma["transferStopId"]))
+                self._aktarma_sure.append(durak.aktarma["transferSure"])
+            self._aktarma_baslangic.append(len(self._aktarma_hedef))
+        
+        # Varışa göre (geriye doğru) sorgular için durağa gelen aktarmalar
+        self._gelen_aktarma_baslangic = array('i', [0])
+        self._gelen_aktarma_kaynak = array('i')
+        self._gelen_aktarma_sure = array('d')
+        for indeks in range(durak_sayisi):
+            durak = hat_yoneticisi.durak_getir(self._graf.durak_id(indeks))
+            for aktarma in durak.gelen_aktarmalar:
+                kaynak = self._graf.indeks(aktarma["transferStopId"])
+                if kaynak is not None:
+                    self._gelen_aktarma_kaynak.append(kaynak)
+                    self._gelen_aktarma_sure.append(aktarma["transferSure"])
+            self._gelen_aktarma_baslangic.append(len(self._gelen_aktarma_kaynak))
+    
+    @property
+    def hat_sayisi(self) -> int:
+        return len(self._hat_idleri)
+    
+    @property
+    def sefer_sayisi(self) -> int:
+        return sum(self._hat_sefer_sayilari)
+    
+    def sorgula(self, kaynak: int, hedef: int, kalkis: float,
+                en_fazla_aktarma: int = 4) -> Optional[Yolculuk]:
+        """
+        Kaynak duraktan verilen zamanda çıkıldığında hedefe en erken varan yolculuk
+        
+        Aynı varış zamanına sahip yolculuklar arasında en az aktarmalı olan seçilir.
+        
+        Args:
+            kaynak: Kaynak durak indeksi (DurakGrafi)
+            hedef: Hedef durak indeksi
+            kalkis: Kaynak duraktan kalkış zamanı (gece yarısından itibaren dk)
+            en_fazla_aktarma: İzin verilen en fazla sefer değiştirme sayısı
+        
+        Returns:
+            Yolculuk veya hiçbir seferle ulaşılamıyorsa None
+        """
+        durum = _TurDurumu(self._graf.durak_sayisi, en_fazla_aktarma + 1)
+        self._turlari_calistir(kaynak, kalkis, durum, hedef)
+        en_iyi_tur = durum.en_iyi_tur(hedef)
+        if en_iyi_tur < 0:
+            return None
+        return self._yolculuk_olustur(kaynak, hedef, kalkis, en_iyi_tur, durum)
+    
+    def pareto_sorgula(self, kaynak: int, hedef: int, kalkis: float,
+                       en_fazla_aktarma: int = 4) -> List[Yolculuk]:
+        """
+        Varış zamanı ve aktarma sayısı bakımından birbirine baskın olmayan yolculuklar
+        
+        Returns:
+            Aktarma sayısına göre artan (varış zamanına göre azalan) yolculuk listesi
+        """
+        durum = _TurDurumu(self._graf.durak_sayisi, en_fazla_aktarma + 1)
+        self._turlari_calistir(kaynak, kalkis, durum, hedef)
+        yolculuklar = []
+        en_iyi_varis = float('inf')
+        for tur, etiketler in enumerate(durum.turlar):
+            if etiketler[hedef] < en_iyi_varis:
+                en_iyi_varis = etiketler[hedef]
+                yolculuklar.append(self._yolculuk_olustur(kaynak, hedef, kalkis, tur, durum))
+        return yolculuklar
+    
+    def profil_sorgula(self, kaynak: int, hedef: int, pencere_baslangic: float,
+                       pencere_bitis: float, en_fazla_aktarma: int = 4) -> List[Yolculuk]:
+        """
+        Kalkış penceresindeki tüm (kalkış, varış) bakımından en iyi yolculuklar (rRAPTOR)
+        
+        Kaynaktan kalkılabilecek zamanlar geç olandan erkene doğru işlenir ve tur
+        etiketleri kalkışlar arasında korunur: daha geç bir kalkıştan bulunan
+        varışlar daha erken kalkışlar için de geçerli üst sınırlardır. Böylece her
+        kalkışta yalnızca iyileşen duraklar yeniden taranır.
+        
+        Args:
+            kaynak: Kaynak durak indeksi (DurakGrafi)
+            hedef: Hedef durak indeksi
+            pencere_baslangic: Kaynaktan en erken kalkış zamanı (dk)
+            pencere_bitis: Kaynaktan en geç kalkış zamanı (dk)
+            en_fazla_aktarma: İzin verilen en fazla sefer değiştirme sayısı
+        
+        Returns:
+            Kalkış zamanına göre artan, birbirine baskın olmayan yolculuk listesi
+        """
+        durum = _TurDurumu(self._graf.durak_sayisi, en_fazla_aktarma + 1)
+        yolculuklar = []
+        en_iyi_varis = float('inf')
+        for kalkis in self._kalkis_zamanlari(kaynak, hedef, pencere_baslangic, pencere_bitis):
+            self._turlari_calistir(kaynak, kalkis, durum, hedef)
+            en_iyi_tur = durum.en_iyi_tur(hedef)
+            if en_iyi_tur >= 0 and durum.turlar[en_iyi_tur][hedef] < en_iyi_varis:
+                en_iyi_varis = durum.turlar[en_iyi_tur][hedef]
+                yolculuklar.append(self._yolculuk_olustur(kaynak, hedef, kalkis, en_iyi_tur, durum))
+        
+        yolculuklar.reverse()
+        return yolculuklar
+    
+    def _kalkis_zamanlari(self, kaynak: int, hedef: int, pencere_baslangic: float,
+                          pencere_bitis: float) -> List[float]:
+        """Kaynaktan (doğrudan veya aktarmayla) bir sefere yetişilen kalkış zamanları, azalan"""
+        cikislar = [(kaynak, 0.0)]
+        for j in range(self._aktarma_baslangic[kaynak], self._aktarma_baslangic[kaynak + 1]):
+            cikislar.append((self._aktarma_hedef[j], self._aktarma_sure[j]))
+        
+        kalkislar = set()
+        # Hedefe yalnızca aktarmayla gidilebiliyorsa seferden bağımsız en geç kalkış
+        if any(durak == hedef for durak, _ in cikislar[1:]):
+            kalkislar.add(pencere_bitis)
+        for durak, yurume in cikislar:
+            for j in range(self._durak_hat_baslangic[durak], self._durak_hat_baslangic[durak + 1]):
+                hat_no = self._durak_hatlari[j]
+                sira = self._durak_hat_sirasi[j]
+                hat_uzunlugu = self._hat_durak_baslangic[hat_no + 1] - self._hat_durak_baslangic[hat_no]
+                zaman_baslangic = self._hat_zaman_baslangic[hat_no]
+                for sefer in range(self._hat_sefer_sayilari[hat_no]):
+                    kalkis = self._durak_zamanlari[zaman_baslangic + sefer * hat_uzunlugu + sira] - yurume
+                    if pencere_baslangic <= kalkis <= pencere_bitis:
+                        kalkislar.add(kalkis)
+        return sorted(kalkislar, reverse=True)
+    
+    def varis_sorgula(self, kaynak: int, hedef: int, varis: float,
+                      en_fazla_aktarma: int = 4) -> Optional[Yolculuk]:
+        """
+        Hedefe en geç verilen zamanda varmak için kaynaktan en geç çıkılabilen yolculuk
+        
+        Arama hedef duraktan başlayıp ters bağlantılar üzerinde geriye doğru
+        yürütülür; etiketler en geç kalkış zamanlarıdır. Aynı kalkış zamanına
+        sahip yolculuklar arasında en az aktarmalı olan seçilir.
+        
+        Args:
+            kaynak: Kaynak durak indeksi (DurakGrafi)
+            hedef: Hedef durak indeksi
+            varis: Hedef durağa en geç varış zamanı (gece yarısından itibaren dk)
+            en_fazla_aktarma: İzin verilen en fazla sefer değiştirme sayısı
+        
+        Returns:
+            Yolculuk (kalkis: kaynaktan en geç kalkış) veya ulaşılamıyorsa None
+        """
+        turlar, sefer_ebeveynleri, aktarma_ebeveynleri = self._ters_turlari_calistir(
+            hedef, varis, en_fazla_aktarma + 2, kaynak
+        )
+        en_iyi_tur = -1
+        for tur, etiketler in enumerate(turlar):
+            if etiketler[kaynak] > float('-inf') and (
+                    en_iyi_tur < 0 or etiketler[kaynak] > turlar[en_iyi_tur][kaynak]):
+                en_iyi_tur = tur
+        if en_iyi_tur < 0:
+            return None
+        return self._ters_yolculuk_olustur(kaynak, hedef, varis, en_iyi_tur, turlar,
+                                           sefer_ebeveynleri, aktarma_ebeveynleri)
+    
+    def _turlari_calistir(self, kaynak: int, kalkis: float, durum: "_TurDurumu",
+                          hedef: int = -1):
+        """
+        RAPTOR turlarını çalıştır
+        
+        durum.turlar[k][durak] en fazla k seferle en erken varış zamanıdır; ebeveynler
+        etiketi o turda belirleyen sefer veya aktarmayı tutar. Önceki çalıştırmalardan
+        kalan etiketler korunur ve yalnızca bu kalkışla iyileşen duraklar taranır.
+        
+        Budama sınırı, durağın bu turdaki etiketi ile bu kalkışta şimdiye kadarki
+        turlardaki en iyi varışının küçüğüdür. Daha geç kalkışlardan kalan daha
+        yüksek turlu etiketler sınır olarak kullanılmaz: aynı durağa daha az seferle
+        varan etiketi budayıp aktarma sınırının hâlâ izin verdiği yolculukları
+        kaybettirirler.
+        """
+        sonsuz = float('inf')
+        durak_sayisi = self._graf.durak_sayisi
+        turlar = durum.turlar
+        
+        etiketler = turlar[0]
+        if kalkis >= etiketler[kaynak]:
+            return
+        etiketler[kaynak] = kalkis
+        en_iyi = durum.kalkis_baslat()
+        en_iyi[kaynak] = kalkis
+        durum.ebeveynleri_sil(0, kaynak)
+        isaretli = self._aktarmalari_uygula([kaynak], etiketler, en_iyi, hedef, durum, 0)
+        isaretli.add(kaynak)
+        
+        hat_duraklari = self._hat_duraklari
+        durak_zamanlari = self._durak_zamanlari
+        for tur in range(1, len(turlar)):
+            onceki = turlar[tur - 1]
+            etiketler = turlar[tur]
+            sefer_ebeveyni = durum.sefer_ebeveynleri[tur]
+            aktarma_ebeveyni = durum.aktarma_ebeveynleri[tur]
+            
+            # Önceki turda iyileşen etiketler bu tur için de geçerlidir
+            for durak in isaretli:
+                if onceki[durak] < etiketler[durak]:
+                    etiketler[durak] = onceki[durak]
+                    durum.ebeveynleri_sil(tur, durak)
+            
+            # İşaretli duraklardan geçen hatları en erken biniş sırasıyla topla
+            kuyruk: Dict[int, int] = {}
+            for durak in isaretli:
+                for j in range(self._durak_hat_baslangic[durak], self._durak_hat_baslangic[durak + 1]):
+                    hat_no = self._durak_hatlari[j]
+                    sira = self._durak_hat_sirasi[j]
+                    if sira < kuyruk.get(hat_no, durak_sayisi):
+                        kuyruk[hat_no] = sira
+            
+            iyilesen = []
+            for hat_no, ilk_sira in kuyruk.items():
+                durak_baslangic = self._hat_durak_baslangic[hat_no]
+                hat_uzunlugu = self._hat_durak_baslangic[hat_no + 1] - durak_baslangic
+                zaman_baslangic = self._hat_zaman_baslangic[hat_no]
+                sefer_sayisi = self._hat_sefer_sayilari[hat_no]
+                sefer = -1
+                binis = -1
+                for sira in range(ilk_sira, hat_uzunlugu):
+                    durak = hat_duraklari[durak_baslangic + sira]
+                    if sefer >= 0:
+                        varis = durak_zamanlari[zaman_baslangic + sefer * hat_uzunlugu + sira]
+                        sinir = min(etiketler[durak], en_iyi[durak])
+                        if hedef >= 0:
+                            sinir = min(sinir, etiketler[hedef], en_iyi[hedef])
+                        if varis < sinir:
+                            iyilesen.append(durak)
+                            etiketler[durak] = varis
+                            en_iyi[durak] = varis
+                            sefer_ebeveyni[durak] = (hat_no, sefer, binis, sira)
+                            aktarma_ebeveyni.pop(durak, None)
+                    
+                    # Önceki turda bu durağa daha erken varıldıysa daha erken bir sefere bin
+                    hazir = onceki[durak]
+                    if hazir < sonsuz and (sefer < 0 or hazir <= durak_zamanlari[
+                            zaman_baslangic + sefer * hat_uzunlugu + sira]):
+                        ust = sefer if sefer >= 0 else sefer_sayisi
+                        yeni = self._en_erken_sefer(zaman_baslangic, hat_uzunlugu, ust, sira, hazir)
+                        if yeni >= 0 and yeni != sefer:
+                            sefer = yeni
+                            binis = sira
+            
+            isaretli = set(iyilesen)
+            isaretli |= self._aktarmalari_uygula(isaretli, etiketler, en_iyi, hedef, durum, tur)
+            if not isaretli:
+                break
+    
+    def _aktarmalari_uygula(self, duraklar, etiketler: array, en_iyi: array,
+                            hedef: int, durum: "_TurDurumu", tur: int) -> set:
+        """Bu turda iyileşen duraklardan aktarma (yürüme) bağlantılarını gevşet"""
+        # Aktarmalar zincirlenmez; yalnızca seferle varılan zamanlardan yapılır
+        cikislar = [(durak, etiketler[durak]) for durak in duraklar]
+        isaretli = set()
+        for durak, zaman in cikislar:
+            for j in range(self._aktarma_baslangic[durak], self._aktarma_baslangic[durak + 1]):
+                komsu = self._aktarma_hedef[j]
+                varis = zaman + self._aktarma_sure[j]
+                sinir = min(etiketler[komsu], en_iyi[komsu])
+                if hedef >= 0:
+                    sinir = min(sinir, etiketler[hedef], en_iyi[hedef])
+                if varis < sinir:
+                    etiketler[komsu] = varis
+                    en_iyi[komsu] = varis
+                    durum.aktarma_ebeveynleri[tur][komsu] = durak
+                    isaretli.add(komsu)
+        return isaretli
+    
+    def _ters_turlari_calistir(self, hedef: int, varis: float, tur_sayisi: int,
+                               kaynak: int = -1) -> Tuple[List[array], List[Dict], List[Dict]]:
+        """
+        RAPTOR turlarını hedeften geriye doğru çalıştır
+        
+        Returns:
+            (turlar, sefer_ebeveynleri, aktarma_ebeveynleri) - turlar[k][durak] en fazla
+            k seferle hedefe zamanında varmak için duraktan en geç kalkış zamanı
+        """
+        eksi_sonsuz = float('-inf')
+        durak_sayisi = self._graf.durak_sayisi
+        en_iyi = array('d', [eksi_sonsuz]) * durak_sayisi
+        
+        etiketler = array('d', [eksi_sonsuz]) * durak_sayisi
+        etiketler[hedef] = varis
+        en_iyi[hedef] = varis
+        aktarma_ebeveyni: Dict[int, int] = {}
+        isaretli = self._gelen_aktarmalari_uygula([hedef], etiketler, en_iyi, kaynak, aktarma_ebeveyni)
+        isaretli.add(hedef)
+        
+        turlar = [etiketler]
+        sefer_ebeveynleri: List[Dict] = [{}]
+        aktarma_ebeveynleri: List[Dict] = [aktarma_ebeveyni]
+        
+        hat_duraklari = self._hat_duraklari
+        durak_zamanlari = self._durak_zamanlari
+        for _ in range(tur_sayisi - 1):
+            onceki = etiketler
+            etiketler = array('d', onceki)
+            
+            # İşaretli duraklardan geçen hatları en geç iniş sırasıyla topla
+            kuyruk: Dict[int, int] = {}
+            for durak in isaretli:
+                for j in range(self._durak_hat_baslangic[durak], self._durak_hat_baslangic[durak + 1]):
+                    hat_no = self._durak_hatlari[j]
+                    sira = self._durak_hat_sirasi[j]
+                    if sira > kuyruk.get(hat_no, -1):
+                        kuyruk[hat_no] = sira
+            
+            sefer_ebeveyni: Dict[int, Tuple[int, int, int, int]] = {}
+            iyilesen = []
+            for hat_no, son_sira in kuyruk.items():
+                durak_baslangic = self._hat_durak_baslangic[hat_no]
+                hat_uzunlugu = self._hat_durak_baslangic[hat_no + 1] - durak_baslangic
+                zaman_baslangic = self._hat_zaman_baslangic[hat_no]
+                sefer_sayisi = self._hat_sefer_sayilari[hat_no]
+                sefer = -1
+                inis = -1
+                for sira in range(son_sira, -1, -1):
+                    durak = hat_duraklari[durak_baslangic + sira]
+                    if sefer >= 0:
+                        kalkis = durak_zamanlari[zaman_baslangic + sefer * hat_uzunlugu + sira]
+                        sinir = en_iyi[durak] if kaynak < 0 else max(en_iyi[durak], en_iyi[kaynak])
+                        if kalkis > sinir:
+                            if durak not in sefer_ebeveyni:
+                                iyilesen.append(durak)
+                            etiketler[durak] = kalkis
+                            en_iyi[durak] = kalkis
+                            sefer_ebeveyni[durak] = (hat_no, sefer, sira, inis)
+                    
+                    # Önceki turda bu duraktan daha geç çıkılabiliyorsa daha geç bir seferden in
+                    son_zaman = onceki[durak]
+                    if son_zaman > eksi_sonsuz and (sefer < 0 or son_zaman >= durak_zamanlari[
+                            zaman_baslangic + sefer * hat_uzunlugu + sira]):
+                        alt = sefer + 1 if sefer >= 0 else 0
+                        yeni = self._en_gec_sefer(zaman_baslangic, hat_uzunlugu, alt,
+                                                  sefer_sayisi, sira, son_zaman)
+                        if yeni >= 0:
+                            sefer = yeni
+                            inis = sira
+            
+            aktarma_ebeveyni = {}
+            isaretli = set(iyilesen)
+            isaretli |= self._gelen_aktarmalari_uygula(iyilesen, etiketler, en_iyi, kaynak,
+                                                       aktarma_ebeveyni)
+            
+            turlar.append(etiketler)
+            sefer_ebeveynleri.append(sefer_ebeveyni)
+            aktarma_ebeveynleri.append(aktarma_ebeveyni)
+            if not isaretli:
+                break
+        
+        return turlar, sefer_ebeveynleri, aktarma_ebeveynleri
+    
+    def _gelen_aktarmalari_uygula(self, duraklar: List[int], etiketler: array, en_iyi: array,
+                                  kaynak: int, aktarma_ebeveyni: Dict[int, int]) -> set:
+        """Bu turda iyileşen duraklara gelen aktarma bağlantılarını geriye doğru gevşet"""
+        cikislar = [(durak, etiketler[durak]) for durak in duraklar]
+        isaretli = set()
+        for durak, zaman in cikislar:
+            for j in range(self._gelen_aktarma_baslangic[durak], self._gelen_aktarma_baslangic[durak + 1]):
+                komsu = self._gelen_aktarma_kaynak[j]
+                kalkis = zaman - self._gelen_aktarma_sure[j]
+                sinir = en_iyi[komsu] if kaynak < 0 else max(en_iyi[komsu], en_iyi[kaynak])
+                if kalkis > sinir:
+                    etiketler[komsu] = kalkis
+                    en_iyi[komsu] = kalkis
+                    aktarma_ebeveyni[komsu] = durak
+                    isaretli.add(komsu)
+        return isaretli
+    
+    def _en_gec_sefer(self, zaman_baslangic: int, hat_uzunlugu: int, alt: int, ust: int,
+                      sira: int, zaman: float) -> int:
+        """Duraktan verilen zamanda veya önce geçen son sefer (ikili arama, [alt, ust))"""
+        durak_zamanlari = self._durak_zamanlari
+        sinir = alt
+        while alt < ust:
+            orta = (alt + ust) // 2
+            if durak_zamanlari[zaman_baslangic + orta * hat_uzunlugu + sira] <= zaman:
+                alt = orta + 1
+            else:
+                ust = orta
+        return alt - 1 if alt > sinir else -1
+    
+    def _en_erken_sefer(self, zaman_baslangic: int, hat_uzunlugu: int, ust: int,
+                        sira: int, zaman: float) -> int:
+        """Duraktan verilen zamanda veya sonra kalkan ilk sefer (ikili arama, [0, ust))"""
+        durak_zamanlari = self._durak_zamanlari
+        alt, sinir = 0, ust
+        while alt < ust:
+            orta = (alt + ust) // 2
+            if durak_zamanlari[zaman_baslangic + orta * hat_uzunlugu + sira] < zaman:
+                alt = orta + 1
+            else:
+                ust = orta
+        return alt if alt < sinir else -1
+    
+    def _yolculuk_olustur(self, kaynak: int, hedef: int, kalkis: float, tur: int,
+                          durum: "_TurDurumu") -> Yolculuk:
+        """Tur etiketlerinden geriye doğru yürüyerek yolculuğu oluştur"""
+        graf = self._graf
+        turlar = durum.turlar
+        sefer_ebeveynleri = durum.sefer_ebeveynleri
+        aktarma_ebeveynleri = durum.aktarma_ebeveynleri
+        bacaklar: List[YolculukBacagi] = []
+        durak = hedef
+        aktarma_olabilir = True
+        while tur >= 0 and not (durak == kaynak and tur == 0):
+            if aktarma_olabilir and durak in aktarma_ebeveynleri[tur]:
+                onceki = aktarma_ebeveynleri[tur][durak]
+                bacaklar.append(YolculukBacagi(
+                    tip="aktarma",
+                    baslangic=graf.durak_id(onceki),
+                    hedef=graf.durak_id(durak),
+                    kalkis=turlar[tur][onceki],
+                    varis=turlar[tur][durak]
+                ))
+                durak = onceki
+                aktarma_olabilir = False
+            elif durak in sefer_ebeveynleri[tur]:
+                hat_no, sefer, binis, inis = sefer_ebeveynleri[tur][durak]
+                durak_baslangic = self._hat_durak_baslangic[hat_no]
+                hat_uzunlugu = self._hat_durak_baslangic[hat_no + 1] - durak_baslangic
+                zaman_baslangic = self._hat_zaman_baslangic[hat_no] + sefer * hat_uzunlugu
+                gecilen = [graf.durak_id(self._hat_duraklari[durak_baslangic + sira])
+                           for sira in range(binis, inis + 1)]
+                bacaklar.append(YolculukBacagi(
+                    tip="sefer",
+                    baslangic=gecilen[0],
+                    hedef=gecilen[-1],
+                    kalkis=self._durak_zamanlari[zaman_baslangic + binis],
+                    varis=self._durak_zamanlari[zaman_baslangic + inis],
+                    hat_id=self._hat_idleri[hat_no],
+                    sefer_id=self._sefer_idleri[hat_no][sefer],
+                    duraklar=gecilen
+                ))
+                durak = self._hat_duraklari[durak_baslangic + binis]
+                tur -= 1
+                aktarma_olabilir = True
+            else:
+                tur -= 1
+                aktarma_olabilir = True
+        
+        bacaklar.reverse()
+        return Yolculuk(
+            kalkis=kalkis,
+            varis=bacaklar[-1].varis if bacaklar else kalkis,
+            aktarma_sayisi=max(0, sum(1 for bacak in bacaklar if bacak.tip == "sefer") - 1),
+            bacaklar=bacaklar
+        )
+    
+    def _ters_yolculuk_olustur(self, kaynak: int, hedef: int, varis: float, tur: int,
+                               turlar: List[array], sefer_ebeveynleri: List[Dict],
+                               aktarma_ebeveynleri: List[Dict]) -> Yolculuk:
+        """Geriye doğru tur etiketlerinden kaynaktan ileri yürüyerek yolculuğu oluştur"""
+        graf = self._graf
+        bacaklar: List[YolculukBacagi] = []
+        durak = kaynak
+        aktarma_olabilir = True
+        while tur >= 0 and not (durak == hedef and tur == 0):
+            if aktarma_olabilir and durak in aktarma_ebeveynleri[tur]:
+                sonraki = aktarma_ebeveynleri[tur][durak]
+                kalkis = turlar[tur][durak]
+                bacaklar.append(YolculukBacagi(
+                    tip="aktarma",
+                    baslangic=graf.durak_id(durak),
+                    hedef=graf.durak_id(sonraki),
+                    kalkis=kalkis,
+                    varis=kalkis + self._gelen_aktarma_suresi(durak, sonraki)
+                ))
+                durak = sonraki
+                aktarma_olabilir = False
+            elif durak in sefer_ebeveynleri[tur]:
+                hat_no, sefer, binis, inis = sefer_ebeveynleri[tur][durak]
+                durak_baslangic = self._hat_durak_baslangic[hat_no]
+                hat_uzunlugu = self._hat_durak_baslangic[hat_no + 1] - durak_baslangic
+                zaman_baslangic = self._hat_zaman_baslangic[hat_no] + sefer * hat_uzunlugu
+                gecilen = [graf.durak_id(self._hat_duraklari[durak_baslangic + sira])
+                           for sira in range(binis, inis + 1)]
+                bacaklar.append(YolculukBacagi(
+                    tip="sefer",
+                    baslangic=gecilen[0],
+                    hedef=gecilen[-1],
+                    kalkis=self._durak_zamanlari[zaman_baslangic + binis],
+                    varis=self._durak_zamanlari[zaman_baslangic + inis],
+                    hat_id=self._hat_idleri[hat_no],
+                    sefer_id=self._sefer_idleri[hat_no][sefer],
+                    duraklar=gecilen
+                ))
+                durak = self._hat_duraklari[durak_baslangic + inis]
+                tur -= 1
+                aktarma_olabilir = True
+            else:
+                tur -= 1
+                aktarma_olabilir = True
+        
+        return Yolculuk(
+            kalkis=bacaklar[0].kalkis if bacaklar else varis,
+            varis=bacaklar[-1].varis if bacaklar else varis,
+            aktarma_sayisi=max(0, sum(1 for bacak in bacaklar if bacak.tip == "sefer") - 1),
+            bacaklar=bacaklar
+        )
+    
+    def _gelen_aktarma_suresi(self, kaynak: int, hedef: int) -> float:
+        """kaynak -> hedef aktarmasının süresi"""
+        for j in range(self._gelen_aktarma_baslangic[hedef], self._gelen_aktarma_baslangic[hedef + 1]):
+            if self._gelen_aktarma_kaynak[j] == kaynak:
+                return self._gelen_aktarma_sure[j]
+        return 0.0
+    
+    @property
+    def tarife(self) -> Tarife:
+        return self._tarife
+
+
+class _TurDurumu:
+    """RAPTOR turlarının etiket ve ebeveyn bilgileri (profil sorgularında korunur)"""
+    
+    def __init__(self, durak_sayisi: int, en_fazla_sefer: int):
+        sonsuz = float('inf')
+        tur_sayisi = en_fazla_sefer + 1
+        self.turlar = [array('d', [sonsuz]) * durak_sayisi for _ in range(tur_sayisi)]
+        self.en_iyi = array('d', [sonsuz]) * durak_sayisi
+        self.sefer_ebeveynleri: List[Dict[int, Tuple[int, int, int, int]]] = [
+            {} for _ in range(tur_sayisi)
+        ]
+        self.aktarma_ebeveynleri: List[Dict[int, int]] = [{} for _ in range(tur_sayisi)]
+    
+    def kalkis_baslat(self) -> array:
+        """
+        Yeni bir kalkış için turlar arası en iyi varışları sıfırla
+        
+        Tur etiketleri kalkışlar arasında korunur, ancak en_iyi yalnızca bu kalkışın
+        işlenmiş turlarını yansıtmalıdır.
+        """
+        self.en_iyi = array('d', [float('inf')]) * len(self.en_iyi)
+        return self.en_iyi
+    
+    def ebeveynleri_sil(self, tur: int, durak: int):
+        """Etiketi önceki turdan devralınan durağın bu turdaki eski ebeveynlerini sil"""
+        self.sefer_ebeveynleri[tur].pop(durak, None)
+        self.aktarma_ebeveynleri[tur].pop(durak, None)
+    
+    def en_iyi_tur(self, durak: int) -> int:
+        """Durağa en erken varılan (eşitlikte en az seferli) tur, ulaşılamıyorsa -1"""
+        en_iyi_tur = -1
+        for tur, etiketler in enumerate(self.turlar):
+            if etiketler[durak] < float('inf') and (
+                    en_iyi_tur < 0 or etiketler[durak] < self.turlar[en_iyi_tur][durak]):
+                en_iyi_tur = tur
+        return en_iyi_tur
@@ -1,4 +1,5 @@
-from typing import List, Dict, Optional, Tuple
+import time
+from typing import List, Dict, Optional, Tuple, Union
 from dataclasses import dataclass, field
 from durak import Durak
 from konum import Konum
@@ -7,6 +8,13 @@ from mesafe_hesaplayici import MesafeHesaplayici
 from hat import HatYoneticisi
 from aktarma_indirimi import AktarmaIndirimYoneticisi
 from taksi_zorunlulugu import TaksiZorunlulukYoneticisi
+from odeme import OdemeYontemi, NakitOdeme
+from tarife import Tarife, saat_dakikaya_cevir
+from raptor import RaptorMotoru, Yolculuk
+from maliyet_agirliklari import MaliyetAgirliklari
+from gecikme_olcumu import asama
+from arama_istatistikleri import AramaIstatistikleri
+from sorgu_kaydi import kaydedilen_sorgu
 
 
 @dataclass
@@ -14,7 +22,7 @@ class RotaAdimi:
     """Rota adımı - her bir ulaşım segmentini temsil eder"""
     baslangic: str  # Başlangıç durak ID veya "konum"
     hedef: str  # Hedef durak ID veya "konum"
-    ulasim_tipi: str  # "yurume", "taksi", "otobus", "tramvay", "aktarma"
+    ulasim_tipi: str  # "yurume", "taksi", "otobus", "tramvay", "aktarma", "bekleme"
     mesafe: float  # km
     sure: float  # dakika
     ucret: float  # TL
@@ -31,6 +39,9 @@ class Rota:
     toplam_sure: float
     toplam_ucret: float
     aktarma_sayisi: int
+    kalkis_zamani: Optional[float] = None  # Zamanlı sorgularda konumdan çıkış (dk)
+    varis_zamani: Optional[float] = None  # Zamanlı sorgularda hedef konuma varış (dk)
+    genel_maliyet: Optional[float] = None  # Genelleştirilmiş maliyetli sorgularda (dk birimi)
     
     def __str__(self) -> str:
         return f"Rota: {len(self.adimlar)} adım, {self.toplam_sure:.1f} dk, {self.toplam_ucret:.2f} TL"
@@ -40,17 +51,37 @@ class RotaHesaplayici:
     """Rota hesaplama sınıfı - en uygun rotayı bulur"""
     
     ESIK_MESAFE_KM = 3.0  # 3 km eşik değeri
+    _BUTCE_TOLERANSI = 1e-9  # Kayan nokta karşılaştırmaları için
+    
+    ARAMA_MODLARI = ("bfs", "dijkstra", "astar", "ch")
     
     def __init__(self, hat_yoneticisi: HatYoneticisi, taksi: Taksi,
                  aktarma_indirim_yoneticisi: Optional[AktarmaIndirimYoneticisi] = None,
-                 taksi_zorunluluk_yoneticisi: Optional[TaksiZorunlulukYoneticisi] = None):
+                 taksi_zorunluluk_yoneticisi: Optional[TaksiZorunlulukYoneticisi] = None,
+                 arama_modu: str = "bfs",
+                 tarife: Optional[Tarife] = None):
+        """
+        Args:
+            arama_modu: Duraklar arası arama - "bfs" (en az durak, varsayılan),
+                "dijkstra" (en kısa süre), "astar" (en kısa süre, hedefe yönelik) veya
+                "ch" (en kısa süre, kontraksiyon hiyerarşisi ile)
+            tarife: Zamanlı sorgular için sefer tarifesi (varsayılan: sabit aralıklı seferler)
+        """
+        if arama_modu not in self.ARAMA_MODLARI:
+            raise ValueError(f"Bilinmeyen arama modu: {arama_modu}")
+        self._arama_modu = arama_modu
         self._hat_yoneticisi = hat_yoneticisi
         self._taksi = taksi
         self._aktarma_indirim_yoneticisi = aktarma_indirim_yoneticisi or AktarmaIndirimYoneticisi()
         self._taksi_zorunluluk_yoneticisi = taksi_zorunluluk_yoneticisi or TaksiZorunlulukYoneticisi()
+        self._tarife = tarife
+        self._raptor_motoru: Optional[RaptorMotoru] = None
     
+    @asama("rota.en_uygun_rota_bul")
+    @kaydedilen_sorgu("rota")
     def en_uygun_rota_bul(self, baslangic_konum: Konum, hedef_konum: Konum,
-                         yolcu_tipi: Optional[str] = None) -> Optional[Rota]:
+                         yolcu_tipi: Optional[str] = None, explain: bool = False, iz: bool = False
+                         ) -> Union[Optional[Rota], Tuple[Optional[Rota], AramaIstatistikleri]]:
         """
         Başlangıç ve hedef konum arasında en uygun rotayı bul
         
@@ -58,25 +89,437 @@ class RotaHesaplayici:
             baslangic_konum: Başlangıç konumu (enlem, boylam)
             hedef_konum: Hedef konum (enlem, boylam)
             yolcu_tipi: Yolcu tipi (indirim hesaplaması için)
+            explain: Arama tanılamalarını da döndür (çıkarılan durak, gevşetilen
+                kenar, kuyruk boyu, önbellek isabeti, süre)
+            iz: explain ile birlikte genişletme sırasını da kaydet
         
         Returns:
-            En uygun rota veya None
+            En uygun rota veya None; explain ise (rota veya None, AramaIstatistikleri)
         """
+        if not explain:
+            return self._en_uygun_rota_bul(baslangic_konum, hedef_konum, yolcu_tipi)
+        istatistik = AramaIstatistikleri(izler=[] if iz else None)
+        baslangic = time.perf_counter()
+        rota = self._en_uygun_rota_bul(baslangic_konum, hedef_konum, yolcu_tipi, istatistik)
+        istatistik.toplam_ms = (time.perf_counter() - baslangic) * 1000
+        return rota, istatistik
+    
+    def _en_uygun_rota_bul(self, baslangic_konum: Konum, hedef_konum: Konum,
+                           yolcu_tipi: Optional[str] = None,
+                           istatistik: Optional[AramaIstatistikleri] = None) -> Optional[Rota]:
         # En yakın durakları bul
-        baslangic_durak_id, baslangic_mesafe = self._en_yakin_durak_bul(
+        baslangic_durak_id, baslangic_mesafe = self.en_yakin_durak_bul(
             baslangic_konum.enlem, baslangic_konum.boylam
         )
-        hedef_durak_id, hedef_mesafe = self._en_yakin_durak_bul(
+        hedef_durak_id, hedef_mesafe = self.en_yakin_durak_bul(
             hedef_konum.enlem, hedef_konum.boylam
         )
         
         if not baslangic_durak_id or not hedef_durak_id:
             return None
         
-        # Rota adımlarını oluştur
-        adimlar: List[RotaAdimi] = []
-        
         # 1. Başlangıç konumundan en yakın durağa
+        adimlar: List[RotaAdimi] = [
+            self.baslangic_adimi_olustur(baslangic_konum, baslangic_durak_id)
+        ]
+        
+        # 2. Duraklar arası toplu taşıma rotası
+        toplu_tasima_rota = self._durak_arasi_rota_bul(
+            baslangic_durak_id, hedef_durak_id, istatistik
+        )
+        if toplu_tasima_rota:
+            adimlar.extend(toplu_tasima_rota)
+        else:
+            # Direkt rota bulunamadı, taksi kullan
+            adimlar.append(self.durak_arasi_taksi_adimi(baslangic_durak_id, hedef_durak_id))
+        
+        # 3. Hedef duraktan hedef konuma
+        adimlar.append(self.bitis_adimi_olustur(hedef_konum, hedef_durak_id))
+        
+        return self._rota_olustur(adimlar, yolcu_tipi)
+    
+    @asama("rota.profil_rotalari_bul")
+    def profil_rotalari_bul(self, baslangic_konum: Konum, hedef_konum: Konum,
+                            pencere_baslangic, pencere_bitis, en_fazla_aktarma: int = 4,
+                            yolcu_tipi: Optional[str] = None) -> List[Rota]:
+        """
+        Kalkış penceresindeki tüm en iyi zamanlı rotaları tek aramada bul (rRAPTOR)
+        
+        Dönen rotaların hiçbiri bir diğerinden hem daha erken kalkıp hem de daha
+        geç varmaz; pencere içinde hangi saatte çıkılırsa çıkılsın en iyi rota
+        bu listededir.
+        
+        Args:
+            baslangic_konum: Başlangıç konumu
+            hedef_konum: Hedef konum
+            pencere_baslangic: Konumdan en erken çıkış saati ("SS:DD" veya dk)
+            pencere_bitis: Konumdan en geç çıkış saati ("SS:DD" veya dk)
+            en_fazla_aktarma: İzin verilen en fazla sefer değiştirme sayısı
+            yolcu_tipi: Yolcu tipi (indirim hesaplaması için)
+        
+        Returns:
+            Kalkış saatine göre artan zamanlı rota listesi
+        """
+        if isinstance(pencere_baslangic, str):
+            pencere_baslangic = saat_dakikaya_cevir(pencere_baslangic)
+        if isinstance(pencere_bitis, str):
+            pencere_bitis = saat_dakikaya_cevir(pencere_bitis)
+        
+        baslangic_durak_id, _ = self.en_yakin_durak_bul(
+            baslangic_konum.enlem, baslangic_konum.boylam
+        )
+        hedef_durak_id, _ = self.en_yakin_durak_bul(
+            hedef_konum.enlem, hedef_konum.boylam
+        )
+        
+        if not baslangic_durak_id or not hedef_durak_id:
+            return []
+        
+        baslangic_adimi = self.baslangic_adimi_olustur(baslangic_konum, baslangic_durak_id)
+        bitis_adimi = self.bitis_adimi_olustur(hedef_konum, hedef_durak_id)
+        graf = self._hat_yoneticisi.durak_grafi
+        yolculuklar = self.raptor_motoru.profil_sorgula(
+            graf.indeks(baslangic_durak_id), graf.indeks(hedef_durak_id),
+            pencere_baslangic + baslangic_adimi.sure, pencere_bitis + baslangic_adimi.sure,
+            en_fazla_aktarma
+        )
+        
+        rotalar = []
+        for yolculuk in yolculuklar:
+            adimlar = [baslangic_adimi] + self._yolculugu_adimlara_cevir(yolculuk) + [bitis_adimi]
+            rota = self._rota_olustur(adimlar, yolcu_tipi)
+            rota.kalkis_zamani = yolculuk.kalkis - baslangic_adimi.sure
+            rota.varis_zamani = yolculuk.varis + bitis_adimi.sure
+            rotalar.append(rota)
+        return rotalar
+    
+    @asama("rota.butceli_rota_bul")
+    def butceli_rota_bul(self, baslangic_konum: Konum, hedef_konum: Konum, butce: float,
+                         odeme_yontemi: Optional[OdemeYontemi] = None,
+                         yolcu_tipi: Optional[str] = None) -> Optional[Rota]:
+        """
+        Komisyon dahil ücreti bütçeyi aşmayan en hızlı rotayı bul
+        
+        Bütçe duraklar arası arama sırasında etiketleri budamak için kullanılır;
+        bütçeyi aşan rotalar hiç üretilmez.
+        
+        Args:
+            baslangic_konum: Başlangıç konumu
+            hedef_konum: Hedef konum
+            butce: Seçilen ödeme yöntemindeki kullanılabilir bakiye (TL)
+            odeme_yontemi: Komisyon hesabı için ödeme yöntemi (varsayılan: nakit)
+            yolcu_tipi: Yolcu tipi (indirim hesaplaması için)
+        
+        Returns:
+            Bütçeye uyan en hızlı rota veya None
+        """
+        odeme_yontemi = odeme_yontemi or NakitOdeme()
+        
+        baslangic_durak_id, _ = self.en_yakin_durak_bul(
+            baslangic_konum.enlem, baslangic_konum.boylam
+        )
+        hedef_durak_id, _ = self.en_yakin_durak_bul(
+            hedef_konum.enlem, hedef_konum.boylam
+        )
+        
+        if not baslangic_durak_id or not hedef_durak_id:
+            return None
+        
+        baslangic_adimi = self.baslangic_adimi_olustur(baslangic_konum, baslangic_durak_id)
+        bitis_adimi = self.bitis_adimi_olustur(hedef_konum, hedef_durak_id)
+        
+        # Bakiyeyi indirimsiz, komisyonsuz ücret bütçesine çevir
+        indirim_carpani = 1 - self.indirim_orani_al(yolcu_tipi) if yolcu_tipi else 1.0
+        birim_tutar = odeme_yontemi.komisyonlu_tutar_hesapla(1.0) * indirim_carpani
+        ham_butce = butce / birim_tutar if birim_tutar > 0 else float('inf')
+        
+        # Duraklar arası kısım için kalan bütçe
+        kalan_butce = ham_butce - baslangic_adimi.ucret - bitis_adimi.ucret
+        if kalan_butce < -self._BUTCE_TOLERANSI:
+            return None
+        
+        graf = self._hat_yoneticisi.durak_grafi
+        kenarlar = graf.butceli_yol_bul(
+            graf.indeks(baslangic_durak_id), graf.indeks(hedef_durak_id),
+            kalan_butce + self._BUTCE_TOLERANSI,
+            graf.kenar_ucretleri(self._aktarma_indirim_yoneticisi)
+        )
+        
+        if kenarlar is not None:
+            ara_adimlar = self._yolu_adimlara_cevir(graf.yol_demetleri(kenarlar))
+        else:
+            # Toplu taşıma bütçeye sığmıyor, duraklar arası taksi dene
+            ara_adimlar = [self.durak_arasi_taksi_adimi(baslangic_durak_id, hedef_durak_id)]
+        
+        rota = self._rota_olustur([baslangic_adimi] + ara_adimlar + [bitis_adimi], yolcu_tipi)
+        
+        if odeme_yontemi.komisyonlu_tutar_hesapla(rota.toplam_ucret) > butce + self._BUTCE_TOLERANSI:
+            return None
+        return rota
+    
+    @asama("rota.genel_maliyetli_rota_bul")
+    def genel_maliyetli_rota_bul(self, baslangic_konum: Konum, hedef_konum: Konum,
+                                 agirliklar: Optional[MaliyetAgirliklari] = None,
+                                 yolcu_tipi: Optional[str] = None) -> Optional[Rota]:
+        """
+        α·süre + β·ücret + γ·aktarma + δ·yürüme toplamını en aza indiren rotayı bul
+        
+        Maliyet arama içinde kullanılır: tüm duraklar erişim adımı maliyetiyle
+        kaynak, hedefe bitiş adımı maliyetiyle bitiş olur ve tek bir arama erişim
+        durağını, duraklar arası yolu ve bitiş durağını birlikte seçer. Doğrudan
+        taksi de aday olarak karşılaştırılır; ondan pahalı erişim/bitiş adımları
+        aramaya alınmaz.
+        
+        Args:
+            baslangic_konum: Başlangıç konumu
+            hedef_konum: Hedef konum
+            agirliklar: Maliyet ağırlıkları (varsayılan: MaliyetAgirliklari());
+                yolcuya göre ağırlıklar için Yolcu.maliyet_agirliklari() verilebilir
+            yolcu_tipi: Yolcu tipi (indirim hesaplaması için; ücret maliyeti
+                indirimli ücretle hesaplanır)
+        """
+        agirliklar = agirliklar or MaliyetAgirliklari()
+        ucret_carpani = 1 - self.indirim_orani_al(yolcu_tipi) if yolcu_tipi else 1.0
+        
+        # Doğrudan taksi adayı
+        mesafe = MesafeHesaplayici.haversine_mesafe(
+            baslangic_konum.enlem, baslangic_konum.boylam,
+            hedef_konum.enlem, hedef_konum.boylam
+        )
+        taksi_adimi = RotaAdimi(
+            baslangic="konum", hedef="konum", ulasim_tipi="taksi", mesafe=mesafe,
+            sure=mesafe * 2, ucret=self._taksi.ucret_hesapla(mesafe),
+            aciklama="Taksi ile direkt gidiş"
+        )
+        taksi_maliyeti = agirliklar.adim_maliyeti(taksi_adimi, ucret_carpani)
+        
+        graf = self._hat_yoneticisi.durak_grafi
+        erisimler: Dict[int, RotaAdimi] = {}
+        bitisler: Dict[int, RotaAdimi] = {}
+        baslangic_maliyetleri: Dict[int, float] = {}
+        bitis_maliyetleri: Dict[int, float] = {}
+        for durak_id in self._hat_yoneticisi.tum_duraklar():
+            indeks = graf.indeks(durak_id)
+            adim = self.baslangic_adimi_olustur(baslangic_konum, durak_id)
+            maliyet = agirliklar.adim_maliyeti(adim, ucret_carpani)
+            if maliyet < taksi_maliyeti:
+                erisimler[indeks] = adim
+                baslangic_maliyetleri[indeks] = maliyet
+            adim = self.bitis_adimi_olustur(hedef_konum, durak_id)
+            maliyet = agirliklar.adim_maliyeti(adim, ucret_carpani)
+            if maliyet < taksi_maliyeti:
+                bitisler[indeks] = adim
+                bitis_maliyetleri[indeks] = maliyet
+        
+        kenar_maliyetleri = graf.genel_maliyetler(
+            agirliklar.sure, agirliklar.ucret * ucret_carpani, agirliklar.aktarma,
+            graf.kenar_ucretleri(self._aktarma_indirim_yoneticisi)
+        )
+        sonuc = graf.cok_kaynakli_yol_bul(baslangic_maliyetleri, bitis_maliyetleri,
+                                          kenar_maliyetleri)
+        
+        if sonuc is None or sonuc[3] >= taksi_maliyeti:
+            rota = self._rota_olustur([taksi_adimi], yolcu_tipi)
+        else:
+            kaynak, hedef, kenarlar, _ = sonuc
+            adimlar = ([erisimler[kaynak]]
+                       + self._yolu_adimlara_cevir(graf.yol_demetleri(kenarlar))
+                       + [bitisler[hedef]])
+            rota = self._rota_olustur(adimlar, yolcu_tipi)
+        rota.genel_maliyet = agirliklar.rota_maliyeti(rota)
+        return rota
+    
+    @asama("rota.alternatif_rotalar_bul")
+    def alternatif_rotalar_bul(self, baslangic_konum: Konum, hedef_konum: Konum,
+                               k: int = 5, ortusme_esigi: float = 0.7,
+                               yolcu_tipi: Optional[str] = None) -> List[Rota]:
+        """
+        Duraklar arası kısmı birbirinden farklı en fazla k rota bul
+        
+        Args:
+            baslangic_konum: Başlangıç konumu
+            hedef_konum: Hedef konum
+            k: İstenen en fazla rota sayısı
+            ortusme_esigi: İki rotanın süre bazında en fazla ortak oranı (0.0 - 1.0)
+            yolcu_tipi: Yolcu tipi (indirim hesaplaması için)
+        
+        Returns:
+            Süreye göre artan rota listesi (toplu taşıma yolu yoksa boş)
+        """
+        baslangic_durak_id, _ = self.en_yakin_durak_bul(
+            baslangic_konum.enlem, baslangic_konum.boylam
+        )
+        hedef_durak_id, _ = self.en_yakin_durak_bul(
+            hedef_konum.enlem, hedef_konum.boylam
+        )
+        
+        if not baslangic_durak_id or not hedef_durak_id:
+            return []
+        
+        graf = self._hat_yoneticisi.durak_grafi
+        yollar = graf.alternatif_yollar(
+            graf.indeks(baslangic_durak_id), graf.indeks(hedef_durak_id),
+            k, ortusme_esigi
+        )
+        
+        baslangic_adimi = self.baslangic_adimi_olustur(baslangic_konum, baslangic_durak_id)
+        bitis_adimi = self.bitis_adimi_olustur(hedef_konum, hedef_durak_id)
+        
+        rotalar = []
+        for kenarlar in yollar:
+            ara_adimlar = self._yolu_adimlara_cevir(graf.yol_demetleri(kenarlar))
+            rotalar.append(self._rota_olustur([baslangic_adimi] + ara_adimlar + [bitis_adimi],
+                                              yolcu_tipi))
+        
+        rotalar.sort(key=lambda rota: rota.toplam_sure)
+        return rotalar
+    
+    @asama("rota.zamanli_rota_bul")
+    def zamanli_rota_bul(self, baslangic_konum: Konum, hedef_konum: Konum, kalkis_zamani,
+                         en_fazla_aktarma: int = 4,
+                         yolcu_tipi: Optional[str] = None) -> Optional[Rota]:
+        """
+        Verilen saatte yola çıkıldığında hedefe en erken varan rotayı bul
+        
+        Duraklar arası kısım tarifedeki seferlerle (RAPTOR) aranır; durakta
+        beklenen süreler "bekleme" adımları olarak rotaya eklenir.
+        
+        Args:
+            baslangic_konum: Başlangıç konumu
+            hedef_konum: Hedef konum
+            kalkis_zamani: Konumdan çıkış saati ("SS:DD" veya gece yarısından itibaren dk)
+            en_fazla_aktarma: İzin verilen en fazla sefer değiştirme sayısı
+            yolcu_tipi: Yolcu tipi (indirim hesaplaması için)
+        
+        Returns:
+            Zamanlı rota veya tarifedeki seferlerle ulaşılamıyorsa None
+        """
+        if isinstance(kalkis_zamani, str):
+            kalkis_zamani = saat_dakikaya_cevir(kalkis_zamani)
+        
+        baslangic_durak_id, _ = self.en_yakin_durak_bul(
+            baslangic_konum.enlem, baslangic_konum.boylam
+        )
+        hedef_durak_id, _ = self.en_yakin_durak_bul(
+            hedef_konum.enlem, hedef_konum.boylam
+        )
+        
+        if not baslangic_durak_id or not hedef_durak_id:
+            return None
+        
+        baslangic_adimi = self.baslangic_adimi_olustur(baslangic_konum, baslangic_durak_id)
+        graf = self._hat_yoneticisi.durak_grafi
+        yolculuk = self.raptor_motoru.sorgula(
+            graf.indeks(baslangic_durak_id), graf.indeks(hedef_durak_id),
+            kalkis_zamani + baslangic_adimi.sure, en_fazla_aktarma
+        )
+        if yolculuk is None:
+            return None
+        
+        bitis_adimi = self.bitis_adimi_olustur(hedef_konum, hedef_durak_id)
+        adimlar = [baslangic_adimi] + self._yolculugu_adimlara_cevir(yolculuk) + [bitis_adimi]
+        rota = self._rota_olustur(adimlar, yolcu_tipi)
+        rota.kalkis_zamani = kalkis_zamani
+        rota.varis_zamani = yolculuk.varis + bitis_adimi.sure
+        return rota
+    
+    @asama("rota.varisa_gore_rota_bul")
+    def varisa_gore_rota_bul(self, baslangic_konum: Konum, hedef_konum: Konum, varis_zamani,
+                             en_fazla_aktarma: int = 4,
+                             yolcu_tipi: Optional[str] = None) -> Optional[Rota]:
+        """
+        Hedef konuma en geç verilen saatte varan ve en geç yola çıkılan rotayı bul
+        
+        Duraklar arası kısım hedef duraktan geriye doğru, ters bağlantılar
+        üzerinde aranır (RAPTOR). Rotanın kalkis_zamani en geç çıkış saatidir.
+        
+        Args:
+            baslangic_konum: Başlangıç konumu
+            hedef_konum: Hedef konum
+            varis_zamani: Hedef konuma en geç varış saati ("SS:DD" veya gece yarısından itibaren dk)
+            en_fazla_aktarma: İzin verilen en fazla sefer değiştirme sayısı
+            yolcu_tipi: Yolcu tipi (indirim hesaplaması için)
+        
+        Returns:
+            Zamanlı rota veya zamanında varan sefer yoksa None
+        """
+        if isinstance(varis_zamani, str):
+            varis_zamani = saat_dakikaya_cevir(varis_zamani)
+        
+        baslangic_durak_id, _ = self.en_yakin_durak_bul(
+            baslangic_konum.enlem, baslangic_konum.boylam
+        )
+        hedef_durak_id, _ = self.en_yakin_durak_bul(
+            hedef_konum.enlem, hedef_konum.boylam
+        )
+        
+        if not baslangic_durak_id or not hedef_durak_id:
+            return None
+        
+        baslangic_adimi = self.baslangic_adimi_olustur(baslangic_konum, baslangic_durak_id)
+        bitis_adimi = self.bitis_adimi_olustur(hedef_konum, hedef_durak_id)
+        graf = self._hat_yoneticisi.durak_grafi
+        yolculuk = self.raptor_motoru.varis_sorgula(
+            graf.indeks(baslangic_durak_id), graf.indeks(hedef_durak_id),
+            varis_zamani - bitis_adimi.sure, en_fazla_aktarma
+        )
+        if yolculuk is None:
+            return None
+        
+        adimlar = [baslangic_adimi] + self._yolculugu_adimlara_cevir(yolculuk) + [bitis_adimi]
+        rota = self._rota_olustur(adimlar, yolcu_tipi)
+        rota.kalkis_zamani = yolculuk.kalkis - baslangic_adimi.sure
+        rota.varis_zamani = yolculuk.varis + bitis_adimi.sure
+        return rota
+    
+    @property
+    def raptor_motoru(self) -> RaptorMotoru:
+        """Zamanlı sorguların kullandığı RAPTOR motoru (ilk erişimde oluşturulur)"""
+        if self._raptor_motoru is None:
+            if self._tarife is None:
+                self._tarife = Tarife.varsayilan(self._hat_yoneticisi)
+            self._raptor_motoru = RaptorMotoru(self._tarife)
+        return self._raptor_motoru
+    
+    @asama("rota.adimlara_cevirme")
+    def _yolculugu_adimlara_cevir(self, yolculuk: Yolculuk) -> List[RotaAdimi]:
+        """Zamanlı yolculuğu bekleme adımları dahil RotaAdimi listesine çevir"""
+        adimlar = []
+        zaman = yolculuk.kalkis
+        for bacak in yolculuk.bacaklar:
+            bekleme = bacak.kalkis - zaman
+            if bekleme > self._BUTCE_TOLERANSI:
+                adimlar.append(RotaAdimi(
+                    baslangic=bacak.baslangic,
+                    hedef=bacak.baslangic,
+                    ulasim_tipi="bekleme",
+                    mesafe=0,
+                    sure=bekleme,
+                    ucret=0.0,
+                    aciklama=f"Bekleme: {bacak.baslangic} ({bacak.sefer_id or 'aktarma'})"
+                ))
+            
+            if bacak.tip == "sefer":
+                yol = []
+                for durak_id, sonraki_id in zip(bacak.duraklar, bacak.duraklar[1:]):
+                    durak = self._hat_yoneticisi.durak_getir(durak_id)
+                    bilgi = next(sonraki for sonraki in durak.sonraki_duraklar
+                                 if sonraki["stopId"] == sonraki_id)
+                    yol.append((durak_id, sonraki_id, bilgi))
+            else:
+                durak = self._hat_yoneticisi.durak_getir(bacak.baslangic)
+                aktarma_bilgisi = {
+                    "transferSure": durak.aktarma["transferSure"],
+                    "transferUcret": durak.aktarma["transferUcret"]
+                }
+                yol = [(bacak.baslangic, bacak.hedef, aktarma_bilgisi, True)]
+            adimlar.extend(self._yolu_adimlara_cevir(yol))
+            zaman = bacak.varis
+        return adimlar
+    
+    @asama("rota.erisim_adimi")
+    def baslangic_adimi_olustur(self, baslangic_konum: Konum, baslangic_durak_id: str) -> RotaAdimi:
+        """Başlangıç konumundan en yakın durağa ulaşım adımı"""
         baslangic_durak = self._hat_yoneticisi.durak_getir(baslangic_durak_id)
         taksi_gerekli, mesafe, kontrol_aciklama = self._taksi_zorunluluk_yoneticisi.taksi_gerekli_mi(
             baslangic_konum, baslangic_durak
@@ -87,7 +530,7 @@ class RotaHesaplayici:
             taksi_ucret = self._taksi.ucret_hesapla(mesafe)
             taksi_sure = mesafe * 2  # Yaklaşık 2 dk/km
             aciklama = f"Taksi ile {baslangic_durak_id} durağına (Zorunlu - {kontrol_aciklama})"
-            adimlar.append(RotaAdimi(
+            return RotaAdimi(
                 baslangic="konum",
                 hedef=baslangic_durak_id,
                 ulasim_tipi="taksi",
@@ -95,47 +538,23 @@ class RotaHesaplayici:
                 sure=taksi_sure,
                 ucret=taksi_ucret,
                 aciklama=aciklama
-            ))
-        else:
-            # Yürüyerek
-            yurume_sure = mesafe * 12  # Yaklaşık 12 dk/km (yürüyüş)
-            adimlar.append(RotaAdimi(
-                baslangic="konum",
-                hedef=baslangic_durak_id,
-                ulasim_tipi="yurume",
-                mesafe=mesafe,
-                sure=yurume_sure,
-                ucret=0.0,
-                aciklama=f"Yürüyerek {baslangic_durak_id} durağına ({mesafe:.2f} km)"
-            ))
-        
-        # 2. Duraklar arası toplu taşıma rotası
-        toplu_tasima_rota = self._durak_arasi_rota_bul(
-            baslangic_durak_id, hedef_durak_id
-        )
-        if toplu_tasima_rota:
-            adimlar.extend(toplu_tasima_rota)
-        else:
-            # Direkt rota bulunamadı, taksi kullan
-            durak_arasi_mesafe = MesafeHesaplayici.haversine_mesafe(
-                self._hat_yoneticisi.durak_getir(baslangic_durak_id).enlem,
-                self._hat_yoneticisi.durak_getir(baslangic_durak_id).boylam,
-                self._hat_yoneticisi.durak_getir(hedef_durak_id).enlem,
-                self._hat_yoneticisi.durak_getir(hedef_durak_id).boylam
             )
-            taksi_ucret = self._taksi.ucret_hesapla(durak_arasi_mesafe)
-            taksi_sure = durak_arasi_mesafe * 2
-            adimlar.append(RotaAdimi(
-                baslangic=baslangic_durak_id,
-                hedef=hedef_durak_id,
-                ulasim_tipi="taksi",
-                mesafe=durak_arasi_mesafe,
-                sure=taksi_sure,
-                ucret=taksi_ucret,
-                aciklama=f"Taksi ile {baslangic_durak_id} -> {hedef_durak_id}"
-            ))
         
-        # 3. Hedef duraktan hedef konuma
+        # Yürüyerek
+        yurume_sure = mesafe * 12  # Yaklaşık 12 dk/km (yürüyüş)
+        return RotaAdimi(
+            baslangic="konum",
+            hedef=baslangic_durak_id,
+            ulasim_tipi="yurume",
+            mesafe=mesafe,
+            sure=yurume_sure,
+            ucret=0.0,
+            aciklama=f"Yürüyerek {baslangic_durak_id} durağına ({mesafe:.2f} km)"
+        )
+    
+    @asama("rota.erisim_adimi")
+    def bitis_adimi_olustur(self, hedef_konum: Konum, hedef_durak_id: str) -> RotaAdimi:
+        """Hedef duraktan hedef konuma ulaşım adımı"""
         hedef_durak = self._hat_yoneticisi.durak_getir(hedef_durak_id)
         taksi_gerekli, mesafe, kontrol_aciklama = self._taksi_zorunluluk_yoneticisi.taksi_gerekli_mi(
             hedef_konum, hedef_durak
@@ -146,7 +565,7 @@ class RotaHesaplayici:
             taksi_ucret = self._taksi.ucret_hesapla(mesafe)
             taksi_sure = mesafe * 2
             aciklama = f"Taksi ile hedef konuma (Zorunlu - {kontrol_aciklama})"
-            adimlar.append(RotaAdimi(
+            return RotaAdimi(
                 baslangic=hedef_durak_id,
                 hedef="konum",
                 ulasim_tipi="taksi",
@@ -154,21 +573,44 @@ class RotaHesaplayici:
                 sure=taksi_sure,
                 ucret=taksi_ucret,
                 aciklama=aciklama
-            ))
-        else:
-            # Yürüyerek
-            yurume_sure = mesafe * 12
-            adimlar.append(RotaAdimi(
-                baslangic=hedef_durak_id,
-                hedef="konum",
-                ulasim_tipi="yurume",
-                mesafe=mesafe,
-                sure=yurume_sure,
-                ucret=0.0,
-                aciklama=f"Yürüyerek hedef konuma ({mesafe:.2f} km)"
-            ))
+            )
         
-        # Toplam değerleri hesapla
+        # Yürüyerek
+        yurume_sure = mesafe * 12
+        return RotaAdimi(
+            baslangic=hedef_durak_id,
+            hedef="konum",
+            ulasim_tipi="yurume",
+            mesafe=mesafe,
+            sure=yurume_sure,
+            ucret=0.0,
+            aciklama=f"Yürüyerek hedef konuma ({mesafe:.2f} km)"
+        )
+    
+    @asama("rota.durak_arasi_taksi")
+    def durak_arasi_taksi_adimi(self, baslangic_durak_id: str, hedef_durak_id: str) -> RotaAdimi:
+        """Toplu taşıma rotası yoksa iki durak arası taksi adımı"""
+        baslangic_durak = self._hat_yoneticisi.durak_getir(baslangic_durak_id)
+        hedef_durak = self._hat_yoneticisi.durak_getir(hedef_durak_id)
+        durak_arasi_mesafe = MesafeHesaplayici.haversine_mesafe(
+            baslangic_durak.enlem, baslangic_durak.boylam,
+            hedef_durak.enlem, hedef_durak.boylam
+        )
+        taksi_ucret = self._taksi.ucret_hesapla(durak_arasi_mesafe)
+        taksi_sure = durak_arasi_mesafe * 2
+        return RotaAdimi(
+            baslangic=baslangic_durak_id,
+            hedef=hedef_durak_id,
+            ulasim_tipi="taksi",
+            mesafe=durak_arasi_mesafe,
+            sure=taksi_sure,
+            ucret=taksi_ucret,
+            aciklama=f"Taksi ile {baslangic_durak_id} -> {hedef_durak_id}"
+        )
+    
+    @asama("rota.ucret_indirim")
+    def _rota_olustur(self, adimlar: List[RotaAdimi], yolcu_tipi: Optional[str] = None) -> Rota:
+        """Adımlardan toplam değerleri hesaplayarak Rota oluştur"""
         toplam_mesafe = sum(adim.mesafe for adim in adimlar)
         toplam_sure = sum(adim.sure for adim in adimlar)
         toplam_ucret = sum(adim.ucret for adim in adimlar)
@@ -176,7 +618,7 @@ class RotaHesaplayici:
         
         # Yolcu indirimi uygula (eğer belirtilmişse)
         if yolcu_tipi:
-            indirim_orani = self._indirim_orani_al(yolcu_tipi)
+            indirim_orani = self.indirim_orani_al(yolcu_tipi)
             toplam_ucret = toplam_ucret * (1 - indirim_orani)
         
         return Rota(
@@ -187,7 +629,8 @@ class RotaHesaplayici:
             aktarma_sayisi=aktarma_sayisi
         )
     
-    def _en_yakin_durak_bul(self, enlem: float, boylam: float) -> Tuple[Optional[str], float]:
+    @asama("rota.en_yakin_durak")
+    def en_yakin_durak_bul(self, enlem: float, boylam: float) -> Tuple[Optional[str], float]:
         """En yakın durağı bul"""
         en_yakin_id = None
         en_kisa_mesafe = float('inf')
@@ -204,54 +647,63 @@ class RotaHesaplayici:
         
         return en_yakin_id, en_kisa_mesafe
     
-    def _durak_arasi_rota_bul(self, baslangic_durak_id: str, 
-                              hedef_durak_id: str) -> Optional[List[RotaAdimi]]:
+    @asama("rota.durak_arasi_arama")
+    def _durak_arasi_rota_bul(self, baslangic_durak_id: str, hedef_durak_id: str,
+                              istatistik: Optional[AramaIstatistikleri] = None
+                              ) -> Optional[List[RotaAdimi]]:
         """
-        İki durak arasındaki en kısa rotayı bul (Dijkstra benzeri algoritma)
+        İki durak arasındaki en kısa rotayı bul (arama moduna göre)
         """
-        # Basit BFS/DFS yaklaşımı
-        from collections import deque
+        graf = self._hat_yoneticisi.durak_grafi
+        kaynak = graf.indeks(baslangic_durak_id)
+        hedef = graf.indeks(hedef_durak_id)
+        if not graf.ulasilabilir_mi(kaynak, hedef):
+            if istatistik is not None:
+                istatistik.bilesen_elemesi += 1
+            return None
         
-        ziyaret_edildi = set()
-        kuyruk = deque([(baslangic_durak_id, [])])
+        # Önbellekte (veya kabul edilirse) kök durağın ağacı varsa yol doğrudan okunur
+        olcut = "durak" if self._arama_modu == "bfs" else "sure"
+        agac = graf.agac_onbellegi.agac_getir(kaynak, olcut, istatistik=istatistik)
+        if agac is not None:
+            kenarlar = agac.yol(hedef)
+        elif self._arama_modu == "bfs":
+            kenarlar = graf.en_az_durakli_yol(kaynak, hedef, istatistik=istatistik)
+        else:
+            kenarlar, _ = graf.yol_bul(kaynak, hedef, self._arama_modu, istatistik=istatistik)
         
-        while kuyruk:
-            mevcut_durak_id, yol = kuyruk.popleft()
-            
-            if mevcut_durak_id == hedef_durak_id:
-                # Rota bulundu, adımları oluştur
-                return self._yolu_adimlara_cevir(yol)
-            
-            if mevcut_durak_id in ziyaret_edildi:
-                continue
-            
-            ziyaret_edildi.add(mevcut_durak_id)
-            mevcut_durak = self._hat_yoneticisi.durak_getir(mevcut_durak_id)
-            
-            if not mevcut_durak:
-                continue
-            
-            # Sonraki duraklara git
-            for sonraki in mevcut_durak.sonraki_duraklar:
-                sonraki_id = sonraki["stopId"]
-                if sonraki_id not in ziyaret_edildi:
-                    yeni_yol = yol + [(mevcut_durak_id, sonraki_id, sonraki)]
-                    kuyruk.append((sonraki_id, yeni_yol))
-            
-            # Aktarma yap
-            if mevcut_durak.aktarma:
-                aktarma_id = mevcut_durak.aktarma["transferStopId"]
-                if aktarma_id not in ziyaret_edildi:
-                    # Aktarma bilgisini tuple olarak ekle
-                    aktarma_bilgisi = {
-                        "transferSure": mevcut_durak.aktarma["transferSure"],
-                        "transferUcret": mevcut_durak.aktarma["transferUcret"]
-                    }
-                    yeni_yol = yol + [(mevcut_durak_id, aktarma_id, aktarma_bilgisi, True)]
-                    kuyruk.append((aktarma_id, yeni_yol))
-        
-        return None
+        if kenarlar is None:
+            return None
+        return self._yolu_adimlara_cevir(graf.yol_demetleri(kenarlar))
+    
+    def agac_onbellegini_isit(self, durak_idleri: Optional[List[str]] = None):
+        """
+        Verilen duraklardan başlayan arama ağaçlarını önceden hesapla
+        
+        Args:
+            durak_idleri: Popüler başlangıç durakları (varsayılan: aktarma noktaları)
+        """
+        graf = self._hat_yoneticisi.durak_grafi
+        if durak_idleri is None:
+            durak_idleri = [durak_id for durak_id, durak in self._hat_yoneticisi.tum_duraklar().items()
+                            if durak.aktarma]
+        olcut = "durak" if self._arama_modu == "bfs" else "sure"
+        graf.agac_onbellegi.isit((graf.indeks(durak_id) for durak_id in durak_idleri
+                                  if graf.indeks(durak_id) is not None), olcut)
+    
+    @property
+    def arama_modu(self) -> str:
+        return self._arama_modu
+    
+    @property
+    def hat_yoneticisi(self) -> HatYoneticisi:
+        return self._hat_yoneticisi
+    
+    @property
+    def aktarma_indirim_yoneticisi(self) -> AktarmaIndirimYoneticisi:
+        return self._aktarma_indirim_yoneticisi
     
+    @asama("rota.adimlara_cevirme")
     def _yolu_adimlara_cevir(self, yol: List[Tuple]) -> List[RotaAdimi]:
         """Yol listesini RotaAdimi listesine çevir"""
         adimlar = []
@@ -309,7 +761,7 @@ class RotaHesaplayici:
         
         return adimlar
     
-    def _indirim_orani_al(self, yolcu_tipi: str) -> float:
+    def indirim_orani_al(self, yolcu_tipi: str) -> float:
         """Yolcu tipine göre indirim oranı"""
         indirimler = {
             "ogrenci": 0.3,
@@ -0,0 +1,215 @@
+import os
+import time
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, TypeVar
+from veri_yukleyici import VeriYukleyici
+from hat import HatYoneticisi
+from taksi import Taksi
+from rota import RotaHesaplayici
+from rota_secenekleri import RotaSecenekleriUretici
+from en_uygun_rota_secici import EnUygunRotaSecici
+from ucret_motoru import UcretMotoru
+import sorgu_kaydi
+
+if TYPE_CHECKING:
+    # Toplu analiz modülleri (od_matrisi multiprocessing'i yükler) ilk kullanımda içe aktarılır
+    from izokron import IzokronHesaplayici
+    from od_matrisi import OdMatrisiHesaplayici
+
+
+T = TypeVar("T")
+
+
+def veri_dosyasi_bul(klasor: str = ".") -> Optional[str]:
+    """Klasördeki veri seti dosyasını bul (dosya adındaki Türkçe karakterler için adla eşleştirir)"""
+    for dosya_adi in sorted(os.listdir(klasor)):
+        if dosya_adi.endswith('.txt') and ('VER' in dosya_adi.upper() or 'SET' in dosya_adi.upper()
+                                           or 'PROLAB' in dosya_adi.upper()):
+            return os.path.join(klasor, dosya_adi)
+    return None
+
+
+class RotaMotoru:
+    """
+    Arayüzden bağımsız rota motoru - veri setinden tüm hesaplama hattını kurar
+    
+    Yalnızca sorgu için gerekenler (duraklar, hatlar, rota hesaplayıcı) hemen
+    oluşturulur; durak grafı, isim dizini, arama ağacı önbelleği, seçenek üretici,
+    izokron ve OD matrisi hesaplayıcıları ilk erişimde kurulur. Her aşamanın
+    süresi kaydedilir ve baslangic_raporu() ile okunabilir. tkinter içe
+    aktarılmaz; sunucu, komut satırı ve testler arayüz olmadan başlatılabilir.
+    """
+    
+    def __init__(self, dosya_yolu: Optional[str] = None, arama_modu: str = "bfs",
+                 onbellegi_isit: bool = False, sorgu_kaydi_dosyasi: Optional[str] = None):
+        """
+        Args:
+            dosya_yolu: JSON veri seti (varsayılan: çalışma klasöründe aranır)
+            arama_modu: RotaHesaplayici arama modu
+            onbellegi_isit: Aktarma duraklarının arama ağaçlarını başlangıçta hesapla
+            sorgu_kaydi_dosyasi: Verilirse gelen sorgular bu JSONL dosyasına eklenir
+                (benchmarks/sorgu_tekrari.py ile yeniden oynatılabilir)
+        
+        Raises:
+            FileNotFoundError: Veri dosyası bulunamazsa
+            ValueError: Veri dosyası okunamazsa
+        """
+        self._asama_sureleri: Dict[str, float] = {}
+        baslangic = time.perf_counter()
+        
+        if dosya_yolu is None:
+            dosya_yolu = veri_dosyasi_bul()
+            if dosya_yolu is None:
+                raise FileNotFoundError("Veri dosyası bulunamadı!")
+        self._dosya_yolu = dosya_yolu
+        
+        self._veri_yukleyici = VeriYukleyici(dosya_yolu)
+        if not self._olc("veri_yukle", self._veri_yukleyici.veri_yukle):
+            raise ValueError(f"Veri dosyası yüklenemedi: {dosya_yolu}")
+        self._olc("duraklari_olustur", self._veri_yukleyici.duraklari_olustur)
+        self._hat_yoneticisi = self._olc("hat_yoneticisi",
+                                         lambda: HatYoneticisi(self._veri_yukleyici.duraklar))
+        
+        taksi_bilgi = self._veri_yukleyici.taksi_bilgisi
+        self._taksi = Taksi(
+            acilis_ucreti=taksi_bilgi.get("openingFee", 10),
+            km_basina_ucret=taksi_bilgi.get("costPerKm", 4)
+        )
+        self._rota_hesaplayici = RotaHesaplayici(self._hat_yoneticisi, self._taksi,
+                                                 arama_modu=arama_modu)
+        
+        # İlk erişimde kurulan alt sistemler
+        self._rota_secenekleri_uretici: Optional[RotaSecenekleriUretici] = None
+        self._en_uygun_rota_secici: Optional[EnUygunRotaSecici] = None
+        self._ucret_motoru: Optional[UcretMotoru] = None
+        self._izokron_hesaplayici: Optional["IzokronHesaplayici"] = None
+        self._od_matrisi_hesaplayici: Optional["OdMatrisiHesaplayici"] = None
+        
+        if onbellegi_isit:
+            self.onbellegi_isit()
+        if sorgu_kaydi_dosyasi:
+            sorgu_kaydi.kaydi_baslat(sorgu_kaydi_dosyasi)
+        self._baslangic_suresi = time.perf_counter() - baslangic
+    
+    def _olc(self, asama: str, fonksiyon: Callable[[], T]) -> T:
+        """Fonksiyonu çalıştır ve süresini aşama adıyla kaydet"""
+        baslangic = time.perf_counter()
+        sonuc = fonksiyon()
+        self._asama_sureleri[asama] = time.perf_counter() - baslangic
+        return sonuc
+    
+    # Hemen kurulan bileşenler
+    
+    @property
+    def dosya_yolu(self) -> str:
+        return self._dosya_yolu
+    
+    @property
+    def veri_yukleyici(self) -> VeriYukleyici:
+        return self._veri_yukleyici
+    
+    @property
+    def hat_yoneticisi(self) -> HatYoneticisi:
+        return self._hat_yoneticisi
+    
+    @property
+    def taksi(self) -> Taksi:
+        return self._taksi
+    
+    @property
+    def rota_hesaplayici(self) -> RotaHesaplayici:
+        return self._rota_hesaplayici
+    
+    # İlk erişimde kurulan alt sistemler
+    
+    @property
+    def rota_secenekleri_uretici(self) -> RotaSecenekleriUretici:
+        if self._rota_secenekleri_uretici is None:
+            self._rota_secenekleri_uretici = self._olc(
+                "rota_secenekleri_uretici", lambda: RotaSecenekleriUretici(self._hat_yoneticisi, self._taksi)
+            )
+        return self._rota_secenekleri_uretici
+    
+    @property
+    def en_uygun_rota_secici(self) -> EnUygunRotaSecici:
+        if self._en_uygun_rota_secici is None:
+            self._en_uygun_rota_secici = EnUygunRotaSecici(self.rota_secenekleri_uretici,
+                                                           rota_hesaplayici=self._rota_hesaplayici)
+        return self._en_uygun_rota_secici
+    
+    @property
+    def ucret_motoru(self) -> UcretMotoru:
+        if self._ucret_motoru is None:
+            self._ucret_motoru = UcretMotoru()
+        return self._ucret_motoru
+    
+    @property
+    def izokron_hesaplayici(self) -> "IzokronHesaplayici":
+        if self._izokron_hesaplayici is None:
+            from izokron import IzokronHesaplayici
+            self._izokron_hesaplayici = IzokronHesaplayici(self._rota_hesaplayici)
+        return self._izokron_hesaplayici
+    
+    @property
+    def od_matrisi_hesaplayici(self) -> "OdMatrisiHesaplayici":
+        if self._od_matrisi_hesaplayici is None:
+            from od_matrisi import OdMatrisiHesaplayici
+            self._od_matrisi_hesaplayici = OdMatrisiHesaplayici(self._rota_hesaplayici)
+        return self._od_matrisi_hesaplayici
+    
+    @property
+    def durak_grafi(self):
+        """Derlenmiş durak grafı (HatYoneticisi'nde ilk erişimde oluşturulur, süresi kaydedilir)"""
+        if "durak_grafi" not in self._asama_sureleri:
+            return self._olc("durak_grafi", lambda: self._hat_yoneticisi.durak_grafi)
+        return self._hat_yoneticisi.durak_grafi
+    
+    @property
+    def durak_adi_dizini(self):
+        """Durak isim dizini (HatYoneticisi'nde ilk erişimde oluşturulur, süresi kaydedilir)"""
+        if "durak_adi_dizini" not in self._asama_sureleri:
+            return self._olc("durak_adi_dizini", lambda: self._hat_yoneticisi.durak_adi_dizini)
+        return self._hat_yoneticisi.durak_adi_dizini
+    
+    def onbellegi_isit(self, durak_idleri: Optional[List[str]] = None):
+        """Arama ağacı önbelleğini önceden doldur (varsayılan: aktarma durakları)"""
+        self.hazirla("durak_grafi")
+        self._olc("agac_onbellegi", lambda: self._rota_hesaplayici.agac_onbellegini_isit(durak_idleri))
+    
+    def hazirla(self, *alt_sistemler: str):
+        """
+        Verilen alt sistemleri şimdi kur (örn. sunucu ilk isteği beklemeden)
+        
+        Args:
+            alt_sistemler: Özellik adları, örn. "durak_grafi", "durak_adi_dizini",
+                "en_uygun_rota_secici"
+        """
+        for ad in alt_sistemler:
+            if not isinstance(getattr(type(self), ad, None), property):
+                raise ValueError(f"Bilinmeyen alt sistem: {ad}")
+            getattr(self, ad)
+    
+    # Başlangıç süresi raporu
+    
+    @property
+    def baslangic_suresi(self) -> float:
+        """Kurucunun toplam süresi (sn) - ilk erişimde kurulan alt sistemler hariç"""
+        return self._baslangic_suresi
+    
+    @property
+    def asama_sureleri(self) -> Dict[str, float]:
+        """Aşama adı -> süre (sn); ilk erişimde kurulan alt sistemler kuruldukça eklenir"""
+        return dict(self._asama_sureleri)
+    
+    def baslangic_raporu(self) -> str:
+        satirlar = [f"Rota motoru {self._baslangic_suresi * 1000:.1f} ms içinde başlatıldı "
+                    f"({len(self._veri_yukleyici.duraklar)} durak, {self._dosya_yolu})"]
+        for asama, sure in self._asama_sureleri.items():
+            satirlar.append(f"  {asama:<26} {sure * 1000:>9.1f} ms")
+        return "\n".join(satirlar)
+
+
+if __name__ == "__main__":
+    import sys
+    motor = RotaMotoru(sys.argv[1] if len(sys.argv) > 1 else None)
+    motor.hazirla("durak_grafi", "durak_adi_dizini", "en_uygun_rota_secici")
+    print(motor.baslangic_raporu())
@@ -1,10 +1,15 @@
 from abc import ABC, abstractmethod
+import time
 from typing import List, Optional, Tuple
 from konum import Konum
 from rota import Rota, RotaAdimi, RotaHesaplayici
 from hat import HatYoneticisi
+from durak_grafi import DurakGrafi
 from taksi import Taksi
 from mesafe_hesaplayici import MesafeHesaplayici
+from gecikme_olcumu import asama
+from arama_istatistikleri import AramaIstatistikleri
+from sorgu_kaydi import kaydedilen_sorgu
 
 
 class RotaStratejisi(ABC):
@@ -12,8 +17,9 @@ class RotaStratejisi(ABC):
     
     @abstractmethod
     def rota_olustur(self, baslangic_konum: Konum, hedef_konum: Konum,
-                    hat_yoneticisi: HatYoneticisi, taksi: Taksi) -> Optional[Rota]:
-        """Rota oluştur"""
+                    hat_yoneticisi: HatYoneticisi, taksi: Taksi,
+                    istatistik: Optional[AramaIstatistikleri] = None) -> Optional[Rota]:
+        """Rota oluştur (istatistik verilirse arama sayaçları buna eklenir)"""
         pass
     
     @abstractmethod
@@ -30,11 +36,15 @@ class RotaStratejisi(ABC):
 class SadeceOtobusStratejisi(RotaStratejisi):
     """Sadece otobüs kullanarak rota oluştur"""
     
+    _TIP_MASKELERI = {"otobus": DurakGrafi.MOD_OTOBUS, "tramvay": DurakGrafi.MOD_TRAMVAY}
+    
+    @asama("strateji.sadece_otobus")
     def rota_olustur(self, baslangic_konum: Konum, hedef_konum: Konum,
-                    hat_yoneticisi: HatYoneticisi, taksi: Taksi) -> Optional[Rota]:
+                    hat_yoneticisi: HatYoneticisi, taksi: Taksi,
+                    istatistik: Optional[AramaIstatistikleri] = None) -> Optional[Rota]:
         """Sadece otobüs durakları kullanarak rota oluştur"""
         return self._rota_olustur_tek_tip(baslangic_konum, hedef_konum, 
-                                          hat_yoneticisi, taksi, "otobus")
+                                          hat_yoneticisi, taksi, "otobus", istatistik)
     
     def strateji_adi(self) -> str:
         return "Sadece Otobüs"
@@ -43,8 +53,8 @@ class SadeceOtobusStratejisi(RotaStratejisi):
         return ["otobus"]
     
     def _rota_olustur_tek_tip(self, baslangic_konum: Konum, hedef_konum: Konum,
-                              hat_yoneticisi: HatYoneticisi, taksi: Taksi,
-                              tasima_tipi: str) -> Optional[Rota]:
+                              hat_yoneticisi: HatYoneticisi, taksi: Taksi, tasima_tipi: str,
+                              istatistik: Optional[AramaIstatistikleri] = None) -> Optional[Rota]:
         """Tek taşıma tipi ile rota oluştur"""
         # En yakın durakları bul (sadece belirtilen tip)
         baslangic_durak_id, baslangic_mesafe = self._en_yakin_durak_bul_tip(
@@ -65,7 +75,7 @@ class SadeceOtobusStratejisi(RotaStratejisi):
         
         # Duraklar arası (sadece belirtilen tip)
         durak_arasi_rota = self._durak_arasi_rota_bul_tip(
-            baslangic_durak_id, hedef_durak_id, hat_yoneticisi, tasima_tipi
+            baslangic_durak_id, hedef_durak_id, hat_yoneticisi, tasima_tipi, istatistik
         )
         if durak_arasi_rota:
             adimlar.extend(durak_arasi_rota)
@@ -78,14 +88,17 @@ class SadeceOtobusStratejisi(RotaStratejisi):
         
         return self._rota_olustur(adimlar)
     
+    @asama("strateji.en_yakin_durak")
     def _en_yakin_durak_bul_tip(self, konum: Konum, hat_yoneticisi: HatYoneticisi,
                                 tasima_tipi: str) -> Tuple[Optional[str], float]:
         """Belirli tip durak bul"""
         en_yakin_id = None
         en_kisa_mesafe = float('inf')
+        graf = hat_yoneticisi.durak_grafi
+        maske = self._TIP_MASKELERI[tasima_tipi]
         
         for durak_id, durak in hat_yoneticisi.tum_duraklar().items():
-            if durak.tasima_tipi() == tasima_tipi:
+            if graf.durak_modu(graf.indeks(durak_id)) & maske:
                 mesafe = MesafeHesaplayici.haversine_mesafe(
                     konum.enlem, konum.boylam,
                     durak.enlem, durak.boylam
@@ -96,39 +109,20 @@ class SadeceOtobusStratejisi(RotaStratejisi):
         
         return en_yakin_id, en_kisa_mesafe
     
+    @asama("strateji.durak_arasi_arama")
     def _durak_arasi_rota_bul_tip(self, baslangic_id: str, hedef_id: str,
-                                  hat_yoneticisi: HatYoneticisi, tasima_tipi: str) -> Optional[List[RotaAdimi]]:
+                                  hat_yoneticisi: HatYoneticisi, tasima_tipi: str,
+                                  istatistik: Optional[AramaIstatistikleri] = None
+                                  ) -> Optional[List[RotaAdimi]]:
         """Belirli tip ile durak arası rota bul"""
-        from collections import deque
-        
-        ziyaret_edildi = set()
-        kuyruk = deque([(baslangic_id, [])])
-        
-        while kuyruk:
-            mevcut_id, yol = kuyruk.popleft()
-            
-            if mevcut_id == hedef_id:
-                return self._yolu_adimlara_cevir(yol, hat_yoneticisi)
-            
-            if mevcut_id in ziyaret_edildi:
-                continue
-            
-            ziyaret_edildi.add(mevcut_id)
-            durak = hat_yoneticisi.durak_getir(mevcut_id)
-            
-            if not durak or durak.tasima_tipi() != tasima_tipi:
-                continue
-            
-            for sonraki in durak.sonraki_duraklar:
-                sonraki_id = sonraki["stopId"]
-                sonraki_durak = hat_yoneticisi.durak_getir(sonraki_id)
-                if sonraki_durak and sonraki_durak.tasima_tipi() == tasima_tipi:
-                    if sonraki_id not in ziyaret_edildi:
-                        yeni_yol = yol + [(mevcut_id, sonraki_id, sonraki)]
-                        kuyruk.append((sonraki_id, yeni_yol))
-        
-        return None
+        graf = hat_yoneticisi.durak_grafi
+        kenarlar = _en_az_durakli_kenarlar(graf, baslangic_id, hedef_id,
+                                           self._TIP_MASKELERI[tasima_tipi], istatistik)
+        if kenarlar is None:
+            return None
+        return self._yolu_adimlara_cevir(graf.yol_demetleri(kenarlar), hat_yoneticisi)
     
+    @asama("strateji.erisim_adimi")
     def _konumdan_duraga(self, konum: Konum, durak_id: str, mesafe: float,
                         hat_yoneticisi: HatYoneticisi, taksi: Taksi) -> List[RotaAdimi]:
         """Konumdan durağa ulaşım adımları"""
@@ -148,6 +142,7 @@ class SadeceOtobusStratejisi(RotaStratejisi):
             ))
         return adimlar
     
+    @asama("strateji.erisim_adimi")
     def _durakdan_konuma(self, durak_id: str, konum: Konum, mesafe: float,
                          hat_yoneticisi: HatYoneticisi, taksi: Taksi) -> List[RotaAdimi]:
         """Duraktan konuma ulaşım adımları"""
@@ -167,6 +162,7 @@ class SadeceOtobusStratejisi(RotaStratejisi):
             ))
         return adimlar
     
+    @asama("strateji.adimlara_cevirme")
     def _yolu_adimlara_cevir(self, yol: List, hat_yoneticisi: HatYoneticisi) -> List[RotaAdimi]:
         """Yol listesini RotaAdimi listesine çevir"""
         adimlar = []
@@ -180,6 +176,7 @@ class SadeceOtobusStratejisi(RotaStratejisi):
             ))
         return adimlar
     
+    @asama("strateji.ucret")
     def _rota_olustur(self, adimlar: List[RotaAdimi]) -> Rota:
         """RotaAdimi listesinden Rota oluştur"""
         toplam_mesafe = sum(adim.mesafe for adim in adimlar)
@@ -194,11 +191,13 @@ class SadeceOtobusStratejisi(RotaStratejisi):
 class SadeceTramvayStratejisi(SadeceOtobusStratejisi):
     """Sadece tramvay kullanarak rota oluştur"""
     
+    @asama("strateji.sadece_tramvay")
     def rota_olustur(self, baslangic_konum: Konum, hedef_konum: Konum,
-                    hat_yoneticisi: HatYoneticisi, taksi: Taksi) -> Optional[Rota]:
+                    hat_yoneticisi: HatYoneticisi, taksi: Taksi,
+                    istatistik: Optional[AramaIstatistikleri] = None) -> Optional[Rota]:
         """Sadece tramvay durakları kullanarak rota oluştur"""
         return self._rota_olustur_tek_tip(baslangic_konum, hedef_konum,
-                                          hat_yoneticisi, taksi, "tramvay")
+                                          hat_yoneticisi, taksi, "tramvay", istatistik)
     
     def strateji_adi(self) -> str:
         return "Sadece Tramvay"
@@ -210,12 +209,20 @@ class SadeceTramvayStratejisi(SadeceOtobusStratejisi):
 class OtobusTramvayAktarmaStratejisi(RotaStratejisi):
     """Otobüs + Tramvay aktarması ile rota oluştur"""
     
+    @asama("strateji.otobus_tramvay_aktarma")
     def rota_olustur(self, baslangic_konum: Konum, hedef_konum: Konum,
-                    hat_yoneticisi: HatYoneticisi, taksi: Taksi) -> Optional[Rota]:
+                    hat_yoneticisi: HatYoneticisi, taksi: Taksi,
+                    istatistik: Optional[AramaIstatistikleri] = None) -> Optional[Rota]:
         """Aktarma içeren rota oluştur"""
         # Mevcut RotaHesaplayici'yi kullan (aktarma destekli)
         rota_hesaplayici = RotaHesaplayici(hat_yoneticisi, taksi)
-        rota = rota_hesaplayici.en_uygun_rota_bul(baslangic_konum, hedef_konum)
+        if istatistik is None:
+            rota = rota_hesaplayici.en_uygun_rota_bul(baslangic_konum, hedef_konum)
+        else:
+            rota, alt_istatistik = rota_hesaplayici.en_uygun_rota_bul(
+                baslangic_konum, hedef_konum, explain=True, iz=istatistik.izler is not None
+            )
+            istatistik.birlestir(alt_istatistik)
         
         # Sadece aktarma içeren rotaları filtrele
         if rota and rota.aktarma_sayisi > 0:
@@ -232,8 +239,10 @@ class OtobusTramvayAktarmaStratejisi(RotaStratejisi):
 class TaksiKombinasyonStratejisi(RotaStratejisi):
     """Taksi + Otobüs veya Tramvay kombinasyonu"""
     
+    @asama("strateji.taksi_kombinasyon")
     def rota_olustur(self, baslangic_konum: Konum, hedef_konum: Konum,
-                    hat_yoneticisi: HatYoneticisi, taksi: Taksi) -> Optional[Rota]:
+                    hat_yoneticisi: HatYoneticisi, taksi: Taksi,
+                    istatistik: Optional[AramaIstatistikleri] = None) -> Optional[Rota]:
         """Taksi ile başlayan kombinasyon rota oluştur"""
         # En yakın durakları bul
         baslangic_durak_id, baslangic_mesafe = self._en_yakin_durak_bul(
@@ -258,7 +267,7 @@ class TaksiKombinasyonStratejisi(RotaStratejisi):
         
         # Duraklar arası toplu taşıma - kendi implementasyonumuzu kullan
         durak_arasi_rota = self._durak_arasi_rota_bul_genel(
-            baslangic_durak_id, hedef_durak_id, hat_yoneticisi
+            baslangic_durak_id, hedef_durak_id, hat_yoneticisi, istatistik
         )
         if durak_arasi_rota:
             adimlar.extend(durak_arasi_rota)
@@ -308,6 +317,7 @@ class TaksiKombinasyonStratejisi(RotaStratejisi):
     def izin_verilen_tasima_tipleri(self) -> List[str]:
         return ["taksi", "otobus", "tramvay"]
     
+    @asama("strateji.en_yakin_durak")
     def _en_yakin_durak_bul(self, konum: Konum, hat_yoneticisi: HatYoneticisi) -> Tuple[Optional[str], float]:
         """En yakın durağı bul"""
         en_yakin_id = None
@@ -324,49 +334,20 @@ class TaksiKombinasyonStratejisi(RotaStratejisi):
         
         return en_yakin_id, en_kisa_mesafe
     
+    @asama("strateji.durak_arasi_arama")
     def _durak_arasi_rota_bul_genel(self, baslangic_id: str, hedef_id: str,
-                                    hat_yoneticisi: HatYoneticisi) -> Optional[List[RotaAdimi]]:
+                                    hat_yoneticisi: HatYoneticisi,
+                                    istatistik: Optional[AramaIstatistikleri] = None
+                                    ) -> Optional[List[RotaAdimi]]:
         """Genel durak arası rota bul (aktarma dahil)"""
-        from collections import deque
-        
-        ziyaret_edildi = set()
-        kuyruk = deque([(baslangic_id, [])])
-        
-        while kuyruk:
-            mevcut_id, yol = kuyruk.popleft()
-            
-            if mevcut_id == hedef_id:
-                return self._yolu_adimlara_cevir_genel(yol, hat_yoneticisi)
-            
-            if mevcut_id in ziyaret_edildi:
-                continue
-            
-            ziyaret_edildi.add(mevcut_id)
-            durak = hat_yoneticisi.durak_getir(mevcut_id)
-            
-            if not durak:
-                continue
-            
-            # Sonraki duraklara git
-            for sonraki in durak.sonraki_duraklar:
-                sonraki_id = sonraki["stopId"]
-                if sonraki_id not in ziyaret_edildi:
-                    yeni_yol = yol + [(mevcut_id, sonraki_id, sonraki)]
-                    kuyruk.append((sonraki_id, yeni_yol))
-            
-            # Aktarma yap
-            if durak.aktarma:
-                aktarma_id = durak.aktarma["transferStopId"]
-                if aktarma_id not in ziyaret_edildi:
-                    aktarma_bilgisi = {
-                        "transferSure": durak.aktarma["transferSure"],
-                        "transferUcret": durak.aktarma["transferUcret"]
-                    }
-                    yeni_yol = yol + [(mevcut_id, aktarma_id, aktarma_bilgisi, True)]
-                    kuyruk.append((aktarma_id, yeni_yol))
-        
-        return None
+        graf = hat_yoneticisi.durak_grafi
+        kenarlar = _en_az_durakli_kenarlar(graf, baslangic_id, hedef_id, DurakGrafi.MOD_TUMU,
+                                           istatistik)
+        if kenarlar is None:
+            return None
+        return self._yolu_adimlara_cevir_genel(graf.yol_demetleri(kenarlar), hat_yoneticisi)
     
+    @asama("strateji.adimlara_cevirme")
     def _yolu_adimlara_cevir_genel(self, yol: List, hat_yoneticisi: HatYoneticisi) -> List[RotaAdimi]:
         """Yol listesini RotaAdimi listesine çevir (aktarma dahil)"""
         adimlar = []
@@ -393,8 +374,10 @@ class TaksiKombinasyonStratejisi(RotaStratejisi):
 class SadeceTaksiStratejisi(RotaStratejisi):
     """Sadece taksi kullanarak rota oluştur"""
     
+    @asama("strateji.sadece_taksi")
     def rota_olustur(self, baslangic_konum: Konum, hedef_konum: Konum,
-                    hat_yoneticisi: HatYoneticisi, taksi: Taksi) -> Optional[Rota]:
+                    hat_yoneticisi: HatYoneticisi, taksi: Taksi,
+                    istatistik: Optional[AramaIstatistikleri] = None) -> Optional[Rota]:
         """Sadece taksi ile direkt rota"""
         mesafe = MesafeHesaplayici.haversine_mesafe(
             baslangic_konum.enlem, baslangic_konum.boylam,
@@ -443,21 +426,35 @@ class RotaSecenekleriUretici:
             SadeceTaksiStratejisi()
         ]
     
-    def tum_rota_secenekleri_olustur(self, baslangic_konum: Konum, 
-                                     hedef_konum: Konum) -> List[Tuple[str, Optional[Rota]]]:
+    @asama("secenekler.tum_rota_secenekleri")
+    @kaydedilen_sorgu("secenekler")
+    def tum_rota_secenekleri_olustur(self, baslangic_konum: Konum, hedef_konum: Konum,
+                                     istatistik: Optional[AramaIstatistikleri] = None
+                                     ) -> List[Tuple[str, Optional[Rota]]]:
         """
         Tüm rota seçeneklerini oluştur
         
+        Args:
+            istatistik: Verilirse stratejilerin arama sayaçları ve süreleri buna eklenir
+        
         Returns:
             [(strateji_adi, rota), ...] listesi
         """
         secenekler = []
         
         for strateji in self._stratejiler:
-            rota = strateji.rota_olustur(
-                baslangic_konum, hedef_konum,
-                self._hat_yoneticisi, self._taksi
-            )
+            if istatistik is None:
+                rota = strateji.rota_olustur(
+                    baslangic_konum, hedef_konum,
+                    self._hat_yoneticisi, self._taksi
+                )
+            else:
+                istatistik.baglam = strateji.strateji_adi()
+                baslangic = time.perf_counter()
+                rota = strateji.rota_olustur(baslangic_konum, hedef_konum,
+                                             self._hat_yoneticisi, self._taksi, istatistik)
+                istatistik.strateji_sureleri[istatistik.baglam] = (time.perf_counter() - baslangic) * 1000
+                istatistik.baglam = ""
             secenekler.append((strateji.strateji_adi(), rota))
         
         return secenekler
@@ -469,4 +466,31 @@ class RotaSecenekleriUretici:
     @property
     def stratejiler(self) -> List[RotaStratejisi]:
         return self._stratejiler
+    
+    @property
+    def hat_yoneticisi(self) -> HatYoneticisi:
+        return self._hat_yoneticisi
+    
+    @property
+    def taksi(self) -> Taksi:
+        return self._taksi
 
+
+def _en_az_durakli_kenarlar(graf: DurakGrafi, baslangic_id: str, hedef_id: str, izin_maskesi: int,
+                            istatistik: Optional[AramaIstatistikleri] = None) -> Optional[List[int]]:
+    """
+    Mod maskesiyle en az duraklı yol kenarları
+    
+    Ulaşılamayan çiftler bileşenlere bakılarak aramadan elenir; başlangıç
+    durağının ağacı önbellekteyse yol oradan okunur.
+    """
+    kaynak = graf.indeks(baslangic_id)
+    hedef = graf.indeks(hedef_id)
+    if not graf.ulasilabilir_mi(kaynak, hedef, izin_maskesi):
+        if istatistik is not None:
+            istatistik.bilesen_elemesi += 1
+        return None
+    agac = graf.agac_onbellegi.agac_getir(kaynak, "durak", izin_maskesi, istatistik)
+    if agac is not None:
+        return agac.yol(hedef)
+    return graf.en_az_durakli_yol(kaynak, hedef, izin_maskesi, istatistik)
@@ -0,0 +1,154 @@
+import tkinter as tk
+from tkinter import ttk
+from tkinter import font as tkfont
+from typing import List, Dict, Optional, Tuple
+
+
+# Sonuç metnindeki etiketlerin görünümü (Text etiketleri ve sanal liste için ortak)
+ETIKET_STILLERI: Dict[str, Dict] = {
+    "baslik": {"foreground": "#2c3e50", "font": ("Consolas", 10, "bold")},
+    "ayirici": {"foreground": "#95a5a6"},
+    "vurgu": {"foreground": "#2980b9", "font": ("Consolas", 10, "bold")},
+    "olumlu": {"foreground": "#27ae60"},
+    "olumsuz": {"foreground": "#e74c3c"},
+}
+
+
+class SonucTamponu:
+    """
+    Sonuç panelinin metnini tek seferde yazılmak üzere biriktiren tampon
+    
+    Parçalar (metin, etiket) olarak tutulur; Text bileşenine tek bir insert
+    çağrısıyla ve etiketleriyle birlikte yazılır ya da sanal liste için
+    satırlara bölünür.
+    """
+    
+    def __init__(self):
+        self._parcalar: List[Tuple[str, Optional[str]]] = []
+        self._satir_sayisi = 0
+    
+    def ekle(self, metin: str, etiket: Optional[str] = None):
+        if not metin:
+            return
+        if self._parcalar and self._parcalar[-1][1] == etiket:
+            # Aynı etiketli ardışık parçalar birleştirilir (daha az insert argümanı)
+            self._parcalar[-1] = (self._parcalar[-1][0] + metin, etiket)
+        else:
+            self._parcalar.append((metin, etiket))
+        self._satir_sayisi += metin.count("\n")
+    
+    @property
+    def satir_sayisi(self) -> int:
+        return self._satir_sayisi
+    
+    def metin_argumanlari(self) -> Tuple:
+        """Text.insert için (metin, etiketler, metin, etiketler, ...) argümanları"""
+        argumanlar = []
+        for metin, etiket in self._parcalar:
+            argumanlar.append(metin)
+            argumanlar.append((etiket,) if etiket else ())
+        return tuple(argumanlar)
+    
+    def satirlar(self) -> List[Tuple[str, Optional[str]]]:
+        """(satır, etiket) listesi - satırın etiketi satırdaki ilk etiketli parçanınkidir"""
+        satirlar = []
+        satir = []
+        satir_etiketi = None
+        for metin, etiket in self._parcalar:
+            parcalar = metin.split("\n")
+            for i, parca in enumerate(parcalar):
+                if i > 0:
+                    satirlar.append(("".join(satir), satir_etiketi))
+                    satir = []
+                    satir_etiketi = None
+                if parca:
+                    satir.append(parca)
+                    if satir_etiketi is None:
+                        satir_etiketi = etiket
+        if satir:
+            satirlar.append(("".join(satir), satir_etiketi))
+        return satirlar
+
+
+class SanalSatirListesi(tk.Frame):
+    """
+    Yalnızca görünen satırları çizen kaydırılabilir satır listesi
+    
+    Satır sayısından bağımsız olarak pencere yüksekliği kadar canvas metin öğesi
+    oluşturulur ve kaydırıldıkça bu öğelerin metni güncellenir; yüzlerce
+    alternatif rota da anında gösterilir.
+    """
+    
+    def __init__(self, ana, font=("Consolas", 10), etiket_stilleri: Optional[Dict[str, Dict]] = None,
+                 arka_plan: str = "#ffffff", on_plan: str = "#2c3e50", **kwargs):
+        super().__init__(ana, **kwargs)
+        self._font = tkfont.Font(font=font)
+        self._satir_yuksekligi = self._font.metrics("linespace") + 2
+        self._etiket_stilleri = etiket_stilleri or {}
+        self._on_plan = on_plan
+        self._satirlar: List[Tuple[str, Optional[str]]] = []
+        self._ilk = 0
+        self._ogeler: List[int] = []  # Yeniden kullanılan canvas metin öğeleri
+        
+        self.canvas = tk.Canvas(self, bg=arka_plan, highlightthickness=0)
+        self.kaydirma = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._kaydir)
+        self.canvas.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.kaydirma.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=1)
+        
+        self.canvas.bind("<Configure>", lambda event: self._ciz())
+        self.canvas.bind("<MouseWheel>", self._fare_tekerlegi)
+        self.canvas.bind("<Button-4>", self._fare_tekerlegi)
+        self.canvas.bind("<Button-5>", self._fare_tekerlegi)
+    
+    def satirlari_ayarla(self, satirlar: List[Tuple[str, Optional[str]]]):
+        """Listenin satırlarını değiştir ve başa kaydır"""
+        self._satirlar = satirlar
+        self._ilk = 0
+        self._ciz()
+    
+    def temizle(self):
+        self.satirlari_ayarla([])
+    
+    def _gorunen_satir_sayisi(self) -> int:
+        return max(1, self.canvas.winfo_height() // self._satir_yuksekligi + 1)
+    
+    def _kaydir(self, *args):
+        """Kaydırma çubuğu komutu: ('moveto', oran) veya ('scroll', adet, 'units'/'pages')"""
+        gorunen = self._gorunen_satir_sayisi()
+        if args[0] == "moveto":
+            ilk = int(float(args[1]) * len(self._satirlar))
+        else:
+            adet = int(args[1])
+            if args[2] == "pages":
+                adet *= max(1, gorunen - 1)
+            ilk = self._ilk + adet
+        self._ilk = max(0, min(ilk, len(self._satirlar) - gorunen + 1))
+        self._ciz()
+    
+    def _fare_tekerlegi(self, event):
+        if event.num == 4 or getattr(event, "delta", 0) > 0:
+            self._kaydir("scroll", -3, "units")
+        else:
+            self._kaydir("scroll", 3, "units")
+    
+    def _ciz(self):
+        gorunen = self._gorunen_satir_sayisi()
+        while len(self._ogeler) < gorunen:
+            self._ogeler.append(self.canvas.create_text(10, 0, anchor=tk.NW, font=self._font))
+        
+        for i, oge in enumerate(self._ogeler):
+            sira = self._ilk + i
+            if i < gorunen and sira < len(self._satirlar):
+                metin, etiket = self._satirlar[sira]
+                stil = self._etiket_stilleri.get(etiket, {})
+                self.canvas.coords(oge, 10, 4 + i * self._satir_yuksekligi)
+                self.canvas.itemconfigure(oge, text=metin, state=tk.NORMAL,
+                                          fill=stil.get("foreground", self._on_plan),
+                                          font=stil.get("font", self._font))
+            else:
+                self.canvas.itemconfigure(oge, state=tk.HIDDEN)
+        
+        toplam = len(self._satirlar) or 1
+        self.kaydirma.set(self._ilk / toplam, min(1.0, (self._ilk + gorunen) / toplam))
@@ -0,0 +1,193 @@
+import functools
+import hashlib
+import inspect
+import json
+import threading
+import time
+from dataclasses import asdict
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+KAYIT_SURUMU = 1
+SORGU_TURLERI = ("rota", "secenekler", "secici", "degerlendirme")
+
+_etkin_kaydedici: Optional["SorguKaydedici"] = None
+_yerel = threading.local()  # Kaydedilen bir sorgunun içindeki (iç içe) çağrılar kaydedilmez
+
+
+class SorguKaydedici:
+    """
+    Motora gelen sorguları yalnızca eklemeli bir JSONL dosyasına yazan kaydedici
+    
+    Her satır bir sorgudur: tür, başlangıç/hedef konumu, yolcu tipi, cüzdan,
+    ödeme yöntemi, öncelik, strateji kümesi, süre ve sonucun özeti. Her kayıttan
+    sonra dosya boşaltılır; süreç çökerse en fazla son satır yarım kalır
+    (kayitlari_oku bozuk satırları atlar).
+    """
+    
+    def __init__(self, dosya_yolu: str):
+        self._dosya_yolu = dosya_yolu
+        self._dosya = open(dosya_yolu, "a", encoding="utf-8")
+        self._kilit = threading.Lock()  # Arayüzün işçi iş parçacığı da sorgu yapar
+        self._kayit_sayisi = 0
+    
+    @property
+    def dosya_yolu(self) -> str:
+        return self._dosya_yolu
+    
+    @property
+    def kayit_sayisi(self) -> int:
+        return self._kayit_sayisi
+    
+    def kaydet(self, kayit: Dict[str, Any]):
+        satir = json.dumps(kayit, ensure_ascii=False, separators=(",", ":")) + "\n"
+        with self._kilit:
+            if self._dosya.closed:
+                return
+            self._dosya.write(satir)
+            self._dosya.flush()
+            self._kayit_sayisi += 1
+    
+    def kapat(self):
+        with self._kilit:
+            self._dosya.close()
+
+
+def kaydi_baslat(dosya_yolu: str) -> SorguKaydedici:
+    """Sorgu kaydını başlat (zaten açıksa önceki kaydedici kapatılır)"""
+    global _etkin_kaydedici
+    kaydi_durdur()
+    _etkin_kaydedici = SorguKaydedici(dosya_yolu)
+    return _etkin_kaydedici
+
+
+def kaydi_durdur():
+    global _etkin_kaydedici
+    kaydedici, _etkin_kaydedici = _etkin_kaydedici, None
+    if kaydedici is not None:
+        kaydedici.kapat()
+
+
+def etkin_kaydedici() -> Optional[SorguKaydedici]:
+    """Kayıt açıksa etkin kaydedici, değilse None"""
+    return _etkin_kaydedici
+
+
+def kaydedilen_sorgu(tur: str) -> Callable[[Callable], Callable]:
+    """
+    Metodu sorgu giriş noktası olarak işaretle
+    
+    Kayıt kapalıyken yalnızca bir denetim eklenir. Açıkken yalnızca en dıştaki
+    çağrı kaydedilir: örn. en_uygun_rotayi_bul içindeki seçenek üretimi veya
+    aktarma stratejisinin kendi en_uygun_rota_bul çağrısı ayrı sorgu sayılmaz.
+    """
+    if tur not in SORGU_TURLERI:
+        raise ValueError(f"Bilinmeyen sorgu türü: {tur}")
+    
+    def dekorator(fonksiyon: Callable) -> Callable:
+        imza = inspect.signature(fonksiyon)
+        
+        @functools.wraps(fonksiyon)
+        def sarmalayici(nesne, *args, **kwargs):
+            kaydedici = _etkin_kaydedici
+            if kaydedici is None or getattr(_yerel, "sorguda", False):
+                return fonksiyon(nesne, *args, **kwargs)
+            _yerel.sorguda = True
+            baslangic = time.perf_counter()
+            try:
+                sonuc = fonksiyon(nesne, *args, **kwargs)
+            finally:
+                _yerel.sorguda = False
+            sure = time.perf_counter() - baslangic
+            argumanlar = imza.bind(nesne, *args, **kwargs)
+            argumanlar.apply_defaults()
+            kaydedici.kaydet(_kayit_olustur(tur, nesne, argumanlar.arguments, sonuc, sure))
+            return sonuc
+        return sarmalayici
+    return dekorator
+
+
+def _kayit_olustur(tur: str, nesne, argumanlar: Dict[str, Any], sonuc, sure: float) -> Dict[str, Any]:
+    kayit = {
+        "surum": KAYIT_SURUMU,
+        "zaman": datetime.now().isoformat(timespec="milliseconds"),
+        "tur": tur,
+        "baslangic": [argumanlar["baslangic_konum"].enlem, argumanlar["baslangic_konum"].boylam],
+        "hedef": [argumanlar["hedef_konum"].enlem, argumanlar["hedef_konum"].boylam],
+    }
+    if "yolcu_tipi" in argumanlar:
+        kayit["yolcu_tipi"] = argumanlar["yolcu_tipi"]
+    if "cuzdan" in argumanlar:
+        cuzdan = argumanlar["cuzdan"]
+        kayit["cuzdan"] = {"nakit": cuzdan.nakit, "kredi_karti_limiti": cuzdan.kredi_karti_limiti,
+                           "kentkart_bakiyesi": cuzdan.kentkart_bakiyesi}
+        kayit["odeme_yontemi"] = argumanlar["odeme_yontemi"]
+        kayit["oncelik"] = argumanlar["oncelik"]
+    if "butce_kisitli" in argumanlar:
+        kayit["butce_kisitli"] = argumanlar["butce_kisitli"]
+        agirliklar = argumanlar["agirliklar"]
+        kayit["agirliklar"] = asdict(agirliklar) if agirliklar is not None else None
+    
+    if hasattr(nesne, "arama_modu"):
+        kayit["arama_modu"] = nesne.arama_modu
+    uretici = getattr(nesne, "rota_secenekleri_uretici", nesne)
+    if hasattr(uretici, "stratejiler"):
+        kayit["stratejiler"] = [strateji.strateji_adi() for strateji in uretici.stratejiler]
+    
+    kayit["sure_ms"] = sure * 1000
+    kayit["sonuc"] = sonuc_ozeti(tur, sonuc)
+    return kayit
+
+
+def rota_ozeti(rota) -> Optional[Dict[str, Any]]:
+    """
+    Rotanın karşılaştırılabilir özeti - toplamlar ve adım dizisinin imzası
+    
+    Kayan nokta toplamları yuvarlanır; böylece toplama sırasındaki küçük farklar
+    sonuç farkı sayılmaz.
+    """
+    if rota is None:
+        return None
+    adimlar = "|".join(f"{adim.baslangic}>{adim.hedef}:{adim.ulasim_tipi}" for adim in rota.adimlar)
+    return {
+        "sure": round(rota.toplam_sure, 6),
+        "ucret": round(rota.toplam_ucret, 6),
+        "mesafe": round(rota.toplam_mesafe, 6),
+        "aktarma": rota.aktarma_sayisi,
+        "adim": len(rota.adimlar),
+        "imza": hashlib.sha1(adimlar.encode("utf-8")).hexdigest()[:16],
+    }
+
+
+def sonuc_ozeti(tur: str, sonuc) -> Any:
+    """Sorgu türüne göre sonucun JSON'a yazılabilir özeti (explain çıktıları da kabul edilir)"""
+    if tur == "rota":
+        return rota_ozeti(sonuc[0] if isinstance(sonuc, tuple) else sonuc)
+    if tur == "secenekler":
+        return [[strateji_adi, rota_ozeti(rota)] for strateji_adi, rota in sonuc]
+    en_uygun, secenekler = sonuc[0], sonuc[1]
+    return {
+        "en_uygun": rota_ozeti(en_uygun),
+        "secenekler": [[strateji_adi, rota_ozeti(rota), odeme_yapilabilir]
+                       for strateji_adi, rota, odeme_yapilabilir in secenekler],
+    }
+
+
+def kayitlari_oku(dosya_yolu: str) -> Iterator[Dict[str, Any]]:
+    """Kayıtları sırayla oku; yarım kalmış veya bozuk satırlar atlanır"""
+    with open(dosya_yolu, encoding="utf-8") as dosya:
+        for satir in dosya:
+            try:
+                kayit = json.loads(satir)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(kayit, dict) and kayit.get("tur") in SORGU_TURLERI:
+                yield kayit
+
+
+def tur_sayilari(kayitlar: List[Dict[str, Any]]) -> Dict[str, int]:
+    sayilar = {tur: 0 for tur in SORGU_TURLERI}
+    for kayit in kayitlar:
+        sayilar[kayit["tur"]] += 1
+    return sayilar
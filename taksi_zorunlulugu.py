@@ -3,6 +3,7 @@ from typing import Optional, Tuple
 from konum import Konum
 from durak import Durak
 from mesafe_hesaplayici import MesafeHesaplayici
+from gecikme_olcumu import asama
 
 
 class TaksiZorunlulukKontrolu(ABC):
@@ -100,6 +101,7 @@ class TaksiZorunlulukYoneticisi:
         else:
             self._kontroller = kontrol_stratejileri
     
+    @asama("taksi_zorunlulugu.kontrol")
     def taksi_gerekli_mi(self, konum: Konum, durak: Durak) -> Tuple[bool, float, Optional[str]]:
         """
         Tüm kontrolleri uygula - herhangi biri taksi gerektiriyorsa True döndür
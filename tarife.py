@@ -0,0 +1,115 @@
+from typing import List, Dict, Optional
+from dataclasses import dataclass
+from hat import HatYoneticisi, Hat
+
+
+def saat_dakikaya_cevir(saat: str) -> float:
+    """"SS:DD" biçimindeki saati gece yarısından itibaren dakikaya çevir"""
+    saat_kismi, dakika_kismi = saat.split(":")
+    return int(saat_kismi) * 60 + float(dakika_kismi)
+
+
+def dakikayi_saate_cevir(dakika: float) -> str:
+    """Gece yarısından itibaren dakikayı "SS:DD" biçimine çevir"""
+    toplam = int(round(dakika))
+    return f"{(toplam // 60) % 24:02d}:{toplam % 60:02d}"
+
+
+@dataclass
+class Sefer:
+    """Bir hattın tek bir seferi - hat duraklarındaki kalkış zamanları"""
+    sefer_id: str
+    hat_id: str
+    zamanlar: List[float]  # Hat duraklarının sırasıyla kalkış zamanları (dk)
+    
+    @property
+    def kalkis(self) -> float:
+        return self.zamanlar[0]
+    
+    @property
+    def varis(self) -> float:
+        return self.zamanlar[-1]
+    
+    def __str__(self) -> str:
+        return f"{self.sefer_id}: {dakikayi_saate_cevir(self.kalkis)} - {dakikayi_saate_cevir(self.varis)}"
+
+
+class Tarife:
+    """Hatların sefer tarifelerini tutan sınıf"""
+    
+    VARSAYILAN_SEFER_ARALIKLARI = {"bus": 15.0, "tram": 10.0}  # dakika
+    
+    def __init__(self, hat_yoneticisi: HatYoneticisi):
+        self._hat_yoneticisi = hat_yoneticisi
+        self._seferler: Dict[str, List[Sefer]] = {}
+    
+    def sefer_ekle(self, hat_id: str, kalkis: float) -> Sefer:
+        """
+        Hattın ilk durağından verilen zamanda kalkan bir sefer ekle
+        
+        Ara durak zamanları duraklar arası bağlantı sürelerinden hesaplanır.
+        
+        Args:
+            hat_id: Hat ID
+            kalkis: İlk duraktan kalkış zamanı (gece yarısından itibaren dk)
+        """
+        hat = self._hat_yoneticisi.hatlar.get(hat_id)
+        if hat is None:
+            raise ValueError(f"Bilinmeyen hat: {hat_id}")
+        
+        zamanlar = [kalkis]
+        for durak_id, sonraki_id in zip(hat.duraklar, hat.duraklar[1:]):
+            bilgi = self._hat_yoneticisi.durak_bilgisi_al(durak_id, sonraki_id)
+            zamanlar.append(zamanlar[-1] + bilgi["sure"])
+        
+        seferler = self._seferler.setdefault(hat_id, [])
+        sefer = Sefer(f"{hat_id}_{len(seferler) + 1}", hat_id, zamanlar)
+        seferler.append(sefer)
+        seferler.sort(key=lambda s: s.kalkis)
+        return sefer
+    
+    def sabit_aralikli_seferler_olustur(self, ilk_sefer: str = "06:00", son_sefer: str = "23:00",
+                                        sefer_araliklari: Optional[Dict[str, float]] = None):
+        """
+        Tüm hatlara ilk ve son sefer arasında sabit aralıklı seferler ekle
+        
+        Args:
+            ilk_sefer: İlk seferin kalkış saati ("SS:DD")
+            son_sefer: Son seferin en geç kalkış saati ("SS:DD")
+            sefer_araliklari: Taşıma tipine göre sefer aralığı (dk)
+        """
+        araliklar = dict(self.VARSAYILAN_SEFER_ARALIKLARI)
+        if sefer_araliklari:
+            araliklar.update(sefer_araliklari)
+        
+        baslangic = saat_dakikaya_cevir(ilk_sefer)
+        bitis = saat_dakikaya_cevir(son_sefer)
+        for hat in self._hat_yoneticisi.hatlar.values():
+            aralik = araliklar.get(hat.tasima_tipi, self.VARSAYILAN_SEFER_ARALIKLARI["bus"])
+            kalkis = baslangic
+            while kalkis <= bitis:
+                self.sefer_ekle(hat.hat_id, kalkis)
+                kalkis += aralik
+    
+    @classmethod
+    def varsayilan(cls, hat_yoneticisi: HatYoneticisi) -> "Tarife":
+        """Varsayılan sefer aralıklarıyla oluşturulmuş tarife"""
+        tarife = cls(hat_yoneticisi)
+        tarife.sabit_aralikli_seferler_olustur()
+        return tarife
+    
+    def hat_seferleri(self, hat_id: str) -> List[Sefer]:
+        """Hattın kalkış zamanına göre sıralı seferleri"""
+        return self._seferler.get(hat_id, [])
+    
+    def hat_getir(self, hat_id: str) -> Optional[Hat]:
+        return self._hat_yoneticisi.hatlar.get(hat_id)
+    
+    @property
+    def hat_yoneticisi(self) -> HatYoneticisi:
+        return self._hat_yoneticisi
+    
+    @property
+    def hat_idleri(self) -> List[str]:
+        """Seferi olan hatlar"""
+        return [hat_id for hat_id, seferler in self._seferler.items() if seferler]
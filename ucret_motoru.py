@@ -0,0 +1,67 @@
+from typing import List, Optional
+from dataclasses import dataclass
+from rota import Rota
+from yolcu import Yolcu, GenelYolcu, OgrenciYolcu, OgretmenYolcu, YasliYolcu
+
+
+@dataclass
+class UcretTablosu:
+    """Bir rotanın birden çok yolcu tipi için fiyatlandırılmış hali"""
+    yolcu_tipleri: List[str]  # Yolcu.yolcu_tipi() değerleri (sütunlar)
+    indirim_oranlari: List[float]  # Her sütunun indirim oranı
+    adim_ucretleri: List[List[float]]  # [adim][yolcu] indirimli adım ücretleri
+    toplam_ucretler: List[float]  # Her yolcu tipi için toplam ücret
+    
+    def yolcu_ucreti(self, yolcu_tipi: str) -> Optional[float]:
+        """Belirli bir yolcu tipinin toplam ücretini döndür"""
+        if yolcu_tipi not in self.yolcu_tipleri:
+            return None
+        return self.toplam_ucretler[self.yolcu_tipleri.index(yolcu_tipi)]
+    
+    def adim_dokumu(self, yolcu_tipi: str) -> Optional[List[float]]:
+        """Belirli bir yolcu tipinin adım adım ücret dökümünü döndür"""
+        if yolcu_tipi not in self.yolcu_tipleri:
+            return None
+        sutun = self.yolcu_tipleri.index(yolcu_tipi)
+        return [satir[sutun] for satir in self.adim_ucretleri]
+
+
+class UcretMotoru:
+    """Tek bir rotayı tüm yolcu tipleri için tek geçişte fiyatlandıran sınıf"""
+    
+    def __init__(self, yolcular: Optional[List[Yolcu]] = None):
+        """
+        Args:
+            yolcular: Fiyatlandırılacak yolcu tipleri (varsayılan: tüm tipler)
+        """
+        if yolcular is None:
+            yolcular = [GenelYolcu(), OgrenciYolcu(), OgretmenYolcu(), YasliYolcu()]
+        self._yolcular = yolcular
+        self._yolcu_tipleri = [yolcu.yolcu_tipi() for yolcu in yolcular]
+        self._indirim_oranlari = [yolcu.indirim_orani() for yolcu in yolcular]
+        self._carpanlar = [1 - oran for oran in self._indirim_oranlari]
+    
+    def fiyatlandir(self, rota: Rota) -> UcretTablosu:
+        """
+        İndirimsiz hesaplanmış bir rotayı tüm yolcu tipleri için fiyatlandır
+        
+        Yolcu indirimi RotaHesaplayici ile aynı şekilde rotanın tüm ücretine
+        uygulanır; adım dökümü bu indirimin adımlara dağıtılmış halidir.
+        """
+        carpanlar = self._carpanlar
+        adim_ucretleri = [[adim.ucret * carpan for carpan in carpanlar]
+                          for adim in rota.adimlar]
+        
+        taban_ucret = sum(adim.ucret for adim in rota.adimlar)
+        toplam_ucretler = [taban_ucret * carpan for carpan in carpanlar]
+        
+        return UcretTablosu(
+            yolcu_tipleri=list(self._yolcu_tipleri),
+            indirim_oranlari=list(self._indirim_oranlari),
+            adim_ucretleri=adim_ucretleri,
+            toplam_ucretler=toplam_ucretler
+        )
+    
+    @property
+    def yolcular(self) -> List[Yolcu]:
+        return self._yolcular
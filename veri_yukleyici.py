@@ -67,6 +67,21 @@ class VeriYukleyici:
                 durak.aktarma_ayarla(durak_verisi["transfer"])
             
             self._duraklar[durak_id] = durak
+        
+        self._ters_baglantilari_olustur()
+    
+    def _ters_baglantilari_olustur(self):
+        """
+        Geriye doğru aramalar için her durağa gelen aktarmaları ekle
+        
+        Gelen seferli bağlantılar burada tutulmaz; DurakGrafi ters komşuluğu
+        derlenmiş kenarlardan ilk ihtiyaçta kendisi oluşturur.
+        """
+        for durak_id, durak in self._duraklar.items():
+            if durak.aktarma:
+                hedef_durak = self._duraklar.get(durak.aktarma["transferStopId"])
+                if hedef_durak:
+                    hedef_durak.gelen_aktarma_ekle({**durak.aktarma, "transferStopId": durak_id})
     
     @property
     def duraklar(self) -> Dict[str, Durak]:
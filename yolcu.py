@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from maliyet_agirliklari import MaliyetAgirliklari
 
 
 class Yolcu(ABC):
@@ -26,6 +27,10 @@ class Yolcu(ABC):
         indirim_miktari = normal_ucret * self.indirim_orani()
         return normal_ucret - indirim_miktari
     
+    def maliyet_agirliklari(self) -> MaliyetAgirliklari:
+        """Genelleştirilmiş maliyetli rota aramasında kullanılacak ağırlıklar"""
+        return MaliyetAgirliklari()
+    
     def __str__(self) -> str:
         return f"{self._isim} ({self.yolcu_tipi()})"
 
@@ -59,6 +64,9 @@ class OgrenciYolcu(Yolcu):
     
     def indirim_orani(self) -> float:
         return 0.3  # %30 indirim
+    
+    def maliyet_agirliklari(self) -> MaliyetAgirliklari:
+        return MaliyetAgirliklari(ucret=2.0)  # Ücrete daha duyarlı
 
 
 class OgretmenYolcu(Yolcu):
@@ -85,4 +93,7 @@ class YasliYolcu(Yolcu):
     
     def indirim_orani(self) -> float:
         return 0.35  # %35 indirim
+    
+    def maliyet_agirliklari(self) -> MaliyetAgirliklari:
+        return MaliyetAgirliklari(aktarma=6.0, yurume=1.5)  # Aktarma ve yürümeden kaçınır
 